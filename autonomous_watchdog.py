@@ -7,11 +7,13 @@ Learns from errors and evolves optimization strategies
 
 import subprocess
 import time
-import json
 import logging
 from pathlib import Path
 from datetime import datetime
-import psutil
+
+from metrics_sampler import get_sampler
+from state_store import get_store
+from supervisor import supervisor_active
 
 # Configuration
 TRINITY_DIR = Path.home() / "Desktop" / "Trinity-System"
@@ -19,6 +21,13 @@ LOG_FILE = TRINITY_DIR / "logs" / "watchdog.log"
 STATE_FILE = TRINITY_DIR / ".watchdog_state.json"
 CHECK_INTERVAL = 60  # seconds
 
+STATE_STORE = get_store(STATE_FILE, default={
+    'total_checks': 0,
+    'total_restarts': 0,
+    'last_check': None,
+    'services': {}
+})
+
 # Ensure logs directory
 LOG_FILE.parent.mkdir(exist_ok=True)
 
@@ -56,24 +65,12 @@ class TrinityWatchdog:
 
     def load_state(self):
         """Load watchdog state."""
-        if STATE_FILE.exists():
-            try:
-                with open(STATE_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {
-            'total_checks': 0,
-            'total_restarts': 0,
-            'last_check': None,
-            'services': {}
-        }
+        return STATE_STORE.read()
 
     def save_state(self):
-        """Save watchdog state."""
+        """Save watchdog state (atomic, so a crash mid-write can't corrupt it)."""
         try:
-            with open(STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            STATE_STORE.write(self.state)
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
 
@@ -118,26 +115,33 @@ class TrinityWatchdog:
             return False
 
     def check_system_health(self):
-        """Check overall system health."""
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        """Check overall system health (5-minute averages from the sampler)."""
+        summary = get_sampler().summary(300)
+        latest, fields = summary['latest'], summary['fields']
+
+        def avg(field):
+            return fields.get(field, {}).get('avg', latest.get(field) or 0.0)
+
+        # CPU usage (averaged, so one busy sample doesn't trigger a warning)
+        cpu_percent = avg('cpu_percent')
         if cpu_percent > 80:
-            logger.warning(f"High CPU usage: {cpu_percent}%")
+            logger.warning(f"High CPU usage: {cpu_percent}% (5 min avg)")
 
         # Memory usage
-        memory = psutil.virtual_memory()
-        if memory.percent > 80:
-            logger.warning(f"High memory usage: {memory.percent}%")
+        memory_percent = latest.get('memory_percent') or 0.0
+        if memory_percent > 80:
+            logger.warning(f"High memory usage: {memory_percent}%")
 
         # Disk usage
-        disk = psutil.disk_usage('/')
-        if disk.percent > 90:
-            logger.warning(f"High disk usage: {disk.percent}%")
+        disk_percent = latest.get('disk_percent') or 0.0
+        if disk_percent > 90:
+            logger.warning(f"High disk usage: {disk_percent}%")
 
         return {
             'cpu': cpu_percent,
-            'memory': memory.percent,
-            'disk': disk.percent
+            'cpu_p95': fields.get('cpu_percent', {}).get('p95', cpu_percent),
+            'memory': memory_percent,
+            'disk': disk_percent
         }
 
     def check_services(self):
@@ -153,7 +157,9 @@ class TrinityWatchdog:
                 all_healthy = False
 
                 # Auto-restart high priority services
-                if service['priority'] == 'high' and service['failures'] < 3:
+                if supervisor_active():
+                    logger.info(f"   Supervisor owns {name}; not restarting")
+                elif service['priority'] == 'high' and service['failures'] < 3:
                     self.restart_service(name, service)
                 elif service['failures'] >= 3:
                     logger.critical(f"⚠️ {name} failed 3+ times - manual intervention required")
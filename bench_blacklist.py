@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Trinity Blacklist Benchmark
+
+Compares the legacy lookup (re-read blacklist.json + lowercase the list on
+every call) with the normalised index, on a synthetic blacklist.
+
+Usage:
+    python3 bench_blacklist.py
+    python3 bench_blacklist.py --entries 100000 --lookups 1000
+"""
+
+import argparse
+import json
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from blacklist import Blacklist
+
+SUFFIXES = ["", " Inc", " Inc.", " LLC", ", Ltd", " Corp", " & Co"]
+WORDS = ["Hotel", "Inn", "Resort", "Suites", "Lodge", "Group", "Hospitality",
+         "Partners", "Services", "Holdings", "Coastal", "Pacific", "Central"]
+
+
+def company_names(count: int, seed: int = 7):
+    """Unique synthetic company names like 'Qzmtr Coastal Inn LLC'."""
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        stem = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 9))).title()
+        words = ' '.join(rng.sample(WORDS, 2))
+        names.add(f"{stem} {words}{rng.choice(SUFFIXES)}")
+    return sorted(names)
+
+
+def legacy_is_blacklisted(path: Path, company: str) -> bool:
+    """The original implementation: full JSON load + lowercase per call."""
+    with open(path) as f:
+        blacklist = json.load(f).get("companies", [])
+    return company.lower() in [c.lower() for c in blacklist]
+
+
+def timed(func, items):
+    """Mean time per call in microseconds."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Blacklist benchmark')
+    parser.add_argument('--entries', type=int, default=100000)
+    parser.add_argument('--lookups', type=int, default=1000)
+    parser.add_argument('--legacy-lookups', type=int, default=20,
+                        help='Legacy lookups are slow; time fewer of them')
+    args = parser.parse_args()
+
+    names = company_names(args.entries)
+    rng = random.Random(11)
+    hits = rng.sample(names, args.lookups // 2)
+    misses = [f"Zz{name}" for name in rng.sample(names, args.lookups // 2)]
+    typos = [name[:3] + name[4:] for name in rng.sample(names, 100)]
+    queries = hits + misses
+    rng.shuffle(queries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "blacklist.json"
+        path.write_text(json.dumps({"companies": names, "reasons": {}}))
+
+        blacklist = Blacklist(path)
+        start = time.perf_counter()
+        blacklist.is_blacklisted("warm up")
+        load_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        blacklist.find_similar("warm up")
+        trigram_ms = (time.perf_counter() - start) * 1000
+
+        legacy_us = timed(lambda q: legacy_is_blacklisted(path, q), queries[:args.legacy_lookups])
+        exact_us = timed(blacklist.is_blacklisted, queries)
+        fuzzy_us = timed(lambda q: blacklist.is_blacklisted(q, fuzzy=True), queries)
+        typo_hits = sum(blacklist.is_blacklisted(q, fuzzy=True) for q in typos)
+
+        print("=" * 60)
+        print("  TRINITY BLACKLIST BENCHMARK")
+        print("=" * 60)
+        print(f"  Entries:              {len(blacklist):>12,}")
+        print(f"  Load + index:         {load_ms:>10.1f}ms")
+        print(f"  Trigram index build:  {trigram_ms:>10.1f}ms")
+        print(f"  Legacy lookup:        {legacy_us:>10.1f}µs")
+        print(f"  Exact lookup:         {exact_us:>10.1f}µs  ({legacy_us / exact_us:,.0f}x)")
+        print(f"  Fuzzy lookup:         {fuzzy_us:>10.1f}µs")
+        print(f"  Typo recall (fuzzy):  {typo_hits:>9}/{len(typos)}")
+        print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
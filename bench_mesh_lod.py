@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Trinity Mesh LOD Benchmark
+
+Measures STL parse (binary + ASCII), vertex dedupe and decimation time
+across model sizes using synthetic UV spheres.
+
+Usage:
+    python3 bench_mesh_lod.py
+    python3 bench_mesh_lod.py --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import mesh_lod
+
+
+def uv_sphere(target_triangles: int):
+    """Build a UV sphere with roughly ``target_triangles`` faces."""
+    segments = max(4, int(np.sqrt(target_triangles / 2)))
+    rings = segments
+    theta = np.linspace(0, np.pi, rings + 1)
+    phi = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    t, p = np.meshgrid(theta, phi, indexing='ij')
+    vertices = np.stack([np.sin(t) * np.cos(p), np.sin(t) * np.sin(p), np.cos(t)], axis=-1)
+    vertices = (vertices.reshape(-1, 3) * 50).astype(np.float32)
+
+    idx = np.arange((rings + 1) * segments).reshape(rings + 1, segments)
+    nxt = np.roll(idx, -1, axis=1)
+    a, b, c, d = idx[:-1], nxt[:-1], idx[1:], nxt[1:]
+    faces = np.concatenate([
+        np.stack([a, c, b], axis=-1).reshape(-1, 3),
+        np.stack([b, c, d], axis=-1).reshape(-1, 3)
+    ])
+    return vertices, faces
+
+
+def write_ascii_stl(vertices, faces, path: Path):
+    """Write an ASCII STL like OpenSCAD does."""
+    normals = mesh_lod.face_normals(vertices, faces)
+    lines = ["solid bench"]
+    for n, tri in zip(normals, vertices[faces]):
+        lines.append(f"  facet normal {n[0]:g} {n[1]:g} {n[2]:g}")
+        lines.append("    outer loop")
+        for v in tri:
+            lines.append(f"      vertex {v[0]:g} {v[1]:g} {v[2]:g}")
+        lines.append("    endloop")
+        lines.append("  endfacet")
+    lines.append("endsolid bench")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def timed(func, *args, repeat: int = 3):
+    """Best-of-N wall time in milliseconds, plus the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mesh LOD benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 500000])
+    parser.add_argument('--ascii-max', type=int, default=100000,
+                        help='Skip ASCII parse above this many triangles (slow to generate)')
+    args = parser.parse_args()
+
+    print("=" * 96)
+    print("  TRINITY MESH LOD BENCHMARK")
+    print("=" * 96)
+    print(f"  {'Triangles':>10} {'Bin parse':>10} {'ASCII parse':>12} {'Dedupe':>9} "
+          f"{'LOD 25%':>9} {'LOD 5%':>9} {'Tris 25%':>9} {'Tris 5%':>9} {'Build all':>10}")
+    print("  " + "-" * 94)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for size in args.sizes:
+            vertices, faces = uv_sphere(size)
+            bin_path = tmp_dir / f"sphere_{size}.stl"
+            mesh_lod.write_stl(vertices, faces, bin_path)
+
+            bin_ms, triangles = timed(mesh_lod.load_triangles, bin_path)
+
+            ascii_ms = float('nan')
+            if size <= args.ascii_max:
+                ascii_path = tmp_dir / f"sphere_{size}_ascii.stl"
+                write_ascii_stl(vertices, faces, ascii_path)
+                ascii_ms, _ = timed(mesh_lod.load_triangles, ascii_path, repeat=1)
+
+            dedupe_ms, (v, f) = timed(mesh_lod.dedupe_vertices, triangles)
+            lod25_ms, (_, f25) = timed(mesh_lod.decimate, v, f, 0.25)
+            lod5_ms, (_, f5) = timed(mesh_lod.decimate, v, f, 0.05)
+            build_ms, _ = timed(mesh_lod.build_lods, bin_path, tmp_dir / "lod", repeat=1)
+
+            print(f"  {len(f):>10} {bin_ms:>8.1f}ms {ascii_ms:>10.1f}ms {dedupe_ms:>7.1f}ms "
+                  f"{lod25_ms:>7.1f}ms {lod5_ms:>7.1f}ms {len(f25):>9} {len(f5):>9} {build_ms:>8.1f}ms")
+
+    print("=" * 96)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Trinity Prompt Builder Benchmark
+
+Compares the legacy AI Assistant prompt assembly (genai.configure +
+GenerativeModel + indented JSON dumps of profile/preferences/decisions on
+every message) with the cached-prefix builder, on a synthetic memory.
+
+No API calls are made; timings cover local assembly and client setup,
+token counts are the ~4 chars/token estimate.
+
+Usage:
+    python3 bench_prompt_builder.py
+    python3 bench_prompt_builder.py --profile 60 --preferences 200 --messages 200
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from llm_gateway import ROUTES, GeminiProvider
+from prompt_builder import PERSONA, PromptBuilder, estimate_tokens
+from trinity_memory import TrinityMemory
+
+STATIONS = ["Career", "Engineering", "Trading", "AI Assistant"]
+
+
+def populate(memory: TrinityMemory, profile: int, preferences: int, seed: int = 3):
+    rng = random.Random(seed)
+    for i in range(profile):
+        memory.set_profile(f"field_{i}", f"value {rng.randint(0, 10 ** 6)}", rng.choice(["identity", "career", "skills"]))
+    for i in range(preferences):
+        memory.learn_preference(rng.choice(STATIONS), f"category_{i % 12}", f"key_{i}",
+                                {"choice": rng.choice(["day", "evening", "remote", "onsite"]), "weight": i})
+    for i in range(20):
+        memory.record_decision(rng.choice(STATIONS), "choice", f"Decision number {i}")
+
+
+def legacy_build(memory, history, user_message, api_key):
+    """The original process_ai_message assembly."""
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    genai.GenerativeModel('gemini-2.5-flash')  # Built per message, as the original did
+
+    parts = []
+    context = "Previous conversation:\n"
+    for msg in history[-10:]:
+        context += f"{msg['role'].title()}: {msg['content'][:200]}\n"
+    parts.append(context)
+    user_profile = memory.get_full_profile()
+    preferences = memory.get_all_preferences()
+    recent = memory.get_decisions(limit=5)
+    parts.append(f"""{PERSONA}
+
+USER PROFILE:
+{json.dumps(user_profile, indent=2)}
+
+LEARNED PREFERENCES:
+{json.dumps(preferences, indent=2)}
+
+RECENT DECISIONS:
+{json.dumps([{'station': d['station'], 'type': d['decision_type'], 'decision': d['decision']} for d in recent], indent=2)}""")
+    parts.append(f"User: {user_message}")
+    return parts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prompt builder benchmark')
+    parser.add_argument('--profile', type=int, default=30)
+    parser.add_argument('--preferences', type=int, default=120)
+    parser.add_argument('--messages', type=int, default=100)
+    args = parser.parse_args()
+
+    api_key = "bench-key"
+    history = [{'role': 'user' if i % 2 == 0 else 'assistant', 'content': f"message {i} " + "lorem " * 60}
+               for i in range(12)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = TrinityMemory(Path(tmp) / "memory.db")
+        populate(memory, args.profile, args.preferences)
+
+        start = time.perf_counter()
+        for i in range(args.messages):
+            parts = legacy_build(memory, history, f"Question {i}", api_key)
+        legacy_ms = (time.perf_counter() - start) / args.messages * 1000
+        legacy_tokens = sum(estimate_tokens(p) for p in parts)
+
+        builder = PromptBuilder()
+        provider = GeminiProvider(api_key)
+        chat_model = ROUTES["chat"][0][1]
+        start = time.perf_counter()
+        for i in range(args.messages):
+            prompt = builder.build(memory, history, f"Question {i}")
+            provider.model(chat_model, prompt.prefix.text)  # Its counterpart: the shared client
+        new_ms = (time.perf_counter() - start) / args.messages * 1000
+        dynamic_tokens = prompt.tokens - prompt.prefix.tokens
+        memory.close()
+
+    print("=" * 60)
+    print("  TRINITY PROMPT BUILDER BENCHMARK")
+    print("=" * 60)
+    print(f"  Profile / preferences:  {args.profile} / {args.preferences}")
+    print(f"  Legacy assembly:        {legacy_ms:>8.2f}ms/message")
+    print(f"  Builder assembly:       {new_ms:>8.2f}ms/message  ({legacy_ms / new_ms:,.1f}x)")
+    print(f"  Legacy tokens:          {legacy_tokens:>8,}/message")
+    print(f"  Builder tokens:         {prompt.tokens:>8,}/message  "
+          f"({1 - prompt.tokens / legacy_tokens:.0%} fewer)")
+    print(f"    cached prefix:        {prompt.prefix.tokens:>8,}  (version {prompt.prefix.version})")
+    print(f"    per-message:          {dynamic_tokens:>8,}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
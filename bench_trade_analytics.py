@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Trinity Trade Analytics Benchmark
+
+Compares the legacy Paper → Live metric loops with the NumPy analytics
+module on a synthetic Phoenix state file, and shows the cost of a
+Streamlit rerun once the stats are cached by mtime.
+
+Usage:
+    python3 bench_trade_analytics.py
+    python3 bench_trade_analytics.py --trades 1000000 --repeat 3
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from trade_analytics import analyze, load_trade_stats, trades_to_array
+
+
+def synthetic_history(count: int, seed: int = 11):
+    """Phoenix-style trade history with a slight positive edge."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 5, 9, 30)
+    equity = 100000.0
+    history = []
+    for i in range(count):
+        entry = start + timedelta(hours=2 * i)
+        pnl = rng.gauss(40, 900)
+        equity += pnl
+        history.append({
+            "entry_time": entry.isoformat(),
+            "exit_time": (entry + timedelta(minutes=rng.randint(5, 180))).isoformat(),
+            "pnl": pnl,
+            "equity_after": equity
+        })
+    return history
+
+
+def legacy_metrics(state: dict) -> dict:
+    """The original Paper → Live calculations."""
+    paper_equity = state.get("current_equity", 100000)
+    total_trades = state.get("total_trades", 0)
+    winning_trades = state.get("winning_trades", 0)
+    losing_trades = state.get("losing_trades", 0)
+    trade_history = state.get("trade_history", [])
+
+    win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+    avg_win = sum(t.get("pnl", 0) for t in trade_history if t.get("pnl", 0) > 0) / winning_trades if winning_trades > 0 else 0
+    avg_loss = abs(sum(t.get("pnl", 0) for t in trade_history if t.get("pnl", 0) < 0) / losing_trades) if losing_trades > 0 else 0
+    avg_r_multiple = (avg_win / avg_loss) if avg_loss > 0 else 0
+
+    peak_equity = state.get("peak_equity", 100000)
+    current_drawdown_pct = ((peak_equity - paper_equity) / peak_equity * 100) if peak_equity > 0 else 0
+
+    sharpe_ratio = 0.0
+    if len(trade_history) >= 5:
+        returns = []
+        for trade in trade_history:
+            equity_before = trade.get("equity_after", paper_equity) - trade.get("pnl", 0)
+            if equity_before > 0:
+                returns.append(trade.get("pnl", 0) / equity_before)
+        if len(returns) >= 5:
+            mean_return = sum(returns) / len(returns)
+            variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
+            std_return = variance ** 0.5
+            if std_return > 0:
+                sharpe_ratio = (mean_return / std_return) * (252 / len(returns)) ** 0.5
+    return {"win_rate": win_rate, "avg_r": avg_r_multiple,
+            "drawdown": current_drawdown_pct, "sharpe": sharpe_ratio}
+
+
+def best_of(func, repeat: int) -> float:
+    """Fastest of ``repeat`` runs, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Trade analytics benchmark')
+    parser.add_argument('--trades', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    history = synthetic_history(args.trades)
+    pnls = [t["pnl"] for t in history]
+    state = {
+        "current_equity": history[-1]["equity_after"],
+        "peak_equity": max(t["equity_after"] for t in history),
+        "total_trades": len(history),
+        "winning_trades": sum(p > 0 for p in pnls),
+        "losing_trades": sum(p < 0 for p in pnls),
+        "total_pnl": sum(pnls),
+        "trade_history": history
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "phoenix_state.json"
+        path.write_text(json.dumps(state))
+
+        trades = trades_to_array(history)
+        legacy_ms = best_of(lambda: legacy_metrics(state), args.repeat)
+        convert_ms = best_of(lambda: trades_to_array(history), args.repeat)
+        analyze_ms = best_of(lambda: analyze(trades), args.repeat)
+        start = time.perf_counter()
+        _, stats = load_trade_stats(path)
+        cold_ms = (time.perf_counter() - start) * 1000
+        cached_ms = best_of(lambda: load_trade_stats(path), args.repeat)
+
+    legacy = legacy_metrics(state)
+    print("=" * 60)
+    print("  TRINITY TRADE ANALYTICS BENCHMARK")
+    print("=" * 60)
+    print(f"  Trades:                 {args.trades:>10,}")
+    print(f"  Legacy loops:           {legacy_ms:>10.2f}ms  (4 metrics, drawdown from stored peak)")
+    print(f"  Trade array build:      {convert_ms:>10.2f}ms  (once per state change)")
+    print(f"  NumPy analyze():        {analyze_ms:>10.2f}ms  ({legacy_ms / analyze_ms:,.1f}x, 12 metrics + curves)")
+    print(f"  Cold load (JSON+stats): {cold_ms:>10.2f}ms")
+    print(f"  Cached rerun:           {cached_ms * 1000:>10.1f}us")
+    print(f"  Sharpe legacy / numpy:  {legacy['sharpe']:>10.4f} / {stats.sharpe:.4f}")
+    print(f"  Max drawdown (curve):   {stats.max_drawdown_pct:>10.2f}%  "
+          f"(stored-peak method: {legacy['drawdown']:.2f}%)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
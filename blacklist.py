@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Trinity Company Blacklist Engine
+
+In-memory index over job_logs/blacklist.json:
+- Loaded once, reloaded only when the file's mtime/size changes
+- Company names normalised ("The Madonna Inn, LLC" → "madonna inn")
+  into a dict for O(1) exact lookups
+- Optional trigram index for near-duplicate names (typos, spacing),
+  built lazily on the first fuzzy query
+- Every reason is kept; writes are atomic and locked via state_store
+"""
+
+import json
+import math
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from state_store import get_store
+
+# Legal suffixes / articles that don't distinguish companies
+COMPANY_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation',
+    'co', 'company', 'plc', 'lp', 'llp', 'pllc', 'gmbh'
+}
+LEADING_ARTICLES = {'the'}
+
+DEFAULT_FUZZY_THRESHOLD = 0.75
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+
+def normalize_company(name: str) -> str:
+    """Canonical lookup key for a company name."""
+    # '&' and 'and' are interchangeable in names, so drop both
+    words = [w for w in _PUNCTUATION_RE.sub(' ', name.lower()).split() if w != 'and']
+    while words and words[0] in LEADING_ARTICLES:
+        words.pop(0)
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def trigrams(key: str) -> Set[str]:
+    """Character trigrams of a normalised key (space padded)."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Blacklist:
+    """Normalised, mtime-reloaded company blacklist."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature = None
+        self._data: Dict = {"companies": [], "reasons": {}}
+        self._keys: Dict[str, str] = {}  # normalised key → company as entered
+        self._grams: Optional[Dict[str, Set[str]]] = None
+        self._gram_counts: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _stat_signature(self):
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _refresh(self):
+        """Reload and re-index if the file changed (caller holds the lock)."""
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return
+
+        data = {"companies": [], "reasons": {}}
+        if signature is not None:
+            try:
+                with open(self.path, 'r') as f:
+                    data.update(json.load(f))
+            except (OSError, ValueError):
+                return  # Keep the last good index (e.g. file mid-replace)
+
+        self._data = data
+        self._keys = {}
+        for company in data.get("companies", []):
+            key = normalize_company(company)
+            if key:
+                self._keys.setdefault(key, company)
+        self._grams = None
+        self._signature = signature
+
+    def _build_trigram_index(self):
+        grams: Dict[str, Set[str]] = {}
+        counts = {}
+        for key in self._keys:
+            key_grams = trigrams(key)
+            counts[key] = len(key_grams)
+            for gram in key_grams:
+                grams.setdefault(gram, set()).add(key)
+        self._grams = grams
+        self._gram_counts = counts
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def companies(self) -> List[str]:
+        """All blacklisted companies, as entered."""
+        with self._lock:
+            self._refresh()
+            return list(self._data.get("companies", []))
+
+    def reason(self, company: str) -> Optional[str]:
+        """Reason recorded for a company (matched by normalised key)."""
+        with self._lock:
+            self._refresh()
+            original = self._keys.get(normalize_company(company))
+            if original is None:
+                return None
+            return self._data.get("reasons", {}).get(original)
+
+    def find_similar(self, company: str, threshold: float = DEFAULT_FUZZY_THRESHOLD,
+                     limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Near-duplicate blacklisted companies by trigram Jaccard similarity.
+
+        Returns:
+            [(company as entered, similarity)], best first
+        """
+        key = normalize_company(company)
+        if not key:
+            return []
+        query = trigrams(key)
+
+        with self._lock:
+            self._refresh()
+            if self._grams is None:
+                self._build_trigram_index()
+
+            # Prefix filter: a match shares >= ceil(t*|Q|) grams with the
+            # query, so it must contain one of the |Q| - ceil(t*|Q|) + 1
+            # rarest query grams - only those posting lists are scanned
+            postings = sorted((self._grams.get(gram, ()) for gram in query), key=len)
+            prefix = len(query) - math.ceil(threshold * len(query)) + 1
+            candidates = set().union(*postings[:max(prefix, 1)])
+
+            matches = []
+            for candidate in candidates:
+                size = self._gram_counts[candidate]
+                if not threshold * size <= len(query) <= size / threshold:
+                    continue  # Length filter
+                common = len(query & trigrams(candidate))
+                similarity = common / (len(query) + size - common)
+                if similarity >= threshold:
+                    matches.append((self._keys[candidate], similarity))
+
+        matches.sort(key=lambda match: -match[1])
+        return matches[:limit]
+
+    def is_blacklisted(self, company: str, fuzzy: bool = False,
+                       threshold: float = DEFAULT_FUZZY_THRESHOLD) -> bool:
+        """
+        Check a company against the blacklist.
+
+        Args:
+            company: Company name as found in a posting
+            fuzzy: Also match near-duplicate names via the trigram index
+            threshold: Minimum trigram similarity for fuzzy matches
+        """
+        key = normalize_company(company)
+        if not key:
+            return False
+        with self._lock:
+            self._refresh()
+            if key in self._keys:
+                return True
+        return fuzzy and bool(self.find_similar(company, threshold, limit=1))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._keys)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, company: str, reason: str = "") -> bool:
+        """
+        Add a company (no-op if its normalised key is already listed).
+
+        Reasons for every company are kept; re-adding a listed company
+        with a new reason updates that reason.
+
+        Returns:
+            True if the company was newly added
+        """
+        key = normalize_company(company)
+        if not key:
+            raise ValueError(f"Invalid company name: {company!r}")
+        added = []
+
+        def _add(data):
+            companies = data.get("companies", [])
+            reasons = data.get("reasons", {})
+            existing = next((c for c in companies if normalize_company(c) == key), None)
+            if existing is None:
+                companies.append(company)
+                existing = company
+                added.append(company)
+            if reason or existing not in reasons:
+                reasons[existing] = reason
+            return {
+                "companies": companies,
+                "updated": datetime.now().isoformat(),
+                "reasons": reasons
+            }
+
+        get_store(self.path, backend='file').update(_add)
+        return bool(added)
+
+    def remove(self, company: str) -> bool:
+        """Remove a company by normalised key. Returns True if removed."""
+        key = normalize_company(company)
+        removed = []
+
+        def _remove(data):
+            companies = []
+            for c in data.get("companies", []):
+                if normalize_company(c) == key:
+                    removed.append(c)
+                    data.get("reasons", {}).pop(c, None)
+                else:
+                    companies.append(c)
+            data["companies"] = companies
+            data["updated"] = datetime.now().isoformat()
+            return data
+
+        get_store(self.path, backend='file').update(_remove)
+        return bool(removed)
+
+
+_blacklists: Dict[Path, Blacklist] = {}
+_blacklists_lock = threading.Lock()
+
+
+def get_blacklist(path: Path) -> Blacklist:
+    """Get the shared blacklist instance for a file."""
+    key = path.resolve()
+    with _blacklists_lock:
+        if key not in _blacklists:
+            _blacklists[key] = Blacklist(path)
+        return _blacklists[key]
@@ -4,13 +4,13 @@ Trinity Bot Optimizer - Monte Carlo Analysis System
 Analyzes trading bots using extensive backtest data and AI recommendations
 """
 
-import os
 import json
 import subprocess
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
-import google.generativeai as genai
+
+from llm_gateway import get_gateway
 
 load_dotenv()
 
@@ -24,9 +24,6 @@ COUNCIL_LOG = BOT_FACTORY / "council_log.md"
 EVOLUTION_LOG = BOT_FACTORY / "evolution_engine.log"
 GENERATION_LOG = BOT_FACTORY / "generation_log.md"
 
-# Configure AI
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY"))
-
 def analyze_bot_code(bot_name: str, file_path: Path) -> dict:
     """Analyze bot strategy from source code."""
     print(f"\n📖 Reading {bot_name} source code...")
@@ -130,8 +127,7 @@ def check_running_bots() -> dict:
     }
 
 def get_ai_recommendation(phoenix_data: dict, genesis_data: dict, council_data: dict, running_status: dict) -> str:
-    """Get AI recommendation using Gemini."""
-    model = genai.GenerativeModel('gemini-pro')
+    """Get AI recommendation using Gemini (Claude fallback)."""
 
     prompt = f"""You are analyzing two trading bots for a single paper trading account to determine which should run.
 
@@ -192,8 +188,7 @@ Provide a clear, decisive recommendation with reasoning. Format as:
 Be direct and technical. This is for an algorithmic trader who needs data-driven decisions.
 """
 
-    response = model.generate_content(prompt)
-    return response.text
+    return get_gateway().generate(prompt, route="analysis").text
 
 def main():
     """Run comprehensive bot analysis."""
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Trinity Clipboard Sync Engine
+
+Event-driven Mac ↔ Quest clipboard sync:
+- Sync file changes are delivered by watchdog (inotify/FSEvents), with a
+  cheap stat() poll as fallback - the file is only parsed when it changed
+- Pluggable clipboard backends (AppKit/pbpaste on macOS, plain file for
+  tests and Linux)
+- Content hashes cached on size + mtime (or pasteboard change count)
+- Atomic sync file writes (temp file + rename)
+- The sync file lives in its own directory (~/.trinity), so the watch
+  never covers the home tree (FSEvents streams are always recursive)
+"""
+
+import hashlib
+import json
+import logging
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional
+
+from state_store import atomic_write_bytes, atomic_write_json
+
+# Optional: native file-change notifications
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Optional: read the pasteboard change count without forking pbpaste
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+    APPKIT_AVAILABLE = True
+except ImportError:
+    APPKIT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+SYNC_DIR = Path.home() / ".trinity"
+SYNC_FILE = SYNC_DIR / "clipboard"
+LEGACY_SYNC_FILE = Path.home() / ".trinity_clipboard"  # Pre-SYNC_DIR location
+MAX_CLIPBOARD_SIZE = 10 * 1024 * 1024  # 10MB limit
+FILE_POLL_INTERVAL = 1.0  # Fallback stat() interval when watchdog is unavailable
+
+
+def content_hash(text: str) -> str:
+    """Hash clipboard content (MD5, matching the sync file 'hash' field)."""
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+def migrate_legacy_sync_file(sync_file: Path = SYNC_FILE,
+                             legacy: Path = LEGACY_SYNC_FILE) -> bool:
+    """Move the old ~/.trinity_clipboard into SYNC_DIR. Returns True if moved."""
+    if sync_file.exists() or not legacy.exists():
+        return False
+    sync_file.parent.mkdir(parents=True, exist_ok=True)
+    legacy.replace(sync_file)
+    return True
+
+
+def file_signature(path: Path) -> Optional[tuple]:
+    """Cheap change signature for a file: (size, mtime_ns), or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+# ============================================================================
+# SYNC FILE
+# ============================================================================
+
+class SyncFileReader:
+    """Parse the sync file only when its size/mtime signature changes."""
+
+    EMPTY = {'content': '', 'source': 'none', 'timestamp': '', 'hash': ''}
+
+    def __init__(self, path: Path = SYNC_FILE):
+        self.path = path
+        self._signature = None
+        self._data = dict(self.EMPTY)
+        self._lock = threading.Lock()
+
+    def read(self) -> Dict:
+        """Return the parsed sync file (cached until the file changes)."""
+        signature = file_signature(self.path)
+        with self._lock:
+            if signature == self._signature:
+                return self._data
+
+            data = dict(self.EMPTY)
+            if signature is not None:
+                try:
+                    with open(self.path, 'r') as f:
+                        data.update(json.load(f))
+                except (OSError, ValueError):
+                    return self._data  # Keep last good copy
+                if not data.get('hash'):
+                    data['hash'] = content_hash(data.get('content', ''))
+
+            self._signature = signature
+            self._data = data
+            return data
+
+    def write(self, content: str, source: str) -> Dict:
+        """Atomically write new clipboard content to the sync file."""
+        data = {
+            'content': content,
+            'source': source,
+            'timestamp': datetime.now().isoformat(),
+            'hash': content_hash(content)
+        }
+        atomic_write_json(self.path, data)
+        return data
+
+
+class FileWatcher:
+    """
+    Invoke a callback when a single file changes.
+
+    Uses watchdog when installed (watching the parent directory so atomic
+    renames are seen), otherwise polls the file's stat() signature. Keep
+    the file in a directory of its own: on macOS the FSEvents stream for
+    the parent reports its whole subtree.
+    """
+
+    def __init__(self, path: Path, callback: Callable[[], None],
+                 poll_interval: float = FILE_POLL_INTERVAL):
+        self.path = path
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self._observer = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def native(self) -> bool:
+        """True when OS change notifications are in use."""
+        return self._observer is not None
+
+    def start(self):
+        if WATCHDOG_AVAILABLE:
+            watcher = self
+
+            class _Handler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    paths = {getattr(event, 'src_path', None), getattr(event, 'dest_path', None)}
+                    if str(watcher.path) in paths:
+                        watcher.callback()
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._observer = Observer()
+            self._observer.schedule(_Handler(), str(self.path.parent), recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+            return
+
+        logger.warning("watchdog not installed; polling %s every %.1fs",
+                       self.path, self.poll_interval)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, name='clipboard-file-watch', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _poll(self):
+        last = file_signature(self.path)
+        while not self._stop.wait(self.poll_interval):
+            current = file_signature(self.path)
+            if current != last:
+                last = current
+                self.callback()
+
+
+# ============================================================================
+# CLIPBOARD BACKENDS
+# ============================================================================
+
+class ClipboardBackend(ABC):
+    """Interface for local clipboard access."""
+
+    source = 'local'
+    poll_interval = 0.25  # How often change_token() is checked
+
+    @abstractmethod
+    def get_text(self) -> str:
+        """Current clipboard text ('' when empty or unreadable)."""
+
+    @abstractmethod
+    def set_text(self, text: str) -> bool:
+        """Replace the clipboard text; False if the write failed."""
+
+    def change_token(self) -> Optional[Hashable]:
+        """
+        Cheap value that changes whenever the clipboard does.
+
+        Returning None means "unknown" and forces a full read + hash.
+        """
+        return None
+
+
+class MacClipboardBackend(ClipboardBackend):
+    """
+    macOS clipboard.
+
+    With PyObjC, the pasteboard change count is checked in-process, so
+    idle ticks cost nothing. Without it, falls back to pbpaste/pbcopy at
+    a slower interval.
+    """
+
+    source = 'mac'
+
+    def __init__(self):
+        self._pasteboard = NSPasteboard.generalPasteboard() if APPKIT_AVAILABLE else None
+        self.poll_interval = 0.25 if self._pasteboard else 1.0
+        if not self._pasteboard:
+            logger.warning("PyObjC (AppKit) not installed; polling pbpaste every %.1fs",
+                           self.poll_interval)
+
+    def get_text(self) -> str:
+        if self._pasteboard:
+            return self._pasteboard.stringForType_(NSPasteboardTypeString) or ""
+        try:
+            result = subprocess.run(['pbpaste'], capture_output=True, text=True, timeout=1)
+            return result.stdout
+        except (OSError, subprocess.SubprocessError):
+            return ""
+
+    def set_text(self, text: str) -> bool:
+        if self._pasteboard:
+            self._pasteboard.clearContents()
+            return bool(self._pasteboard.setString_forType_(text, NSPasteboardTypeString))
+        try:
+            subprocess.run(['pbcopy'], input=text.encode(), timeout=1)
+            return True
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+    def change_token(self) -> Optional[Hashable]:
+        return self._pasteboard.changeCount() if self._pasteboard else None
+
+
+class FileClipboardBackend(ClipboardBackend):
+    """Clipboard stand-in backed by a plain text file (tests, Linux)."""
+
+    def __init__(self, path: Path, source: str = 'local'):
+        self.path = path
+        self.source = source
+
+    def get_text(self) -> str:
+        try:
+            return self.path.read_text()
+        except OSError:
+            return ""
+
+    def set_text(self, text: str) -> bool:
+        try:
+            atomic_write_bytes(self.path, text.encode())
+            return True
+        except OSError:
+            return False
+
+    def change_token(self) -> Optional[Hashable]:
+        return file_signature(self.path)
+
+
+# ============================================================================
+# SYNC ENGINE
+# ============================================================================
+
+class ClipboardSyncEngine:
+    """Two-way sync between a clipboard backend and the sync file."""
+
+    def __init__(self, backend: ClipboardBackend, sync_file: Path = SYNC_FILE,
+                 log: Callable[[str], None] = print):
+        self.backend = backend
+        self.reader = SyncFileReader(sync_file)
+        self.log = log
+
+        self._file_changed = threading.Event()
+        self._stop = threading.Event()
+        self._watcher = FileWatcher(sync_file, self._file_changed.set)
+
+        self._clipboard_token = object()  # Never equal to a real token
+        self._clipboard_hash = None
+        self._applied_sync_hash = None
+
+    def sync_from_clipboard(self) -> bool:
+        """Push local clipboard changes to the sync file. Returns True if written."""
+        token = self.backend.change_token()
+        if token is not None and token == self._clipboard_token:
+            return False  # Nothing changed: no read, no hash
+        self._clipboard_token = token
+
+        text = self.backend.get_text()
+        text_hash = content_hash(text)
+        if text_hash == self._clipboard_hash:
+            return False
+        self._clipboard_hash = text_hash
+
+        if not text or text_hash == self.reader.read().get('hash'):
+            return False
+
+        if len(text) > MAX_CLIPBOARD_SIZE:
+            self.log(f"Local clipboard too large: {len(text)} bytes (max {MAX_CLIPBOARD_SIZE})")
+            return False
+
+        self.reader.write(text, self.backend.source)
+        self._applied_sync_hash = text_hash
+        self.log(f"{self.backend.source.title()} → Sync: {len(text)} chars")
+        return True
+
+    def sync_from_file(self) -> bool:
+        """Apply sync file changes (e.g. from Quest) to the local clipboard."""
+        data = self.reader.read()
+        sync_hash = data.get('hash')
+        content = data.get('content', '')
+
+        if not content or sync_hash == self._applied_sync_hash:
+            return False
+        self._applied_sync_hash = sync_hash
+
+        if data.get('source') == self.backend.source or sync_hash == self._clipboard_hash:
+            return False  # Our own write echoing back
+
+        if len(content) > MAX_CLIPBOARD_SIZE:
+            self.log(f"Sync content too large: {len(content)} bytes (max {MAX_CLIPBOARD_SIZE})")
+            return False
+
+        if self.backend.set_text(content):
+            self._clipboard_hash = sync_hash
+            self._clipboard_token = self.backend.change_token()
+            self.log(f"Sync → {self.backend.source.title()}: {len(content)} chars")
+            return True
+        return False
+
+    def run(self):
+        """Run until stop() is called."""
+        self._watcher.start()
+        self._file_changed.set()  # Pick up anything written while we were down
+        try:
+            while not self._stop.is_set():
+                if self._file_changed.is_set():
+                    self._file_changed.clear()
+                    self.sync_from_file()
+                self.sync_from_clipboard()
+                # Wakes early on file events; otherwise only the cheap
+                # clipboard change-token check runs each interval
+                self._file_changed.wait(self.backend.poll_interval)
+        finally:
+            self._watcher.stop()
+
+    def stop(self):
+        self._stop.set()
+        self._file_changed.set()
+
+
+# ============================================================================
+# PUSH NOTIFICATIONS
+# ============================================================================
+
+class ClipboardBroadcaster:
+    """
+    Fan out sync file changes to waiting subscribers (e.g. SSE clients).
+
+    A single watcher feeds every subscriber; changes are deduplicated by
+    content hash, so rewriting identical content wakes nobody. Nothing is
+    read until start(), so constructing one at import time is free.
+    """
+
+    def __init__(self, sync_file: Path = SYNC_FILE):
+        self.reader = SyncFileReader(sync_file)
+        self._condition = threading.Condition()
+        self._current = dict(SyncFileReader.EMPTY)
+        self._watcher = FileWatcher(sync_file, self._on_change)
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        """Start watching the sync file and load its content (idempotent)."""
+        with self._start_lock:
+            if not self._started:
+                self._watcher.start()
+                self._on_change()  # Initial read, after the watcher so no edit is missed
+                self._started = True
+
+    def stop(self):
+        with self._start_lock:
+            if self._started:
+                self._watcher.stop()
+                self._started = False
+
+    def current(self) -> Dict:
+        """Latest clipboard data (cached read)."""
+        return self._current
+
+    def _on_change(self):
+        data = self.reader.read()
+        with self._condition:
+            if data.get('hash') == self._current.get('hash'):
+                return
+            self._current = data
+            self._condition.notify_all()
+
+    def wait_for_change(self, last_hash: Optional[str], timeout: float) -> Optional[Dict]:
+        """
+        Block until the clipboard hash differs from ``last_hash``.
+
+        Returns the new data, or None on timeout.
+        """
+        with self._condition:
+            changed = self._condition.wait_for(
+                lambda: self._current.get('hash') != last_hash, timeout=timeout
+            )
+            return self._current if changed else None
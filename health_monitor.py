@@ -12,15 +12,20 @@ Continuously monitors Trinity system health and auto-recovers from failures.
 import os
 import sys
 import time
-import json
 import socket
 import sqlite3
 import subprocess
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import psutil
+
+from state_store import get_store
+from supervisor import supervisor_active
+
 # Configuration
 BASE_DIR = Path(__file__).parent
 LOG_FILE = BASE_DIR / "logs" / "health_monitor.log"
@@ -59,8 +64,8 @@ class TrinityHealthMonitor:
             },
             'command_center': {
                 'port': 8502,
-                'process_name': 'command_center.py',
-                'restart_command': ['streamlit', 'run', str(BASE_DIR / 'command_center.py'),
+                'process_name': 'trinity_app.py',
+                'restart_command': ['streamlit', 'run', str(BASE_DIR / 'trinity_app.py'),
                                    '--server.port', '8502', '--server.headless', 'true'],
                 'critical': True
             },
@@ -78,8 +83,23 @@ class TrinityHealthMonitor:
         }
 
         self.check_interval = 30  # seconds
+        self.check_deadline = 5  # seconds, shared by all checks in a cycle
+        self.port_timeout = 2  # seconds
+        self.restart_timeout = 15  # seconds to wait for a restarted port
+        self.integrity_interval = 6 * 3600  # seconds between full DB checks
         self.auto_restart = True
         self.restart_attempts = {}
+        self.pending_restarts: Dict[str, Future] = {}
+        self.last_recovery: Dict[str, bool] = {}  # Outcome of each service's last finished restart
+        self.last_integrity_check: Dict[Path, float] = {}
+        self.pending_integrity: Dict[Path, Future] = {}
+
+        self.check_pool = ThreadPoolExecutor(
+            max_workers=len(self.services) + len(self.databases),
+            thread_name_prefix='health-check'
+        )
+        self.restart_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='health-restart')
+        self.integrity_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='health-integrity')
 
         logger.info(f"Monitoring {len(self.services)} services")
         logger.info(f"Check interval: {self.check_interval}s")
@@ -88,29 +108,42 @@ class TrinityHealthMonitor:
     def check_port(self, port: int) -> bool:
         """Check if a port is listening."""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex(('localhost', port))
-            sock.close()
-            return result == 0
-        except:
-            return False
-
-    def check_process(self, process_name: str) -> bool:
-        """Check if a process is running."""
-        try:
-            result = subprocess.run(
-                ['pgrep', '-f', process_name],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except:
+            with socket.create_connection(('localhost', port), timeout=self.port_timeout):
+                return True
+        except OSError:
             return False
 
-    def check_database(self, db_path: Path) -> Dict:
-        """Check database health."""
+    def wait_for_port(self, port: int, timeout: float) -> bool:
+        """Poll a port until it listens or ``timeout`` expires."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.check_port(port):
+                return True
+            time.sleep(0.25)
+        return False
+
+    def running_processes(self) -> List[str]:
+        """Command lines of all processes (one psutil scan per cycle)."""
+        cmdlines = []
+        for proc in psutil.process_iter(['cmdline']):
+            cmdline = proc.info.get('cmdline')
+            if cmdline:
+                cmdlines.append(' '.join(cmdline))
+        return cmdlines
+
+    def check_process(self, process_name: str, cmdlines: Optional[List[str]] = None) -> bool:
+        """Check if a process is running (no pgrep fork)."""
+        if cmdlines is None:
+            cmdlines = self.running_processes()
+        return any(process_name in cmdline for cmdline in cmdlines)
+
+    def check_database(self, db_path: Path, full: bool = False) -> Dict:
+        """
+        Check database health.
+
+        The fast probe reads the header and page count (constant time);
+        ``full`` runs PRAGMA integrity_check, which reads every page.
+        """
         if not db_path.exists():
             return {
                 'status': 'missing',
@@ -118,21 +151,32 @@ class TrinityHealthMonitor:
             }
 
         try:
-            conn = sqlite3.connect(str(db_path), timeout=5)
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA integrity_check")
-            result = cursor.fetchone()
-            conn.close()
-
-            if result and result[0] == 'ok':
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=5)
+            try:
+                if full:
+                    result = conn.execute("PRAGMA integrity_check").fetchone()
+                    ok = bool(result) and result[0] == 'ok'
+                else:
+                    # Fails fast on a bad header or unreadable schema page
+                    conn.execute("PRAGMA schema_version").fetchone()
+                    ok = conn.execute("PRAGMA page_count").fetchone()[0] > 0
+            finally:
+                conn.close()
+
+            if ok:
+                st = db_path.stat()
+                if full:
+                    self.last_integrity_check[db_path] = time.time()
                 return {
                     'status': 'healthy',
-                    'size': db_path.stat().st_size,
-                    'modified': datetime.fromtimestamp(db_path.stat().st_mtime).isoformat()
+                    'check': 'integrity' if full else 'probe',
+                    'size': st.st_size,
+                    'modified': datetime.fromtimestamp(st.st_mtime).isoformat()
                 }
             else:
                 return {
                     'status': 'corrupted',
+                    'check': 'integrity' if full else 'probe',
                     'error': 'Database integrity check failed'
                 }
         except Exception as e:
@@ -141,6 +185,33 @@ class TrinityHealthMonitor:
                 'error': str(e)
             }
 
+    def integrity_check_due(self, db_path: Path) -> bool:
+        """Full integrity checks run on the slow schedule."""
+        last = self.last_integrity_check.get(db_path, 0)
+        return time.time() - last >= self.integrity_interval
+
+    def schedule_integrity_check(self, db_path: Path) -> Optional[Dict]:
+        """
+        Run full integrity checks in the background, outside the per-cycle
+        deadline: they read every page, so a large database (or the first
+        check at startup) can outlast the whole cycle budget. Returns the
+        result once a check has finished, otherwise None.
+        """
+        future = self.pending_integrity.get(db_path)
+        if future is not None:
+            if not future.done():
+                return None
+            del self.pending_integrity[db_path]
+            try:
+                return future.result()
+            except Exception as e:
+                return {'status': 'error', 'check': 'integrity', 'error': str(e)}
+        if self.integrity_check_due(db_path):
+            self.pending_integrity[db_path] = self.integrity_pool.submit(
+                self.check_database, db_path, True
+            )
+        return None
+
     def restart_service(self, service_name: str, config: Dict) -> bool:
         """Attempt to restart a service."""
         # Track restart attempts
@@ -169,11 +240,8 @@ class TrinityHealthMonitor:
                 start_new_session=True
             )
 
-            # Wait for service to come up
-            time.sleep(5)
-
-            # Verify restart
-            if self.check_port(config['port']):
+            # Verify restart (returns as soon as the port is up)
+            if self.wait_for_port(config['port'], self.restart_timeout):
                 logger.info(f"✅ {service_name} restarted successfully")
                 return True
             else:
@@ -184,7 +252,35 @@ class TrinityHealthMonitor:
             logger.error(f"❌ Error restarting {service_name}: {e}")
             return False
 
-    def check_service_health(self, service_name: str, config: Dict) -> Dict:
+    def collect_restart(self, service_name: str) -> Optional[bool]:
+        """
+        Record the outcome of a background restart once it has finished.
+
+        Returns the outcome of the service's last finished restart, or
+        None if none has finished yet.
+        """
+        future = self.pending_restarts.get(service_name)
+        if future is not None and future.done():
+            del self.pending_restarts[service_name]
+            self.last_recovery[service_name] = future.result()
+        return self.last_recovery.get(service_name)
+
+    def schedule_restart(self, service_name: str, config: Dict) -> str:
+        """
+        Restart a service in the background so the check cycle never waits
+        on it. Returns 'started' or 'pending' (already restarting); the
+        outcome is picked up later by collect_restart().
+        """
+        self.collect_restart(service_name)
+        if service_name in self.pending_restarts:
+            return 'pending'
+        self.pending_restarts[service_name] = self.restart_pool.submit(
+            self.restart_service, service_name, config
+        )
+        return 'started'
+
+    def check_service_health(self, service_name: str, config: Dict,
+                             cmdlines: Optional[List[str]] = None) -> Dict:
         """Check health of a single service."""
         status = {
             'service': service_name,
@@ -198,24 +294,32 @@ class TrinityHealthMonitor:
         status['port_listening'] = port_ok
 
         # Check process
-        process_ok = self.check_process(config['process_name'])
+        process_ok = self.check_process(config['process_name'], cmdlines)
         status['process_running'] = process_ok
 
         # Overall health
         status['healthy'] = port_ok and process_ok
 
-        # Recovery action
-        if not status['healthy'] and config['critical'] and self.auto_restart:
+        # Outcome of the last background restart (None until one finishes)
+        status['recovery_successful'] = self.collect_restart(service_name)
+
+        # Recovery action (runs in the background; the supervisor owns
+        # restarts when it is running)
+        if not status['healthy'] and config['critical'] and self.auto_restart \
+                and not supervisor_active():
             logger.warning(f"⚠️  {service_name} is down, attempting recovery...")
             status['recovery_attempted'] = True
-            status['recovery_successful'] = self.restart_service(service_name, config)
+            status['recovery'] = self.schedule_restart(service_name, config)
         else:
             status['recovery_attempted'] = False
 
         return status
 
     def check_system_health(self) -> Dict:
-        """Comprehensive system health check."""
+        """Comprehensive system health check (all checks run concurrently)."""
+        cycle_start = time.perf_counter()
+        cpu_start = time.process_time()
+
         health_report = {
             'timestamp': datetime.now().isoformat(),
             'services': {},
@@ -223,31 +327,61 @@ class TrinityHealthMonitor:
             'overall_status': 'healthy'
         }
 
-        # Check all services
-        critical_down = []
-        for service_name, config in self.services.items():
-            status = self.check_service_health(service_name, config)
-            health_report['services'][service_name] = status
-
-            if config['critical'] and not status['healthy']:
-                critical_down.append(service_name)
+        cmdlines = self.running_processes()
 
-        # Check databases
+        futures = {}
+        for service_name, config in self.services.items():
+            future = self.check_pool.submit(self.check_service_health, service_name, config, cmdlines)
+            futures[future] = ('services', service_name)
         for db_name, db_path in self.databases.items():
-            health_report['databases'][db_name] = self.check_database(db_path)
+            future = self.check_pool.submit(self.check_database, db_path)
+            futures[future] = ('databases', db_name)
+        integrity = {db_name: self.schedule_integrity_check(db_path)
+                     for db_name, db_path in self.databases.items()}
+
+        # Every fast check shares one deadline; a hung check can't stall the cycle
+        done, not_done = wait(futures, timeout=self.check_deadline)
+        for future in done:
+            section, name = futures[future]
+            try:
+                health_report[section][name] = future.result()
+            except Exception as e:
+                health_report[section][name] = {'status': 'error', 'healthy': False, 'error': str(e)}
+        for future in not_done:
+            section, name = futures[future]
+            health_report[section][name] = {
+                'status': 'timeout',
+                'healthy': False,
+                'error': f'Check exceeded {self.check_deadline}s deadline'
+            }
+
+        # A finished integrity check supersedes the probe (unless the probe timed out)
+        for db_name, result in integrity.items():
+            if result is not None and (result['status'] != 'healthy'
+                                       or health_report['databases'][db_name]['status'] == 'healthy'):
+                health_report['databases'][db_name] = result
 
         # Overall status
+        critical_down = [
+            service_name for service_name, config in self.services.items()
+            if config['critical'] and not health_report['services'][service_name].get('healthy')
+        ]
         if critical_down:
             health_report['overall_status'] = 'degraded'
             health_report['critical_services_down'] = critical_down
 
+        health_report['cycle'] = {
+            'duration_ms': round((time.perf_counter() - cycle_start) * 1000, 1),
+            'cpu_ms': round((time.process_time() - cpu_start) * 1000, 1)
+        }
+
         return health_report
 
     def save_health_status(self, health_report: Dict):
         """Save health status to file."""
         try:
-            with open(HEALTH_STATUS_FILE, 'w') as f:
-                json.dump(health_report, f, indent=2)
+            # Always a plain file: dashboards read health_status.json directly
+            get_store(HEALTH_STATUS_FILE, backend='file').write(health_report)
         except Exception as e:
             logger.error(f"Failed to save health status: {e}")
 
@@ -288,7 +422,11 @@ class TrinityHealthMonitor:
                 # Database details
                 for db_name, status in health_report['databases'].items():
                     emoji = "✅" if status['status'] == 'healthy' else "❌"
-                    logger.info(f"  {emoji} {db_name} DB: {status['status'].upper()}")
+                    check = f" ({status['check']})" if 'check' in status else ""
+                    logger.info(f"  {emoji} {db_name} DB: {status['status'].upper()}{check}")
+
+                cycle = health_report['cycle']
+                logger.info(f"  ⏱️  Cycle: {cycle['duration_ms']}ms wall, {cycle['cpu_ms']}ms CPU")
 
                 # Wait for next check
                 logger.info(f"\nNext check in {self.check_interval}s...")
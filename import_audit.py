@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Trinity Import Audit
+
+Cold-start profiling for the Streamlit apps, driven by ``python -X importtime``:
+- Imports a module in a fresh interpreter and parses the import-time tree
+- Top modules by cumulative / self time, and self time per top-level package
+- Flags heavy modules (SDKs, NumPy/pandas, charting) a cold import pulled in
+- First render: runs the app script once through Streamlit's AppTest in a
+  fresh interpreter, timing the render and listing heavy modules it loaded
+- Budgets: exits non-zero when an import or first render is over budget
+
+Usage:
+    python3 import_audit.py command_center trinity_v3
+    python3 import_audit.py command_center --render --top 10
+    python3 import_audit.py command_center --budget-ms 800 --render-budget-ms 2500
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+BASE_DIR = Path(__file__).parent
+
+IMPORT_BUDGET_MS = float(os.getenv("TRINITY_IMPORT_BUDGET_MS", 1000))  # Cold import of an app module
+RENDER_BUDGET_MS = float(os.getenv("TRINITY_RENDER_BUDGET_MS", 4000))  # First AppTest run of an app
+HEAVY_MODULES = ('numpy', 'pandas', 'altair', 'psutil', 'PIL', 'requests',
+                 'google.generativeai', 'anthropic')
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+RENDER_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[2])).run()
+rendered = time.perf_counter()
+app.run()
+print(json.dumps({
+    "streamlit_seconds": imported - started,
+    "first_render_seconds": rendered - imported,
+    "rerun_seconds": time.perf_counter() - rendered,
+    "exceptions": [str(e.value) for e in app.exception],
+    "modules": sorted(sys.modules)
+}))
+"""
+
+
+@dataclass
+class ImportEntry:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """Import-time tree of one cold import."""
+    target: str
+    entries: List[ImportEntry]
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time of the target itself."""
+        for entry in reversed(self.entries):
+            if entry.module == self.target and entry.depth == 0:
+                return entry.cumulative_us / 1000
+        return sum(e.self_us for e in self.entries) / 1000
+
+    @property
+    def modules(self) -> List[str]:
+        return [e.module for e in self.entries]
+
+    def heavy(self, heavy=HEAVY_MODULES) -> List[str]:
+        """Heavy modules (or their submodules) this import loaded."""
+        loaded = set(self.modules)
+        return [name for name in heavy
+                if name in loaded or any(m.startswith(name + '.') for m in loaded)]
+
+    def top(self, count: int = 15, by: str = 'cumulative') -> List[ImportEntry]:
+        key = (lambda e: e.cumulative_us) if by == 'cumulative' else (lambda e: e.self_us)
+        return sorted(self.entries, key=key, reverse=True)[:count]
+
+    def packages(self) -> Dict[str, float]:
+        """Self time (ms) per top-level package, largest first."""
+        totals: Dict[str, float] = {}
+        for entry in self.entries:
+            package = entry.module.split('.')[0]
+            totals[package] = totals.get(package, 0.0) + entry.self_us / 1000
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+@dataclass
+class RenderReport:
+    """First AppTest run of a Streamlit script in a fresh interpreter."""
+    script: str
+    streamlit_seconds: float
+    first_render_seconds: float
+    rerun_seconds: float
+    exceptions: List[str] = field(default_factory=list)
+    modules: List[str] = field(default_factory=list)
+
+    def heavy(self, heavy=HEAVY_MODULES) -> List[str]:
+        loaded = set(self.modules)
+        return [name for name in heavy if name in loaded]
+
+
+def parse_importtime(text: str) -> List[ImportEntry]:
+    """Entries from ``-X importtime`` stderr (other lines ignored)."""
+    entries = []
+    for line in text.splitlines():
+        match = IMPORTTIME_LINE.match(line.rstrip())
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(ImportEntry(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def measure_import(target: str, cwd: Path = BASE_DIR, timeout: float = 120) -> ImportReport:
+    """Cold ``import target`` in a fresh interpreter."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {target}'],
+                            cwd=cwd, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {target} failed: {result.stderr.strip().splitlines()[-1:]}")
+    return ImportReport(target, parse_importtime(result.stderr))
+
+
+def measure_render(script: Path, cwd: Path = BASE_DIR, timeout: float = 120) -> RenderReport:
+    """First (and second) run of a Streamlit script via AppTest, in a fresh interpreter."""
+    result = subprocess.run([sys.executable, '-c', RENDER_SCRIPT, str(script), str(timeout)],
+                            cwd=cwd, capture_output=True, text=True, timeout=timeout * 2)
+    if result.returncode != 0:
+        raise RuntimeError(f"render of {script} failed: {result.stderr.strip().splitlines()[-1:]}")
+    return RenderReport(str(script), **json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Import-time audit for Trinity apps')
+    parser.add_argument('targets', nargs='+', help='Module names (e.g. command_center)')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--render', action='store_true', help='Also time the first Streamlit render')
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument('--render-budget-ms', type=float, default=RENDER_BUDGET_MS)
+    args = parser.parse_args()
+
+    over_budget = False
+    for target in args.targets:
+        report = measure_import(target)
+        print("=" * 70)
+        print(f"  {target}: cold import {report.total_ms:.0f}ms (budget {args.budget_ms:.0f}ms)")
+        print("=" * 70)
+        print(f"  {'cumulative':>10}  {'self':>8}  module")
+        for entry in report.top(args.top):
+            print(f"  {entry.cumulative_us / 1000:>8.1f}ms  {entry.self_us / 1000:>6.1f}ms  "
+                  f"{'  ' * entry.depth}{entry.module}")
+        print("  Self time by package: " + ", ".join(
+            f"{name} {ms:.0f}ms" for name, ms in list(report.packages().items())[:8]))
+        heavy = report.heavy()
+        print(f"  Heavy modules at import: {', '.join(heavy) or 'none'}")
+        over_budget |= report.total_ms > args.budget_ms
+
+        script = BASE_DIR / f"{target.replace('.', '/')}.py"
+        if args.render and script.exists():
+            render = measure_render(script)
+            render_ms = render.first_render_seconds * 1000
+            print(f"  First render: {render_ms:.0f}ms (budget {args.render_budget_ms:.0f}ms), "
+                  f"rerun {render.rerun_seconds * 1000:.0f}ms, streamlit import "
+                  f"{render.streamlit_seconds * 1000:.0f}ms")
+            print(f"  Heavy modules after first render: {', '.join(render.heavy()) or 'none'}")
+            for error in render.exceptions:
+                print(f"  Exception: {error}")
+            over_budget |= render_ms > args.render_budget_ms or bool(render.exceptions)
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
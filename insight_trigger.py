@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Trinity Insight Trigger
+
+Change detection for trinity_auto_sync's AI insights:
+- The sync context is fingerprinted; an identical context never triggers
+- Numeric metrics trigger once they move past a threshold relative to
+  the context the last insight was generated for (so slow drift still
+  accumulates into a trigger)
+- Any change to a state field (Phoenix status, positions, trade/task
+  counts) triggers
+- A slow floor interval refreshes the insight even when nothing moved
+
+Usage:
+    trigger = InsightTrigger()
+    reason = trigger.check(context)
+    if reason:
+        insight = ai.analyze_system_state(context)
+        trigger.record(context)
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Callable, Dict, Optional
+
+from instrumentation import counter
+
+# Fractional move (of the baseline value) that warrants a new insight
+RELATIVE_THRESHOLDS = {
+    'equity': float(os.getenv("TRINITY_INSIGHT_EQUITY_PCT", 0.5)) / 100
+}
+# Absolute move (in the metric's units) that warrants a new insight
+ABSOLUTE_THRESHOLDS = {
+    'daily_pnl': float(os.getenv("TRINITY_INSIGHT_PNL_DELTA", 250))
+}
+FLOOR_INTERVAL = float(os.getenv("TRINITY_INSIGHT_FLOOR", 6 * 3600))  # Seconds between forced refreshes
+
+INSIGHT_CHECKS = counter("trinity_insight_checks_total", "Insight trigger decisions by reason")
+
+
+def fingerprint(context: Dict) -> str:
+    """Stable hash of a context dict."""
+    return hashlib.sha1(json.dumps(context, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class InsightTrigger:
+    """Decides when the sync context has changed enough for a new insight."""
+
+    def __init__(self, relative: Optional[Dict[str, float]] = None,
+                 absolute: Optional[Dict[str, float]] = None,
+                 floor_interval: float = FLOOR_INTERVAL, clock: Callable[[], float] = time.time):
+        self.relative = RELATIVE_THRESHOLDS if relative is None else relative
+        self.absolute = ABSOLUTE_THRESHOLDS if absolute is None else absolute
+        self.floor_interval = floor_interval
+        self.clock = clock
+        self.baseline: Optional[Dict] = None  # Context of the last insight
+        self._fingerprint: Optional[str] = None
+        self._last = 0.0
+
+    def _moved(self, context: Dict) -> Optional[str]:
+        """First field that moved past its threshold (or changed), if any."""
+        for key in sorted(set(context) | set(self.baseline)):
+            old, new = self.baseline.get(key), context.get(key)
+            if old == new:
+                continue
+            numeric = isinstance(old, (int, float)) and isinstance(new, (int, float))
+            if numeric and key in self.relative:
+                if abs(new - old) >= self.relative[key] * max(abs(old), 1):
+                    return key
+            elif numeric and key in self.absolute:
+                if abs(new - old) >= self.absolute[key]:
+                    return key
+            else:
+                return key  # State field changed
+        return None
+
+    def check(self, context: Dict) -> Optional[str]:
+        """
+        Reason to request a new insight for ``context``, or None to skip.
+
+        Returns:
+            'startup', 'floor', or the name of the field that moved
+        """
+        if self.baseline is None:
+            reason = 'startup'
+        elif self.clock() - self._last >= self.floor_interval:
+            reason = 'floor'
+        elif fingerprint(context) == self._fingerprint:
+            reason = None
+        else:
+            reason = self._moved(context)
+        INSIGHT_CHECKS.inc(reason=reason or 'unchanged')
+        return reason
+
+    def record(self, context: Dict):
+        """Mark ``context`` as the one the latest insight describes."""
+        self.baseline = dict(context)
+        self._fingerprint = fingerprint(context)
+        self._last = self.clock()
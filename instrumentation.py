@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Trinity Instrumentation
+
+Lightweight, dependency-free metrics shared by all Trinity services:
+- Counters, gauges and histograms with labels
+- ``timer()`` context manager and ``@timed`` decorator (outcome-labelled)
+- Instrumented SQLite connections (per-statement latency)
+- Prometheus text exposition for ``/metrics`` endpoints
+
+Usage:
+    from instrumentation import timed, counter
+
+    @timed("trinity_llm_request_seconds", "LLM call latency", model="nexus")
+    def ask_nexus(...): ...
+
+    counter("trinity_jobs_total", "Jobs processed").inc(outcome="applied")
+"""
+
+import functools
+import math
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds: sub-ms SQLite up to multi-minute LLM/CAD calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+def _label_key(labels: Dict[str, str]) -> Tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(key: Tuple, extra: Optional[Tuple] = None) -> str:
+    pairs = list(key) + list(extra or ())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """Base class: a named family of labelled series."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str = ""):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple, object] = {}
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = list(self._series.items())
+        for key, value in series:
+            lines.extend(self._render_series(key, value))
+        return lines
+
+    def _render_series(self, key, value) -> Iterable[str]:
+        yield f"{self.name}{_format_labels(key)} {_format_value(value)}"
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._series.get(_label_key(labels), 0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down, or is read from a callback."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str = "", callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, help)
+        self.callback = callback
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._series[_label_key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        if self.callback and not labels:
+            return self.callback()
+        with self._lock:
+            return self._series.get(_label_key(labels), 0)
+
+    def render(self) -> List[str]:
+        if self.callback:
+            try:
+                self.set(self.callback())
+            except Exception:
+                pass
+        return super().render()
+
+
+class Histogram(Metric):
+    """Bucketed distribution (cumulative buckets, sum and count)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self, **labels) -> Dict:
+        """Count, sum and per-bucket (non-cumulative) counts for one series."""
+        with self._lock:
+            series = self._series.get(_label_key(labels))
+            if series is None:
+                return {'count': 0, 'sum': 0.0, 'buckets': [0] * len(self.buckets)}
+            return {'count': series[2], 'sum': series[1], 'buckets': list(series[0])}
+
+    def _render_series(self, key, value) -> Iterable[str]:
+        counts, total, count = value
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            yield f"{self.name}_bucket{_format_labels(key, (('le', _format_value(bound)),))} {cumulative}"
+        yield f"{self.name}_sum{_format_labels(key)} {_format_value(total)}"
+        yield f"{self.name}_count{_format_labels(key)} {count}"
+
+
+class Registry:
+    """Named metric families; get-or-create so modules can share metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+
+    def _get(self, cls, name: str, help: str, **kwargs) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help: str = "") -> Counter:
+        return self._get(Counter, name, help)
+
+    def gauge(self, name: str, help: str = "", callback: Optional[Callable[[], float]] = None) -> Gauge:
+        gauge = self._get(Gauge, name, help)
+        if callback is not None:
+            gauge.callback = callback
+        return gauge
+
+    def histogram(self, name: str, help: str = "",
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+PROCESS_START_TIME = time.time()
+
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+render = REGISTRY.render
+
+gauge("trinity_process_start_time_seconds", "Unix time the process started",
+      callback=lambda: PROCESS_START_TIME)
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+@contextmanager
+def timer(name: str, help: str = "", **labels):
+    """
+    Time a block into histogram ``name`` with an ``outcome`` label
+    ('ok' or 'error').
+
+    Exceptions are 'error'. The block can also set the outcome itself
+    through the yielded dict (``span['outcome'] = 'error'``).
+    """
+    hist = histogram(name, help)
+    start = time.perf_counter()
+    span = {"outcome": "ok"}
+    try:
+        yield span
+    except BaseException:
+        span["outcome"] = "error"
+        raise
+    finally:
+        hist.observe(time.perf_counter() - start, outcome=span["outcome"], **labels)
+
+
+def timed(name: str, help: str = "", outcome: Optional[Callable[[Any], str]] = None, **labels):
+    """
+    Decorator form of ``timer()``.
+
+    ``outcome`` maps the return value to the outcome label, for
+    functions that report failure instead of raising.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name, help, **labels) as span:
+                result = func(*args, **kwargs)
+                if outcome is not None:
+                    span["outcome"] = outcome(result)
+                return result
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# SQLITE
+# ============================================================================
+
+SQLITE_SECONDS = "trinity_sqlite_query_seconds"
+SQLITE_HELP = "SQLite statement latency"
+
+
+def _statement_kind(sql: str) -> str:
+    words = sql.lstrip().split(None, 1)
+    return words[0].upper() if words else "EMPTY"
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that times execute()/executemany()."""
+
+    db_name = "unknown"
+
+    def execute(self, sql, *args):
+        with timer(SQLITE_SECONDS, SQLITE_HELP, db=self.db_name, op=_statement_kind(sql)):
+            return super().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        with timer(SQLITE_SECONDS, SQLITE_HELP, db=self.db_name, op=_statement_kind(sql)):
+            return super().executemany(sql, *args)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose statements (direct or via cursors) are timed."""
+
+    db_name = "unknown"
+    cursor_class = InstrumentedCursor
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or self.cursor_class)
+
+    def execute(self, sql, *args):
+        return self.cursor().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        return self.cursor().executemany(sql, *args)
+
+    def commit(self):
+        with timer(SQLITE_SECONDS, SQLITE_HELP, db=self.db_name, op="COMMIT"):
+            return super().commit()
+
+
+_connection_classes: Dict[str, type] = {}
+
+
+def sqlite_connect(database, db_name: str, **kwargs) -> sqlite3.Connection:
+    """``sqlite3.connect`` with per-statement latency metrics labelled ``db_name``."""
+    cls = _connection_classes.get(db_name)
+    if cls is None:
+        cursor_class = type("Cursor", (InstrumentedCursor,), {"db_name": db_name})
+        cls = _connection_classes[db_name] = type(
+            "Connection", (InstrumentedConnection,),
+            {"db_name": db_name, "cursor_class": cursor_class}
+        )
+    return sqlite3.connect(database, factory=cls, **kwargs)
@@ -15,6 +15,8 @@ from typing import List, Dict
 from dotenv import load_dotenv
 import psutil
 
+from instrumentation import timer
+
 load_dotenv()
 
 # Set low CPU priority
@@ -45,6 +47,9 @@ EXCLUDE_KEYWORDS = [
 
 MIN_SALARY = 20  # per hour
 
+FETCH_SECONDS = "trinity_scraper_fetch_seconds"
+FETCH_HELP = "Job posting fetch latency"
+
 # ============================================================================
 # JOB BOARD SCRAPERS
 # ============================================================================
@@ -100,7 +105,8 @@ def scan_indeed(keywords: str, location: str) -> List[Dict]:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
 
-        response = requests.get(rss_url, headers=headers, timeout=15)
+        with timer(FETCH_SECONDS, FETCH_HELP, source="indeed"):
+            response = requests.get(rss_url, headers=headers, timeout=15)
 
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'xml')
@@ -166,7 +172,8 @@ def scan_linkedin(keywords: str, location: str) -> List[Dict]:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         }
 
-        response = requests.get(search_url, headers=headers, timeout=15)
+        with timer(FETCH_SECONDS, FETCH_HELP, source="linkedin"):
+            response = requests.get(search_url, headers=headers, timeout=15)
 
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
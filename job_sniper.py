@@ -14,7 +14,6 @@ Features:
 
 import os
 import json
-import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict
@@ -29,6 +28,9 @@ load_dotenv()
 
 # Import Trinity Router
 from trinity_router import TrinityRouter
+from instrumentation import sqlite_connect, timed
+from job_trace import JobTrace, init_trace_table
+from safety_config import acquire_application_slot, check_rate_limit, release_application_slot
 
 # Import Pushover notifications
 try:
@@ -63,7 +65,6 @@ NEGATIVE_KEYWORDS = [
 
 # Job Search Parameters
 MIN_HOURLY_RATE = int(os.getenv("MIN_HOURLY_RATE", 20))
-MAX_DAILY_APPLICATIONS = int(os.getenv("MAX_DAILY_APPLICATIONS", 3))
 DUPLICATE_COOLDOWN_DAYS = int(os.getenv("DUPLICATE_COOLDOWN_DAYS", 90))
 AUTOMATION_LEVEL = os.getenv("AUTOMATION_LEVEL", "SEMI-AUTO")  # FULL-AUTO, SEMI-AUTO, or MANUAL
 
@@ -91,7 +92,7 @@ def init_database():
     """Initialize SQLite database for application tracking"""
     DB_PATH.parent.mkdir(exist_ok=True)
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "applications")
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -123,12 +124,14 @@ def init_database():
         )
     """)
 
+    init_trace_table(conn)
+
     conn.commit()
     conn.close()
 
 def check_duplicate(company: str, position: str) -> bool:
     """Check if already applied to this company/position within cooldown period"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "applications")
     cursor = conn.cursor()
 
     cooldown_date = datetime.now() - timedelta(days=DUPLICATE_COOLDOWN_DAYS)
@@ -146,7 +149,7 @@ def check_duplicate(company: str, position: str) -> bool:
 
 def log_application(company: str, position: str, url: str, fit_score: int, notes: str = ""):
     """Log application to database"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "applications")
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -157,28 +160,12 @@ def log_application(company: str, position: str, url: str, fit_score: int, notes
     conn.commit()
     conn.close()
 
-def get_daily_application_count() -> int:
-    """Get number of applications sent today"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    today = datetime.now().date()
-
-    cursor.execute("""
-        SELECT COUNT(*) FROM applications
-        WHERE DATE(applied_date) = ?
-    """, (today,))
-
-    count = cursor.fetchone()[0]
-    conn.close()
-
-    return count
-
 
 # ============================================================================
 # JOB SCRAPING & FILTERING
 # ============================================================================
 
+@timed("trinity_scraper_fetch_seconds", "Job posting fetch latency", source="job_url")
 def scrape_job_posting(url: str) -> Optional[str]:
     """Scrape job description from URL"""
     try:
@@ -350,6 +337,7 @@ class JobSniper:
         self.trinity = TrinityRouter()
         init_database()
 
+    @timed("trinity_job_process_seconds", "End-to-end Job Sniper latency")
     def process_job(self, job_url_or_text: str, company: str, position: str) -> Dict:
         """
         Complete job processing workflow.
@@ -360,21 +348,32 @@ class JobSniper:
             position: Position title
 
         Returns:
-            dict with status and details
+            dict with status and details (plus the run's ``trace``)
         """
+        trace = JobTrace(company, position)
+        try:
+            result = self._run_pipeline(trace, job_url_or_text, company, position)
+        except Exception:
+            trace.finish("error")
+            raise
+        result["trace"] = trace.finish(result.get("status", "unknown"))
+        return result
+
+    def _run_pipeline(self, trace: JobTrace, job_url_or_text: str,
+                      company: str, position: str) -> Dict:
+        """process_job steps 1-8; each step opens a span on ``trace``"""
         print(f"\n{'='*70}")
         print(f"  JOB SNIPER: Processing {position} at {company}")
         print(f"{'='*70}\n")
 
-        # Step 1: Check daily limit
-        daily_count = get_daily_application_count()
-        if daily_count >= MAX_DAILY_APPLICATIONS:
-            return {
-                "status": "rejected",
-                "reason": f"Daily limit reached ({MAX_DAILY_APPLICATIONS} applications)"
-            }
+        # Step 1: Check rate limits (hourly, rolling 24h, per-company)
+        trace.stage("limit_check")
+        rate = check_rate_limit(company)
+        if not rate["allowed"]:
+            return {"status": "rejected", "reason": rate["reason"]}
 
         # Step 2: Check duplicates
+        trace.stage("duplicate_check")
         if check_duplicate(company, position):
             return {
                 "status": "rejected",
@@ -382,6 +381,7 @@ class JobSniper:
             }
 
         # Step 3: Get job description
+        trace.stage("scrape")
         if job_url_or_text.startswith("http"):
             job_text = scrape_job_posting(job_url_or_text)
             if not job_text:
@@ -390,6 +390,7 @@ class JobSniper:
             job_text = job_url_or_text
 
         # Step 4: Filter keywords
+        trace.stage("filter")
         filter_result = filter_job(job_text)
         if not filter_result["passed"]:
             print(f"  ❌ FILTERED OUT: {filter_result['reason']}")
@@ -402,8 +403,10 @@ class JobSniper:
         print(f"  ✅ Filter passed: {filter_result['reason']}")
 
         # Step 5: Trinity analysis
+        trace.stage("nexus_analysis")
         print(f"\n  🔍 Analyzing with Trinity...")
         analysis_result = self.trinity.analyze_job_posting(job_text)
+        trace.annotate(**self.trinity.last_usage())
         fit_score = analysis_result.get("fit_score", 0)
         recommendation = analysis_result.get("recommendation", "review")
 
@@ -419,32 +422,46 @@ class JobSniper:
             }
 
         # Step 6.5: Extract contact information
+        trace.stage("contact_extraction")
         from job_scanner import extract_contact_info
         contact_info = extract_contact_info(job_text)
         if contact_info:
             print(f"  📧 Contact Info: {contact_info}")
 
         # Step 7: Generate application materials
+        trace.stage("jarvis_materials")
         print(f"\n  📝 Generating application materials...")
         materials = self._generate_application_materials(
             company, position, job_text, analysis_result, contact_info
         )
+        trace.annotate(**self.trinity.last_usage())
 
         # Step 8: Check automation level
+        trace.stage("draft_notify")
         print(f"\n  🔧 Automation Level: {AUTOMATION_LEVEL} (checking for FULL-AUTO)")
         if AUTOMATION_LEVEL == "FULL-AUTO":
             # FULL-AUTO mode: Create draft and send via Pushover
             print(f"\n  📧 FULL-AUTO: Creating draft and sending to Pushover...")
 
+            # Claim a rate-limit slot atomically (parallel workers share the
+            # caps); it is given back below if the draft fails
+            slot = acquire_application_slot(company)
+            if not slot["allowed"]:
+                return {"status": "rejected", "reason": slot["reason"]}
+
             # Create local draft
-            send_result = send_application_email(
-                company=company,
-                position=position,
-                cover_letter=materials.get("cover_letter", ""),
-                resume_path=materials.get("resume_path"),
-                test_mode=True,  # Always draft mode for Pushover workflow
-                contact_info=contact_info
-            )
+            try:
+                send_result = send_application_email(
+                    company=company,
+                    position=position,
+                    cover_letter=materials.get("cover_letter", ""),
+                    resume_path=materials.get("resume_path"),
+                    test_mode=True,  # Always draft mode for Pushover workflow
+                    contact_info=contact_info
+                )
+            except Exception:
+                release_application_slot(company, slot)
+                raise
 
             if send_result["status"] in ["sent", "draft_created"]:
                 # Record application in database
@@ -581,7 +598,10 @@ Copy from draft file to send"""
                         "message": f"Draft created locally at {send_result.get('draft_path', 'N/A')}"
                     }
             else:
-                # Email failed, fall back to approval workflow
+                # Email failed: nothing was sent, so the slot isn't used
+                release_application_slot(company, slot)
+
+                # Fall back to approval workflow
                 print(f"  ⚠️  Email failed: {send_result['message']}")
                 print(f"  📱 Falling back to approval workflow...")
 
@@ -636,6 +656,7 @@ Copy from draft file to send"""
                 "message": "Documents ready for manual review"
             }
 
+    @timed("trinity_job_materials_seconds", "Resume/cover letter generation latency")
     def _generate_application_materials(self, company: str, position: str,
                                        job_text: str, analysis: Dict,
                                        contact_info: Dict = None) -> Dict:
@@ -691,7 +712,7 @@ Requirements:
     def _record_application(self, company: str, position: str, url: str,
                             fit_score: int, status: str, materials: Dict):
         """Record application in database"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite_connect(DB_PATH, "applications")
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -724,7 +745,7 @@ Reply with /approve or /reject"""
         )
 
         # Save to pending approvals
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite_connect(DB_PATH, "applications")
         cursor = conn.cursor()
 
         expires = datetime.now() + timedelta(minutes=60)
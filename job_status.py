@@ -11,6 +11,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from instrumentation import sqlite_connect
+
 # Database path
 DB_PATH = Path(__file__).parent / "job_logs" / "job_status.db"
 
@@ -18,7 +20,7 @@ def init_job_status_db():
     """Initialize job status database"""
     DB_PATH.parent.mkdir(exist_ok=True)
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "job_status")
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -58,7 +60,7 @@ def add_job_status(draft_filename: str, company: str, position: str,
     """Add new job to status tracking"""
     init_job_status_db()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "job_status")
     cursor = conn.cursor()
 
     contact_info = contact_info or {}
@@ -95,7 +97,7 @@ def add_job_status(draft_filename: str, company: str, position: str,
 
 def update_job_status(draft_filename: str, new_status: str, notes: str = None) -> bool:
     """Update job status (pending → applied → denied/accepted)"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "job_status")
     cursor = conn.cursor()
 
     timestamp_field = None
@@ -127,7 +129,7 @@ def get_jobs_by_status(status: str = None) -> List[Dict]:
     """Get jobs filtered by status"""
     init_job_status_db()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "job_status")
     cursor = conn.cursor()
 
     if status:
@@ -185,7 +187,7 @@ def check_duplicate_application(company: str, position: str) -> Optional[Dict]:
     """Check if already applied to this company/position"""
     init_job_status_db()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "job_status")
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -213,7 +215,7 @@ def get_stats() -> Dict:
     """Get application statistics"""
     init_job_status_db()
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_connect(DB_PATH, "job_status")
     cursor = conn.cursor()
 
     cursor.execute("SELECT COUNT(*) FROM job_statuses WHERE status = 'pending'")
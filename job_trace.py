@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Job Sniper Tracing
+
+Per-job traces through the Job Sniper pipeline:
+- One span per pipeline stage (limit check → draft/notify) with duration,
+  token counts and outcome
+- Traces persisted to the ``job_traces`` table in applications.db
+  (one row per stage, plus a ``total`` row)
+- Stage p50/p95 for /job/stats, and stage latency histograms for /metrics
+- CLI flame-style summary of where end-to-end time goes
+
+Usage:
+    trace = JobTrace(company, position)
+    trace.stage("scrape")
+    ...
+    trace.annotate(tokens_in=812, tokens_out=240)
+    trace.finish("draft_created")
+
+    python3 job_trace.py --days 7
+"""
+
+import argparse
+import json
+import math
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from instrumentation import histogram, sqlite_connect
+
+DB_PATH = Path(__file__).parent / "job_logs" / "applications.db"
+TRACE_RETENTION_DAYS = 30
+
+# Pipeline order (process_job steps 1-8)
+STAGES = [
+    "limit_check",
+    "duplicate_check",
+    "scrape",
+    "filter",
+    "nexus_analysis",
+    "contact_extraction",
+    "jarvis_materials",
+    "draft_notify"
+]
+TOTAL_STAGE = "total"
+
+STAGE_SECONDS = histogram("trinity_job_stage_seconds", "Job Sniper per-stage latency")
+
+
+def init_trace_table(conn):
+    """Create the job_traces table (idempotent)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_traces (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            trace_id TEXT NOT NULL,
+            started REAL NOT NULL,
+            company TEXT,
+            position TEXT,
+            stage TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            offset_ms REAL NOT NULL,
+            duration_ms REAL NOT NULL,
+            outcome TEXT NOT NULL,
+            tokens_in INTEGER,
+            tokens_out INTEGER,
+            status TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_traces_started ON job_traces(started)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_traces_trace ON job_traces(trace_id)")
+
+
+class JobTrace:
+    """
+    Stopwatch-style trace of one process_job run.
+
+    ``stage(name)`` closes the open span and starts the next, so each
+    pipeline step is a single call. The span open when the trace
+    finishes takes the final status as its outcome (that's where the job
+    was rejected, filtered or failed); earlier spans are 'ok'.
+    """
+
+    def __init__(self, company: str = "", position: str = "", db_path: Path = DB_PATH):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.company = company
+        self.position = position
+        self.db_path = db_path
+        self.started = time.time()
+        self.status: Optional[str] = None
+        self.spans: List[Dict] = []
+        self._start = time.perf_counter()
+        self._open: Optional[Dict] = None
+
+    def _close(self, now: float, outcome: str):
+        span = self._open
+        if span is None:
+            return
+        span["duration_ms"] = (now - span.pop("_start")) * 1000
+        span["outcome"] = outcome
+        self.spans.append(span)
+        STAGE_SECONDS.observe(span["duration_ms"] / 1000, stage=span["stage"], outcome=outcome)
+        self._open = None
+
+    def stage(self, name: str):
+        """Close the current span (outcome 'ok') and open ``name``."""
+        now = time.perf_counter()
+        self._close(now, "ok")
+        self._open = {
+            "stage": name,
+            "offset_ms": (now - self._start) * 1000,
+            "_start": now,
+            "tokens_in": None,
+            "tokens_out": None
+        }
+
+    def annotate(self, tokens_in: Optional[int] = None, tokens_out: Optional[int] = None):
+        """Add token counts to the open span (accumulates across calls)."""
+        if self._open is None:
+            return
+        for key, value in (("tokens_in", tokens_in), ("tokens_out", tokens_out)):
+            if value is not None:
+                self._open[key] = (self._open[key] or 0) + value
+
+    def finish(self, status: str) -> Dict:
+        """Close the trace, persist it and return its summary."""
+        now = time.perf_counter()
+        self._close(now, status)
+        self.status = status
+        self.total_ms = (now - self._start) * 1000
+        STAGE_SECONDS.observe(self.total_ms / 1000, stage=TOTAL_STAGE, outcome=status)
+        try:
+            self._persist()
+        except Exception as e:
+            print(f"  ⚠️  Trace not saved: {e}")
+        return self.summary()
+
+    def summary(self) -> Dict:
+        return {
+            "trace_id": self.trace_id,
+            "status": self.status,
+            "total_ms": round(getattr(self, "total_ms", 0), 1),
+            "stages": [
+                {
+                    "stage": span["stage"],
+                    "duration_ms": round(span["duration_ms"], 1),
+                    "outcome": span["outcome"],
+                    "tokens_in": span["tokens_in"],
+                    "tokens_out": span["tokens_out"]
+                }
+                for span in self.spans
+            ]
+        }
+
+    def _persist(self):
+        self.db_path.parent.mkdir(exist_ok=True)
+        rows = [
+            (self.trace_id, self.started, self.company, self.position, span["stage"], seq,
+             span["offset_ms"], span["duration_ms"], span["outcome"],
+             span["tokens_in"], span["tokens_out"], self.status)
+            for seq, span in enumerate(self.spans)
+        ]
+        rows.append((self.trace_id, self.started, self.company, self.position, TOTAL_STAGE,
+                     len(self.spans), 0.0, self.total_ms, self.status,
+                     _sum(s["tokens_in"] for s in self.spans),
+                     _sum(s["tokens_out"] for s in self.spans), self.status))
+
+        conn = sqlite_connect(self.db_path, "applications")
+        try:
+            init_trace_table(conn)
+            conn.executemany("""
+                INSERT INTO job_traces
+                (trace_id, started, company, position, stage, seq, offset_ms,
+                 duration_ms, outcome, tokens_in, tokens_out, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.execute("DELETE FROM job_traces WHERE started < ?",
+                         (time.time() - TRACE_RETENTION_DAYS * 86400,))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def _sum(values) -> Optional[int]:
+    values = [v for v in values if v is not None]
+    return sum(values) if values else None
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(index, len(sorted_values) - 1))]
+
+
+def stage_stats(days: float = 7, db_path: Path = DB_PATH) -> Dict:
+    """
+    Per-stage latency over the last ``days``.
+
+    Returns:
+        {stage: {count, p50_ms, p95_ms, mean_ms, total_ms, tokens_in, tokens_out}}
+        in pipeline order, ``total`` last
+    """
+    if not db_path.exists():
+        return {}
+    conn = sqlite_connect(db_path, "applications")
+    try:
+        init_trace_table(conn)
+        rows = conn.execute("""
+            SELECT stage, duration_ms, tokens_in, tokens_out FROM job_traces
+            WHERE started >= ? ORDER BY stage, duration_ms
+        """, (time.time() - days * 86400,)).fetchall()
+    finally:
+        conn.close()
+
+    grouped: Dict[str, List] = {}
+    for stage, duration, tokens_in, tokens_out in rows:
+        grouped.setdefault(stage, []).append((duration, tokens_in or 0, tokens_out or 0))
+
+    order = {name: i for i, name in enumerate(STAGES + [TOTAL_STAGE])}
+    stats = {}
+    for stage in sorted(grouped, key=lambda s: (order.get(s, len(order) - 1), s)):
+        durations = [d for d, _, _ in grouped[stage]]
+        total = sum(durations)
+        stats[stage] = {
+            "count": len(durations),
+            "p50_ms": round(_percentile(durations, 50), 1),
+            "p95_ms": round(_percentile(durations, 95), 1),
+            "mean_ms": round(total / len(durations), 1),
+            "total_ms": round(total, 1),
+            "tokens_in": sum(t for _, t, _ in grouped[stage]),
+            "tokens_out": sum(t for _, _, t in grouped[stage])
+        }
+    return stats
+
+
+def render_flame(stats: Dict, width: int = 40) -> str:
+    """
+    Flame-style text summary: each stage's share of end-to-end time as a
+    bar, widest = dominant stage.
+    """
+    total = stats.get(TOTAL_STAGE, {}).get("total_ms") or \
+        sum(s["total_ms"] for name, s in stats.items() if name != TOTAL_STAGE)
+    if not total:
+        return "No traces recorded"
+
+    lines = [f"{'stage':<20} {'p50 ms':>10} {'p95 ms':>10} {'share':>7}"]
+    for name, s in stats.items():
+        if name == TOTAL_STAGE:
+            continue
+        share = s["total_ms"] / total
+        bar = "█" * max(1 if share > 0 else 0, round(share * width))
+        lines.append(f"{name:<20} {s['p50_ms']:>10.1f} {s['p95_ms']:>10.1f} {share:>6.1%}  {bar}")
+    if TOTAL_STAGE in stats:
+        s = stats[TOTAL_STAGE]
+        lines.append(f"{TOTAL_STAGE:<20} {s['p50_ms']:>10.1f} {s['p95_ms']:>10.1f} {'':>7}  "
+                     f"({s['count']} traces)")
+
+    dominant = max((n for n in stats if n != TOTAL_STAGE), key=lambda n: stats[n]["total_ms"])
+    lines.append(f"\nDominant stage: {dominant}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Job Sniper stage latency summary')
+    parser.add_argument('--days', type=float, default=7, help='Look-back window (default 7)')
+    parser.add_argument('--json', action='store_true', help='Print raw stats as JSON')
+    args = parser.parse_args()
+
+    stats = stage_stats(args.days)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return
+    print(f"Job Sniper stage latency (last {args.days:g} days)\n")
+    print(render_flame(stats))
+
+
+if __name__ == '__main__':
+    main()
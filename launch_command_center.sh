@@ -20,9 +20,9 @@ if [ $? -ne 0 ]; then
     pip3 install streamlit
 fi
 
-# Launch Command Center v2
-echo "🚀 Starting Command Center..."
-streamlit run command_center_v2.py --server.port 8001 --server.address localhost
+# Launch Command Center v2 (one process serves v1, v2.0 and v2.1; v2.0 is /command_center_v2)
+echo "🚀 Starting Command Center at http://localhost:8502/command_center_v2 ..."
+streamlit run trinity_app.py --server.port 8502 --server.address localhost
 
 # Keep script running
 wait
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Trinity Lazy Imports
+
+Deferred imports for the Streamlit apps' cold start:
+- lazy_module(): module proxy that imports on first attribute access
+- lazy_callable(): function proxy, the lazy form of ``from x import f``
+- Shared facades for the SDKs and heavy helpers only some stations use
+  (Gemini SDK, PIL, psutil, requests, the NumPy-backed CAD/metrics helpers)
+- Each module's first-use import time is recorded, so a deferred import
+  that lands on a hot path shows up in /metrics
+
+Usage:
+    from lazy_imports import psutil, pil_image
+    psutil.Process(pid)  # psutil is imported here, once
+"""
+
+import importlib
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable
+
+from instrumentation import histogram
+
+LAZY_IMPORT_SECONDS = histogram("trinity_lazy_import_seconds", "First-use import time of lazily loaded modules",
+                                buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5))
+
+_import_lock = threading.RLock()
+
+
+def _load(name: str) -> ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _import_lock:
+        started = time.perf_counter()
+        module = importlib.import_module(name)  # ImportError surfaces at first use
+        LAZY_IMPORT_SECONDS.observe(time.perf_counter() - started, module=name)
+        return module
+
+
+class LazyModule(ModuleType):
+    """Stands in for a module until one of its attributes is used."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_module'] = None
+
+    def _resolve(self) -> ModuleType:
+        module = self.__dict__['_module']
+        if module is None:
+            module = self.__dict__['_module'] = _load(self.__name__)
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the real module has been imported (by anyone)."""
+        return self.__dict__['_module'] is not None or self.__name__ in sys.modules
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+    def __dir__(self):
+        return dir(self._resolve())
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self.__name__}' ({'loaded' if self.loaded else 'not loaded'})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Proxy for module ``name``, imported on first attribute access."""
+    return LazyModule(name)
+
+
+def lazy_callable(module: str, name: str) -> Callable:
+    """Proxy for ``module.name``, imported on first call."""
+    def call(*args, **kwargs):
+        return getattr(_load(module), name)(*args, **kwargs)
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f"Lazily imported {module}.{name}."
+    return call
+
+
+# ============================================================================
+# SHARED FACADES
+# ============================================================================
+
+genai = lazy_module("google.generativeai")
+pil_image = lazy_module("PIL.Image")
+psutil = lazy_module("psutil")
+requests = lazy_module("requests")
+
+# NumPy-backed helpers (the engineering station and sidebar metrics)
+convert_to_binary_stl = lazy_callable("stl_tools", "convert_to_binary_stl")
+build_lods = lazy_callable("mesh_lod", "build_lods")
+get_catalog = lazy_callable("model_catalog", "get_catalog")
+get_sampler = lazy_callable("metrics_sampler", "get_sampler")
@@ -0,0 +1,665 @@
+#!/usr/bin/env python3
+"""
+Trinity LLM Gateway
+
+Single entry point for every Gemini / Claude call in Trinity:
+- Pooled clients: each SDK is configured once (Gemini's on first use, so
+  app start-up doesn't pay for its import); Gemini models are reused per
+  (model, system instruction)
+- Named routes ("chat", "analysis", "writing", "deep", "background"), each
+  an ordered list of (provider, model) candidates
+- A circuit breaker per provider/model: after repeated failures the model
+  is skipped for a cool-down instead of being called (and timing out)
+  again, then a single trial call decides whether it closes
+- Automatic failover to the next candidate (Gemini ↔ Claude)
+- Hedging for latency-critical routes (HEDGED_ROUTES, "chat" by default):
+  if the first candidate hasn't answered (or, when streaming, sent its
+  first chunk) within a delay, the next one is raced against it
+- Coalescing: identical concurrent text requests share one provider call
+- StubProvider for tests and offline runs
+
+Usage:
+    gateway = get_gateway()
+    text = gateway.generate(prompt, route="analysis").text
+    for chunk in gateway.stream(parts, route="chat", system=persona):
+        ...
+"""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from instrumentation import counter, gauge, histogram
+from lazy_imports import genai
+
+logger = logging.getLogger(__name__)
+
+# Ordered (provider, model) candidates per route
+ROUTES: Dict[str, List[Tuple[str, str]]] = {
+    # Interactive chat: fast model first
+    "chat": [("gemini", "gemini-2.5-flash"), ("claude", "claude-sonnet-4-20250514")],
+    # Structured analysis (job fit, finances, trading logic)
+    "analysis": [("gemini", "gemini-2.5-pro"), ("claude", "claude-sonnet-4-20250514")],
+    # Precise writing (cover letters, rewrites)
+    "writing": [("claude", "claude-sonnet-4-20250514"), ("gemini", "gemini-2.5-pro")],
+    # Long-form strategic reasoning
+    "deep": [("claude", "claude-opus-4-5-20251101"), ("gemini", "gemini-2.5-pro")],
+    # Periodic daemons: cheapest model, never worth a long wait
+    "background": [("gemini", "gemini-2.5-flash"), ("claude", "claude-3-5-haiku-latest")],
+}
+
+FAILURE_THRESHOLD = int(os.getenv("TRINITY_LLM_FAILURE_THRESHOLD", 3))  # Consecutive failures to open
+RESET_TIMEOUT = float(os.getenv("TRINITY_LLM_RESET_TIMEOUT", 60))  # Seconds before a trial call
+HEDGE_DELAY = float(os.getenv("TRINITY_LLM_HEDGE_DELAY", 2.0))  # Seconds before racing a second model
+# Routes hedged unless a call says otherwise (interactive: a user is waiting)
+HEDGED_ROUTES = {r.strip() for r in os.getenv("TRINITY_LLM_HEDGED_ROUTES", "chat").split(",") if r.strip()}
+CLAUDE_MAX_TOKENS = 2048  # Claude requires max_tokens; Gemini uses its default unless given
+GEMINI_MODEL_CACHE = 8
+
+LLM_SECONDS = histogram("trinity_llm_request_seconds", "LLM request latency")
+FIRST_TOKEN_SECONDS = histogram("trinity_llm_first_token_seconds", "LLM time to first streamed token")
+FAILOVERS = counter("trinity_llm_failover_total", "LLM calls that moved to a fallback candidate")
+SHORT_CIRCUITS = counter("trinity_llm_short_circuit_total", "LLM candidates skipped by an open breaker")
+COALESCED = counter("trinity_llm_coalesced_total", "LLM requests served by an identical in-flight call")
+HEDGES = counter("trinity_llm_hedge_total", "Hedged LLM requests by winning candidate")
+
+Prompt = Union[str, List[Any]]
+
+
+class LLMUnavailable(RuntimeError):
+    """No candidate for the route could serve the request."""
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    provider: str
+    model: str
+    tokens_in: Optional[int] = None
+    tokens_out: Optional[int] = None
+
+
+# ============================================================================
+# CIRCUIT BREAKER
+# ============================================================================
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker.
+
+    closed → (threshold failures) → open → (reset_timeout) → half_open,
+    where one trial call either closes it again or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_timeout: float = RESET_TIMEOUT, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial = False  # Half-open trial call in flight
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go through now (claims the half-open trial)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self.clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial = False
+            if self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+
+
+# ============================================================================
+# PROVIDERS
+# ============================================================================
+
+def _text_only(parts: List[Any]) -> bool:
+    return all(isinstance(part, str) for part in parts)
+
+
+class Provider(ABC):
+    """One LLM vendor. ``parts`` is a list of text (and, if supported, image) parts."""
+
+    name = "provider"
+
+    def supports(self, parts: List[Any]) -> bool:
+        return _text_only(parts)
+
+    @abstractmethod
+    def generate(self, model: str, parts: List[Any], system: Optional[str],
+                 max_tokens: Optional[int]) -> LLMResponse:
+        """Complete ``parts`` on ``model`` in one call."""
+
+    def stream(self, model: str, parts: List[Any], system: Optional[str],
+               max_tokens: Optional[int], usage: Dict) -> Iterator[str]:
+        """Yield text chunks; fill ``usage`` with tokens_in/tokens_out at the end."""
+        response = self.generate(model, parts, system, max_tokens)
+        usage.update(tokens_in=response.tokens_in, tokens_out=response.tokens_out)
+        yield response.text
+
+
+class GeminiProvider(Provider):
+    """Google Gemini via google-generativeai (supports image parts)."""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, cache_size: int = GEMINI_MODEL_CACHE):
+        self._api_key = api_key
+        self._configured = False  # The SDK is imported on the first model request
+        self._cache_size = cache_size
+        self._models: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def supports(self, parts: List[Any]) -> bool:
+        return True
+
+    def model(self, name: str, system: Optional[str] = None):
+        """Shared GenerativeModel for (name, system instruction)."""
+        key = (name, system)
+        with self._lock:
+            if not self._configured:
+                genai.configure(api_key=self._api_key)
+                self._configured = True
+            model = self._models.get(key)
+            if model is None:
+                model = genai.GenerativeModel(name, system_instruction=system)
+                self._models[key] = model
+                while len(self._models) > self._cache_size:
+                    self._models.popitem(last=False)
+            else:
+                self._models.move_to_end(key)
+            return model
+
+    @staticmethod
+    def _config(max_tokens: Optional[int]) -> Dict:
+        return {"generation_config": {"max_output_tokens": max_tokens}} if max_tokens else {}
+
+    @staticmethod
+    def _usage(response) -> Dict:
+        usage = getattr(response, "usage_metadata", None)
+        return {
+            "tokens_in": getattr(usage, "prompt_token_count", None),
+            "tokens_out": getattr(usage, "candidates_token_count", None)
+        }
+
+    def generate(self, model, parts, system, max_tokens):
+        response = self.model(model, system).generate_content(parts, **self._config(max_tokens))
+        return LLMResponse(response.text, self.name, model, **self._usage(response))
+
+    def stream(self, model, parts, system, max_tokens, usage):
+        response = None
+        for chunk in self.model(model, system).generate_content(parts, stream=True,
+                                                                **self._config(max_tokens)):
+            response = chunk
+            try:
+                text = chunk.text
+            except ValueError:
+                continue  # Chunk without text parts (e.g. final safety metadata)
+            if text:
+                yield text
+        if response is not None:
+            usage.update(self._usage(response))
+
+
+class ClaudeProvider(Provider):
+    """Anthropic Claude (text parts only)."""
+
+    name = "claude"
+
+    def __init__(self, api_key: str):
+        from anthropic import Anthropic
+        # The gateway fails over instead of retrying a struggling provider
+        self.client = Anthropic(api_key=api_key, max_retries=1)
+
+    @staticmethod
+    def _request(model, parts, system, max_tokens) -> Dict:
+        request = {
+            "model": model,
+            "max_tokens": max_tokens or CLAUDE_MAX_TOKENS,
+            "messages": [{"role": "user", "content": "\n\n".join(parts)}]
+        }
+        if system:
+            request["system"] = system
+        return request
+
+    def generate(self, model, parts, system, max_tokens):
+        message = self.client.messages.create(**self._request(model, parts, system, max_tokens))
+        return LLMResponse(message.content[0].text, self.name, model,
+                           message.usage.input_tokens, message.usage.output_tokens)
+
+    def stream(self, model, parts, system, max_tokens, usage):
+        with self.client.messages.stream(**self._request(model, parts, system, max_tokens)) as stream:
+            yield from stream.text_stream
+            final = stream.get_final_message().usage
+            usage.update(tokens_in=final.input_tokens, tokens_out=final.output_tokens)
+
+
+class StubProvider(Provider):
+    """
+    Local provider for tests and offline runs.
+
+    Args:
+        name: Provider name the routes refer to (e.g. "gemini")
+        reply: Text, or callable(model, prompt_text) -> text
+        latency: Seconds per call (spread across chunks when streaming)
+        error: Exception raised by every call while set
+    """
+
+    def __init__(self, name: str = "stub", reply: Union[str, Callable] = "ok",
+                 latency: float = 0.0, error: Optional[Exception] = None):
+        self.name = name
+        self.reply = reply
+        self.latency = latency
+        self.error = error
+        self.calls: List[Tuple[str, str]] = []  # (model, prompt text)
+        self._lock = threading.Lock()
+
+    def _text(self, model, parts) -> str:
+        prompt = "\n\n".join(p for p in parts if isinstance(p, str))
+        with self._lock:
+            self.calls.append((model, prompt))
+        if self.error is not None:
+            raise self.error
+        return self.reply(model, prompt) if callable(self.reply) else self.reply
+
+    def generate(self, model, parts, system, max_tokens):
+        time.sleep(self.latency)
+        text = self._text(model, parts)
+        return LLMResponse(text, self.name, model, len(parts), len(text.split()))
+
+    def stream(self, model, parts, system, max_tokens, usage):
+        text = self._text(model, parts)
+        words = text.split(" ")
+        for i, word in enumerate(words):
+            time.sleep(self.latency / len(words))
+            yield word if i == 0 else " " + word
+        usage.update(tokens_in=len(parts), tokens_out=len(words))
+
+
+# ============================================================================
+# GATEWAY
+# ============================================================================
+
+class LLMGateway:
+    """Routes requests over providers with breakers, failover, hedging and coalescing."""
+
+    def __init__(self, providers: Dict[str, Provider],
+                 routes: Optional[Dict[str, List[Tuple[str, str]]]] = None,
+                 failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT,
+                 hedge_delay: float = HEDGE_DELAY, max_workers: int = 8):
+        self.providers = providers
+        self.routes = routes or ROUTES
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_delay = hedge_delay
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-gateway')
+
+    # ------------------------------------------------------------------
+    # Candidates
+    # ------------------------------------------------------------------
+
+    def breaker(self, provider: str, model: str) -> CircuitBreaker:
+        key = (provider, model)
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                gauge("trinity_llm_circuit_open", "1 while an LLM circuit breaker is open").set(
+                    0, provider=provider, model=model)
+            return self._breakers[key]
+
+    def has_provider(self, name: str) -> bool:
+        return name in self.providers
+
+    def available(self, route: str = "chat") -> bool:
+        """Whether any provider is configured for ``route``."""
+        return any(name in self.providers for name, _ in self.routes.get(route, ()))
+
+    def _candidates(self, route: str, parts: List[Any]) -> List[Tuple[Provider, str, CircuitBreaker]]:
+        if route not in self.routes:
+            raise ValueError(f"Unknown LLM route: {route}")
+        candidates = []
+        for name, model in self.routes[route]:
+            provider = self.providers.get(name)
+            if provider is not None and provider.supports(parts):
+                candidates.append((provider, model, self.breaker(name, model)))
+        if not candidates:
+            raise LLMUnavailable(f"No LLM provider configured for route '{route}'")
+        return candidates
+
+    def status(self) -> Dict[str, str]:
+        """Breaker state per provider/model."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {f"{provider}/{model}": b.state for (provider, model), b in breakers.items()}
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    def _record(self, provider: Provider, model: str, breaker: CircuitBreaker,
+                start: float, ok: bool):
+        LLM_SECONDS.observe(time.perf_counter() - start, provider=provider.name, model=model,
+                            outcome="ok" if ok else "error")
+        if ok:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        gauge("trinity_llm_circuit_open").set(
+            1 if breaker.state == CircuitBreaker.OPEN else 0, provider=provider.name, model=model)
+
+    def _failover(self, candidates, parts, system, max_tokens) -> LLMResponse:
+        """Try candidates in order, skipping open breakers."""
+        errors = []
+        for i, (provider, model, breaker) in enumerate(candidates):
+            if not breaker.allow():
+                SHORT_CIRCUITS.inc(provider=provider.name, model=model)
+                errors.append(f"{provider.name}/{model}: circuit open")
+                continue
+            if i > 0:
+                FAILOVERS.inc(provider=provider.name, model=model)
+            start = time.perf_counter()
+            try:
+                response = provider.generate(model, parts, system, max_tokens)
+            except Exception as e:
+                self._record(provider, model, breaker, start, ok=False)
+                logger.warning(f"LLM {provider.name}/{model} failed: {str(e)[:200]}")
+                errors.append(f"{provider.name}/{model}: {e}")
+                continue
+            self._record(provider, model, breaker, start, ok=True)
+            return response
+        raise LLMUnavailable("; ".join(errors))
+
+    def _hedged(self, candidates, parts, system, max_tokens) -> LLMResponse:
+        """
+        Start the first candidate; if it hasn't answered within
+        ``hedge_delay`` (or fails), race the rest against it. The slower
+        call is left to finish in the background.
+        """
+        first = self._executor.submit(self._failover, candidates[:1], parts, system, max_tokens)
+        done, _ = wait([first], timeout=self.hedge_delay)
+        if first in done and first.exception() is None:
+            return first.result()
+
+        second = self._executor.submit(self._failover, candidates[1:], parts, system, max_tokens)
+        pending, errors = {first, second}, []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    result = future.result()
+                    HEDGES.inc(provider=result.provider, model=result.model)
+                    return result
+                errors.append(str(future.exception()))
+        raise LLMUnavailable("; ".join(errors))
+
+    def generate(self, prompt: Prompt, route: str = "chat", system: Optional[str] = None,
+                 max_tokens: Optional[int] = None, hedge: Optional[bool] = None,
+                 coalesce: bool = True) -> LLMResponse:
+        """
+        Complete a prompt on the first healthy candidate for ``route``.
+
+        Args:
+            prompt: Text, or a list of parts (text / PIL images)
+            route: Key of ``routes``
+            system: System instruction (kept separate so providers can cache it)
+            max_tokens: Output cap (provider default when None; Claude 2048)
+            hedge: Race a second candidate after ``hedge_delay`` seconds
+                (default: whether ``route`` is in HEDGED_ROUTES)
+            coalesce: Share the result with identical concurrent requests
+
+        Raises:
+            LLMUnavailable: every candidate failed or is short-circuited
+        """
+        parts = prompt if isinstance(prompt, list) else [prompt]
+        candidates = self._candidates(route, parts)
+        if hedge is None:
+            hedge = route in HEDGED_ROUTES
+
+        key = None
+        if coalesce and _text_only(parts):
+            key = hashlib.sha256(json.dumps([route, system, max_tokens, hedge, parts]).encode()).hexdigest()
+            with self._lock:
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._inflight[key] = Future()
+            if not leader:
+                COALESCED.inc(route=route)
+                return future.result()
+
+        try:
+            if hedge and len(candidates) > 1:
+                response = self._hedged(candidates, parts, system, max_tokens)
+            else:
+                response = self._failover(candidates, parts, system, max_tokens)
+        except BaseException as e:
+            if key:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.set_exception(e)
+            raise
+        if key:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(response)
+        return response
+
+    def stream(self, prompt: Prompt, route: str = "chat", system: Optional[str] = None,
+               max_tokens: Optional[int] = None, usage: Optional[Dict] = None,
+               hedge: Optional[bool] = None) -> Iterator[str]:
+        """
+        Stream a completion. Failover applies until the first chunk has been
+        yielded; after that a provider error propagates to the caller.
+
+        Args:
+            usage: Optional dict filled with tokens_in/tokens_out when done
+            hedge: Race a second candidate if no chunk arrives within
+                ``hedge_delay`` seconds (default: whether ``route`` is in
+                HEDGED_ROUTES)
+        """
+        parts = prompt if isinstance(prompt, list) else [prompt]
+        usage = usage if usage is not None else {}
+        candidates = self._candidates(route, parts)
+        if hedge is None:
+            hedge = route in HEDGED_ROUTES
+        if hedge and len(candidates) > 1:
+            yield from self._hedged_stream(candidates, parts, system, max_tokens, usage)
+        else:
+            yield from self._stream_failover(candidates, parts, system, max_tokens, usage)
+
+    def _stream_failover(self, candidates, parts, system, max_tokens, usage: Dict,
+                         served: Optional[Dict] = None) -> Iterator[str]:
+        """Stream from the first candidate that answers (``served`` gets its provider/model)."""
+        errors = []
+        for i, (provider, model, breaker) in enumerate(candidates):
+            if not breaker.allow():
+                SHORT_CIRCUITS.inc(provider=provider.name, model=model)
+                errors.append(f"{provider.name}/{model}: circuit open")
+                continue
+            if i > 0:
+                FAILOVERS.inc(provider=provider.name, model=model)
+            start = time.perf_counter()
+            started = False
+            try:
+                for text in provider.stream(model, parts, system, max_tokens, usage):
+                    if not started:
+                        FIRST_TOKEN_SECONDS.observe(time.perf_counter() - start,
+                                                    provider=provider.name, model=model)
+                        started = True
+                        if served is not None:
+                            served.update(provider=provider.name, model=model)
+                    yield text
+            except GeneratorExit:
+                # Consumer stopped reading; the provider was answering fine
+                self._record(provider, model, breaker, start, ok=True)
+                raise
+            except Exception as e:
+                self._record(provider, model, breaker, start, ok=False)
+                if started:
+                    raise
+                logger.warning(f"LLM {provider.name}/{model} stream failed: {str(e)[:200]}")
+                errors.append(f"{provider.name}/{model}: {e}")
+                continue
+            self._record(provider, model, breaker, start, ok=True)
+            return
+        raise LLMUnavailable("; ".join(errors))
+
+    @staticmethod
+    def _pump(chunks: Iterator[str], lane: int, events: "queue.Queue", cancel: threading.Event):
+        """Hedge worker: forward ``chunks`` as (lane, kind, value) events until done or cancelled."""
+        try:
+            for text in chunks:
+                events.put((lane, "chunk", text))
+                if cancel.is_set():
+                    break
+        except Exception as e:
+            events.put((lane, "error", e))
+            return
+        finally:
+            chunks.close()  # A cancelled lane records its call as answered
+        events.put((lane, "done", None))
+
+    def _hedged_stream(self, candidates, parts, system, max_tokens, usage: Dict) -> Iterator[str]:
+        """
+        Start the first candidate; if it hasn't sent a chunk within
+        ``hedge_delay`` (or fails first), race the rest against it. The
+        first lane to send a chunk is streamed; the other stops at its
+        next chunk.
+        """
+        events: "queue.Queue" = queue.Queue()
+        lanes: List[Tuple[threading.Event, Dict, Dict]] = []  # (cancel, usage, served)
+
+        def launch(lane_candidates):
+            lane = (threading.Event(), {}, {})
+            chunks = self._stream_failover(lane_candidates, parts, system, max_tokens,
+                                           lane[1], served=lane[2])
+            threading.Thread(target=self._pump, args=(chunks, len(lanes), events, lane[0]),
+                             name="llm-hedge", daemon=True).start()
+            lanes.append(lane)
+
+        launch(candidates[:1])
+        deadline = time.monotonic() + self.hedge_delay
+        winner, kind, value, errors = None, None, None, []
+        try:
+            while winner is None:
+                try:
+                    timeout = None if len(lanes) > 1 else max(0.0, deadline - time.monotonic())
+                    lane, kind, value = events.get(timeout=timeout)
+                except queue.Empty:
+                    launch(candidates[1:])  # First chunk is late: hedge
+                    continue
+                if kind == "error":
+                    errors.append(str(value))
+                    if len(lanes) == 1:
+                        launch(candidates[1:])  # Failed before the delay: plain failover
+                    elif len(errors) == len(lanes):
+                        raise LLMUnavailable("; ".join(errors))
+                else:
+                    winner = lane  # First chunk (or an empty, finished response)
+
+            for lane, (cancel, _, _) in enumerate(lanes):
+                if lane != winner:
+                    cancel.set()
+            served = lanes[winner][2]
+            if len(lanes) > 1 and served:
+                HEDGES.inc(provider=served["provider"], model=served["model"])
+
+            while kind == "chunk":
+                yield value
+                lane, kind, value = events.get()
+                while lane != winner:
+                    lane, kind, value = events.get()
+            if kind == "error":
+                raise value
+            usage.update(lanes[winner][1])
+        finally:
+            for cancel, _, _ in lanes:
+                cancel.set()
+
+
+# ============================================================================
+# SHARED GATEWAY
+# ============================================================================
+
+def default_providers() -> Dict[str, Provider]:
+    """Providers whose API keys are configured (Claude's SDK importable; Gemini's is checked on first use)."""
+    providers: Dict[str, Provider] = {}
+    gemini_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+    if gemini_key:
+        try:
+            providers["gemini"] = GeminiProvider(gemini_key)
+        except Exception as e:
+            logger.warning(f"Gemini provider unavailable: {e}")
+    claude_key = os.getenv("ANTHROPIC_API_KEY")
+    if claude_key:
+        try:
+            providers["claude"] = ClaudeProvider(claude_key)
+        except Exception as e:
+            logger.warning(f"Claude provider unavailable: {e}")
+    return providers
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """Process-wide gateway (clients and breaker state are shared)."""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway(default_providers())
+        return _gateway
+
+
+def set_gateway(gateway: Optional[LLMGateway]):
+    """Replace the shared gateway (e.g. with stub providers in tests)."""
+    global _gateway
+    with _gateway_lock:
+        _gateway = gateway
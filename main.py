@@ -8,11 +8,16 @@ Endpoints:
 - POST /job/apply - Process job application
 - GET /job/status - Check application status
 - POST /chat - Chat with Trinity
+- POST /chat/stream - Chat with Trinity (Server-Sent Events)
 - GET /health - System health check
+- GET /health/history - System metric history
+- GET /metrics - Prometheus-style metrics
 """
 
 import os
+import json
 import psutil
+import time
 import sqlite3
 from typing import Optional
 from pathlib import Path
@@ -20,7 +25,7 @@ from datetime import datetime
 import re
 from fastapi import FastAPI, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -34,6 +39,9 @@ load_dotenv()
 # Import Trinity components
 from trinity_router import TrinityRouter
 from job_sniper import JobSniper
+from metrics_sampler import get_sampler
+from instrumentation import CONTENT_TYPE, histogram, render
+from llm_gateway import get_gateway
 from job_status import (
     init_job_status_db, add_job_status, update_job_status,
     get_jobs_by_status, check_duplicate_application, get_stats as get_job_stats
@@ -64,9 +72,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+HTTP_SECONDS = histogram("trinity_http_request_seconds", "Trinity API request latency")
+
+
+@app.middleware("http")
+async def time_requests(request, call_next):
+    """Record per-route request latency for /metrics"""
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    HTTP_SECONDS.observe(
+        time.perf_counter() - start,
+        method=request.method,
+        route=getattr(route, "path", "unmatched"),
+        status=str(response.status_code)
+    )
+    return response
+
 # Initialize systems
 trinity = TrinityRouter()
 job_sniper = JobSniper()
+metrics_sampler = get_sampler()
 
 # ============================================================================
 # AUTHENTICATION
@@ -119,15 +145,52 @@ async def root():
     }
 
 @app.get("/health")
-async def health_check():
-    """System health check"""
+async def health_check(window: int = 300):
+    """System health check (with rolling system metrics over ``window`` seconds)"""
     return {
         "status": "healthy",
         "cpu_priority": p.nice(),
         "memory_mb": psutil.Process().memory_info().rss / 1024 / 1024,
-        "uptime": "running"
+        "uptime": "running",
+        "system": metrics_sampler.summary(max(1, min(window, 86400))),
+        "llm": get_gateway().status()
     }
 
+@app.get("/health/history")
+async def health_history(window: int = 3600, points: int = 120, fields: Optional[str] = None):
+    """Downsampled system metric history for dashboards"""
+    return metrics_sampler.history(
+        max(1, min(window, 86400)),
+        points=max(1, min(points, 1000)),
+        fields=fields.split(",") if fields else None
+    )
+
+@app.get("/timeseries/{name}")
+async def timeseries_range(name: str, days: float = 30, resolution: str = "auto",
+                           agg: str = "mean", points: int = 3000,
+                           authenticated: bool = Depends(verify_password)):
+    """Range of a metric series (e.g. account.equity) for charts"""
+    from timeseries import AGGREGATES, RESOLUTIONS, get_store
+
+    if resolution not in ("auto", "raw", *RESOLUTIONS) or agg not in AGGREGATES:
+        raise HTTPException(status_code=400, detail="Unknown resolution or aggregate")
+    store = get_store()
+    end = time.time()
+    start = end - max(0.01, min(days, 3650)) * 86400
+    points = max(1, min(points, 10000))
+    if resolution == "auto":
+        resolution = store.pick_resolution(start, end, points)
+    try:
+        ts, values = store.range(name, start, end, resolution=resolution, agg=agg)
+    except ValueError as e:  # Text series (events) have no numeric range
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"series": name, "resolution": resolution, "ts": ts.tolist(), "values": values.tolist()}
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus-style metrics (request, LLM, scraper and SQLite latencies)"""
+    return PlainTextResponse(render(), media_type=CONTENT_TYPE)
+
 @app.post("/job/analyze")
 async def analyze_job(
     request: JobAnalysisRequest,
@@ -197,6 +260,39 @@ async def chat(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post("/chat/stream")
+def chat_stream(
+    request: ChatRequest,
+    authenticated: bool = Depends(verify_password)
+):
+    """
+    Chat with Trinity, streaming the response as Server-Sent Events.
+
+    Events: 'meta' {source}, then 'token' {text} per chunk, then 'done'
+    {length} (or 'error' {detail}).
+    """
+    source, chunks = trinity.stream_command(request.message, mode=request.mode)
+
+    def events():
+        yield _sse("meta", {"source": source})
+        length = 0
+        try:
+            for text in chunks:
+                length += len(text)
+                yield _sse("token", {"text": text})
+        except Exception as e:
+            yield _sse("error", {"detail": str(e)})
+            return
+        yield _sse("done", {"length": length})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"  # Don't let proxies buffer the stream
+    })
+
 @app.post("/job/approve")
 async def approve_application(
     request: ApprovalRequest,
@@ -215,14 +311,14 @@ async def approve_application(
     }
 
 @app.get("/job/stats")
-async def job_stats(authenticated: bool = Depends(verify_password)):
-    """Get job application statistics"""
-    from job_sniper import get_daily_application_count
-    import sqlite3
-    from pathlib import Path
+async def job_stats(days: float = 7, authenticated: bool = Depends(verify_password)):
+    """Get job application statistics (stage latency over the last ``days``)"""
+    from safety_config import MAX_DAILY_APPLICATIONS, check_rate_limit
+    from instrumentation import sqlite_connect
+    from job_trace import stage_stats
 
     db_path = Path(__file__).parent / "job_logs" / "applications.db"
-    conn = sqlite3.connect(db_path)
+    conn = sqlite_connect(db_path, "applications")
     cursor = conn.cursor()
 
     cursor.execute("SELECT COUNT(*) FROM applications")
@@ -236,8 +332,9 @@ async def job_stats(authenticated: bool = Depends(verify_password)):
     return {
         "total_applications": total,
         "pending_approvals": pending,
-        "applications_today": get_daily_application_count(),
-        "daily_limit": 3
+        "applications_today": check_rate_limit()["daily_count"],  # Rolling 24h
+        "daily_limit": MAX_DAILY_APPLICATIONS,
+        "stage_latency": stage_stats(max(0.01, min(days, 365)), db_path)
     }
 
 # ============================================================================
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Trinity Mesh LOD Pipeline
+
+Post-compile mesh stage for VR model delivery (pure NumPy, CPU only):
+- Parse binary/ASCII STL into vertex + face arrays
+- Deduplicate shared vertices
+- Vertex-clustering decimation to target triangle ratios
+- Per-model LOD manifest (triangle counts, files) for /api/models
+
+The Quest loads the smallest LOD first and refines to higher levels.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from stl_tools import BINARY_HEADER, COUNT_STRUCT, atomic_write_bytes, is_binary_stl
+
+# LOD levels as percent of the full triangle count
+LOD_LEVELS = (100, 25, 5)
+
+# Quest 1 comfort budget (matches the generate_scad_code VR prompt)
+VR_TRIANGLE_BUDGET = 5000
+
+STL_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attr', '<u2')
+])
+
+# Never decimate below this many triangles (a box is 12)
+MIN_LOD_TRIANGLES = 12
+
+# Decimation search settings
+_SEARCH_STEPS = 18
+_MIN_CELL_FRACTION = 2.0 ** -20  # Keeps cluster keys well inside int64
+
+_VERTEX_RE = re.compile(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)')
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def load_triangles(path: Path) -> np.ndarray:
+    """Load an STL file as an (M, 3, 3) float32 triangle array."""
+    if is_binary_stl(path):
+        data = path.read_bytes()
+        (count,) = COUNT_STRUCT.unpack_from(data, 80)
+        records = np.frombuffer(data, dtype=STL_DTYPE, count=count, offset=84)
+        return records['vertices']
+
+    # Normals are recomputed on output, so only vertex lines matter
+    coords = _VERTEX_RE.findall(path.read_bytes())
+    if len(coords) % 3:
+        raise ValueError("Malformed ASCII STL: incomplete facet")
+    return np.array(coords, dtype=np.float32).reshape(-1, 3, 3)
+
+
+def _row_keys(rows: np.ndarray) -> np.ndarray:
+    """View each row of a C-contiguous 2D array as a single opaque key."""
+    rows = np.ascontiguousarray(rows)
+    return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
+
+
+def dedupe_vertices(triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a triangle soup into shared vertices + face indices.
+
+    Returns:
+        (vertices (N, 3) float32, faces (M, 3) int64)
+    """
+    # + 0.0 folds -0.0 into 0.0 so byte-wise keys compare correctly
+    flat = np.ascontiguousarray(triangles.reshape(-1, 3), dtype=np.float32) + np.float32(0.0)
+    _, first, inverse = np.unique(_row_keys(flat), return_index=True, return_inverse=True)
+    return flat[first], inverse.reshape(-1, 3).astype(np.int64)
+
+
+def load_mesh(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Load an STL file as deduplicated (vertices, faces)."""
+    return dedupe_vertices(load_triangles(path))
+
+
+# ============================================================================
+# DECIMATION
+# ============================================================================
+
+def _compact(vertices: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Drop degenerate/duplicate faces and unreferenced vertices."""
+    a, b, c = faces[:, 0], faces[:, 1], faces[:, 2]
+    faces = faces[(a != b) & (b != c) & (a != c)]
+    if len(faces) == 0:
+        return vertices[:0], faces
+
+    _, keep = np.unique(_row_keys(np.sort(faces, axis=1)), return_index=True)
+    faces = faces[np.sort(keep)]
+
+    used, remap = np.unique(faces, return_inverse=True)
+    return vertices[used], remap.reshape(-1, 3)
+
+
+def cluster_vertices(vertices: np.ndarray, faces: np.ndarray,
+                     cell_size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge all vertices that fall in the same grid cell.
+
+    Each cluster is replaced by the mean of its vertices; faces that
+    collapse are removed.
+    """
+    origin = vertices.min(axis=0)
+    cells = np.floor((vertices - origin) / cell_size).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+    _, cluster = np.unique(keys, return_inverse=True)
+    counts = np.bincount(cluster).astype(np.float64)
+    merged = np.empty((len(counts), 3), dtype=np.float32)
+    for axis in range(3):
+        merged[:, axis] = np.bincount(cluster, weights=vertices[:, axis]) / counts
+
+    return _compact(merged, cluster[faces])
+
+
+def decimate(vertices: np.ndarray, faces: np.ndarray,
+             ratio: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a mesh to roughly ``ratio`` of its triangles.
+
+    Binary-searches the clustering cell size for the largest mesh that
+    stays within the target triangle count. If every mesh within the
+    target is empty (all faces collapse at once), the coarsest non-empty
+    mesh seen is returned instead.
+    """
+    target = max(MIN_LOD_TRIANGLES, int(len(faces) * ratio))
+    if ratio >= 1.0 or target >= len(faces):
+        return vertices, faces
+
+    diagonal = float(np.linalg.norm(vertices.max(axis=0) - vertices.min(axis=0)))
+    if diagonal == 0.0:
+        return vertices, faces
+
+    lo, hi = np.log(diagonal * _MIN_CELL_FRACTION), np.log(diagonal)
+    best = None
+    coarsest = (vertices, faces)  # Fewest faces seen above the target
+    for _ in range(_SEARCH_STEPS):
+        mid = (lo + hi) / 2
+        v, f = cluster_vertices(vertices, faces, float(np.exp(mid)))
+        if len(f) <= target:
+            if len(f):
+                best = (v, f)
+            hi = mid  # Within budget (or collapsed): try finer cells
+        else:
+            if len(f) < len(coarsest[1]):
+                coarsest = (v, f)
+            lo = mid
+        if best is not None and len(best[1]) >= target * 0.9:
+            break
+
+    return best if best is not None else coarsest
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def face_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Unit normals for each face (zero for degenerate faces)."""
+    tri = vertices[faces]
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+
+def write_stl(vertices: np.ndarray, faces: np.ndarray, path: Path):
+    """Write a mesh as binary STL (atomically)."""
+    records = np.zeros(len(faces), dtype=STL_DTYPE)
+    records['normal'] = face_normals(vertices, faces)
+    records['vertices'] = vertices[faces]
+    atomic_write_bytes(path, BINARY_HEADER + COUNT_STRUCT.pack(len(faces)) + records.tobytes())
+
+
+# ============================================================================
+# LOD MANIFESTS
+# ============================================================================
+
+def lod_file(stl_path: Path, lod_dir: Path, level: int) -> Path:
+    """Path of a decimated LOD file."""
+    return lod_dir / f"{stl_path.stem}_lod{level}.stl"
+
+
+def manifest_file(stl_path: Path, lod_dir: Path) -> Path:
+    """Path of a model's LOD manifest."""
+    return lod_dir / f"{stl_path.stem}.json"
+
+
+def build_lods(stl_path: Path, lod_dir: Path, levels=LOD_LEVELS,
+               budget: int = VR_TRIANGLE_BUDGET) -> Dict:
+    """
+    Generate LOD variants for a model and write its manifest.
+
+    Level 100 is the source file itself; lower levels are written to
+    ``lod_dir``. ``recommended`` is the most detailed level that fits the
+    VR triangle budget (or the smallest level if none do).
+    """
+    lod_dir.mkdir(parents=True, exist_ok=True)
+    vertices, faces = load_mesh(stl_path)
+    source_stat = stl_path.stat()
+
+    lods = []
+    for level in sorted(levels, reverse=True):
+        if level >= 100:
+            lods.append({
+                'level': 100,
+                'file': stl_path.name,
+                'triangles': int(len(faces)),
+                'size': source_stat.st_size
+            })
+            continue
+
+        v, f = decimate(vertices, faces, level / 100)
+        out = lod_file(stl_path, lod_dir, level)
+        write_stl(v, f, out)
+        lods.append({
+            'level': level,
+            'file': f"{lod_dir.name}/{out.name}",
+            'triangles': int(len(f)),
+            'size': out.stat().st_size
+        })
+
+    within_budget = [lod for lod in lods if lod['triangles'] <= budget]
+    recommended = within_budget[0] if within_budget else lods[-1]
+
+    manifest = {
+        'source': stl_path.name,
+        'source_mtime': source_stat.st_mtime,
+        'triangles': int(len(faces)),
+        'vertices': int(len(vertices)),
+        'lods': lods,
+        'recommended': recommended['level']
+    }
+    atomic_write_bytes(manifest_file(stl_path, lod_dir), json.dumps(manifest, indent=2).encode())
+    return manifest
+
+
+def load_manifest(stl_path: Path, lod_dir: Path) -> Optional[Dict]:
+    """Load a model's manifest if it is up to date with the source."""
+    try:
+        manifest = json.loads(manifest_file(stl_path, lod_dir).read_text())
+        if manifest.get('source_mtime') == stl_path.stat().st_mtime:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def ensure_lods(stl_path: Path, lod_dir: Path) -> Dict:
+    """Return the model's LOD manifest, building it if missing or stale."""
+    return load_manifest(stl_path, lod_dir) or build_lods(stl_path, lod_dir)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Trinity Metrics Sampler
+
+Background system sampler with fixed-size history:
+- CPU, memory, disk and per-service RSS / open FD counts
+- Samples go into a preallocated NumPy ring buffer (no per-sample
+  allocation, constant memory)
+- Non-blocking CPU readings (cpu_percent(interval=None) measures since
+  the previous sample instead of sleeping for a second); readings over
+  less than MIN_CPU_INTERVAL (e.g. the sample right after start-up) are
+  recorded as missing rather than as noise
+- Rolling averages, percentiles and downsampled history for the API and
+  dashboards
+
+Usage:
+    sampler = get_sampler()          # Started on first use
+    sampler.summary(300)             # Last 5 minutes
+    sampler.history(3600, points=60)
+"""
+
+import threading
+import time
+import warnings
+from typing import Dict, List, Optional
+
+import numpy as np
+import psutil
+
+DEFAULT_INTERVAL = 2.0  # seconds between samples
+DEFAULT_CAPACITY = 1800  # samples kept (1 hour at the default interval)
+PROCESS_RESCAN_INTERVAL = 30.0  # seconds between lookups of missing services
+MIN_CPU_INTERVAL = 0.5  # seconds a CPU reading must span to be recorded
+
+# Service name → command-line fragment used to find its process
+SERVICE_PROCESSES = {
+    'vr_server': 'vr_server.py',
+    'command_center': 'trinity_app.py',
+    'trinity_api': 'main.py',
+    'clipboard_daemon': 'clipboard_daemon.py',
+    'scanner_service': 'scanner_service.py'
+}
+
+SYSTEM_FIELDS = ['cpu_percent', 'memory_percent', 'disk_percent']
+
+
+class MetricsSampler:
+    """Samples system and service metrics into a ring buffer."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, capacity: int = DEFAULT_CAPACITY,
+                 services: Optional[Dict[str, str]] = None, disk_path: str = '/'):
+        self.interval = interval
+        self.capacity = capacity
+        self.services = dict(SERVICE_PROCESSES if services is None else services)
+        self.disk_path = disk_path
+
+        self.fields = ['timestamp'] + SYSTEM_FIELDS
+        for name in self.services:
+            self.fields += [f'{name}.rss_mb', f'{name}.fds']
+        self._column = {name: i for i, name in enumerate(self.fields)}
+
+        self._buffer = np.full((capacity, len(self.fields)), np.nan)
+        self._next = 0  # Write position
+        self._count = 0  # Valid rows
+        self._lock = threading.Lock()
+
+        self._processes: Dict[str, Optional[psutil.Process]] = {name: None for name in self.services}
+        self._last_rescan = 0.0
+        self._thread = None
+        self._stop = threading.Event()
+
+        psutil.cpu_percent(interval=None)  # Prime: first real reading is since now
+        self._cpu_since = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def _find_processes(self):
+        """Resolve services whose process is unknown or gone (one scan)."""
+        missing = {name for name, proc in self._processes.items()
+                   if proc is None or not proc.is_running()}
+        if not missing:
+            return
+        for name in missing:
+            self._processes[name] = None
+        for proc in psutil.process_iter(['cmdline']):
+            cmdline = ' '.join(proc.info.get('cmdline') or ())
+            for name in list(missing):
+                if self.services[name] in cmdline:
+                    self._processes[name] = proc
+                    missing.discard(name)
+            if not missing:
+                break
+
+    def sample(self, now: Optional[float] = None):
+        """Take one sample and write it into the ring buffer."""
+        now = time.time() if now is None else now
+        if now - self._last_rescan >= PROCESS_RESCAN_INTERVAL or \
+                any(p is not None and not p.is_running() for p in self._processes.values()):
+            self._find_processes()
+            self._last_rescan = now
+
+        cpu = psutil.cpu_percent(interval=None)
+        cpu_clock = time.monotonic()
+        if cpu_clock - self._cpu_since < MIN_CPU_INTERVAL:
+            cpu = np.nan  # Too short a span to mean anything
+        self._cpu_since = cpu_clock
+        memory = psutil.virtual_memory().percent
+        disk = psutil.disk_usage(self.disk_path).percent
+
+        with self._lock:
+            row = self._buffer[self._next]  # View: written in place
+            row[0] = now
+            row[1] = cpu
+            row[2] = memory
+            row[3] = disk
+            column = 4
+            for name in self.services:
+                proc = self._processes[name]
+                rss = fds = np.nan
+                if proc is not None:
+                    try:
+                        with proc.oneshot():
+                            rss = proc.memory_info().rss / 1048576
+                            fds = proc.num_fds() if hasattr(proc, 'num_fds') else np.nan
+                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                        self._processes[name] = None
+                row[column] = rss
+                row[column + 1] = fds
+                column += 2
+
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def start(self):
+        """Start background sampling (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='metrics-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception:
+                pass  # Never let a transient psutil error kill the sampler
+            self._stop.wait(self.interval)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _window(self, seconds: Optional[float]) -> np.ndarray:
+        """Rows (oldest first) within the last ``seconds``."""
+        with self._lock:
+            if self._count < self.capacity:
+                rows = self._buffer[:self._count].copy()
+            else:
+                rows = np.concatenate([self._buffer[self._next:], self._buffer[:self._next]])
+        if seconds is not None and len(rows):
+            rows = rows[rows[:, 0] >= rows[-1, 0] - seconds]
+        return rows
+
+    def latest(self) -> Dict:
+        """Most recent sample as {field: value}."""
+        rows = self._window(0)
+        if not len(rows):
+            return {}
+        return self._row_dict(rows[-1])
+
+    def _row_dict(self, row: np.ndarray) -> Dict:
+        result = {'timestamp': float(row[0])}
+        services = {}
+        for field, value in zip(self.fields[1:], row[1:]):
+            value = None if np.isnan(value) else round(float(value), 2)
+            if '.' in field:
+                name, metric = field.split('.', 1)
+                services.setdefault(name, {})[metric] = value
+            else:
+                result[field] = value
+        result['services'] = services
+        return result
+
+    def summary(self, seconds: Optional[float] = 300) -> Dict:
+        """
+        Rolling statistics over the last ``seconds``.
+
+        Returns:
+            {'window_seconds', 'samples', 'latest', 'fields': {field: {avg, p50, p95, max}}}
+        """
+        rows = self._window(seconds)
+        stats = {}
+        if len(rows):
+            values = rows[:, 1:]
+            valid = ~np.isnan(values).all(axis=0)
+            with np.errstate(all='ignore'):
+                avg = np.nanmean(values[:, valid], axis=0)
+                p50, p95 = np.nanpercentile(values[:, valid], [50, 95], axis=0)
+                peak = np.nanmax(values[:, valid], axis=0)
+            for i, field in enumerate(np.array(self.fields[1:])[valid]):
+                stats[field] = {
+                    'avg': round(float(avg[i]), 2),
+                    'p50': round(float(p50[i]), 2),
+                    'p95': round(float(p95[i]), 2),
+                    'max': round(float(peak[i]), 2)
+                }
+        return {
+            'window_seconds': seconds,
+            'samples': int(len(rows)),
+            'interval': self.interval,
+            'latest': self._row_dict(rows[-1]) if len(rows) else {},
+            'fields': stats
+        }
+
+    def history(self, seconds: Optional[float] = 3600, points: int = 120,
+                fields: Optional[List[str]] = None) -> Dict:
+        """
+        Downsampled series for charts (bucket means).
+
+        Returns:
+            {'timestamp': [...], field: [...], ...}
+        """
+        rows = self._window(seconds)
+        fields = fields or SYSTEM_FIELDS
+        columns = [0] + [self._column[f] for f in fields if f in self._column]
+        names = ['timestamp'] + [f for f in fields if f in self._column]
+        if not len(rows):
+            return {name: [] for name in names}
+
+        buckets = np.array_split(rows[:, columns], min(points, len(rows)))
+        with np.errstate(all='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN bucket → None
+            means = np.array([np.nanmean(bucket, axis=0) for bucket in buckets])
+        return {
+            name: [None if np.isnan(v) else round(float(v), 2) for v in means[:, i]]
+            for i, name in enumerate(names)
+        }
+
+
+_sampler: Optional[MetricsSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_sampler(interval: float = DEFAULT_INTERVAL) -> MetricsSampler:
+    """Shared, already-running sampler for this process."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = MetricsSampler(interval=interval)
+            _sampler.sample()  # So callers have data immediately (CPU from the next tick)
+            _sampler.start()
+        return _sampler
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Trinity Model Catalog
+
+Indexed SQLite catalog of compiled CAD models, stored alongside them in
+``cad_output/.catalog.db``:
+- Written by the compile pipeline (with the source prompt)
+- Reconciled with the directory when it changes (new/removed files)
+- Paginated, sorted listing for /api/models without glob/stat per request
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from mesh_lod import ensure_lods
+
+CATALOG_FILENAME = ".catalog.db"
+
+# Sort keys exposed to API clients → indexed columns
+SORT_COLUMNS = {
+    'modified': 'mtime',
+    'name': 'name',
+    'size': 'size',
+    'triangles': 'triangles'
+}
+
+MAX_PAGE_SIZE = 500
+
+
+class ModelCatalog:
+    """SQLite-backed index of STL models in a CAD output directory."""
+
+    def __init__(self, models_dir: Path, db_path: Optional[Path] = None):
+        self.models_dir = models_dir
+        self.db_path = db_path or models_dir / CATALOG_FILENAME
+        self._lock = threading.Lock()
+        self._count = None
+        self._count_version = None
+
+        self.models_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=10)
+        self.conn.row_factory = sqlite3.Row
+        self._initialize_database()
+
+    def _initialize_database(self):
+        """Create the catalog schema."""
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS models (
+                    name TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    triangles INTEGER,
+                    recommended_lod INTEGER,
+                    lods TEXT,
+                    prompt TEXT,
+                    added REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_models_mtime ON models(mtime);
+                CREATE INDEX IF NOT EXISTS idx_models_size ON models(size);
+                CREATE INDEX IF NOT EXISTS idx_models_triangles ON models(triangles);
+            """)
+            self.conn.commit()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(self, stl_path: Path, prompt: Optional[str] = None,
+               manifest: Optional[Dict] = None):
+        """
+        Add or update a model entry.
+
+        Args:
+            stl_path: Compiled STL file inside ``models_dir``
+            prompt: Source prompt (kept from earlier records if omitted)
+            manifest: LOD manifest from mesh_lod (built if omitted)
+        """
+        st = stl_path.stat()
+        if manifest is None:
+            try:
+                manifest = ensure_lods(stl_path, self.models_dir / "lod")
+            except Exception:
+                manifest = None
+
+        triangles = manifest['triangles'] if manifest else None
+        recommended = manifest['recommended'] if manifest else None
+        lods = json.dumps(manifest['lods']) if manifest else None
+
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO models (name, size, mtime, triangles, recommended_lod, lods, prompt, added)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    size = excluded.size,
+                    mtime = excluded.mtime,
+                    triangles = excluded.triangles,
+                    recommended_lod = excluded.recommended_lod,
+                    lods = excluded.lods,
+                    prompt = COALESCE(excluded.prompt, models.prompt)
+            """, (stl_path.name, st.st_size, st.st_mtime, triangles, recommended,
+                  lods, prompt, time.time()))
+            self.conn.commit()
+
+    def remove(self, name: str):
+        """Remove a model entry."""
+        with self._lock:
+            self.conn.execute("DELETE FROM models WHERE name = ?", (name,))
+            self.conn.commit()
+
+    def sync(self) -> Dict:
+        """
+        Reconcile the catalog with the directory.
+
+        Only new or changed files are (re)indexed, so this is cheap to
+        call whenever the directory mtime moves.
+
+        Returns:
+            dict with 'added', 'updated', 'removed' counts
+        """
+        on_disk = {}
+        with os.scandir(self.models_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.stl') and entry.is_file():
+                    st = entry.stat()
+                    on_disk[entry.name] = (st.st_size, st.st_mtime)
+
+        with self._lock:
+            indexed = {
+                row['name']: (row['size'], row['mtime'])
+                for row in self.conn.execute("SELECT name, size, mtime FROM models")
+            }
+
+        stats = {'added': 0, 'updated': 0, 'removed': 0}
+        for name, signature in on_disk.items():
+            if name not in indexed:
+                stats['added'] += 1
+            elif indexed[name] != signature:
+                stats['updated'] += 1
+            else:
+                continue
+            try:
+                self.record(self.models_dir / name)
+            except OSError:
+                pass  # File vanished mid-sync; next sync removes it
+
+        for name in indexed.keys() - on_disk.keys():
+            self.remove(name)
+            stats['removed'] += 1
+
+        return stats
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        """
+        Number of cataloged models.
+
+        Cached and revalidated with ``PRAGMA data_version``, so repeated
+        calls don't scan the table unless some connection wrote to it.
+        """
+        with self._lock:
+            version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            # data_version only tracks *other* connections; our own writes
+            # go through total_changes
+            version = (version, self.conn.total_changes)
+            if self._count is None or version != self._count_version:
+                self._count = self.conn.execute("SELECT COUNT(*) FROM models").fetchone()[0]
+                self._count_version = version
+            return self._count
+
+    def list_models(self, offset: int = 0, limit: int = 100, sort: str = 'modified',
+                    descending: bool = True) -> Tuple[int, List[Dict]]:
+        """
+        Return one page of models.
+
+        Args:
+            offset: Rows to skip
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            sort: One of SORT_COLUMNS
+            descending: Sort direction
+
+        Returns:
+            (total model count, list of model dicts)
+        """
+        column = SORT_COLUMNS.get(sort, 'mtime')
+        direction = 'DESC' if descending else 'ASC'
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        offset = max(0, offset)
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM models ORDER BY {column} {direction}, name {direction} LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+
+        return self.count(), [self._row_to_model(row) for row in rows]
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Return a single model entry."""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM models WHERE name = ?", (name,)).fetchone()
+        return self._row_to_model(row) if row else None
+
+    def _row_to_model(self, row: sqlite3.Row) -> Dict:
+        """Convert a catalog row to the /api/models JSON shape."""
+        model = {
+            'name': row['name'],
+            'path': f"/cad_output/{row['name']}",
+            'size': row['size'],
+            'modified': row['mtime'],
+            'prompt': row['prompt']
+        }
+        if row['lods']:
+            model['triangles'] = row['triangles']
+            model['recommended_lod'] = row['recommended_lod']
+            model['lods'] = [
+                {
+                    'level': lod['level'],
+                    'path': f"/cad_output/{lod['file']}",
+                    'triangles': lod['triangles'],
+                    'size': lod['size']
+                }
+                for lod in json.loads(row['lods'])
+            ]
+        return model
+
+
+_catalogs: Dict[Path, ModelCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(models_dir: Path) -> ModelCatalog:
+    """Get the shared catalog instance for a models directory."""
+    key = models_dir.resolve()
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = ModelCatalog(models_dir)
+        return _catalogs[key]
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Trinity Monte-Carlo Projections
+
+Vectorised simulation behind the Financial Hub's 10-year plan:
+- Monthly returns bootstrapped from Phoenix's per-trade returns (a
+  Poisson number of trades per month, each drawn with replacement);
+  a plan-based assumption stands in until enough trades exist
+- Monthly contributions and burn drawn around their planned means
+- Every path advances one month per step as a NumPy vector, so thousands
+  of 10-year paths take a fraction of a second
+- P5/P50/P95 capital paths, yearly percentiles, probability of reaching a
+  target and of running the account to zero
+- Results cached per parameter set and return pool
+
+Usage:
+    pool, source = returns_pool(stats)
+    projection = project(ProjectionParams(start_capital=40000), pool)
+    projection.percentiles[50][-1], projection.prob_above(2_970_000)
+"""
+
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from instrumentation import counter, histogram
+
+PERCENTILES = (5, 50, 95)
+MIN_BOOTSTRAP_TRADES = 20  # Phoenix trades needed before its returns are resampled
+CACHE_SIZE = int(os.getenv("TRINITY_PROJECTION_CACHE", 32))  # Parameter sets kept
+MONTH_CHUNK = 12  # Months of trade draws generated per NumPy call (bounds memory)
+POISSON_TABLE_MAX_RATE = 100.0  # Above this, exp(-rate) heads for underflow (~745): use NumPy
+
+# Plan assumption used until Phoenix has a track record: 1% risk at 2R
+# with a 40% win rate is ~1.6%/month at 8 trades, in line with the ~20%
+# yearly trading gains of the conservative flywheel
+ASSUMED_RISK_PCT = 1.0
+ASSUMED_R_MULTIPLE = 2.0
+ASSUMED_WIN_RATE = 0.40
+
+PROJECTION_SECONDS = histogram("trinity_projection_seconds", "Monte-Carlo projection run time",
+                               buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5))
+PROJECTION_CACHE = counter("trinity_projection_cache_total", "Monte-Carlo projection cache lookups")
+
+
+@dataclass(frozen=True)
+class ProjectionParams:
+    """One simulation setup (hashable, so it keys the result cache)."""
+    start_capital: float = 40000.0
+    months: int = 120
+    monthly_contribution: float = 1000.0  # Savings + signal revenue added each month
+    contribution_vol: float = 0.25  # Std of the contribution, as a fraction of its mean
+    monthly_burn: float = 0.0  # Withdrawn from the account each month
+    burn_vol: float = 0.10
+    trades_per_month: float = 8.0  # Poisson mean
+    return_scale: float = 1.0  # Multiplier on resampled returns (e.g. a larger risk setting)
+    paths: int = 5000
+    seed: int = 0
+
+
+@dataclass
+class Projection:
+    """Percentile paths and outcome distribution of one simulation."""
+    params: ProjectionParams
+    source: str  # Where the return pool came from
+    percentiles: Dict[int, np.ndarray]  # Percentile -> capital at months 0..N
+    final: np.ndarray  # Capital at the horizon, per path
+    prob_ruin: float  # Share of paths that hit zero at some point
+    seconds: float = 0.0
+    months: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def prob_above(self, target: float) -> float:
+        """Share of paths ending at or above ``target``."""
+        return float(np.mean(self.final >= target))
+
+    def yearly(self) -> List[Tuple[int, float, float, float]]:
+        """(year, P5, P50, P95) capital at the end of each full year."""
+        rows = []
+        for month in range(12, self.params.months + 1, 12):
+            rows.append((month // 12, *(float(self.percentiles[p][month]) for p in PERCENTILES)))
+        return rows
+
+
+def assumed_returns(win_rate: float = ASSUMED_WIN_RATE, risk_pct: float = ASSUMED_RISK_PCT,
+                    r_multiple: float = ASSUMED_R_MULTIPLE) -> np.ndarray:
+    """Per-trade return pool for a fixed-risk strategy (100 trades at ``win_rate``)."""
+    wins = int(round(win_rate * 100))
+    return np.concatenate((np.full(wins, risk_pct * r_multiple / 100),
+                           np.full(100 - wins, -risk_pct / 100)))
+
+
+def returns_pool(stats) -> Tuple[np.ndarray, str]:
+    """
+    Per-trade returns to resample: Phoenix's own once it has
+    MIN_BOOTSTRAP_TRADES, otherwise the plan assumption.
+
+    Returns:
+        (returns, source label)
+    """
+    returns = getattr(stats, 'returns', np.empty(0))
+    if len(returns) >= MIN_BOOTSTRAP_TRADES:
+        return np.asarray(returns, dtype=np.float64), f"Phoenix ({len(returns)} trades)"
+    return assumed_returns(), "plan assumption"
+
+
+def trades_per_month(stats, default: float = ProjectionParams.trades_per_month) -> float:
+    """Phoenix's observed trade frequency, or ``default`` without a track record."""
+    if stats.trades < MIN_BOOTSTRAP_TRADES or stats.days_trading <= 0:
+        return default
+    return stats.trades / stats.days_trading * 30.44
+
+
+def _poisson(rng: np.random.Generator, rate: float, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Poisson counts by inverting the CDF (several times faster than
+    Generator.poisson at trading-frequency rates); large rates, whose pmf
+    would start from an underflowed exp(-rate), go to Generator.poisson.
+    """
+    if rate > POISSON_TABLE_MAX_RATE:
+        return rng.poisson(rate, shape).astype(np.int64)
+    pmf = [math.exp(-rate)]
+    while sum(pmf) < 1 - 1e-12 and len(pmf) < 10 * rate + 50:
+        pmf.append(pmf[-1] * rate / len(pmf))
+    return np.searchsorted(np.cumsum(pmf), rng.random(shape), side='right').astype(np.int64)
+
+
+def _monthly_growth(rng: np.random.Generator, log_pool: np.ndarray, paths: int,
+                    months: int, rate: float) -> np.ndarray:
+    """
+    (months, paths) growth factors: each month draws its trades from the
+    pool in one flat batch, and a running sum differenced at the month
+    boundaries gives every month's total log return.
+    """
+    growth = np.empty((months, paths))
+    for start in range(0, months, MONTH_CHUNK):
+        span = min(MONTH_CHUNK, months - start)
+        ends = np.cumsum(_poisson(rng, rate, (span, paths)).ravel())
+        draws = log_pool[rng.integers(0, len(log_pool), int(ends[-1]), dtype=np.int32)]
+        running = np.concatenate(([0.0], np.cumsum(draws)))[ends]
+        totals = np.diff(running, prepend=0.0)
+        growth[start:start + span] = np.exp(totals).reshape(span, paths)
+    return growth
+
+
+def simulate(params: ProjectionParams, pool: np.ndarray, source: str = "") -> Projection:
+    """Run ``params.paths`` capital paths over ``params.months`` (uncached)."""
+    started = time.perf_counter()
+    rng = np.random.default_rng(params.seed)
+    paths, months = params.paths, params.months
+
+    # Losses beyond -100% would make log1p undefined; a trade can't lose more than the account
+    log_pool = np.log1p(np.clip(np.asarray(pool, dtype=np.float64) * params.return_scale, -0.999999, None))
+    growth = _monthly_growth(rng, log_pool, paths, months, params.trades_per_month)
+    contributions = np.clip(rng.normal(params.monthly_contribution,
+                                       params.contribution_vol * abs(params.monthly_contribution),
+                                       (months, paths)), 0, None)
+    burn = np.clip(rng.normal(params.monthly_burn, params.burn_vol * abs(params.monthly_burn),
+                              (months, paths)), 0, None)
+    flows = contributions - burn
+
+    capital = np.empty((months + 1, paths))
+    capital[0] = params.start_capital
+    for month in range(months):
+        np.maximum(capital[month] * growth[month] + flows[month], 0.0, out=capital[month + 1])
+
+    bands = np.percentile(capital, PERCENTILES, axis=1)
+    seconds = time.perf_counter() - started
+    PROJECTION_SECONDS.observe(seconds)
+    return Projection(
+        params=params,
+        source=source,
+        percentiles={p: bands[i] for i, p in enumerate(PERCENTILES)},
+        final=capital[-1].copy(),
+        prob_ruin=float(np.mean((capital[1:] <= 0).any(axis=0))),
+        seconds=seconds,
+        months=np.arange(months + 1)
+    )
+
+
+# ============================================================================
+# CACHED PROJECTIONS
+# ============================================================================
+
+_cache: 'OrderedDict[Tuple, Projection]' = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def project(params: ProjectionParams, pool: Optional[np.ndarray] = None, source: str = "") -> Projection:
+    """
+    Cached simulate(): one run per (parameters, return pool), so Streamlit
+    reruns and revisited scenarios are instant.
+    """
+    if pool is None:
+        pool, source = assumed_returns(), source or "plan assumption"
+    pool = np.ascontiguousarray(pool, dtype=np.float64)
+    key = (params, hashlib.sha1(pool.tobytes()).hexdigest())
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            PROJECTION_CACHE.inc(result="hit")
+            return _cache[key]
+    PROJECTION_CACHE.inc(result="miss")
+
+    projection = simulate(params, pool, source)
+    with _cache_lock:
+        _cache[key] = projection
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return projection
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Trinity Plan Documents
+
+Lazy access to the large markdown plans shown in the hubs:
+- Each file is scanned once into a section index (heading → byte
+  offsets, fenced code blocks skipped); nothing else is kept in memory
+- The index is cached by mtime/size; when a file only grew (an appended
+  log entry) and its indexed tail is unchanged, just the last section
+  and the new bytes are re-scanned
+- Sections, the opening window and arbitrary byte windows are read with
+  a seek, so a tab showing 5 KB of a 100 KB plan reads 5 KB
+
+Usage:
+    plan = get_plan_library().get(BASE_DIR / "MASTER_DECADE_PLAN_MONTHLY.md")
+    plan.head(5000)
+    plan.section("YEAR 1: IGNITION")
+"""
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from instrumentation import counter
+
+HEAD_BYTES = 5000  # Default preview window
+HEADING = re.compile(rb'^(#{1,6})[ \t]+(.*?)[ \t#]*\r?$')
+FENCE = re.compile(rb'^[ \t]{0,3}(`{3,}|~{3,})')
+
+PLAN_INDEX = counter("trinity_plan_index_total", "Plan document index lookups by result")
+
+
+def clean_title(raw: str) -> str:
+    """Heading text without emphasis markers (``**YEAR 1**`` → ``YEAR 1``)."""
+    return re.sub(r'[*_`]+', '', raw).strip()
+
+
+@dataclass
+class Section:
+    """One heading and the byte range it covers (subsections included)."""
+    title: str
+    level: int
+    offset: int  # Start of the heading line
+    body: int  # First byte after the heading line
+    end: int  # Next heading of the same or a higher level, or EOF
+    parent: Optional[int] = None  # Index of the enclosing section
+
+
+class PlanDocument:
+    """Section index of one markdown file; text is read on demand."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.sections: List[Section] = []
+        self.size = 0
+        self.mtime_ns = 0
+        self._tail_digest = b''  # sha1 of bytes from the last heading to EOF
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def refresh(self, mtime_ns: int, size: int) -> str:
+        """
+        Bring the index up to date with the file on disk.
+
+        Returns:
+            'full' or 'incremental'
+        """
+        with open(self.path, 'rb') as f:
+            mode = 'full'
+            if self.sections and size > self.size:
+                last = self.sections[-1]
+                f.seek(last.offset)
+                if hashlib.sha1(f.read(self.size - last.offset)).digest() == self._tail_digest:
+                    # Appended: re-scan from the last heading, which is still open
+                    mode = 'incremental'
+                    del self.sections[-1]
+                    self._scan(f, last.offset, last.parent)
+            if mode == 'full':
+                self.sections = []
+                self._scan(f, 0, None)
+            tail = self.sections[-1].offset if self.sections else 0
+            f.seek(tail)
+            self._tail_digest = hashlib.sha1(f.read(size - tail)).digest()
+        self.size, self.mtime_ns = size, mtime_ns
+        return mode
+
+    def _scan(self, f, start: int, open_section: Optional[int]):
+        """Index headings from ``start`` (a heading line, or 0); ``open_section`` is the innermost open one."""
+        f.seek(start)
+        pos, fence = start, None
+        for line in f:
+            fenced = FENCE.match(line)
+            if fenced:
+                marker = fenced.group(1)
+                if fence is None:
+                    fence = marker[:1] * 3
+                elif marker.startswith(fence):
+                    fence = None
+            elif fence is None:
+                heading = HEADING.match(line.rstrip(b'\n'))
+                if heading:
+                    level = len(heading.group(1))
+                    # Close every open section at this level or deeper
+                    while open_section is not None and self.sections[open_section].level >= level:
+                        self.sections[open_section].end = pos
+                        open_section = self.sections[open_section].parent
+                    self.sections.append(Section(
+                        title=clean_title(heading.group(2).decode('utf-8', errors='replace')),
+                        level=level, offset=pos, body=pos + len(line), end=-1, parent=open_section
+                    ))
+                    open_section = len(self.sections) - 1
+            pos += len(line)
+        while open_section is not None:
+            self.sections[open_section].end = pos
+            open_section = self.sections[open_section].parent
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Text of bytes ``start``..``end`` (a character cut at a window edge is dropped)."""
+        end = self.size if end is None else min(end, self.size)
+        if end <= start:
+            return ''
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            return f.read(end - start).decode('utf-8', errors='ignore')
+
+    def head(self, limit: int = HEAD_BYTES) -> str:
+        """Opening window of the document."""
+        return self.read(0, limit)
+
+    def window(self, start: int, limit: int = HEAD_BYTES) -> str:
+        """``limit`` bytes from ``start``."""
+        return self.read(start, start + limit)
+
+    def text(self) -> str:
+        """Whole document."""
+        return self.read()
+
+    @property
+    def truncated(self) -> bool:
+        """Whether head() leaves part of the document out."""
+        return self.size > HEAD_BYTES
+
+    def outline(self, max_level: int = 6) -> List[Section]:
+        return [s for s in self.sections if s.level <= max_level]
+
+    def find(self, query: str) -> Optional[Section]:
+        """First section whose title equals, else contains, ``query`` (case-insensitive)."""
+        query = clean_title(query).lower()
+        for match in (lambda t: t == query, lambda t: query in t):
+            for section in self.sections:
+                if match(section.title.lower()):
+                    return section
+        return None
+
+    def section(self, title: str, limit: Optional[int] = None) -> Optional[str]:
+        """Text of the section titled ``title`` (heading included), or None."""
+        section = self.find(title)
+        if section is None:
+            return None
+        end = section.end if limit is None else min(section.end, section.offset + limit)
+        return self.read(section.offset, end)
+
+
+# ============================================================================
+# SHARED LIBRARY
+# ============================================================================
+
+class PlanLibrary:
+    """Plan documents cached by path, re-indexed when mtime/size change."""
+
+    def __init__(self):
+        self._documents: Dict[str, PlanDocument] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> Optional[PlanDocument]:
+        """Indexed document for ``path``; None if the file is missing."""
+        try:
+            st = Path(path).stat()
+        except OSError:
+            PLAN_INDEX.inc(result="missing")
+            return None
+        key = str(path)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None:
+                document = self._documents[key] = PlanDocument(path)
+            if (document.mtime_ns, document.size) == (st.st_mtime_ns, st.st_size) and document.mtime_ns:
+                PLAN_INDEX.inc(result="hit")
+                return document
+            try:
+                PLAN_INDEX.inc(result=document.refresh(st.st_mtime_ns, st.st_size))
+            except OSError:
+                del self._documents[key]
+                PLAN_INDEX.inc(result="missing")
+                return None
+            return document
+
+
+_library: Optional[PlanLibrary] = None
+_shared_lock = threading.Lock()
+
+
+def get_plan_library() -> PlanLibrary:
+    """Process-wide plan library (shares the section indexes)."""
+    global _library
+    with _shared_lock:
+        if _library is None:
+            _library = PlanLibrary()
+        return _library
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Trinity Prompt Builder
+
+Prompt assembly for the AI Assistant:
+- Stable prefix (persona + profile + preferences) rendered once and cached
+  until the memory's profile version changes; its content hash versions
+  the prefix so the provider's implicit context caching keeps hitting
+- Per-message sections (recent decisions, chat history, attachments, the
+  message itself) fitted to a token budget by priority
+- The prefix goes out as the system instruction, so the gateway reuses one
+  Gemini model per prefix version
+
+Usage:
+    builder = get_prompt_builder()
+    prompt = builder.build(memory, chat_history, user_message, attachments)
+    get_gateway().stream(prompt.parts, route="chat", system=prompt.prefix.text)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from instrumentation import counter, histogram
+
+DEFAULT_BUDGET = int(os.getenv("TRINITY_PROMPT_BUDGET", 8000))  # Estimated tokens per request
+PREFIX_BUDGET = int(os.getenv("TRINITY_PREFIX_BUDGET", 2500))  # Cap for the cached prefix
+HISTORY_TURNS = 10
+HISTORY_MESSAGE_CHARS = 200
+RECENT_DECISIONS = 5
+IMAGE_TOKENS = 258  # Gemini's flat per-image charge
+MIN_SECTION_TOKENS = 50  # Don't bother truncating a section below this
+
+# Lower priority value = kept first when over budget
+PRIORITY_MESSAGE = 0
+PRIORITY_ATTACHMENTS = 1
+PRIORITY_HISTORY = 2
+PRIORITY_DECISIONS = 3
+
+PERSONA = """You are Trinity, an advanced AI assistant with military-grade personalized intelligence.
+
+CAPABILITIES:
+- Career Station: Job hunting automation and tracking
+- Engineering Station: CAD/3D modeling with OpenSCAD
+- Trading Station: Algorithmic trading with Phoenix Mark XII Genesis V2 (validated champion)
+- Memory System: Long-term memory, preference learning, decision tracking
+
+INSTRUCTIONS:
+- Use the user profile and preferences to provide highly personalized responses
+- Reference past decisions and patterns when relevant
+- Provide context-aware suggestions based on learned behavior
+- Be thorough and insightful when analyzing files
+- Always maintain privacy and security of personal data"""
+
+PROMPT_TOKENS = histogram("trinity_prompt_tokens", "Estimated AI Assistant prompt tokens",
+                          buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000))
+PREFIX_CACHE = counter("trinity_prompt_prefix_cache_total", "Prompt prefix cache lookups")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def _compact(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(',', ':'), sort_keys=True, default=str)
+
+
+@dataclass
+class Prefix:
+    """Rendered stable prefix; ``version`` is its content hash."""
+    text: str
+    version: str
+    tokens: int
+
+
+def static_prefix(text: str) -> Prefix:
+    """Prefix for a fixed system prompt (e.g. a persona with no memory)."""
+    return Prefix(text, hashlib.sha1(text.encode()).hexdigest()[:12], estimate_tokens(text))
+
+
+@dataclass
+class Section:
+    """One per-message block of the prompt."""
+    name: str
+    text: str
+    priority: int
+    keep_tail: bool = False  # Truncate from the front (newest content is last)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+    def truncated(self, tokens: int) -> 'Section':
+        chars = tokens * 4
+        if self.keep_tail:
+            text = self.text[-chars:]
+            newline = text.find('\n')
+            if 0 <= newline < len(text) - 1:
+                text = text[newline + 1:]  # Don't start mid-line
+            text = "[earlier content omitted]\n" + text
+        else:
+            text = self.text[:chars] + "\n[truncated]"
+        return Section(self.name, text, self.priority, self.keep_tail)
+
+
+@dataclass
+class Prompt:
+    """Assembled request: cached prefix plus budgeted per-message parts."""
+    prefix: Prefix
+    parts: List[Any]
+    tokens: int
+    truncated: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+
+
+class PromptBuilder:
+    """Builds budgeted prompts around a memory-versioned cached prefix."""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET, prefix_budget: int = PREFIX_BUDGET,
+                 persona: str = PERSONA):
+        self.budget = budget
+        self.prefix_budget = prefix_budget
+        self.persona = persona
+        self._lock = threading.Lock()
+        self._prefix: Optional[Prefix] = None
+        self._prefix_key = None
+
+    # ------------------------------------------------------------------
+    # Stable prefix
+    # ------------------------------------------------------------------
+
+    def prefix(self, memory) -> Prefix:
+        """Cached prefix, re-rendered only when the memory's profile changed."""
+        key = (id(memory), memory.profile_version())
+        with self._lock:
+            if self._prefix is not None and key == self._prefix_key:
+                PREFIX_CACHE.inc(result="hit")
+                return self._prefix
+        PREFIX_CACHE.inc(result="miss")
+        prefix = self.render_prefix(memory.get_full_profile(), memory.get_all_preferences())
+        with self._lock:
+            self._prefix, self._prefix_key = prefix, key
+        return prefix
+
+    def render_prefix(self, profile: Dict, preferences: Dict) -> Prefix:
+        """
+        Persona, profile and preferences as compact, deterministically
+        ordered lines (no timestamps or confidence scores, which change
+        on every reinforcement without changing meaning).
+        """
+        remaining = self.prefix_budget - estimate_tokens(self.persona)
+
+        profile_lines = []
+        for category in sorted(profile):
+            for key in sorted(profile[category]):
+                line = f"- {category}.{key}: {_compact(profile[category][key]['value'])}"
+                cost = estimate_tokens(line) + 1
+                if cost > remaining:
+                    continue
+                remaining -= cost
+                profile_lines.append(line)
+
+        # Highest-confidence preferences win the remaining budget; the kept
+        # set is then rendered in key order so it is stable
+        flat = []
+        for station, categories in preferences.items():
+            for category, entries in categories.items():
+                for key, entry in entries.items():
+                    flat.append((-entry.get('confidence', 0), station, category, key, entry['value']))
+        kept = []
+        for _, station, category, key, value in sorted(flat, key=lambda p: p[:4]):
+            line = f"- {station}.{category}.{key}: {_compact(value)}"
+            cost = estimate_tokens(line) + 1
+            if cost > remaining:
+                continue
+            remaining -= cost
+            kept.append(line)
+        kept.sort()
+
+        text = "\n\n".join([
+            self.persona,
+            "USER PROFILE:\n" + ("\n".join(profile_lines) or "No profile data yet"),
+            "LEARNED PREFERENCES:\n" + ("\n".join(kept) or "Learning user preferences...")
+        ])
+        return static_prefix(text)
+
+    # ------------------------------------------------------------------
+    # Per-message sections
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def history_section(chat_history: List[Dict], user_message: str) -> Optional[Section]:
+        history = list(chat_history or [])[-(HISTORY_TURNS + 1):]
+        # The UI appends the current message before asking; it's sent separately
+        if history and history[-1].get('role') == 'user' and history[-1].get('content') == user_message:
+            history.pop()
+        history = history[-HISTORY_TURNS:]
+        if not history:
+            return None
+        lines = [f"{m['role'].title()}: {m['content'][:HISTORY_MESSAGE_CHARS]}" for m in history]
+        return Section("history", "Previous conversation:\n" + "\n".join(lines),
+                       PRIORITY_HISTORY, keep_tail=True)
+
+    @staticmethod
+    def decisions_section(decisions: List[Dict]) -> Optional[Section]:
+        if not decisions:
+            return None
+        lines = [f"- [{d['station']}] {d['decision_type']}: {d['decision']}" for d in decisions]
+        return Section("decisions", "RECENT DECISIONS:\n" + "\n".join(lines), PRIORITY_DECISIONS)
+
+    def build(self, memory, chat_history: List[Dict], user_message: str,
+              attachments: Optional[List[Any]] = None) -> Prompt:
+        """
+        Assemble a prompt within ``budget`` estimated tokens.
+
+        Args:
+            memory: TrinityMemory (profile, preferences, decisions)
+            chat_history: [{'role', 'content'}] oldest first
+            user_message: The message being answered (never dropped)
+            attachments: Text blocks and/or images (PIL) from uploaded files
+
+        Returns:
+            Prompt whose ``parts`` are sent with ``prefix.text`` as the
+            system instruction
+        """
+        prefix = self.prefix(memory)
+
+        # (order, section-or-image) so output keeps conversational order
+        blocks = []
+        decisions = self.decisions_section(memory.get_decisions(limit=RECENT_DECISIONS))
+        if decisions:
+            blocks.append(decisions)
+        history = self.history_section(chat_history, user_message)
+        if history:
+            blocks.append(history)
+        images = []
+        for i, attachment in enumerate(attachments or []):
+            if isinstance(attachment, str):
+                blocks.append(Section(f"attachment_{i}", attachment, PRIORITY_ATTACHMENTS))
+            else:
+                blocks.append(attachment)
+                images.append(attachment)
+        blocks.append(Section("message", f"User: {user_message}", PRIORITY_MESSAGE))
+
+        remaining = self.budget - prefix.tokens - IMAGE_TOKENS * len(images)
+        chosen: Dict[int, Any] = {}
+        truncated, dropped = [], []
+        sections = [(i, b) for i, b in enumerate(blocks) if isinstance(b, Section)]
+        for i, section in sorted(sections, key=lambda item: (item[1].priority, item[0])):
+            tokens = section.tokens
+            if tokens <= remaining or section.priority == PRIORITY_MESSAGE:
+                chosen[i] = section
+                remaining -= tokens
+            elif remaining >= MIN_SECTION_TOKENS:
+                chosen[i] = section.truncated(remaining)
+                remaining = 0
+                truncated.append(section.name)
+            else:
+                dropped.append(section.name)
+
+        parts = []
+        total = prefix.tokens
+        for i, block in enumerate(blocks):
+            if isinstance(block, Section):
+                if i in chosen:
+                    parts.append(chosen[i].text)
+                    total += chosen[i].tokens
+            else:
+                parts.append(block)
+                total += IMAGE_TOKENS
+
+        PROMPT_TOKENS.observe(total)
+        return Prompt(prefix, parts, total, truncated, dropped)
+
+
+# ============================================================================
+# SHARED INSTANCES
+# ============================================================================
+
+_builder: Optional[PromptBuilder] = None
+_shared_lock = threading.Lock()
+
+
+def get_prompt_builder() -> PromptBuilder:
+    """Process-wide prompt builder (shares the cached prefix)."""
+    global _builder
+    with _shared_lock:
+        if _builder is None:
+            _builder = PromptBuilder()
+        return _builder
+
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Trinity Rate Limiter
+
+Sliding-window application limits shared by the scanner, API and
+workers through one SQLite file:
+- Each window is a ring of fixed-size time buckets (e.g. 60 one-minute
+  buckets for the hourly cap), so a check sums a bounded number of rows
+  no matter how much history exists
+- Check-and-record runs in a single IMMEDIATE transaction, so parallel
+  workers in any process can never exceed a cap
+- Global windows (hour, day) plus per-company windows
+
+Buckets make the window edges slightly conservative: an application
+counts until its whole bucket has left the window.
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Window:
+    """A sliding window: at most ``limit`` events per ``seconds``."""
+    name: str
+    seconds: int
+    limit: int
+    buckets: int = 60
+    per_company: bool = False
+
+    @property
+    def bucket_seconds(self) -> float:
+        return self.seconds / self.buckets
+
+
+GLOBAL_SCOPE = '*'
+
+
+def company_scope(company: str) -> str:
+    """Scope key for per-company windows."""
+    return f"company:{' '.join(company.lower().split())}"
+
+
+class RateLimiter:
+    """SQLite-backed sliding-window rate limiter."""
+
+    def __init__(self, db_path: Path, windows: List[Window]):
+        self.db_path = db_path
+        self.windows = windows
+        self._lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=30,
+                                    isolation_level=None)
+        self._initialize_database()
+
+    def _initialize_database(self):
+        """Create the bucket table."""
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS rate_buckets (
+                    scope TEXT NOT NULL,
+                    window TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    count INTEGER NOT NULL,
+                    expires REAL NOT NULL,
+                    PRIMARY KEY (scope, window, bucket)
+                );
+                CREATE INDEX IF NOT EXISTS idx_rate_buckets_expires ON rate_buckets(expires);
+            """)
+
+    def _scopes(self, window: Window, company: Optional[str]) -> List[str]:
+        if not window.per_company:
+            return [GLOBAL_SCOPE]
+        return [company_scope(company)] if company else []
+
+    def _count(self, scope: str, window: Window, now: float) -> int:
+        current = int(now // window.bucket_seconds)
+        row = self.conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM rate_buckets "
+            "WHERE scope = ? AND window = ? AND bucket > ?",
+            (scope, window.name, current - window.buckets)
+        ).fetchone()
+        return row[0]
+
+    def _counts(self, company: Optional[str], now: float) -> Dict[str, int]:
+        counts = {}
+        for window in self.windows:
+            for scope in self._scopes(window, company):
+                counts[window.name] = self._count(scope, window, now)
+        return counts
+
+    def _add(self, company: Optional[str], now: float):
+        for window in self.windows:
+            bucket = int(now // window.bucket_seconds)
+            expires = (bucket + 1) * window.bucket_seconds + window.seconds
+            for scope in self._scopes(window, company):
+                self.conn.execute("""
+                    INSERT INTO rate_buckets (scope, window, bucket, count, expires)
+                    VALUES (?, ?, ?, 1, ?)
+                    ON CONFLICT(scope, window, bucket) DO UPDATE SET count = count + 1
+                """, (scope, window.name, bucket, expires))
+        self.conn.execute("DELETE FROM rate_buckets WHERE expires <= ?", (now,))
+
+    def _verdict(self, counts: Dict[str, int]) -> Dict:
+        result = {'allowed': True, 'counts': counts}
+        for window in self.windows:
+            count = counts.get(window.name)
+            if count is not None and count >= window.limit:
+                result['allowed'] = False
+                result['window'] = window.name
+                result['limit'] = window.limit
+                break
+        return result
+
+    def check(self, company: Optional[str] = None, now: Optional[float] = None) -> Dict:
+        """
+        Check limits without recording.
+
+        Returns:
+            dict with 'allowed', 'counts' ({window name: count}) and, when
+            blocked, the blocking 'window' and its 'limit'
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._verdict(self._counts(company, now))
+
+    def record(self, company: Optional[str] = None, now: Optional[float] = None):
+        """Record an event unconditionally."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._add(company, now)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def acquire(self, company: Optional[str] = None, now: Optional[float] = None) -> Dict:
+        """
+        Atomically check every window and record the event if allowed.
+
+        Returns the same dict as check(); counts include this event when
+        it was allowed, and 'acquired_at' is its timestamp (for release()).
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            # IMMEDIATE takes the write lock before counting, so no other
+            # process can slip an event in between check and record
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = self._verdict(self._counts(company, now))
+                if result['allowed']:
+                    self._add(company, now)
+                    result['counts'] = {name: count + 1 for name, count in result['counts'].items()}
+                    result['acquired_at'] = now
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            return result
+
+    def release(self, company: Optional[str], acquired_at: float):
+        """Undo one event recorded at ``acquired_at`` (e.g. a failed send)."""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for window in self.windows:
+                    bucket = int(acquired_at // window.bucket_seconds)
+                    for scope in self._scopes(window, company):
+                        self.conn.execute(
+                            "UPDATE rate_buckets SET count = count - 1 "
+                            "WHERE scope = ? AND window = ? AND bucket = ? AND count > 0",
+                            (scope, window.name, bucket)
+                        )
+                self.conn.execute("DELETE FROM rate_buckets WHERE count <= 0")
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def reset(self):
+        """Clear all recorded events."""
+        with self._lock:
+            self.conn.execute("DELETE FROM rate_buckets")
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM rate_buckets LIMIT 1").fetchone() is None
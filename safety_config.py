@@ -15,11 +15,16 @@ Multi-layer safety system:
 
 import os
 import json
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+from blacklist import get_blacklist, normalize_company
+from rate_limiter import RateLimiter, Window
+from state_store import get_store
+
 load_dotenv()
 
 # ============================================================================
@@ -45,31 +50,39 @@ DUPLICATE_COOLDOWN_DAYS = int(os.getenv("DUPLICATE_COOLDOWN_DAYS", 90))
 
 BLACKLIST_FILE = Path(__file__).parent / "job_logs" / "blacklist.json"
 
+# Opt-in: near-duplicate names (typos, spacing) also match above this
+# trigram similarity. Off by default - distinct employers with similar
+# names would be silently blocked; add_to_blacklist() warns instead
+BLACKLIST_FUZZY_THRESHOLD = float(os.getenv("BLACKLIST_FUZZY_THRESHOLD", 0))
+
 def load_blacklist() -> List[str]:
     """Load company blacklist"""
-    if BLACKLIST_FILE.exists():
-        with open(BLACKLIST_FILE) as f:
-            return json.load(f).get("companies", [])
-    return []
-
-def add_to_blacklist(company: str, reason: str = ""):
-    """Add company to blacklist"""
-    blacklist = load_blacklist()
-    if company.lower() not in [c.lower() for c in blacklist]:
-        blacklist.append(company)
-
-        BLACKLIST_FILE.parent.mkdir(exist_ok=True)
-        with open(BLACKLIST_FILE, 'w') as f:
-            json.dump({
-                "companies": blacklist,
-                "updated": datetime.now().isoformat(),
-                "reasons": {company: reason}
-            }, f, indent=2)
+    return get_blacklist(BLACKLIST_FILE).companies()
+
+def add_to_blacklist(company: str, reason: str = "") -> List[str]:
+    """
+    Add company to blacklist (reasons for all companies are kept).
+
+    Returns:
+        Near-duplicate names already on the list (possible typos or
+        duplicates); a warning is printed when there are any
+    """
+    blacklist = get_blacklist(BLACKLIST_FILE)
+    key = normalize_company(company)
+    similar = [name for name, _ in blacklist.find_similar(company)
+               if normalize_company(name) != key]
+    blacklist.add(company, reason)
+    if similar:
+        print(f"⚠️  '{company}' looks like already blacklisted: {', '.join(similar)}")
+    return similar
 
 def is_blacklisted(company: str) -> bool:
-    """Check if company is blacklisted"""
-    blacklist = load_blacklist()
-    return company.lower() in [c.lower() for c in blacklist]
+    """Check if company is blacklisted (normalised, optionally fuzzy)"""
+    return get_blacklist(BLACKLIST_FILE).is_blacklisted(
+        company,
+        fuzzy=BLACKLIST_FUZZY_THRESHOLD > 0,
+        threshold=BLACKLIST_FUZZY_THRESHOLD
+    )
 
 # ============================================================================
 # REQUIRED KEYWORDS (Must have at least one)
@@ -105,87 +118,94 @@ SUSPICIOUS_PATTERNS = [
 # RATE LIMITING
 # ============================================================================
 
-RATE_LIMIT_FILE = Path(__file__).parent / "job_logs" / "rate_limits.json"
+RATE_LIMIT_FILE = Path(__file__).parent / "job_logs" / "rate_limits.json"  # Legacy, imported once
+RATE_LIMIT_DB = Path(__file__).parent / "job_logs" / "rate_limits.db"
+
+# Per-company cap (per day), on top of the global hourly/daily caps
+MAX_COMPANY_APPLICATIONS = int(os.getenv("MAX_COMPANY_APPLICATIONS_PER_DAY", 1))
 
-def check_rate_limit() -> Dict:
+RATE_WINDOWS = [
+    Window("hourly", 3600, MAX_HOURLY_APPLICATIONS, buckets=60),
+    Window("daily", 86400, MAX_DAILY_APPLICATIONS, buckets=96),
+    Window("company", 86400, MAX_COMPANY_APPLICATIONS, buckets=96, per_company=True)
+]
+
+_rate_limiters: Dict[Path, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+def _rate_limiter() -> RateLimiter:
+    """Shared limiter for RATE_LIMIT_DB (imports the legacy JSON log on first use)"""
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(RATE_LIMIT_DB)
+        if limiter is None:
+            limiter = RateLimiter(RATE_LIMIT_DB, RATE_WINDOWS)
+            if limiter.is_empty() and RATE_LIMIT_FILE.exists():
+                one_day_ago = datetime.now() - timedelta(days=1)
+                for ts in get_store(RATE_LIMIT_FILE).read().get("applications", []):
+                    when = datetime.fromisoformat(ts)
+                    if when > one_day_ago:
+                        limiter.record(now=when.timestamp())
+            _rate_limiters[RATE_LIMIT_DB] = limiter
+        return limiter
+
+def _rate_limit_result(result: Dict, company: Optional[str]) -> Dict:
+    """Convert a RateLimiter verdict to the safety_config result shape"""
+    counts = result["counts"]
+    response = {
+        "allowed": result["allowed"],
+        "hourly_count": counts.get("hourly", 0),
+        "daily_count": counts.get("daily", 0)
+    }
+    if company:
+        response["company_count"] = counts.get("company", 0)
+
+    if not result["allowed"]:
+        window, limit = result["window"], result["limit"]
+        count = counts[window]
+        if window == "company":
+            response["reason"] = f"Company limit reached for {company} ({count}/{limit} per day)"
+        else:
+            response["reason"] = f"{window.title()} limit reached ({count}/{limit})"
+    return response
+
+def check_rate_limit(company: Optional[str] = None) -> Dict:
     """
     Check if rate limits are exceeded.
 
+    Args:
+        company: Also check the per-company window
+
     Returns:
         dict with 'allowed', 'hourly_count', 'daily_count'
+        (+ 'company_count' when a company is given)
     """
-    now = datetime.now()
-
-    # Load rate limit data
-    if RATE_LIMIT_FILE.exists():
-        with open(RATE_LIMIT_FILE) as f:
-            data = json.load(f)
-    else:
-        data = {"applications": []}
-
-    # Filter to recent applications
-    one_hour_ago = now - timedelta(hours=1)
-    today = now.date()
+    return _rate_limit_result(_rate_limiter().check(company), company)
 
-    applications = [
-        datetime.fromisoformat(ts)
-        for ts in data.get("applications", [])
-    ]
+def record_application(company: Optional[str] = None):
+    """Record application for rate limiting"""
+    _rate_limiter().record(company)
 
-    hourly_applications = [ts for ts in applications if ts > one_hour_ago]
-    daily_applications = [ts for ts in applications if ts.date() == today]
-
-    hourly_count = len(hourly_applications)
-    daily_count = len(daily_applications)
-
-    # Check limits
-    if hourly_count >= MAX_HOURLY_APPLICATIONS:
-        return {
-            "allowed": False,
-            "reason": f"Hourly limit reached ({hourly_count}/{MAX_HOURLY_APPLICATIONS})",
-            "hourly_count": hourly_count,
-            "daily_count": daily_count
-        }
-
-    if daily_count >= MAX_DAILY_APPLICATIONS:
-        return {
-            "allowed": False,
-            "reason": f"Daily limit reached ({daily_count}/{MAX_DAILY_APPLICATIONS})",
-            "hourly_count": hourly_count,
-            "daily_count": daily_count
-        }
-
-    return {
-        "allowed": True,
-        "hourly_count": hourly_count,
-        "daily_count": daily_count
-    }
-
-def record_application():
-    """Record application timestamp for rate limiting"""
-    now = datetime.now()
-
-    # Load existing data
-    if RATE_LIMIT_FILE.exists():
-        with open(RATE_LIMIT_FILE) as f:
-            data = json.load(f)
-    else:
-        data = {"applications": []}
+def acquire_application_slot(company: Optional[str] = None) -> Dict:
+    """
+    Atomically check limits and record the application if allowed.
 
-    # Add new timestamp
-    data["applications"].append(now.isoformat())
+    Use this instead of check_rate_limit() + record_application() when
+    several workers apply in parallel: caps hold across processes.
 
-    # Keep only last 24 hours
-    one_day_ago = now - timedelta(days=1)
-    data["applications"] = [
-        ts for ts in data["applications"]
-        if datetime.fromisoformat(ts) > one_day_ago
-    ]
+    Returns:
+        Same dict as check_rate_limit(); counts include this application.
+        Pass it to release_application_slot() if the application fails.
+    """
+    result = _rate_limiter().acquire(company)
+    response = _rate_limit_result(result, company)
+    if result["allowed"]:
+        response["acquired_at"] = result["acquired_at"]
+    return response
 
-    # Save
-    RATE_LIMIT_FILE.parent.mkdir(exist_ok=True)
-    with open(RATE_LIMIT_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+def release_application_slot(company: Optional[str], slot: Dict):
+    """Give back a slot from acquire_application_slot() that wasn't used"""
+    if slot.get("allowed"):
+        _rate_limiter().release(company, slot["acquired_at"])
 
 # ============================================================================
 # KILL SWITCH
@@ -251,7 +271,7 @@ def validate_job_for_auto_apply(job_data: Dict) -> Dict:
         }
 
     # Check 2: Rate Limits
-    rate_check = check_rate_limit()
+    rate_check = check_rate_limit(job_data.get("company"))
     if not rate_check["allowed"]:
         return {
             "passed": False,
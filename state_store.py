@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Trinity State Store
+
+Crash-safe JSON state shared by the watchdog, safety, voice and health
+modules:
+- Atomic writes (temp file + fsync + rename): readers never see a
+  truncated file, even if the writer dies mid-write
+- Advisory file locking for read-modify-write across processes
+- Per-process read-through cache validated by mtime/size/inode
+- Optional SQLite backing that stores top-level keys as rows and only
+  rewrites keys that changed (TRINITY_STATE_BACKEND=sqlite); an existing
+  JSON file is imported the first time its store is opened
+
+Usage:
+    store = get_store(Path("job_logs/rate_limits.json"), default={"applications": []})
+    data = store.read()
+    store.update(lambda d: {**d, "count": d.get("count", 0) + 1})
+"""
+
+import copy
+import fcntl
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+BASE_DIR = Path(__file__).parent
+STATE_DB = BASE_DIR / "data" / "trinity_state.db"
+STATE_BACKEND = os.getenv("TRINITY_STATE_BACKEND", "file")
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = False):
+    """
+    Write ``data`` to ``path`` via a temp file + rename.
+
+    Readers see either the old or the new file, never a partial one.
+    With ``fsync``, the data is also durable before the rename.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = None, fsync: bool = False):
+    """Serialise ``data`` as JSON and write it atomically."""
+    atomic_write_bytes(path, json.dumps(data, indent=indent).encode(), fsync=fsync)
+
+
+class FileStateStore:
+    """JSON file state with atomic writes, locking and an mtime-keyed cache."""
+
+    def __init__(self, path: Path, default: Any = None, indent: Optional[int] = 2):
+        self.path = path
+        self.default = default if default is not None else {}
+        self.indent = indent
+        self._lock_path = path.with_name(f'.{path.name}.lock')
+        self._thread_lock = threading.RLock()
+        self._signature = None
+        self._cached = None
+
+    def _stat_signature(self):
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    @contextmanager
+    def lock(self):
+        """Exclusive lock across threads and processes."""
+        with self._thread_lock:
+            self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> Any:
+        """Return cached data, re-reading the file only if it changed."""
+        signature = self._stat_signature()
+        if signature is None:
+            return copy.deepcopy(self.default)
+        if signature != self._signature:
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return copy.deepcopy(self.default) if self._cached is None else self._cached
+            self._signature = signature
+            self._cached = data
+        return self._cached
+
+    def read(self) -> Any:
+        """Return a private copy of the current state."""
+        with self._thread_lock:
+            return copy.deepcopy(self._load())
+
+    def write(self, data: Any):
+        """Replace the state atomically."""
+        with self.lock():
+            self._write_locked(data)
+
+    def _write_locked(self, data: Any):
+        atomic_write_json(self.path, data, indent=self.indent)
+        self._signature = self._stat_signature()
+        self._cached = copy.deepcopy(data)
+
+    def update(self, func: Callable[[Any], Any]) -> Any:
+        """
+        Atomic read-modify-write.
+
+        ``func`` receives a copy of the latest state and returns the new
+        state; concurrent updaters in other processes are serialised.
+        """
+        with self.lock():
+            data = func(copy.deepcopy(self._load()))
+            self._write_locked(data)
+            return copy.deepcopy(data)
+
+
+class SQLiteStateStore:
+    """
+    Dict state stored as one row per top-level key.
+
+    Only keys whose value changed are rewritten, so large states with a
+    small hot key (counters, timestamps) don't re-serialise everything.
+    """
+
+    def __init__(self, name: str, db_path: Path = STATE_DB, default: Optional[Dict] = None,
+                 import_path: Optional[Path] = None):
+        self.name = name
+        self.db_path = db_path
+        self.default = default if default is not None else {}
+        self._thread_lock = threading.RLock()
+        self._cached = None
+        self._version = None
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10,
+                                    isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS state (
+                store TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (store, key)
+            )
+        """)
+        if import_path is not None:
+            self._import_json(import_path)
+
+    def _import_json(self, path: Path):
+        """
+        Seed an empty store from its JSON file, so switching backends keeps
+        existing state (blacklist, watchdog) instead of starting from defaults.
+        """
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or not data:
+            return
+        with self._thread_lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Checked under the write lock: only the first opener imports
+                if self.conn.execute("SELECT 1 FROM state WHERE store = ? LIMIT 1",
+                                     (self.name,)).fetchone() is None:
+                    self._write_locked({}, data)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _data_version(self):
+        return (self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes)
+
+    def _load(self) -> Dict:
+        version = self._data_version()
+        if self._cached is None or version != self._version:
+            rows = self.conn.execute("SELECT key, value FROM state WHERE store = ?", (self.name,))
+            data = {key: json.loads(value) for key, value in rows}
+            self._cached = data if data else copy.deepcopy(self.default)
+            self._version = version
+        return self._cached
+
+    def read(self) -> Dict:
+        with self._thread_lock:
+            return copy.deepcopy(self._load())
+
+    def _write_locked(self, old: Dict, new: Dict):
+        for key in old.keys() - new.keys():
+            self.conn.execute("DELETE FROM state WHERE store = ? AND key = ?", (self.name, key))
+        for key, value in new.items():
+            if key not in old or old[key] != value:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO state (store, key, value) VALUES (?, ?, ?)",
+                    (self.name, key, json.dumps(value))
+                )
+
+    def write(self, data: Dict):
+        self.update(lambda _: data)
+
+    def update(self, func: Callable[[Dict], Dict]) -> Dict:
+        with self._thread_lock:
+            # BEGIN IMMEDIATE takes the write lock up front, serialising
+            # read-modify-write across processes
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self.conn.execute("SELECT key, value FROM state WHERE store = ?", (self.name,))
+                stored = {key: json.loads(value) for key, value in rows}
+                new = func(copy.deepcopy(stored or self.default))
+                self._write_locked(stored, new)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                self._cached = None
+                raise
+            self._cached = copy.deepcopy(new)
+            self._version = self._data_version()
+            return copy.deepcopy(new)
+
+
+_stores: Dict[tuple, Any] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path: Path, default: Any = None, backend: Optional[str] = None):
+    """
+    Get the shared store for a JSON state file.
+
+    Args:
+        path: JSON file path (also the SQLite namespace when backed by SQLite)
+        default: State returned when nothing has been written yet
+        backend: 'file' or 'sqlite' (defaults to TRINITY_STATE_BACKEND)
+    """
+    backend = backend or STATE_BACKEND
+    key = (path.resolve(), backend)
+    with _stores_lock:
+        if key not in _stores:
+            if backend == 'sqlite' and (default is None or isinstance(default, dict)):
+                _stores[key] = SQLiteStateStore(str(path.resolve()), default=default, import_path=path)
+            else:
+                _stores[key] = FileStateStore(path, default=default)
+        return _stores[key]
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Trinity Station Data
+
+Data access and status shared by every Command Center layout
+(command_center.py, command_center_v2.py, trinity_v3.py):
+- One set of paths and API keys for all stations
+- Job application database (job_status.db) and job URL submission
+- Process / port checks cached process-wide for TRINITY_STATUS_TTL
+  seconds, so every session, page and sidebar served by one Streamlit
+  process shares a single pgrep instead of each polling on every rerun
+- Phoenix / Genesis / macro status parsed from the Bot-Factory files
+- OpenSCAD generation (LLM gateway) and STL compilation
+
+No Streamlit here; the rendering side lives in stations.py.
+
+Usage:
+    from station_data import get_phoenix_stats, phoenix_status
+    if phoenix_status()['running']:
+        print(get_phoenix_stats()['latest_price'])
+"""
+
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from instrumentation import counter, timed
+# SDKs and NumPy-backed helpers load on first use, keeping cold start to Streamlit itself
+from lazy_imports import build_lods, convert_to_binary_stl, get_catalog, psutil, requests
+
+load_dotenv()
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+BASE_DIR = Path(__file__).parent
+BOT_FACTORY_DIR = BASE_DIR.parent / "Bot-Factory"
+
+# API Configuration
+TRINITY_API_BASE = os.getenv("TRINITY_API_BASE", "http://localhost:8001")
+GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+CLAUDE_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+
+# File paths
+JOB_STATUS_DB = BASE_DIR / "job_logs" / "job_status.db"  # Fixed: matches job_status.py
+DRAFT_DIR = BASE_DIR / "email_drafts"
+CAD_OUTPUT_DIR = BASE_DIR / "cad_output"
+CAD_PREVIEWS_DIR = CAD_OUTPUT_DIR / "previews"
+
+# Trading bot paths
+PHOENIX_LOG = BOT_FACTORY_DIR / "mark_xii_phoenix.log"
+GENESIS_LOG = BOT_FACTORY_DIR / "mark_xi_genesis.log"
+GENESIS_CONFIG = BOT_FACTORY_DIR / "genesis_v2_agro_config.py"
+MACRO_STATUS = BOT_FACTORY_DIR / "macro_status.json"
+
+# Plans and reports shown in the hubs
+OPTIMIZATION_REPORT = BASE_DIR / "TRINITY_OPTIMIZATION_REPORT.md"
+FINANCIAL_MODEL = BASE_DIR / "COMPLETE_FINANCIAL_MODEL_2026_2036.md"
+QUICK_CASH_REPORT = BASE_DIR / "QUICK_CASH_SERVICES_TEST_REPORT.md"
+WEEK1_PLAN = BASE_DIR / "WEEK_1_URGENT_ACTION_PLAN.md"
+FLYWHEEL_PLAN = BASE_DIR / "DECADE_PLAN_WITH_FLYWHEEL.md"
+
+# Process status
+STATUS_TTL = float(os.getenv("TRINITY_STATUS_TTL", 5))  # Seconds a pgrep/lsof result is reused
+PHOENIX_PROCESS = "mark_xii_phoenix"
+GENESIS_PROCESS = "mark_xi_genesis"
+PHOENIX_MODE = "AGRO MODE (3% risk)"
+PAPER_CAPITAL = 100000  # Phoenix paper account until live trading is enabled
+
+STATUS_CHECKS = counter("trinity_status_checks_total", "Process/port status checks by kind and result")
+
+# Ensure directories exist
+for dir_path in [JOB_STATUS_DB.parent, CAD_OUTPUT_DIR, CAD_PREVIEWS_DIR, DRAFT_DIR]:
+    try:
+        dir_path.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        print(f"Warning: Could not create directory {dir_path}: {e}")
+
+# ============================================================================
+# PROCESS STATUS (shared TTL cache)
+# ============================================================================
+
+_status_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+_status_lock = threading.Lock()
+
+def _cached_check(kind: str, target: str, check: Callable[[], bool]) -> bool:
+    """Result of ``check``, reused for STATUS_TTL seconds across sessions and threads."""
+    key = (kind, target)
+    with _status_lock:
+        cached = _status_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < STATUS_TTL:
+            STATUS_CHECKS.inc(kind=kind, result="hit")
+            return cached[1]
+    try:
+        result = check()
+    except (subprocess.TimeoutExpired, OSError) as e:
+        print(f"Warning: {kind} check for {target} failed: {e}")
+        result = False
+    with _status_lock:
+        _status_cache[key] = (time.monotonic(), result)
+    STATUS_CHECKS.inc(kind=kind, result="miss")
+    return result
+
+def process_running(pattern: str) -> bool:
+    """Whether a process whose command line matches ``pattern`` is running (pgrep -f)."""
+    return _cached_check('process', pattern, lambda: subprocess.run(
+        ['pgrep', '-f', pattern], capture_output=True, timeout=5).returncode == 0)
+
+def port_listening(port: int) -> bool:
+    """Whether anything listens on ``port`` (lsof)."""
+    return _cached_check('port', str(port), lambda: subprocess.run(
+        ['lsof', '-i', f':{port}'], capture_output=True, timeout=5).returncode == 0)
+
+def clear_status_cache():
+    """Drop cached checks (the next call polls again)."""
+    with _status_lock:
+        _status_cache.clear()
+
+def phoenix_status() -> Dict:
+    """Phoenix run state for status badges."""
+    return {
+        'running': process_running(PHOENIX_PROCESS),
+        'mode': 'PAPER',
+        'capital': PAPER_CAPITAL,
+        'live': False  # Not live trading yet
+    }
+
+# ============================================================================
+# JOB HUNTING MODULE
+# ============================================================================
+
+def init_job_status_db():
+    """Initialize job status database if it doesn't exist."""
+    try:
+        JOB_STATUS_DB.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(JOB_STATUS_DB)
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_statuses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                draft_filename TEXT UNIQUE,
+                company TEXT NOT NULL,
+                position TEXT NOT NULL,
+                fit_score INTEGER,
+                status TEXT DEFAULT 'pending',
+                contact_email TEXT,
+                contact_name TEXT,
+                contact_phone TEXT,
+                job_url TEXT,
+                source TEXT,
+                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                applied_date TIMESTAMP,
+                response_date TIMESTAMP,
+                notes TEXT
+            )
+        """)
+
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_status ON job_statuses(status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_company ON job_statuses(company)")
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Warning: Could not initialize job status database: {e}")
+        return False
+
+def get_job_statistics() -> Dict:
+    """Get job application statistics from database."""
+    try:
+        # Ensure database is initialized
+        init_job_status_db()
+
+        conn = sqlite3.connect(JOB_STATUS_DB)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT status, COUNT(*) FROM job_statuses GROUP BY status")
+        status_counts = dict(cursor.fetchall())
+
+        cursor.execute("SELECT COUNT(*) FROM job_statuses WHERE applied_date >= date('now', '-7 days')")
+        recent_apps = cursor.fetchone()[0]
+
+        conn.close()
+
+        return {
+            'pending': status_counts.get('pending', 0),
+            'applied': status_counts.get('applied', 0),
+            'denied': status_counts.get('denied', 0),
+            'recent_7_days': recent_apps,
+            'total': sum(status_counts.values())
+        }
+    except Exception as e:
+        print(f"Error getting job statistics: {e}")
+        return {
+            'pending': 0,
+            'applied': 0,
+            'denied': 0,
+            'recent_7_days': 0,
+            'total': 0,
+            'error': str(e)
+        }
+
+def get_recent_jobs(limit: int = 10) -> List[Dict]:
+    """Get recent job applications."""
+    try:
+        # Ensure database is initialized
+        init_job_status_db()
+
+        conn = sqlite3.connect(JOB_STATUS_DB)
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT company, position, status, fit_score, created_date, draft_filename
+            FROM job_statuses
+            ORDER BY created_date DESC
+            LIMIT ?
+        """, (limit,))
+
+        jobs = []
+        for row in cursor.fetchall():
+            jobs.append({
+                'company': row[0],
+                'position': row[1],
+                'status': row[2],
+                'fit_score': row[3],
+                'created_date': row[4],
+                'draft_filename': row[5]
+            })
+
+        conn.close()
+        return jobs
+    except Exception as e:
+        print(f"Error getting recent jobs: {e}")
+        return []
+
+def submit_job_url(url: str) -> Dict:
+    """Submit a job URL to Trinity for processing."""
+    try:
+        response = requests.post(
+            f"{TRINITY_API_BASE}/api/submit-job",
+            json={"url": url},
+            timeout=30
+        )
+        return response.json()
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+# ============================================================================
+# CAD/ENGINEERING MODULE
+# ============================================================================
+
+def generate_scad_code(prompt: str, vr_mode: bool = False) -> str:
+    """Generate OpenSCAD code using AI."""
+    from llm_gateway import get_gateway
+
+    gateway = get_gateway()
+    if not gateway.available("chat"):
+        return "// Error: no LLM API key set (GEMINI_API_KEY or ANTHROPIC_API_KEY)"
+
+    system_prompt = f"""You are an OpenSCAD code generator. Generate clean, well-commented OpenSCAD code.
+
+{'VR MODE: Keep models SIMPLE (< 5000 triangles). Use basic shapes. Avoid complex curves.' if vr_mode else 'Generate detailed, production-ready models.'}
+
+Rules:
+1. Use parametric design with variables at the top
+2. Add comments explaining the design
+3. Use proper OpenSCAD syntax
+4. Include dimensions in comments
+5. Make the code modular and reusable
+
+User Request: {prompt}
+
+Generate ONLY the OpenSCAD code, no explanations before or after."""
+
+    try:
+        # Fast chat route (gemini-2.5-flash, Claude fallback)
+        code = gateway.generate(system_prompt, route="chat").text
+
+        # Extract code block if wrapped in markdown
+        if '```' in code:
+            code = code.split('```')[1]
+            if code.startswith('openscad\n'):
+                code = code[9:]
+            elif code.startswith('scad\n'):
+                code = code[5:]
+
+        return code.strip()
+    except Exception as e:
+        return f"// Error generating code: {str(e)}"
+
+@timed("trinity_scad_compile_seconds", "OpenSCAD compile latency",
+       outcome=lambda result: "ok" if result[0] else "error")  # Failures are returned, not raised
+def compile_scad_to_stl(scad_code: str, output_name: str, timeout: int = 60,
+                        prompt: Optional[str] = None) -> Tuple[bool, str, Optional[Path]]:
+    """Compile OpenSCAD code to STL file and register it in the model catalog."""
+    try:
+        # Ensure output directory exists
+        CAD_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Sanitize output name to prevent path traversal - strict security
+        safe_output_name = "".join(c for c in output_name if c.isalnum() or c in ('_', '-'))
+
+        # Additional security: ensure no path traversal characters remain
+        if '..' in safe_output_name or '/' in safe_output_name or '\\' in safe_output_name:
+            safe_output_name = safe_output_name.replace('..', '').replace('/', '').replace('\\', '')
+
+        # Limit length to prevent DOS
+        safe_output_name = safe_output_name[:50]
+
+        base_name = f"{timestamp}_{safe_output_name}" if safe_output_name else timestamp
+
+        scad_path = CAD_OUTPUT_DIR / f"{base_name}.scad"
+        stl_path = CAD_OUTPUT_DIR / f"{base_name}.stl"
+
+        # Final security check: ensure paths are within CAD_OUTPUT_DIR
+        if not scad_path.resolve().is_relative_to(CAD_OUTPUT_DIR.resolve()):
+            return False, "Security error: Path traversal attempt blocked", None
+        if not stl_path.resolve().is_relative_to(CAD_OUTPUT_DIR.resolve()):
+            return False, "Security error: Path traversal attempt blocked", None
+
+        # Write SCAD file
+        try:
+            with open(scad_path, 'w') as f:
+                f.write(scad_code)
+        except Exception as e:
+            return False, f"Error writing SCAD file: {str(e)}", None
+
+        # Check if openscad is installed
+        try:
+            openscad_path = subprocess.run(['which', 'openscad'], capture_output=True, text=True, timeout=5).stdout.strip()
+        except subprocess.TimeoutExpired:
+            return False, "Timeout checking for OpenSCAD installation", None
+
+        if not openscad_path:
+            return False, "OpenSCAD not installed. Run: brew install --cask openscad", None
+    except Exception as e:
+        return False, f"Initialization error: {str(e)}", None
+
+    # Compile to STL
+    try:
+        result = subprocess.run([
+            'openscad',
+            '-o', str(stl_path),
+            str(scad_path)
+        ], capture_output=True, text=True, timeout=timeout)
+
+        if result.returncode == 0 and stl_path.exists():
+            # OpenSCAD writes ASCII STL; binary is ~5x smaller for VR delivery
+            convert_to_binary_stl(stl_path)
+
+            # Decimated LODs enforce the VR triangle budget at delivery time
+            lod_info = ""
+            manifest = None
+            try:
+                manifest = build_lods(stl_path, CAD_OUTPUT_DIR / "lod")
+                lod_info = "\n\nLODs: " + ", ".join(
+                    f"{lod['level']}% ({lod['triangles']} tris)" for lod in manifest['lods']
+                )
+            except Exception as e:
+                lod_info = f"\n\n⚠️ LOD generation skipped: {str(e)}"
+
+            try:
+                get_catalog(CAD_OUTPUT_DIR).record(stl_path, prompt=prompt, manifest=manifest)
+            except Exception as e:
+                print(f"Warning: Could not update model catalog: {e}")
+
+            return True, f"✅ Model compiled successfully!\n\nFiles:\n- {scad_path}\n- {stl_path}{lod_info}", stl_path
+        else:
+            error_msg = result.stderr if result.stderr else "Unknown compilation error"
+            return False, f"❌ Compilation failed:\n{error_msg}", None
+
+    except subprocess.TimeoutExpired:
+        return False, f"❌ Compilation timed out after {timeout} seconds. Try simplifying the model.", None
+    except Exception as e:
+        return False, f"❌ Error: {str(e)}", None
+
+# ============================================================================
+# TRADING BOT MODULE
+# ============================================================================
+
+def get_bot_status(pid: int) -> Dict:
+    """Check if a bot process is running."""
+    try:
+        process = psutil.Process(pid)
+        return {
+            'running': True,
+            'cpu_percent': process.cpu_percent(interval=0.1),
+            'memory_mb': process.memory_info().rss / 1024 / 1024,
+            'status': process.status()
+        }
+    except:
+        return {'running': False}
+
+def get_phoenix_stats() -> Dict:
+    """Get Phoenix trading bot statistics (AGRO MODE)."""
+    try:
+        if not BOT_FACTORY_DIR.exists():
+            return {'error': f'Bot-Factory directory not found at {BOT_FACTORY_DIR}'}
+
+        if not PHOENIX_LOG.exists():
+            return {'error': 'Log file not found', 'path': str(PHOENIX_LOG)}
+
+        # Read last 100 lines
+        with open(PHOENIX_LOG) as f:
+            lines = f.readlines()[-100:]
+
+        # Parse latest status
+        latest_price = None
+        latest_rsi = None
+        position = "FLAT"
+
+        for line in reversed(lines):
+            if '[INFO]' in line and '$' in line:
+                # Format: $628.52 | RSI:33.1 | ATR:0.12 | SMA:HOLD | Pos:FLAT
+                parts = line.split('|')
+                for part in parts:
+                    if '$' in part and not latest_price:
+                        latest_price = part.strip().split('$')[1].split()[0]
+                    if 'RSI:' in part and not latest_rsi:
+                        latest_rsi = part.split('RSI:')[1].strip().split()[0]
+                    if 'Pos:' in part:
+                        position = part.split('Pos:')[1].strip()
+                if latest_price:
+                    break
+
+        return {
+            'running': process_running(PHOENIX_PROCESS),
+            'symbol': 'QQQ',
+            'latest_price': latest_price,
+            'rsi': latest_rsi,
+            'position': position,
+            'mode': PHOENIX_MODE,
+            'log_updated': datetime.fromtimestamp(PHOENIX_LOG.stat().st_mtime).strftime('%H:%M:%S')
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+def get_genesis_stats() -> Dict:
+    """Get Genesis trading bot statistics."""
+    try:
+        if not BOT_FACTORY_DIR.exists():
+            return {'error': f'Bot-Factory directory not found at {BOT_FACTORY_DIR}'}
+
+        if not GENESIS_LOG.exists():
+            return {'error': 'Log file not found', 'path': str(GENESIS_LOG)}
+
+        running = process_running(GENESIS_PROCESS)
+
+        # Read last few lines for status
+        with open(GENESIS_LOG) as f:
+            lines = f.readlines()[-50:]
+
+        latest_equity = None
+        for line in reversed(lines):
+            if 'equity' in line.lower() or '$' in line:
+                # Try to extract equity value
+                match = re.search(r'\$[\d,]+\.?\d*', line)
+                if match:
+                    latest_equity = match.group()
+                    break
+
+        return {
+            'running': running,
+            'symbol': 'QQQ',
+            'equity': latest_equity or 'Unknown',
+            'log_updated': datetime.fromtimestamp(GENESIS_LOG.stat().st_mtime).strftime('%H:%M:%S')
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+def get_macro_status_data() -> Dict:
+    """Get macro trading status."""
+    try:
+        if not BOT_FACTORY_DIR.exists():
+            return {'error': f'Bot-Factory directory not found at {BOT_FACTORY_DIR}', 'current_action': 'UNKNOWN'}
+
+        if not MACRO_STATUS.exists():
+            return {'current_action': 'UNKNOWN', 'trading_enabled': None, 'error': 'macro_status.json not found'}
+
+        with open(MACRO_STATUS) as f:
+            data = json.load(f)
+
+        return {
+            'current_action': data.get('current_action', 'UNKNOWN'),
+            'trading_enabled': data.get('trading_enabled', None),
+            'last_alert': data.get('last_alert', {}).get('alert_name') if data.get('last_alert') else None,
+            'last_update': data.get('last_update', 'Never')
+        }
+    except Exception as e:
+        return {'error': str(e)}
@@ -0,0 +1,3983 @@
+#!/usr/bin/env python3
+"""
+Trinity Stations
+
+Shared Streamlit station library behind every Command Center layout:
+- Session defaults and Trinity Memory seeding (one profile for all apps)
+- Rendering primitives: VR display config, base styling, VR toggle,
+  system status, sampler quick stats, footer, plan document windows
+- The stations themselves: Career, Engineering, Memory, AI Assistant,
+  Business, Trading and Claude Code
+- The v2.0 Homepage, Financial and Quick Cash stations
+- The v2.1 Dashboard, Financial Hub, Trinity AI sidebar and Apple styling
+
+command_center.py, command_center_v2.py and trinity_v3.py are thin
+layouts (header, navigation, routing) over this module, and
+trinity_app.py serves all three from one process. Data access and
+status checks live in station_data.py.
+
+Usage:
+    import stations
+    stations.init_station_state()
+    stations.render_trading_station(agro=True)
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import streamlit as st
+
+from lazy_imports import get_sampler, pil_image
+from plan_documents import get_plan_library
+from station_data import (BASE_DIR, BOT_FACTORY_DIR, CAD_OUTPUT_DIR, DRAFT_DIR, FLYWHEEL_PLAN,
+                          OPTIMIZATION_REPORT, PHOENIX_LOG, PHOENIX_PROCESS, TRINITY_API_BASE,
+                          compile_scad_to_stl, generate_scad_code, get_job_statistics,
+                          get_macro_status_data, get_phoenix_stats, get_recent_jobs,
+                          port_listening, process_running, submit_job_url)
+from station_data import phoenix_status as check_phoenix
+
+# Trinity Memory imports
+try:
+    from trinity_memory import get_memory, MEMORY_DB
+except ImportError:
+    MEMORY_DB = BASE_DIR / "data" / "trinity_memory.db"
+
+# Trinity personality imports (Trinity AI sidebar)
+try:
+    from trinity_personality import (
+        get_trinity_response,
+        stream_trinity_response,
+        get_trinity_quick_actions,
+    )
+    TRINITY_AVAILABLE = True
+except ImportError:
+    TRINITY_AVAILABLE = False
+    print("Warning: Trinity personality not available")
+
+# ============================================================================
+# SESSION STATE
+# ============================================================================
+
+STATION_DEFAULTS = {
+    'vr_mode': False,
+    'last_cad_render': None,
+    'ai_memory': [],
+    'chat_history': [],
+    'uploaded_files_cache': [],
+    'memory_initialized': False,  # Seeded by ensure_memory() on first use
+    'week1_checklist': {},
+    'optimizations_checklist': {},
+}
+
+def init_station_state(**defaults):
+    """Set shared session defaults (plus a layout's own ``defaults``) once per session."""
+    for key, value in {**STATION_DEFAULTS, **defaults}.items():
+        if key not in st.session_state:
+            # Fresh containers per session
+            st.session_state[key] = value.copy() if isinstance(value, (list, dict)) else value
+
+def ensure_memory():
+    """Trinity Memory, seeded with the user profile the first time a session uses it."""
+    if not st.session_state.get('memory_initialized'):
+        _initialize_trinity_memory()
+    return get_memory()
+
+def _initialize_trinity_memory():
+    """Initialize Trinity Memory with user profile."""
+    try:
+        memory = get_memory()
+
+        # Verify memory system is working
+        try:
+            memory.get_profile('system_initialized')
+        except Exception as e:
+            print(f"Warning: Trinity Memory database error: {e}")
+            return
+
+        # Check if profile exists
+        existing_profile = memory.get_profile('name')
+        if not existing_profile:
+            # Initialize user profile
+            memory.set_profile('name', 'Ty Brown', 'personal')
+            memory.set_profile('email', 'tychabot9@gmail.com', 'personal')
+            memory.set_profile('role', 'Developer & Trader', 'professional')
+            memory.set_profile('github', 'tychabot9-ux', 'professional')
+            memory.set_profile('system_initialized', datetime.now().isoformat(), 'system')
+            memory.set_profile('location', os.uname().nodename, 'system')
+
+            # Set initial preferences
+            memory.learn_preference('Trading', 'bot', 'active_system', 'Phoenix Mark XII AGRO MODE')
+            memory.learn_preference('Trading', 'strategy', 'champion_fitness', 121.08)
+            memory.learn_preference('Trading', 'risk', 'paper_trading', True)
+            memory.learn_preference('Trading', 'risk', 'agro_mode', True)
+            memory.learn_preference('Trading', 'risk', 'base_risk', 0.03)  # 3% AGRO
+            memory.learn_preference('Engineering', 'CAD', 'tool', 'OpenSCAD')
+            memory.learn_preference('Career', 'job_search', 'active', True)
+            memory.learn_preference('Quick Cash', 'services', 'status', 'Ready to Launch')
+            memory.learn_preference('Financial', 'burn_rate', 'monthly', -635)
+            memory.learn_preference('Financial', 'target_cut', 'monthly', 330)
+
+            # Add initial knowledge
+            memory.add_knowledge(
+                'Phoenix Bot',
+                'Phoenix Mark XII Genesis V2 - Validated champion trading bot. Fitness: 121.08, Sharpe: 2.14, Sortino: 15.46, Profit probability: 99.05%. Completed 320 trades.',
+                source='Validation Feb 3, 2026'
+            )
+
+            memory.add_knowledge(
+                'Trinity System',
+                'Personal AI Operating System with Command Center, Career Station, Engineering Station, AI Assistant, and Trading Station. Military-grade personalized intelligence.',
+                source='System initialization'
+            )
+
+            memory.add_knowledge(
+                'AGRO MODE Active',
+                'Phoenix Mark XII upgraded to AGRO MODE - 3% risk per trade, 5 max positions, targeting $4-5k/month. Circuit breakers at 8%, 15%, 25% drawdown.',
+                source='Activation Feb 5, 2026'
+            )
+
+            memory.add_knowledge(
+                'Quick Cash Services',
+                'Three services production-ready: QR codes ($25-60), 3D models ($50-150), Python automation ($75-200). 11 portfolio samples complete. Target +$300-700/month.',
+                source='Testing Feb 5, 2026'
+            )
+
+            memory.add_knowledge(
+                'Optimization Report',
+                '20 optimizations identified worth $2.3M+ additional value. Urgent: Cut $330/month expenses, launch Quick Cash, S-Corp formation, 60hr/week schedule.',
+                source='Optimization Analysis Feb 5, 2026'
+            )
+
+        st.session_state.memory_initialized = True
+
+    except Exception as e:
+        print(f"Warning: Trinity Memory initialization failed: {e}")
+
+# ============================================================================
+# VR MODE UTILITIES
+# ============================================================================
+
+def is_vr_mode() -> bool:
+    """Check if VR mode is enabled."""
+    # Check URL parameter first
+    query_params = st.query_params
+    if 'vr' in query_params and query_params['vr'] == 'true':
+        st.session_state.vr_mode = True
+    return st.session_state.vr_mode
+
+def get_display_config() -> Dict:
+    """Get display configuration based on VR mode."""
+    if is_vr_mode():
+        return {
+            'font_size': 'large',
+            'button_size': 'large',
+            'max_triangles': 5000,  # Simplified meshes for Quest 1
+            'use_previews': True,   # Use PNG previews instead of live 3D
+            'layout': 'wide',
+            'sidebar_collapsed': False,
+            'update_interval': 5000  # Slower updates to save battery
+        }
+    else:
+        return {
+            'font_size': 'normal',
+            'button_size': 'normal',
+            'max_triangles': 50000,
+            'use_previews': False,
+            'layout': 'wide',
+            'sidebar_collapsed': False,
+            'update_interval': 2000
+        }
+
+# ============================================================================
+# CAREER STATION
+# ============================================================================
+
+def render_career_station():
+    """Render the Career/Job Hunting module."""
+    st.header("🎯 Career Station")
+
+    # Statistics
+    stats = get_job_statistics()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Pending Review", stats['pending'])
+    with col2:
+        st.metric("Applied", stats['applied'])
+    with col3:
+        st.metric("Passed On", stats['denied'])
+    with col4:
+        st.metric("Last 7 Days", stats['recent_7_days'])
+
+    st.divider()
+
+    # Job submission
+    st.subheader("Submit New Job")
+    with st.form("job_submission"):
+        job_url = st.text_input(
+            "Job URL",
+            placeholder="https://company.com/careers/job-posting",
+            help="Paste a job posting URL to analyze"
+        )
+        submit_btn = st.form_submit_button("🔍 Analyze Job", width='stretch')
+
+        if submit_btn and job_url:
+            with st.spinner("Trinity is analyzing the job posting..."):
+                result = submit_job_url(job_url)
+
+                if result.get('success'):
+                    st.success(f"✅ Job processed! Fit score: {result.get('fit_score', 'N/A')}/100")
+                    if result.get('status') == 'accepted':
+                        st.info("📝 Draft cover letter created and ready for review!")
+                    else:
+                        st.warning(f"⚠️ Job rejected: {result.get('reason', 'Unknown')}")
+                else:
+                    st.error(f"❌ Error: {result.get('error', 'Unknown error')}")
+
+    st.divider()
+
+    # Recent jobs
+    st.subheader("Recent Applications")
+    jobs = get_recent_jobs(limit=5)
+
+    if jobs:
+        for job in jobs:
+            with st.expander(f"{job['company']} - {job['position']} ({job['status']})"):
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.write(f"**Fit Score:** {job['fit_score']}/100")
+                    st.write(f"**Created:** {job['created_date']}")
+                with col2:
+                    status_emoji = {
+                        'pending': '⏳',
+                        'applied': '✅',
+                        'denied': '❌'
+                    }.get(job['status'], '❓')
+                    st.write(f"**Status:** {status_emoji} {job['status'].title()}")
+
+                if job['draft_filename']:
+                    draft_path = DRAFT_DIR / job['draft_filename']
+                    if draft_path.exists():
+                        if st.button("📄 View Draft", key=f"draft_{job['draft_filename']}"):
+                            try:
+                                with open(draft_path, 'r', encoding='utf-8') as f:
+                                    content = f.read()
+                                    st.text_area("Cover Letter", content, height=300)
+                            except Exception as e:
+                                st.error(f"Error reading draft: {str(e)}")
+    else:
+        st.info("No jobs yet. Submit a job URL above to get started!")
+
+    # Quick link to full dashboard
+    st.divider()
+    st.markdown(f"[📊 Open Full Job Dashboard]({TRINITY_API_BASE}/dashboard)")
+
+# ============================================================================
+# ENGINEERING STATION
+# ============================================================================
+
+def render_engineering_station():
+    """Render the CAD/Engineering module."""
+    st.header("🔧 Engineering Station")
+
+    # VR Workspace Quick Access
+    st.info("🥽 **VR Workspace Available** - Access wireless VR engineering environment")
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.link_button("🎮 Open VR Workspace", "http://localhost:8503", use_container_width=True, type="primary")
+    with col2:
+        st.markdown("""
+        **Quest Access URLs:**
+        - Tailscale: `100.66.103.8:8503`
+        - Local WiFi: `192.168.1.216:8503`
+        """)
+
+    st.divider()
+
+    vr_mode = is_vr_mode()
+    if vr_mode:
+        st.info("🥽 VR Mode Active - Models will be simplified for Quest 1")
+
+    # CAD prompt interface
+    st.subheader("3D Model Generator")
+
+    # Examples
+    with st.expander("💡 Example Prompts"):
+        st.markdown("""
+        - "Design a hex bolt M8x20mm"
+        - "Create a cable management clip for 1/4 inch cables"
+        - "Make a parametric box 100x60x40mm with rounded corners"
+        - "Design a door stop wedge"
+        - "Create a phone stand with 45 degree angle"
+        """)
+
+    with st.form("cad_generation"):
+        cad_prompt = st.text_area(
+            "Describe what you want to design:",
+            height=100,
+            placeholder="Example: Design a hex bolt M8x20mm with standard thread pitch"
+        )
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            generate_btn = st.form_submit_button("⚙️ Generate Model", width='stretch')
+        with col2:
+            vr_optimize = st.checkbox("VR Optimize", value=vr_mode)
+
+        if generate_btn and cad_prompt:
+            with st.spinner("🤖 Trinity is designing your model..."):
+                # Generate OpenSCAD code
+                scad_code = generate_scad_code(cad_prompt, vr_optimize)
+
+                # Show generated code
+                st.subheader("Generated OpenSCAD Code")
+                st.code(scad_code, language='openscad')
+
+                # Compile to STL
+                with st.spinner("🔨 Compiling to STL..."):
+                    success, message, stl_path = compile_scad_to_stl(
+                        scad_code,
+                        output_name=cad_prompt[:30].replace(' ', '_'),
+                        timeout=30 if vr_optimize else 60,
+                        prompt=cad_prompt
+                    )
+
+                    if success:
+                        st.success(message)
+                        st.session_state.last_cad_render = {
+                            'timestamp': datetime.now(),
+                            'prompt': cad_prompt,
+                            'stl_path': str(stl_path),
+                            'scad_code': scad_code
+                        }
+
+                        # Download button
+                        with open(stl_path, 'rb') as f:
+                            st.download_button(
+                                "⬇️ Download STL File",
+                                f.read(),
+                                file_name=stl_path.name,
+                                mime="application/octet-stream"
+                            )
+
+                        # 3D Preview
+                        if not vr_mode:
+                            st.info("💡 Tip: Use software like Blender, FreeCAD, or online STL viewers to visualize the model.")
+                        else:
+                            st.info("🥽 For VR viewing, download the STL and use an Oculus-compatible viewer app.")
+                    else:
+                        st.error(message)
+
+    st.divider()
+
+    # Recent models
+    st.subheader("Recent Models")
+    scad_files = sorted(CAD_OUTPUT_DIR.glob("*.scad"), key=os.path.getmtime, reverse=True)[:5]
+
+    if scad_files:
+        for scad_file in scad_files:
+            stl_file = scad_file.with_suffix('.stl')
+            with st.expander(f"📐 {scad_file.stem}"):
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.write(f"**Created:** {datetime.fromtimestamp(scad_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M')}")
+                    if stl_file.exists():
+                        st.write(f"**STL Size:** {stl_file.stat().st_size / 1024:.1f} KB")
+                with col2:
+                    if stl_file.exists():
+                        with open(stl_file, 'rb') as f:
+                            st.download_button(
+                                "⬇️ STL",
+                                f.read(),
+                                file_name=stl_file.name,
+                                key=f"download_{stl_file.stem}"
+                            )
+
+                # Show code preview
+                try:
+                    with open(scad_file, 'r', encoding='utf-8') as f:
+                        code_preview = f.read()[:500]
+                        st.code(code_preview + "..." if len(code_preview) >= 500 else code_preview, language='openscad')
+                except Exception as e:
+                    st.caption(f"Could not preview: {str(e)}")
+    else:
+        st.info("No models yet. Generate your first model above!")
+
+# ============================================================================
+# AI ASSISTANT STATION
+# ============================================================================
+
+def stream_ai_message(user_message: str, uploaded_files: list = None) -> Iterator[str]:
+    """Stream Trinity AI Assistant response text as it is generated."""
+    try:
+        from prompt_builder import get_prompt_builder
+        from llm_gateway import get_gateway
+
+        gateway = get_gateway()
+        if not gateway.available("chat"):
+            yield "⚠️ Error: No LLM API key configured. Please set GEMINI_API_KEY or ANTHROPIC_API_KEY."
+            return
+
+        # Get Trinity Memory for enhanced context
+        memory = ensure_memory()
+
+        # Log interaction
+        memory.log_interaction('AI Assistant', 'chat_message', {
+            'message_length': len(user_message),
+            'has_files': bool(uploaded_files)
+        })
+
+        # Process uploaded files
+        attachments = []
+        if uploaded_files:
+            for file in uploaded_files:
+                try:
+                    # Check file size to prevent memory issues (max 10MB per file)
+                    file.seek(0, 2)  # Seek to end
+                    file_size = file.tell()
+                    file.seek(0)  # Seek back to start
+
+                    if file_size > 10 * 1024 * 1024:  # 10MB
+                        attachments.append(f"[File too large: {file.name}, {file_size / 1024 / 1024:.1f}MB - skipped]")
+                        continue
+
+                    if file.type and file.type.startswith('image/'):
+                        # Handle image files
+                        try:
+                            image = pil_image.open(file)
+                            attachments.append(image)
+                            attachments.append(f"[Image: {file.name}]")
+                        except Exception as e:
+                            attachments.append(f"[Error loading image {file.name}: {str(e)}]")
+                    else:
+                        # Handle text-based files
+                        content = file.read()
+                        try:
+                            text_content = content.decode('utf-8')
+                            # Limit content to 10,000 characters to prevent token overflow
+                            if len(text_content) > 10000:
+                                attachments.append(f"[File: {file.name} (truncated)]\n{text_content[:10000]}\n... [file truncated]")
+                            else:
+                                attachments.append(f"[File: {file.name}]\n{text_content}")
+                        except UnicodeDecodeError:
+                            attachments.append(f"[Binary file: {file.name}, {len(content)} bytes]")
+                except Exception as e:
+                    attachments.append(f"[Error reading {file.name}: {str(e)}]")
+
+        # Cached persona/profile prefix + budgeted history, decisions and files
+        prompt = get_prompt_builder().build(
+            memory, st.session_state.chat_history, user_message, attachments
+        )
+
+        # Generate response (gemini-2.5-flash supports vision, text, and files;
+        # text-only prompts fail over to Claude)
+        yield from gateway.stream(prompt.parts, route="chat", system=prompt.prefix.text)
+
+    except Exception as e:
+        yield f"⚠️ Error generating response: {str(e)}"
+
+def process_ai_message(user_message: str, uploaded_files: list = None) -> str:
+    """Process user message with Trinity AI Assistant."""
+    return "".join(stream_ai_message(user_message, uploaded_files))
+
+# ============================================================================
+# MEMORY DASHBOARD
+# ============================================================================
+
+def render_memory_dashboard():
+    """Render Trinity Memory Dashboard - AI-powered memory search."""
+    st.header("🧠 Trinity Memory Search")
+
+    st.caption("Ask Trinity about your profile, preferences, decisions, or past interactions")
+
+    try:
+        from llm_gateway import get_gateway
+
+        memory = ensure_memory()
+
+        # Quick stats bar
+        stats = memory.get_memory_stats()
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("Profile", stats['profile_entries'])
+        with col2:
+            st.metric("Preferences", stats['preferences']['count'])
+        with col3:
+            st.metric("Decisions", stats['decisions_tracked'])
+        with col4:
+            st.metric("Interactions", stats['total_interactions'])
+        with col5:
+            st.metric("Knowledge", stats['knowledge_entries'])
+
+        st.divider()
+
+        # AI-Powered Memory Search
+        st.subheader("🔍 Search Your Memory")
+
+        # Initialize session state for memory search history
+        if 'memory_search_history' not in st.session_state:
+            st.session_state.memory_search_history = []
+
+        # Example queries
+        st.caption("**Try asking:**")
+        example_col1, example_col2, example_col3 = st.columns(3)
+        with example_col1:
+            if st.button("💼 My job preferences", width='stretch'):
+                search_query = "What are my career and job search preferences?"
+                st.session_state.temp_search = search_query
+        with example_col2:
+            if st.button("📊 Recent decisions", width='stretch'):
+                search_query = "Show me my recent decisions from the last week"
+                st.session_state.temp_search = search_query
+        with example_col3:
+            if st.button("🎯 What did I do today?", width='stretch'):
+                search_query = "What did I do today?"
+                st.session_state.temp_search = search_query
+
+        # Search input
+        search_input = st.text_input(
+            "Ask about your memory, preferences, decisions, or activities...",
+            value=st.session_state.get('temp_search', ''),
+            placeholder="e.g., 'What are my CAD preferences?', 'Show decisions from last Tuesday', 'What's my profile?'",
+            key="memory_search_input"
+        )
+
+        if 'temp_search' in st.session_state:
+            del st.session_state.temp_search
+
+        if st.button("🔍 Search Memory", type="primary", width='stretch') and search_input:
+            with st.spinner("🧠 Searching Trinity Memory..."):
+                # Get comprehensive memory data
+                full_profile = memory.get_full_profile()
+                all_preferences = memory.get_all_preferences()
+                recent_decisions = memory.get_decisions(limit=50)
+                interactions = memory.get_interactions(hours=168, limit=500)  # Last week
+                insights = memory.get_insights(limit=50)
+                knowledge = memory.get_knowledge(limit=100)
+
+                # Build context for AI
+                memory_context = f"""
+TRINITY MEMORY DATABASE - Query: "{search_input}"
+
+USER PROFILE:
+{json.dumps(full_profile, indent=2)}
+
+LEARNED PREFERENCES:
+{json.dumps(all_preferences, indent=2)}
+
+RECENT DECISIONS (Last 50):
+{json.dumps([{
+    'station': d['station'],
+    'type': d['decision_type'],
+    'decision': d['decision'],
+    'context': d.get('context'),
+    'timestamp': d['timestamp']
+} for d in recent_decisions], indent=2)}
+
+RECENT INTERACTIONS (Last Week):
+{json.dumps([{
+    'station': i['station'],
+    'action': i['action_type'],
+    'timestamp': i['timestamp']
+} for i in interactions[-100:]], indent=2)}
+
+INSIGHTS:
+{json.dumps([{
+    'type': i['insight_type'],
+    'title': i['title'],
+    'confidence': i['confidence']
+} for i in insights], indent=2)}
+
+KNOWLEDGE BASE ENTRIES:
+{json.dumps([{
+    'topic': k['topic'],
+    'content': k['content'][:200]
+} for k in knowledge[:20]], indent=2)}
+
+MEMORY STATISTICS:
+{json.dumps(stats, indent=2)}
+
+TASK:
+Answer the user's query based on the Trinity Memory database above. Be specific, cite dates/timestamps when relevant, and provide actionable information. If searching by date, parse the query intelligently (e.g., "last Tuesday", "yesterday", "this week").
+"""
+
+                # Generate AI response
+                gateway = get_gateway()
+                if not gateway.available("chat"):
+                    st.error("⚠️ No LLM API key configured (GEMINI_API_KEY or ANTHROPIC_API_KEY)")
+                else:
+                    response = gateway.generate(memory_context, route="chat")
+
+                    # Display results
+                    st.success("✅ Search Complete")
+                    st.markdown("### 🎯 Results")
+                    st.markdown(response.text)
+
+                    # Log the search
+                    memory.log_interaction('Memory', 'search', {
+                        'query': search_input,
+                        'results_length': len(response.text)
+                    })
+
+                    # Add to search history
+                    st.session_state.memory_search_history.append({
+                        'query': search_input,
+                        'response': response.text,
+                        'timestamp': datetime.now().isoformat()
+                    })
+
+        # Recent searches
+        if st.session_state.memory_search_history:
+            st.divider()
+            with st.expander("📜 Recent Searches", expanded=False):
+                for search in reversed(st.session_state.memory_search_history[-5:]):
+                    st.caption(f"**Q:** {search['query']}")
+                    st.caption(f"🕐 {search['timestamp'][:16]}")
+                    with st.expander("View Response"):
+                        st.markdown(search['response'])
+                    st.divider()
+
+        # Quick actions
+        st.divider()
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if st.button("📥 Export Memory", width='stretch'):
+                export_data = memory.get_user_summary()
+                st.download_button(
+                    "💾 Download JSON",
+                    json.dumps(export_data, indent=2),
+                    file_name=f"trinity_memory_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json",
+                    width='stretch'
+                )
+
+        with col2:
+            if st.button("🗑️ Clear Search History", width='stretch'):
+                st.session_state.memory_search_history = []
+                st.rerun()
+
+    except Exception as e:
+        st.error(f"⚠️ Memory system error: {str(e)}")
+        st.info("Trinity Memory may not be initialized yet.")
+
+def render_ai_assistant_station():
+    """Render the AI Assistant chat interface."""
+    st.header("🤖 Trinity AI Assistant")
+
+    st.caption("Chat with Trinity AI • Supports text, images, code, documents, and voice")
+
+    # Chat history display
+    chat_container = st.container()
+
+    with chat_container:
+        if not st.session_state.chat_history:
+            st.info("👋 Hi! I'm Trinity, your AI assistant. Upload files, ask questions, or just chat!")
+        else:
+            for idx, message in enumerate(st.session_state.chat_history):
+                if message['role'] == 'user':
+                    with st.chat_message("user", avatar="👤"):
+                        st.markdown(message['content'])
+                        if 'files' in message and message['files']:
+                            st.caption(f"📎 {len(message['files'])} file(s) attached")
+                else:
+                    with st.chat_message("assistant", avatar="🤖"):
+                        st.markdown(message['content'])
+
+    # File upload section
+    st.divider()
+    uploaded_files = st.file_uploader(
+        "📎 Upload files (images, PDFs, code, documents)",
+        accept_multiple_files=True,
+        type=None,  # Accept all file types
+        key="ai_file_upload"
+    )
+
+    if uploaded_files:
+        cols = st.columns(min(len(uploaded_files), 4))
+        for idx, file in enumerate(uploaded_files):
+            with cols[idx % 4]:
+                st.caption(f"📄 {file.name}")
+                st.caption(f"{file.type}")
+
+    # Input area
+    col1, col2 = st.columns([5, 1])
+
+    with col1:
+        user_input = st.chat_input("Type your message here...", key="ai_chat_input")
+
+    with col2:
+        # Voice input button (placeholder for future implementation)
+        try:
+            audio_input = st.audio_input("🎤", key="ai_voice_input")
+            if audio_input:
+                st.info("🎤 Voice transcription coming soon...")
+        except:
+            # Fallback if audio_input not available in Streamlit version
+            if st.button("🎤 Voice", key="ai_voice_btn", help="Voice input (coming soon)"):
+                st.info("🎤 Voice input will be available in future updates")
+
+    # Process user input
+    if user_input:
+        # Add user message to history
+        user_msg = {
+            'role': 'user',
+            'content': user_input,
+            'files': [f.name for f in uploaded_files] if uploaded_files else [],
+            'timestamp': datetime.now().isoformat()
+        }
+        st.session_state.chat_history.append(user_msg)
+
+        # Stream the AI response into the conversation as it is generated
+        with chat_container:
+            with st.chat_message("user", avatar="👤"):
+                st.markdown(user_input)
+            with st.chat_message("assistant", avatar="🤖"):
+                ai_response = st.write_stream(stream_ai_message(user_input, uploaded_files))
+
+        # Add AI response to history
+        ai_msg = {
+            'role': 'assistant',
+            'content': ai_response,
+            'timestamp': datetime.now().isoformat()
+        }
+        st.session_state.chat_history.append(ai_msg)
+
+        # Rerun to display new messages
+        st.rerun()
+
+    # Chat controls
+    st.divider()
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("🗑️ Clear Chat", width='stretch'):
+            st.session_state.chat_history = []
+            st.rerun()
+
+    with col2:
+        if st.button("💾 Export Chat", width='stretch'):
+            if st.session_state.chat_history:
+                export_data = json.dumps(st.session_state.chat_history, indent=2)
+                st.download_button(
+                    "📥 Download JSON",
+                    export_data,
+                    file_name=f"trinity_chat_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json"
+                )
+
+    with col3:
+        st.caption(f"💬 {len(st.session_state.chat_history)} messages")
+
+def show_plan(label: str, filename: str, note: str) -> bool:
+    """Opening window of a plan document (only that window is read); False if missing."""
+    plan = get_plan_library().get(BASE_DIR / filename)
+    if plan is None:
+        return False
+    text = plan.head()
+    if plan.truncated:
+        text += f"\n\n...(truncated, {note})"
+    st.text_area(label, text, height=400)
+    return True
+
+def render_business_station():
+    """Render the Autonomous Business Dashboard with 30+ Money-Making Services."""
+    st.header("💼 Trinity Business Operations")
+
+    st.success("**🚀 30+ Revenue Streams Ready** - Quick wins to premium services")
+
+    # Create business database if it doesn't exist
+    business_db = BASE_DIR / "business_data" / "autonomous_business.db"
+    business_db.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        conn = sqlite3.connect(business_db)
+        c = conn.cursor()
+
+        # Create tables if they don't exist
+        c.execute('''CREATE TABLE IF NOT EXISTS earnings
+                    (date TEXT, source TEXT, amount REAL, description TEXT,
+                     PRIMARY KEY (date, source, description))''')
+
+        c.execute('''CREATE TABLE IF NOT EXISTS opportunities
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                     date_added TEXT, platform TEXT, title TEXT, pay REAL,
+                     estimated_hours REAL, capability_match REAL, profitability REAL,
+                     risk_level TEXT, status TEXT, notes TEXT)''')
+
+        c.execute('''CREATE TABLE IF NOT EXISTS costs
+                    (date TEXT PRIMARY KEY, electricity REAL, internet REAL,
+                     api_costs REAL, taxes REAL, total REAL)''')
+
+        # New table: Service catalog with 30+ services
+        c.execute('''CREATE TABLE IF NOT EXISTS services
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                     name TEXT UNIQUE,
+                     category TEXT,
+                     tier TEXT,
+                     price_min REAL,
+                     price_max REAL,
+                     delivery_days REAL,
+                     hourly_rate REAL,
+                     status TEXT,
+                     orders_completed INTEGER DEFAULT 0,
+                     revenue_total REAL DEFAULT 0.0,
+                     last_order_date TEXT,
+                     fiverr_url TEXT,
+                     upwork_url TEXT,
+                     notes TEXT)''')
+
+        conn.commit()
+
+        # Initialize services catalog (run once)
+        c.execute("SELECT COUNT(*) FROM services")
+        if c.fetchone()[0] == 0:
+            services_data = [
+                # TIER 1: QUICK WINS ($25-100, 1-2 days)
+                ("QR Code Generation", "Specialized", "Quick Win", 25, 100, 0.5, 300, "Ready to Test"),
+                ("3D Model Generation", "3D Modeling", "Quick Win", 50, 300, 1, 150, "Ready to Test"),
+                ("Python Automation Script", "Automation", "Quick Win", 75, 150, 1, 100, "Ready to Test"),
+                ("Web Scraping Task", "Web Scraping", "Quick Win", 75, 100, 1, 75, "Ready to Test"),
+
+                # TIER 2: MEDIUM PROJECTS ($150-400, 3-5 days)
+                ("Streamlit Dashboard", "Dashboards", "Medium", 250, 800, 4, 60, "Ready to Test"),
+                ("Social Media Automation Bot", "AI Automation", "Medium", 200, 350, 4, 60, "Ready to Test"),
+                ("Job Board Scraper", "Web Scraping", "Medium", 100, 500, 3, 50, "Ready to Test"),
+                ("System Health Monitor", "Monitoring", "Medium", 150, 400, 3, 50, "Ready to Test"),
+                ("AI Chatbot Integration", "AI Automation", "Medium", 150, 500, 3, 65, "Ready to Test"),
+                ("Database Design", "Database", "Medium", 150, 400, 3, 50, "Ready to Test"),
+                ("API Development", "Database", "Medium", 300, 1000, 7, 60, "Not Started"),
+
+                # TIER 3: PREMIUM SERVICES ($500-2,000, 1-2 weeks)
+                ("Custom Trading Bot", "Trading", "Premium", 800, 2000, 10, 80, "Not Started"),
+                ("VR Workspace Development", "3D Modeling", "Premium", 600, 1000, 7, 85, "Ready to Test"),
+                ("Full Dashboard Suite", "Dashboards", "Premium", 700, 1200, 10, 70, "Not Started"),
+                ("AI Automation Platform", "AI Automation", "Premium", 1000, 2000, 14, 75, "Not Started"),
+
+                # RECURRING REVENUE SERVICES
+                ("AI Influencer Automation (Basic)", "AI Automation", "Recurring", 300, 300, 30, 0, "Not Started"),
+                ("AI Influencer Automation (Standard)", "AI Automation", "Recurring", 600, 600, 30, 0, "Not Started"),
+                ("AI Influencer Automation (Premium)", "AI Automation", "Recurring", 1200, 1200, 30, 0, "Not Started"),
+
+                # ADDITIONAL QUICK SERVICES
+                ("Voice AI System", "AI Automation", "Medium", 150, 400, 3, 65, "Ready to Test"),
+                ("Trading Signal Dashboard", "Trading", "Medium", 200, 500, 4, 55, "Not Started"),
+                ("Portfolio Tracker", "Trading", "Medium", 300, 700, 5, 60, "Not Started"),
+                ("VR 3D Content", "3D Modeling", "Medium", 150, 600, 4, 70, "Not Started"),
+                ("Custom Web Scraper", "Web Scraping", "Medium", 150, 600, 4, 50, "Not Started"),
+                ("Database Optimization", "Database", "Quick Win", 100, 400, 2, 75, "Ready to Test"),
+                ("File System Automation", "Automation", "Quick Win", 80, 250, 2, 60, "Ready to Test"),
+                ("Mobile Dashboard", "Dashboards", "Medium", 300, 700, 6, 55, "Not Started"),
+                ("AI Content Writer", "AI Automation", "Medium", 200, 500, 4, 60, "Not Started"),
+                ("Image Generation Integration", "AI Automation", "Medium", 200, 500, 4, 60, "Not Started"),
+                ("Clipboard Sync Tool", "Specialized", "Quick Win", 100, 300, 2, 65, "Ready to Test"),
+                ("VPN Setup Service", "Specialized", "Medium", 150, 400, 2, 85, "Not Started"),
+            ]
+
+            for service in services_data:
+                c.execute("""INSERT OR IGNORE INTO services
+                           (name, category, tier, price_min, price_max, delivery_days, hourly_rate, status)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""", service)
+            conn.commit()
+
+        # Calculate totals
+        c.execute("SELECT SUM(amount) FROM earnings WHERE date LIKE ?", (datetime.now().strftime('%Y-%m') + '%',))
+        monthly_total = c.fetchone()[0] or 0.0
+
+        c.execute("SELECT SUM(amount) FROM earnings WHERE date >= ?",
+                 ((datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d'),))
+        quarterly_total = c.fetchone()[0] or 0.0
+
+        c.execute("SELECT SUM(amount) FROM earnings")
+        all_time_total = c.fetchone()[0] or 0.0
+
+        c.execute("SELECT SUM(revenue_total) FROM services")
+        services_revenue = c.fetchone()[0] or 0.0
+
+        c.execute("SELECT COUNT(*) FROM services WHERE status = 'Launched'")
+        launched_count = c.fetchone()[0] or 0
+
+        c.execute("SELECT COUNT(*) FROM services WHERE status = 'Ready to Test'")
+        ready_count = c.fetchone()[0] or 0
+
+        # Dashboard metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("💰 Monthly Revenue", f"${monthly_total:,.0f}")
+        with col2:
+            st.metric("📈 Services Revenue", f"${services_revenue:,.0f}")
+        with col3:
+            st.metric("🚀 Launched", f"{launched_count}/30")
+        with col4:
+            st.metric("✅ Ready to Test", f"{ready_count}")
+
+        st.divider()
+
+        # Tab navigation for different views
+        tab1, tab2, tab3, tab4 = st.tabs(["📊 Service Catalog", "💵 Revenue Tracking", "🎯 Quick Launch", "📋 Opportunities"])
+
+        with tab1:
+            st.subheader("🛍️ Complete Service Catalog (30+ Services)")
+
+            # Filter by tier
+            tier_filter = st.selectbox("Filter by Tier", ["All", "Quick Win", "Medium", "Premium", "Recurring"])
+
+            # Get services
+            if tier_filter == "All":
+                c.execute("""SELECT name, category, tier, price_min, price_max, delivery_days,
+                           hourly_rate, status, orders_completed, revenue_total
+                           FROM services ORDER BY tier, category, name""")
+            else:
+                c.execute("""SELECT name, category, tier, price_min, price_max, delivery_days,
+                           hourly_rate, status, orders_completed, revenue_total
+                           FROM services WHERE tier = ? ORDER BY category, name""", (tier_filter,))
+
+            services = c.fetchall()
+
+            if services:
+                for service in services:
+                    name, category, tier, price_min, price_max, days, hourly, status, orders, revenue = service
+
+                    # Status color
+                    status_colors = {
+                        "Not Started": "🔴",
+                        "Ready to Test": "🟡",
+                        "Testing": "🟠",
+                        "Launched": "🟢"
+                    }
+                    status_emoji = status_colors.get(status, "⚪")
+
+                    with st.expander(f"{status_emoji} {name} - ${price_min}-{price_max}"):
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.caption("**Category:**")
+                            st.write(category)
+                            st.caption("**Tier:**")
+                            st.write(tier)
+                        with col2:
+                            st.caption("**Pricing:**")
+                            st.write(f"${price_min}-${price_max}")
+                            st.caption("**Delivery:**")
+                            st.write(f"{days} days")
+                        with col3:
+                            st.caption("**Hourly Rate:**")
+                            st.write(f"${hourly}/hr")
+                            st.caption("**Status:**")
+                            st.write(status)
+
+                        if orders > 0:
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                st.metric("Orders Completed", orders)
+                            with col2:
+                                st.metric("Total Revenue", f"${revenue:,.0f}")
+
+                        # Quick actions
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            if status == "Not Started":
+                                if st.button("🧪 Mark Ready to Test", key=f"ready_{name}"):
+                                    c.execute("UPDATE services SET status = 'Ready to Test' WHERE name = ?", (name,))
+                                    conn.commit()
+                                    st.rerun()
+                        with col2:
+                            if status == "Ready to Test":
+                                if st.button("🚀 Mark as Launched", key=f"launch_{name}"):
+                                    c.execute("UPDATE services SET status = 'Launched' WHERE name = ?", (name,))
+                                    conn.commit()
+                                    st.success(f"Launched {name}!")
+                                    st.rerun()
+                        with col3:
+                            if status == "Launched":
+                                if st.button("➕ Add Order", key=f"order_{name}"):
+                                    st.session_state[f'adding_order_{name}'] = True
+                                    st.rerun()
+
+                        # Add order form
+                        if st.session_state.get(f'adding_order_{name}', False):
+                            with st.form(key=f"order_form_{name}"):
+                                order_amount = st.number_input("Order Amount ($)", min_value=0.0, value=float(price_min))
+                                order_notes = st.text_input("Notes (optional)")
+                                submitted = st.form_submit_button("Submit Order")
+                                if submitted:
+                                    # Update service stats
+                                    c.execute("""UPDATE services
+                                               SET orders_completed = orders_completed + 1,
+                                                   revenue_total = revenue_total + ?,
+                                                   last_order_date = ?
+                                               WHERE name = ?""",
+                                             (order_amount, datetime.now().strftime('%Y-%m-%d'), name))
+                                    # Add to earnings
+                                    c.execute("""INSERT INTO earnings VALUES (?, ?, ?, ?)""",
+                                             (datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                                              name, order_amount, order_notes or "Order completed"))
+                                    conn.commit()
+                                    st.session_state[f'adding_order_{name}'] = False
+                                    st.success(f"Order recorded: ${order_amount}")
+                                    st.rerun()
+            else:
+                st.info("No services found")
+
+        with tab2:
+            st.subheader("💵 Revenue Analytics")
+
+            # Overall stats
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("All-Time Revenue", f"${all_time_total:,.0f}")
+            with col2:
+                st.metric("This Quarter", f"${quarterly_total:,.0f}")
+            with col3:
+                target_progress = (all_time_total / 100000.0) * 100
+                st.metric("To $100k Goal", f"{target_progress:.1f}%")
+
+            st.divider()
+
+            # Revenue by category
+            c.execute("""SELECT category, SUM(revenue_total) as total
+                       FROM services GROUP BY category ORDER BY total DESC""")
+            cat_revenue = c.fetchall()
+
+            if cat_revenue:
+                st.caption("**Revenue by Category:**")
+                for cat, total in cat_revenue:
+                    if total > 0:
+                        st.write(f"**{cat}:** ${total:,.0f}")
+
+            st.divider()
+
+            # Top performers
+            c.execute("""SELECT name, orders_completed, revenue_total
+                       FROM services WHERE orders_completed > 0
+                       ORDER BY revenue_total DESC LIMIT 5""")
+            top_services = c.fetchall()
+
+            if top_services:
+                st.caption("**Top 5 Services:**")
+                for svc_name, orders, rev in top_services:
+                    st.write(f"**{svc_name}:** {orders} orders, ${rev:,.0f}")
+
+        with tab3:
+            st.subheader("🎯 Quick Launch Services")
+            st.info("**These 3 services are tested and ready to launch THIS WEEK**")
+
+            quick_wins = [
+                ("QR Code Generation", 25, "10 min", 300),
+                ("3D Model Generation", 50, "30 min", 150),
+                ("Python Automation Script", 75, "1 hour", 100)
+            ]
+
+            for service_name, price, turnaround, hourly in quick_wins:
+                with st.container():
+                    col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
+                    with col1:
+                        st.write(f"**{service_name}**")
+                    with col2:
+                        st.write(f"${price}")
+                    with col3:
+                        st.write(turnaround)
+                    with col4:
+                        st.write(f"${hourly}/hr effective")
+
+            st.divider()
+
+            st.markdown("""
+            ### 📋 Launch Checklist:
+
+            **Week 1 (This Week):**
+            - [ ] Test QR codes (3 hours) - See CAPABILITY_TESTING_CHECKLIST.md
+            - [ ] Test 3D models (4 hours)
+            - [ ] Test Python scripts (5 hours)
+
+            **Week 2:**
+            - [ ] Create Fiverr gigs (Friday)
+            - [ ] Set competitive pricing
+            - [ ] Upload portfolio screenshots
+
+            **Week 3:**
+            - [ ] Deliver first 5-10 orders
+            - [ ] Get 5-star reviews
+            - [ ] Target: $500-1,000 revenue
+            """)
+
+            if st.button("📄 Open Full Testing Checklist", use_container_width=True):
+                plan = get_plan_library().get(BASE_DIR / "CAPABILITY_TESTING_CHECKLIST.md")
+                if plan is not None:
+                    st.text_area("Testing Checklist", plan.text(), height=400)
+                else:
+                    st.error("Testing checklist not found")
+
+        with tab4:
+            st.subheader("🔍 Opportunity Queue")
+
+            c.execute("SELECT COUNT(*) FROM opportunities WHERE status = 'pending'")
+            pending_count = c.fetchone()[0] or 0
+
+            if pending_count > 0:
+                st.info(f"**{pending_count} opportunities** awaiting review")
+
+                # Show opportunities
+                c.execute("""SELECT id, platform, title, pay, estimated_hours,
+                            capability_match, profitability, risk_level
+                            FROM opportunities WHERE status = 'pending'
+                            ORDER BY profitability DESC LIMIT 5""")
+                opportunities = c.fetchall()
+
+                for opp in opportunities:
+                    opp_id, platform, title, pay, hours, match, profit, risk = opp
+
+                    with st.expander(f"💼 {title} - ${pay:,.0f}"):
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("Platform", platform)
+                            st.metric("Pay", f"${pay:,.0f}")
+                        with col2:
+                            st.metric("Est. Hours", f"{hours:.1f}h")
+                            st.metric("Match", f"{match:.0%}")
+                        with col3:
+                            st.metric("Profitability", f"${profit:,.0f}")
+                            st.metric("Risk", risk)
+
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            if st.button("✅ Accept", key=f"accept_{opp_id}"):
+                                c.execute("UPDATE opportunities SET status = 'accepted' WHERE id = ?", (opp_id,))
+                                conn.commit()
+                                st.success("Opportunity accepted!")
+                                st.rerun()
+                        with col2:
+                            if st.button("❌ Decline", key=f"decline_{opp_id}"):
+                                c.execute("UPDATE opportunities SET status = 'declined' WHERE id = ?", (opp_id,))
+                                conn.commit()
+                                st.info("Opportunity declined")
+                                st.rerun()
+                        with col3:
+                            if st.button("📝 Review Later", key=f"later_{opp_id}"):
+                                st.info("Will review later")
+            else:
+                st.info("No pending opportunities. Autonomous monitoring active.")
+
+        st.divider()
+
+        # Recent Activity
+        st.subheader("📋 Recent Activity & Earnings Log")
+
+        c.execute("""SELECT date, source, amount, description
+                    FROM earnings ORDER BY date DESC LIMIT 15""")
+        recent_earnings = c.fetchall()
+
+        if recent_earnings:
+            for date, source, amount, desc in recent_earnings:
+                col1, col2, col3 = st.columns([2, 2, 3])
+                with col1:
+                    st.caption(date[:16])
+                with col2:
+                    st.caption(source)
+                with col3:
+                    st.caption(f"**${amount:.2f}** - {desc}")
+        else:
+            st.caption("No earnings yet. Launch quick win services to start earning!")
+
+        st.divider()
+
+        # Planning Documents
+        st.subheader("📚 Strategic Planning Documents")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            if st.button("📄 Master Decade Plan", use_container_width=True):
+                if not show_plan("Master Decade Plan (120-month roadmap)", "MASTER_DECADE_PLAN_MONTHLY.md", "see file for full plan"):
+                    st.error("Master plan not found")
+
+            if st.button("🧪 Testing Checklist", use_container_width=True):
+                if not show_plan("Pre-Launch Testing Checklist", "CAPABILITY_TESTING_CHECKLIST.md", "see file for full checklist"):
+                    st.error("Testing checklist not found")
+
+        with col2:
+            if st.button("💰 Money-Making Guide", use_container_width=True):
+                if not show_plan("30+ Money-Making Services", "TRINITY_MONEY_MAKING_CAPABILITIES.md", "see file for complete guide"):
+                    st.error("Money-making guide not found")
+
+            if st.button("🚀 Optimization Strategies", use_container_width=True):
+                if not show_plan("10 Optimization Levers", "WEALTH_OPTIMIZATION_STRATEGIES.md", "see file for full strategies"):
+                    st.error("Optimization strategies not found")
+
+        with col3:
+            if st.button("📈 Trading Flywheel Plan", use_container_width=True):
+                if not show_plan("Genesis V2 Flywheel Integration", "DECADE_PLAN_WITH_FLYWHEEL.md", "see file for full plan"):
+                    st.error("Flywheel plan not found")
+
+            if st.button("📊 Export All Data", use_container_width=True):
+                # Export all business data
+                c.execute("SELECT * FROM services")
+                services_data = c.fetchall()
+                c.execute("SELECT * FROM earnings")
+                earnings_data = c.fetchall()
+
+                export = {
+                    "services": [{
+                        "name": s[1], "category": s[2], "tier": s[3],
+                        "price": f"${s[4]}-${s[5]}", "status": s[8],
+                        "orders": s[9], "revenue": s[10]
+                    } for s in services_data],
+                    "earnings": [{
+                        "date": e[0], "source": e[1],
+                        "amount": e[2], "description": e[3]
+                    } for e in earnings_data],
+                    "summary": {
+                        "total_revenue": all_time_total,
+                        "monthly_revenue": monthly_total,
+                        "launched_services": launched_count,
+                        "ready_to_test": ready_count
+                    }
+                }
+                st.json(export)
+
+        st.divider()
+
+        # Quick Stats Summary
+        st.subheader("📊 Quick Stats")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        c.execute("SELECT COUNT(*) FROM services WHERE tier = 'Quick Win'")
+        quick_win_count = c.fetchone()[0]
+        c.execute("SELECT COUNT(*) FROM services WHERE tier = 'Medium'")
+        medium_count = c.fetchone()[0]
+        c.execute("SELECT COUNT(*) FROM services WHERE tier = 'Premium'")
+        premium_count = c.fetchone()[0]
+        c.execute("SELECT COUNT(*) FROM services WHERE tier = 'Recurring'")
+        recurring_count = c.fetchone()[0]
+
+        with col1:
+            st.metric("Quick Wins", f"{quick_win_count} services")
+            st.caption("$25-100, 1-2 days")
+        with col2:
+            st.metric("Medium", f"{medium_count} services")
+            st.caption("$150-400, 3-5 days")
+        with col3:
+            st.metric("Premium", f"{premium_count} services")
+            st.caption("$500-2k, 1-2 weeks")
+        with col4:
+            st.metric("Recurring", f"{recurring_count} services")
+            st.caption("$300-1.2k/month")
+
+        conn.close()
+
+    except Exception as e:
+        st.error(f"⚠️ Business dashboard error: {str(e)}")
+        st.info("Business database will be initialized on first use.")
+
+# ============================================================================
+# TRADING STATION
+# ============================================================================
+
+def render_trading_station(agro: bool = False):
+    """Render the Trading Bot monitoring module (``agro``: AGRO MODE configuration view)."""
+    st.header("📊 Trading Station")
+
+    if agro:
+        # Phoenix Mark XII AGRO MODE Badge
+        st.success("🏆 **Phoenix Mark XII - AGRO MODE** (Activated Feb 5, 2026)")
+
+        with st.expander("⚡ AGRO MODE Configuration"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Base Risk", "3.0%")
+                st.caption("Up from 1.76%")
+            with col2:
+                st.metric("Max Positions", "5")
+                st.caption("Concurrent trades")
+            with col3:
+                st.metric("Target Return", "$4-5k/mo")
+                st.caption("10-12% monthly")
+
+            st.divider()
+
+            st.markdown("### Circuit Breakers")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.write("**Daily Loss:** -10%")
+            with col2:
+                st.write("**Drawdown Tiers:** 8%, 15%, 25%")
+            with col3:
+                st.write("**Min Equity:** $38,000")
+    else:
+        # Phoenix Mark XII Genesis V2 Champion Badge
+        st.success("🏆 **Phoenix Mark XII Genesis V2** - Validated Champion (Feb 3, 2026)")
+
+        with st.expander("📈 Validation Results (5,000 simulations)"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Fitness Score", "121.08")
+                st.metric("Sharpe Ratio", "2.14")
+                st.metric("Sortino Ratio", "15.46")
+            with col2:
+                st.metric("Calmar Ratio", "19.40")
+                st.metric("Profit Probability", "99.05%")
+                st.metric("Median Return", "+103.5%")
+            with col3:
+                st.metric("Max Drawdown", "8.8%")
+                st.metric("Ruin Probability", "0.0%")
+                st.write("**Strategy:** QQQ Options (Calls + Puts)")
+
+        st.divider()
+
+        # Macro Status
+        macro = get_macro_status_data()
+        if 'error' not in macro:
+            action_color = {
+                'NORMAL_MODE': '🟢',
+                'DEFENSIVE_MODE': '🟡',
+                'HALT_IMMEDIATELY': '🔴'
+            }.get(macro['current_action'], '⚪')
+
+            st.info(f"{action_color} **Macro Status:** {macro['current_action']}")
+
+    st.divider()
+
+    # Phoenix Status (Single Card)
+    phoenix = get_phoenix_stats()
+
+    if 'error' in phoenix:
+        st.error(f"Error: {phoenix['error']}")
+    else:
+        # Status indicator
+        status_emoji = "🟢" if phoenix['running'] else "🔴"
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            st.metric("Status", f"{status_emoji} {'Online' if phoenix['running'] else 'Offline'}")
+        with col2:
+            if agro:
+                st.write(f"**Mode:** {phoenix['mode']}")
+            st.write(f"**Last Update:** {phoenix['log_updated']}")
+
+        if phoenix['running']:
+            # Live metrics
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                st.metric("Symbol", phoenix['symbol'])
+                st.metric("QQQ Price", f"${phoenix['latest_price']}" if phoenix['latest_price'] else "N/A")
+            with col_b:
+                st.metric("RSI", phoenix['rsi'] if phoenix['rsi'] else "N/A")
+                st.metric("Position", phoenix['position'])
+            with col_c:
+                st.metric("Strategy", "Options")
+                st.write("**Type:** Calls + Puts")
+        else:
+            st.warning("⚠️ Phoenix is offline. Start it with: `python3 mark_xii_phoenix.py`")
+
+    st.divider()
+
+    # Quick Actions
+    st.subheader("Quick Actions")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("📈 View Trading Log", width='stretch', key="trading_view_log"):
+            try:
+                if PHOENIX_LOG.exists():
+                    with open(PHOENIX_LOG, 'r', encoding='utf-8', errors='ignore') as f:
+                        log_content = f.readlines()[-50:]
+                    st.text_area("Phoenix Mark XII Log (Last 50 lines)", "".join(log_content), height=400)
+                else:
+                    st.error(f"Log file not found at {PHOENIX_LOG}")
+            except Exception as e:
+                st.error(f"Error reading log file: {str(e)}")
+
+    with col2:
+        if st.button("🔄 Refresh Status", width='stretch', key="trading_refresh"):
+            st.rerun()
+
+    with col3:
+        if st.button("📁 Open Bot-Factory", width='stretch', key="open_bot_factory"):
+            try:
+                if BOT_FACTORY_DIR.exists():
+                    subprocess.run(["open", str(BOT_FACTORY_DIR)], timeout=5)
+                    st.success("Opening Bot-Factory...")
+                else:
+                    st.error(f"Bot-Factory directory not found at {BOT_FACTORY_DIR}")
+            except Exception as e:
+                st.error(f"Could not open Bot-Factory: {str(e)}")
+
+# ============================================================================
+# CLAUDE CODE TERMINAL STATION
+# ============================================================================
+
+def render_claude_code_station():
+    """Render Claude Code terminal integration."""
+    st.header("💻 Claude Code Terminal")
+
+    st.info("**Claude Code** - Command center for development, debugging, and system updates")
+
+    # Status check
+    claude_code_running = check_claude_code_status()
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        status_emoji = "🟢" if claude_code_running else "🔴"
+        st.metric("Status", f"{status_emoji} {'Active' if claude_code_running else 'Inactive'}")
+
+    with col2:
+        st.metric("Session", "Trinity System")
+
+    with col3:
+        st.metric("Context", "200k tokens")
+
+    st.divider()
+
+    # Quick Actions
+    st.subheader("⚡ Quick Actions")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 🛠️ Development")
+        if st.button("🔧 Debug Command Center", use_container_width=True):
+            st.code("claude code --project Trinity-System", language="bash")
+            st.info("Opens Claude Code in Trinity System project directory")
+
+        if st.button("📊 Update Financial Data", use_container_width=True):
+            st.code("# Update financial projections\ncd /Users/tybrown/Desktop/Trinity-System\ncode COMPLETE_FINANCIAL_MODEL_2026_2036.md", language="bash")
+
+        if st.button("⚡ Deploy Optimizations", use_container_width=True):
+            st.info("Execute Week 1 urgent actions via Claude Code")
+
+    with col2:
+        st.markdown("### 📈 Trading")
+        if st.button("📊 Check Phoenix AGRO Status", use_container_width=True):
+            try:
+                if PHOENIX_LOG.exists():
+                    with open(PHOENIX_LOG, 'r') as f:
+                        log_lines = f.readlines()[-20:]
+                    st.text_area("Phoenix Log (Last 20 lines)", "".join(log_lines), height=300)
+            except:
+                st.error("Could not read Phoenix log")
+
+        if st.button("🔄 Restart Phoenix AGRO", use_container_width=True):
+            st.code("cd /Users/tybrown/Desktop/Bot-Factory\npython3 switch_phoenix_mode.py agro\npython3 mark_xii_phoenix.py", language="bash")
+
+    st.divider()
+
+    # Terminal Access Methods
+    st.subheader("🖥️ Terminal Access")
+
+    tab1, tab2, tab3 = st.tabs(["📱 Launch", "📋 Commands", "🔗 Direct Link"])
+
+    with tab1:
+        st.markdown("### Open Claude Code Terminal")
+
+        st.code("""# Mac/Linux
+open -a Terminal
+
+# Then run:
+cd /Users/tybrown/Desktop/Trinity-System
+claude code
+""", language="bash")
+
+        if st.button("🚀 Launch Terminal (MacOS)", use_container_width=True):
+            try:
+                subprocess.Popen([
+                    'osascript', '-e',
+                    'tell application "Terminal" to do script "cd /Users/tybrown/Desktop/Trinity-System && claude code"'
+                ])
+                st.success("Terminal launched!")
+            except Exception as e:
+                st.error(f"Could not launch terminal: {e}")
+
+    with tab2:
+        st.markdown("### Useful Commands")
+
+        commands = [
+            ("Check system status", "ps aux | grep -E '(phoenix|trinity|streamlit)'"),
+            ("View Phoenix log", "tail -f /Users/tybrown/Desktop/Bot-Factory/mark_xii_phoenix.log"),
+            ("Git status", "git status"),
+            ("Commit changes", "git add . && git commit -m 'Update' && git push"),
+            ("Update Command Center", "cd /Users/tybrown/Desktop/Trinity-System && streamlit run trinity_app.py"),
+            ("Switch Phoenix to AGRO", "cd /Users/tybrown/Desktop/Bot-Factory && python3 switch_phoenix_mode.py agro")
+        ]
+
+        for label, cmd in commands:
+            with st.expander(label):
+                st.code(cmd, language="bash")
+                if st.button("Copy", key=f"copy_{commands.index((label, cmd))}"):
+                    st.success("Copied to clipboard (use Ctrl+V to paste)")
+
+    with tab3:
+        st.markdown("### Direct Terminal Link")
+        st.info("Claude Code CLI currently requires terminal access")
+        st.markdown("""
+        **To access Claude Code:**
+        1. Open Terminal.app
+        2. Navigate to project: `cd /Users/tybrown/Desktop/Trinity-System`
+        3. Run: `claude code`
+
+        **Future:** Web-based terminal integration planned
+        """)
+
+    st.divider()
+
+    # Self-Update Feature
+    st.subheader("🔄 Self-Update Command Center")
+
+    st.markdown("""
+    ### Update This Dashboard
+    Use Claude Code to modify and improve the Command Center:
+
+    1. Open Claude Code terminal
+    2. Request changes: "Update command center to add X feature"
+    3. Claude will modify `stations.py` (shared by every layout) or the layout file
+    4. Restart Streamlit (`trinity_app.py`) to see changes
+    """)
+
+    if st.button("📝 Generate Update Request Template", use_container_width=True):
+        template = """# Command Center Update Request
+
+**Feature:** [Describe what you want to add/change]
+
+**Location:** stations.py (shared stations) or the app layout
+
+**Requirements:**
+- [ ] Maintain existing functionality
+- [ ] Add new feature
+- [ ] Test changes
+- [ ] Update documentation
+
+**Claude Code Prompt:**
+"Update Trinity Command Center to [your request]. Maintain all existing features."
+"""
+        st.text_area("Copy this template:", template, height=300)
+
+def check_claude_code_status() -> bool:
+    """Check if Claude Code CLI session is active."""
+    return process_running('claude')
+
+# ============================================================================
+# HOMEPAGE, FINANCIAL AND QUICK CASH (Command Center v2.0)
+# ============================================================================
+
+def render_homepage(nav_key: str):
+    """Homepage with system overview (quick actions navigate via ``nav_key``)."""
+    st.header("🏠 Trinity System Overview")
+
+    # System Status Banner
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        phoenix_status = check_phoenix_status()
+        st.metric("Phoenix AGRO", "🟢 Active" if phoenix_status else "🔴 Offline")
+
+    with col2:
+        quick_cash_status = get_quick_cash_status()
+        st.metric("Quick Cash", f"{quick_cash_status['ready']}/3 Ready")
+
+    with col3:
+        burn_rate = get_current_burn_rate()
+        st.metric("Burn Rate", f"${burn_rate:,.0f}/mo",
+                 delta="Target: -$330" if burn_rate < 0 else "Positive")
+
+    with col4:
+        week1_progress = get_week1_progress()
+        st.metric("Week 1 Actions", f"{week1_progress['done']}/5")
+
+    with col5:
+        system_health = check_system_health()
+        st.metric("System Health", f"{system_health}%")
+
+    st.divider()
+
+    # Quick Actions Grid
+    st.subheader("⚡ Quick Actions")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("### 💰 Financial")
+        if st.button("📊 View Financial Projections", use_container_width=True):
+            st.session_state[nav_key] = "Financial"
+            st.rerun()
+        if st.button("💼 Launch Quick Cash Services", use_container_width=True):
+            st.session_state[nav_key] = "Quick Cash"
+            st.rerun()
+        if st.button("📈 Week 1 Urgent Actions", use_container_width=True):
+            st.session_state[nav_key] = "Quick Cash"
+            st.rerun()
+
+    with col2:
+        st.markdown("### 🤖 AI Operations")
+        if st.button("📊 Trading Station (AGRO)", use_container_width=True):
+            st.session_state[nav_key] = "Trading"
+            st.rerun()
+        if st.button("🤖 AI Assistant Chat", use_container_width=True):
+            st.session_state[nav_key] = "AI Assistant"
+            st.rerun()
+        if st.button("🧠 Memory Search", use_container_width=True):
+            st.session_state[nav_key] = "Memory"
+            st.rerun()
+
+    with col3:
+        st.markdown("### 🛠️ Development")
+        if st.button("💻 Claude Code Terminal", use_container_width=True):
+            st.session_state[nav_key] = "Claude Code"
+            st.rerun()
+        if st.button("🔧 Engineering Station", use_container_width=True):
+            st.session_state[nav_key] = "Engineering"
+            st.rerun()
+        if st.button("🎯 Career Station", use_container_width=True):
+            st.session_state[nav_key] = "Career"
+            st.rerun()
+
+    st.divider()
+
+    # Recent Activity & Alerts
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🚨 Critical Alerts")
+        alerts = get_critical_alerts()
+        if alerts:
+            for alert in alerts:
+                st.warning(f"**{alert['title']}**: {alert['message']}")
+        else:
+            st.success("✅ No critical alerts")
+
+    with col2:
+        st.subheader("📈 Today's Highlights")
+        highlights = get_daily_highlights()
+        for highlight in highlights:
+            st.info(f"• {highlight}")
+
+    st.divider()
+
+    # System Metrics
+    st.subheader("📊 System Metrics")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Trading Bot", "Phoenix AGRO")
+        st.caption("3% risk, 5 positions")
+        st.caption("Target: $4-5k/month")
+
+    with col2:
+        revenue_target = get_monthly_revenue_target()
+        current_revenue = get_current_monthly_revenue()
+        st.metric("Revenue Target", f"${revenue_target:,.0f}/mo")
+        st.caption(f"Current: ${current_revenue:,.0f}")
+        st.progress(min(current_revenue / revenue_target, 1.0))
+
+    with col3:
+        runway_months = calculate_runway()
+        st.metric("Runway", f"{runway_months} months")
+        st.caption("At current burn rate")
+        if runway_months < 18:
+            st.caption("⚠️ Below 18mo target")
+
+    with col4:
+        st.metric("Optimization Value", "$2.3M+")
+        st.caption("20 optimizations")
+        st.caption("Identified Feb 5, 2026")
+
+# Helper functions for homepage
+def check_phoenix_status() -> bool:
+    """Check if Phoenix is running."""
+    return process_running(PHOENIX_PROCESS)
+
+def get_quick_cash_status() -> Dict:
+    """Get Quick Cash services status."""
+    return {
+        'ready': 3,  # All 3 services ready
+        'total': 3,
+        'services': ['QR Codes', '3D Models', 'Python Automation']
+    }
+
+def get_current_burn_rate() -> float:
+    """Get current monthly burn rate."""
+    return -635.0  # From optimization report
+
+def get_week1_progress() -> Dict:
+    """Get Week 1 urgent actions progress."""
+    # Could be loaded from a tracking file
+    return {
+        'done': len([k for k, v in st.session_state.week1_checklist.items() if v]),
+        'total': 5
+    }
+
+def check_system_health() -> int:
+    """Calculate system health score."""
+    score = 100
+
+    # Phoenix not running: -20
+    if not check_phoenix_status():
+        score -= 20
+
+    # High burn rate: -10
+    if get_current_burn_rate() < -600:
+        score -= 10
+
+    # Quick Cash not launched: -10
+    if get_quick_cash_status()['ready'] < 3:
+        score -= 10
+
+    return max(0, score)
+
+def get_critical_alerts() -> List[Dict]:
+    """Get critical system alerts."""
+    alerts = []
+
+    if get_current_burn_rate() < -600:
+        alerts.append({
+            'title': 'Cash Flow Crisis',
+            'message': f'Burn rate: ${get_current_burn_rate()}/mo. Execute Week 1 actions immediately.'
+        })
+
+    if not check_phoenix_status():
+        alerts.append({
+            'title': 'Phoenix Offline',
+            'message': 'AGRO MODE bot not running. Start with: python3 mark_xii_phoenix.py'
+        })
+
+    return alerts
+
+def get_daily_highlights() -> List[str]:
+    """Get today's highlights."""
+    return [
+        "Phoenix AGRO MODE activated (3% risk)",
+        "Quick Cash services production-ready",
+        "Optimization report: $2.3M+ value identified",
+        "Week 1 urgent actions plan created"
+    ]
+
+def get_monthly_revenue_target() -> float:
+    """Get monthly revenue target."""
+    return 3885.0  # Current expenses from report
+
+def get_current_monthly_revenue() -> float:
+    """Get current monthly revenue."""
+    return 3250.0  # After-tax income from report
+
+def calculate_runway() -> int:
+    """Calculate runway in months."""
+    # From optimization report: 16 months at -$635/mo burn
+    return 16
+
+# ============================================================================
+# FINANCIAL PROJECTIONS STATION
+# ============================================================================
+
+def render_financial_station():
+    """Render comprehensive financial projections dashboard."""
+    st.header("💰 Financial Projections & Analysis")
+
+    # Summary Metrics
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Current Burn Rate", "-$635/mo", delta="-$330 target")
+    with col2:
+        st.metric("Runway", "16 months", delta="+14mo with cuts")
+    with col3:
+        st.metric("Monthly Target", "$3,885", help="Total monthly expenses")
+    with col4:
+        st.metric("Gap to Close", "$635", help="Current deficit")
+
+    st.divider()
+
+    # Tabs for different views
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "📊 Overview",
+        "💸 Income Sources",
+        "📉 Expenses",
+        "📈 10-Year Projection",
+        "⚡ Optimizations"
+    ])
+
+    with tab1:
+        render_financial_overview()
+
+    with tab2:
+        render_income_sources()
+
+    with tab3:
+        render_expenses_breakdown()
+
+    with tab4:
+        render_10year_projection()
+
+    with tab5:
+        render_optimizations()
+
+def render_financial_overview():
+    """Render financial overview."""
+    st.subheader("Current Financial State")
+
+    # Income vs Expenses
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 💵 Monthly Income")
+        st.metric("Current", "$3,250", help="After-tax income")
+
+        st.markdown("**Sources:**")
+        st.write("• Base income: $3,250")
+        st.write("• Phoenix AGRO (target): $4,000-5,000")
+        st.write("• Quick Cash (target): $300-700")
+        st.write("• **Total target:** $7,550-9,000/mo")
+
+    with col2:
+        st.markdown("### 💳 Monthly Expenses")
+        st.metric("Current", "$3,885")
+
+        st.markdown("**Major Categories:**")
+        st.write("• Rent: $1,500")
+        st.write("• Food: $600")
+        st.write("• Utilities: $200")
+        st.write("• Transportation: $300")
+        st.write("• Other: $1,285")
+
+    st.divider()
+
+    # Cash Flow Projection
+    st.subheader("3-Month Cash Flow Projection")
+
+    months = ["Month 1", "Month 2", "Month 3"]
+    income = [3250, 5500, 8000]  # Base, +Phoenix partial, +Phoenix full+Quick Cash
+    expenses = [3885, 3555, 3555]  # Current, then with $330 cuts
+    net = [i - e for i, e in zip(income, expenses)]
+
+    import pandas as pd
+    df = pd.DataFrame({
+        'Month': months,
+        'Income': income,
+        'Expenses': expenses,
+        'Net': net
+    })
+
+    st.bar_chart(df.set_index('Month'))
+    st.dataframe(df, use_container_width=True)
+
+def render_income_sources():
+    """Render detailed income sources."""
+    st.subheader("Income Sources Breakdown")
+
+    st.markdown("### Current Income")
+    st.metric("Base Income (After Tax)", "$3,250/mo")
+
+    st.divider()
+
+    st.markdown("### Phoenix AGRO MODE (Activated)")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Risk Level", "3%")
+    with col2:
+        st.metric("Max Positions", "5")
+    with col3:
+        st.metric("Target Return", "$4-5k/mo")
+
+    st.info("**Status:** Active since Feb 5, 2026. Conservative target: $4,000/mo, Optimistic: $5,000/mo")
+
+    st.divider()
+
+    st.markdown("### Quick Cash Services (Ready to Launch)")
+
+    services = [
+        {"name": "QR Code Generation", "price": "$25-60", "time": "10-15min", "target": "$200-600/mo"},
+        {"name": "3D Model Generation", "price": "$50-150", "time": "30min-2hr", "target": "$300-900/mo"},
+        {"name": "Python Automation", "price": "$75-200", "time": "1-3hr", "target": "$500-1,500/mo"}
+    ]
+
+    for svc in services:
+        with st.expander(f"**{svc['name']}** - {svc['price']}"):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.write(f"**Pricing:** {svc['price']}")
+                st.write(f"**Time per order:** {svc['time']}")
+            with col2:
+                st.write(f"**Monthly target:** {svc['target']}")
+                st.write("**Status:** ✅ Production ready")
+
+    st.success("**Combined target:** $1,000-3,000/mo (conservative: $300-700)")
+
+def render_expenses_breakdown():
+    """Render expenses breakdown with cut opportunities."""
+    st.subheader("Monthly Expenses Breakdown")
+
+    st.metric("Current Total", "$3,885/mo")
+    st.metric("After $330 Cuts", "$3,555/mo", delta="-$330")
+
+    st.divider()
+
+    # Expenses table
+    expenses = [
+        {"category": "Rent", "current": 1500, "target": 1500, "notes": "Fixed"},
+        {"category": "Food/Groceries", "current": 600, "target": 450, "notes": "Meal prep, less eating out"},
+        {"category": "Utilities", "current": 200, "target": 185, "notes": "Lower thermostat, LED bulbs"},
+        {"category": "Internet", "current": 80, "target": 50, "notes": "Call for promo rate"},
+        {"category": "Phone", "current": 70, "target": 40, "notes": "Switch to prepaid"},
+        {"category": "Transportation", "current": 300, "target": 280, "notes": "Insurance shopping"},
+        {"category": "Entertainment", "current": 100, "target": 50, "notes": "Free alternatives"},
+        {"category": "Subscriptions", "current": 47, "target": 0, "notes": "Cancel unused"},
+        {"category": "Other", "current": 988, "target": 1000, "notes": "Misc expenses"}
+    ]
+
+    import pandas as pd
+    df = pd.DataFrame(expenses)
+    df['Savings'] = df['current'] - df['target']
+
+    st.dataframe(df, use_container_width=True)
+
+    total_savings = df['Savings'].sum()
+    st.success(f"**Total Monthly Savings:** ${total_savings:,.0f}")
+
+    st.divider()
+
+    st.markdown("### Action Plan for Expense Cuts")
+    st.markdown("""
+    **Week 1 Actions:**
+    - [ ] Cancel unused subscriptions (-$47/mo)
+    - [ ] Call internet provider for lower rate (-$30/mo)
+    - [ ] Switch phone to prepaid plan (-$30/mo)
+    - [ ] Shop for car insurance quotes (-$20/mo)
+    - [ ] Start meal prep routine (-$150/mo)
+    - [ ] Cancel 1 streaming service (-$13/mo)
+    - [ ] Reduce entertainment budget (-$50/mo)
+
+    **Target:** -$330/mo total savings
+    **Impact:** Extends runway from 16 → 30 months
+    """)
+
+def render_10year_projection():
+    """Render 10-year financial projection."""
+    st.subheader("10-Year Financial Projection (2026-2036)")
+
+    st.info("Based on COMPLETE_FINANCIAL_MODEL_2026_2036.md and TRINITY_OPTIMIZATION_REPORT.md")
+
+    # Scenario comparison
+    scenario = st.selectbox(
+        "Select Scenario:",
+        ["Conservative", "Base", "Optimistic", "Optimized (With Improvements)"]
+    )
+
+    if scenario == "Conservative":
+        year_1_income = 45000
+        year_5_income = 180000
+        year_10_total = 2900000
+        notes = "Phoenix conservative + Quick Cash slow ramp + signal selling Year 3"
+    elif scenario == "Base":
+        year_1_income = 50000
+        year_5_income = 250000
+        year_10_total = 10100000
+        notes = "Phoenix moderate + Quick Cash moderate + signal selling Year 2"
+    elif scenario == "Optimistic":
+        year_1_income = 65000
+        year_5_income = 400000
+        year_10_total = 25000000
+        notes = "Phoenix aggressive + Quick Cash fast + signal selling Year 1 + exits"
+    else:  # Optimized
+        year_1_income = 68000
+        year_5_income = 280000
+        year_10_total = 12400000
+        notes = "With all 20 optimizations from Feb 5, 2026 report"
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Year 1 Income", f"${year_1_income:,.0f}")
+    with col2:
+        st.metric("Year 5 Income", f"${year_5_income:,.0f}")
+    with col3:
+        st.metric("Year 10 Total", f"${year_10_total:,.0f}")
+
+    st.caption(notes)
+
+    st.divider()
+
+    # Key milestones
+    st.markdown("### 🎯 Key Milestones")
+
+    milestones = [
+        {"date": "Month 1 (Feb 2026)", "event": "Quick Cash launch", "value": "+$300-700/mo"},
+        {"date": "Month 2 (Mar 2026)", "event": "Phoenix AGRO compounds", "value": "+$4,000/mo"},
+        {"date": "Month 3 (Apr 2026)", "event": "Positive cash flow", "value": "+$1,950-3,450/mo"},
+        {"date": "Month 6 (Jul 2026)", "event": "Collective2 launch", "value": "+$500-1,000/mo"},
+        {"date": "Month 12 (Jan 2027)", "event": "Signal selling 50 subs", "value": "+$5,000/mo"},
+        {"date": "Year 2 (2027)", "event": "Capital to $100k", "value": "$100,000"},
+        {"date": "Year 3 (2028)", "event": "Signal selling 200 subs", "value": "+$20,000/mo"},
+        {"date": "Year 5 (2030)", "event": "Multiple income streams", "value": "$250k-400k/yr"},
+        {"date": "Year 10 (2036)", "event": "Financial independence", "value": "$10M+ net worth"}
+    ]
+
+    for m in milestones:
+        with st.expander(f"**{m['date']}** - {m['event']}"):
+            st.write(f"**Target Value:** {m['value']}")
+
+def render_optimizations():
+    """Render optimizations from report."""
+    st.subheader("⚡ 20 Optimization Opportunities")
+
+    st.success("**Total Additional Value:** $2.3M+ over 10 years")
+
+    st.markdown("### 🚨 Urgent (This Week)")
+    urgent = [
+        "1. Cut $330/month expenses → Extends runway 16→30 months",
+        "2. Launch 3 Fiverr gigs → +$300-700/mo by Month 2",
+        "3. S-Corp research & formation → Save $14k Year 1",
+        "4. Collective2 account setup → +$85k-120k over 10 years",
+        "5. Implement 60hr/week schedule → Prevent burnout"
+    ]
+    for item in urgent:
+        st.warning(item)
+
+    st.divider()
+
+    st.markdown("### 💰 Financial Optimizations (7)")
+    financial = [
+        "AGRO MODE+ (3.5% risk) → +$1-1.5k/mo",
+        "QSBS strategy → +$390k tax savings on exit",
+        "Fiverr pricing increase after reviews → +$14k/year",
+        "Accelerated capital injection → Better compounding",
+        "Collective2 immediate launch → +$85-120k",
+        "Tax optimization (S-Corp) → +$180k over 10 years",
+        "Capital allocation front-loading → +10-15% returns"
+    ]
+    for item in financial:
+        st.info(f"• {item}")
+
+    st.divider()
+
+    st.markdown("### 🔧 Technical Optimizations (5)")
+    technical = [
+        "Cancel Jarvis Phase 2-7 build → Save 480-600 hours",
+        "Ship Trinity MVP in 8 weeks → Faster revenue",
+        "Tech stack simplification → 60% less complexity",
+        "Fiverr service automation → Faster delivery",
+        "Phoenix algorithm optimization → +5-10% returns"
+    ]
+    for item in technical:
+        st.info(f"• {item}")
+
+    st.divider()
+
+    st.markdown("### 🎯 Strategic Optimizations (4)")
+    strategic = [
+        "Blue ocean positioning → Less competition",
+        "Aggregation strategy → Platform leverage",
+        "Faster path to $10M (7 years vs 10) → 30% faster",
+        "Optionality preservation → Multiple exit paths"
+    ]
+    for item in strategic:
+        st.info(f"• {item}")
+
+# ============================================================================
+# QUICK CASH STATION
+# ============================================================================
+
+def render_quick_cash_station():
+    """Render Quick Cash services dashboard with Week 1 actions."""
+    st.header("⚡ Quick Cash Services & Week 1 Actions")
+
+    # Service Status
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Services Ready", "3/3", help="All production-ready")
+    with col2:
+        st.metric("Portfolio Samples", "11", help="QR codes, 3D models, scripts")
+    with col3:
+        st.metric("Gig Descriptions", "3/3", help="Fiverr ready")
+    with col4:
+        st.metric("Launch Status", "Ready", delta="Launch this week")
+
+    st.divider()
+
+    # Tabs
+    tab1, tab2, tab3 = st.tabs(["📦 Services", "📋 Week 1 Actions", "📊 Launch Plan"])
+
+    with tab1:
+        render_quick_cash_services()
+
+    with tab2:
+        render_week1_actions()
+
+    with tab3:
+        render_launch_plan()
+
+def render_quick_cash_services():
+    """Render Quick Cash services overview."""
+    st.subheader("Production-Ready Services")
+
+    services = [
+        {
+            "name": "QR Code Generation",
+            "status": "✅ Ready",
+            "pricing": "$25-60",
+            "delivery": "10-15 minutes",
+            "samples": 5,
+            "target": "$200-600/mo",
+            "effective_rate": "$100-150/hr"
+        },
+        {
+            "name": "3D Model Generation",
+            "status": "✅ Ready",
+            "pricing": "$50-150",
+            "delivery": "30min-2hr",
+            "samples": 3,
+            "target": "$300-900/mo",
+            "effective_rate": "$50-100/hr"
+        },
+        {
+            "name": "Python Automation",
+            "status": "✅ Ready",
+            "pricing": "$75-200",
+            "delivery": "1-3 hours",
+            "samples": 3,
+            "target": "$500-1,500/mo",
+            "effective_rate": "$40-100/hr"
+        }
+    ]
+
+    for svc in services:
+        with st.expander(f"**{svc['name']}** - {svc['status']}"):
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                st.write(f"**Pricing:** {svc['pricing']}")
+                st.write(f"**Delivery:** {svc['delivery']}")
+
+            with col2:
+                st.write(f"**Portfolio:** {svc['samples']} samples")
+                st.write(f"**Effective Rate:** {svc['effective_rate']}")
+
+            with col3:
+                st.write(f"**Monthly Target:** {svc['target']}")
+                st.button("View Gig Description", key=f"gig_{svc['name']}")
+
+def render_week1_actions():
+    """Render Week 1 urgent action checklist."""
+    st.subheader("🚨 Week 1 Urgent Actions (Feb 5-12, 2026)")
+
+    st.info("**Mission:** Stop the bleeding. Launch revenue streams. Cut waste.")
+
+    # Action 1: Emergency Expense Cut
+    with st.expander("**Action #1:** Emergency Expense Cut (-$330/month)", expanded=True):
+        st.markdown("**Impact:** Extends runway from 16 → 30 months")
+
+        cuts = [
+            ("Cancel unused subscriptions", 47, "subscriptions"),
+            ("Internet - call for promo rate", 30, "internet"),
+            ("Phone - switch to prepaid", 30, "phone"),
+            ("Insurance - shop for quotes", 20, "insurance"),
+            ("Food - meal prep routine", 150, "food"),
+            ("Entertainment - free alternatives", 50, "entertainment"),
+            ("Subscriptions - cancel 1 service", 13, "streaming")
+        ]
+
+        for label, savings, key in cuts:
+            checked = st.checkbox(
+                f"{label} (-${savings}/mo)",
+                key=f"week1_cut_{key}",
+                value=st.session_state.week1_checklist.get(f"cut_{key}", False)
+            )
+            if checked != st.session_state.week1_checklist.get(f"cut_{key}", False):
+                st.session_state.week1_checklist[f"cut_{key}"] = checked
+
+    # Action 2: Launch Quick Cash
+    with st.expander("**Action #2:** Launch Quick Cash Services", expanded=False):
+        st.markdown("**Impact:** +$300-700/month by Month 2")
+
+        steps = [
+            "Set up Fiverr account (30 min)",
+            "Create QR Code gig (1 hour)",
+            "Create 3D Model gig (1 hour)",
+            "Create Python Automation gig (1 hour)",
+            "Social media marketing (2 hours)",
+            "Direct outreach to 20 contacts (2 hours)"
+        ]
+
+        for step in steps:
+            checked = st.checkbox(
+                step,
+                key=f"week1_launch_{steps.index(step)}",
+                value=st.session_state.week1_checklist.get(f"launch_{steps.index(step)}", False)
+            )
+            if checked != st.session_state.week1_checklist.get(f"launch_{steps.index(step)}", False):
+                st.session_state.week1_checklist[f"launch_{steps.index(step)}"] = checked
+
+    # Action 3: S-Corp Research
+    with st.expander("**Action #3:** S-Corp Formation Research", expanded=False):
+        st.markdown("**Impact:** Saves $14,470 Year 1, $180k+ over 10 years")
+
+        steps = [
+            "Read IRS S-Corp election guide (30 min)",
+            "Research state requirements (30 min)",
+            "Find 3 business attorneys (30 min)",
+            "Schedule 2 consultations (30 min)",
+            "Make go/no-go decision (1 hour)"
+        ]
+
+        for step in steps:
+            checked = st.checkbox(
+                step,
+                key=f"week1_scorp_{steps.index(step)}",
+                value=st.session_state.week1_checklist.get(f"scorp_{steps.index(step)}", False)
+            )
+            if checked != st.session_state.week1_checklist.get(f"scorp_{steps.index(step)}", False):
+                st.session_state.week1_checklist[f"scorp_{steps.index(step)}"] = checked
+
+    st.divider()
+
+    # Progress Summary
+    total_items = 18  # Total checklist items
+    completed_items = sum(1 for v in st.session_state.week1_checklist.values() if v)
+    progress = completed_items / total_items if total_items > 0 else 0
+
+    st.subheader("Progress")
+    st.progress(progress)
+    st.metric("Completed", f"{completed_items}/{total_items}")
+
+    if completed_items == total_items:
+        st.balloons()
+        st.success("🎉 Week 1 actions complete! You're on track to positive cash flow!")
+
+def render_launch_plan():
+    """Render Quick Cash launch plan."""
+    st.subheader("📋 24-48 Hour Launch Plan")
+
+    st.markdown("""
+    ### Phase 1: Account Setup (2 hours)
+    - Create/verify Fiverr seller account
+    - Complete profile 100%
+    - Set up payment method
+    - Prepare portfolio images
+
+    ### Phase 2: Gig Creation (3 hours)
+    - Create QR Code gig (1 hour)
+    - Create 3D Model gig (1 hour)
+    - Create Python Automation gig (1 hour)
+
+    ### Phase 3: Marketing (2 hours)
+    - LinkedIn announcement
+    - Twitter/X post
+    - Reddit posts (r/forhire, r/slavelabour)
+    - Direct outreach to 20 contacts
+
+    ### Phase 4: Operations Setup (1 hour)
+    - Create delivery templates
+    - Set up quality checklists
+    - Prepare time management system
+
+    **Total Time:** 8 hours
+    **Target Launch:** Within 48 hours
+    """)
+
+    if st.button("📄 View Full Launch Plan Document", use_container_width=True):
+        plan = get_plan_library().get(BASE_DIR / "QUICK_CASH_LAUNCH_PLAN.md")
+        if plan is not None:
+            st.text_area("Full Launch Plan", plan.text(), height=400)
+        else:
+            st.error("Launch plan document not found")
+
+
+# ============================================================================
+# TRINITY AI SIDEBAR, DASHBOARD AND FINANCIAL HUB (Trinity v2.1)
+# ============================================================================
+
+def trinity_context() -> dict:
+    """Current system context for Trinity AI."""
+    phoenix_status = check_phoenix()
+    return {
+        'burn_rate': -635,
+        'phoenix_running': phoenix_status['running'],
+        'phoenix_mode': phoenix_status['mode'],
+        'phoenix_capital': phoenix_status['capital'],
+        'week1_done': sum(1 for v in st.session_state.week1_checklist.values() if v),
+        'week1_total': 18,
+        'quick_cash_ready': 3,
+        'trading_capital': phoenix_status['capital']  # Use actual capital
+    }
+
+# ============================================================================
+# TRINITY AI SIDEBAR
+# ============================================================================
+
+def render_trinity_sidebar():
+    """Render Trinity AI in sidebar - always available."""
+    if not TRINITY_AVAILABLE:
+        st.sidebar.markdown("---")
+        st.sidebar.warning("⚠️ Trinity AI offline")
+        return
+
+    with st.sidebar:
+        st.markdown("---")
+
+        # Trinity Section Container
+        st.markdown('<div class="trinity-section">', unsafe_allow_html=True)
+
+        # Header with status
+        phoenix_status = check_phoenix()
+        is_running = phoenix_status['running']
+        status_class = "status-online" if is_running else "status-offline"
+        status_text = f"{phoenix_status['mode']} - {is_running and 'ACTIVE' or 'OFFLINE'}"
+
+        st.markdown(f"""
+        <div style="text-align: center; margin-bottom: 1rem;">
+            <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">🤖</div>
+            <h3 style="margin: 0; font-size: 1.1rem; font-weight: 600;">
+                <span class="status-indicator {status_class}"></span>
+                TRINITY AI
+            </h3>
+            <p style="margin: 0.25rem 0 0 0; font-size: 0.7rem; color: var(--apple-text-secondary); text-transform: uppercase; letter-spacing: 1px;">
+                {status_text}
+            </p>
+            <p style="text-align: center; font-size: 0.8rem; color: var(--apple-text-secondary); margin: 0.5rem 0;">Strategic Advisor</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Chat Toggle Button
+        toggle_text = "▼ Hide Panel" if st.session_state.trinity_expanded else "▲ Open Panel"
+        if st.button(f"💬 {toggle_text}", use_container_width=True, key="trinity_toggle"):
+            st.session_state.trinity_expanded = not st.session_state.trinity_expanded
+            st.rerun()
+
+        # Expanded Panel
+        if st.session_state.trinity_expanded:
+            st.markdown("---")
+
+            # Quick Actions
+            st.markdown("**⚡ Quick Actions**")
+            actions = get_trinity_quick_actions()
+
+            # Show actions in compact layout
+            for action in actions[:4]:  # Show first 4
+                if st.button(action['label'], key=f"trinity_{action['label']}", use_container_width=True):
+                    with st.spinner("🔮 Trinity analyzing..."):
+                        context = trinity_context()
+                        response = get_trinity_response(action['command'], context)
+                        st.session_state.trinity_chat_history.append({
+                            'user': action['command'],
+                            'trinity': response,
+                            'timestamp': datetime.now().strftime('%H:%M')
+                        })
+                        st.rerun()
+
+            st.markdown("---")
+
+            # Chat interface
+            user_input = st.text_input("💭 Ask Trinity", key="trinity_input", placeholder="Type your question...")
+            if user_input:
+                # Stream the reply into the panel as it is generated
+                context = trinity_context()
+                response = st.write_stream(stream_trinity_response(user_input, context))
+                st.session_state.trinity_chat_history.append({
+                    'user': user_input,
+                    'trinity': response,
+                    'timestamp': datetime.now().strftime('%H:%M')
+                })
+                st.rerun()
+
+            # Show recent chat (most recent first)
+            if st.session_state.trinity_chat_history:
+                st.markdown("---")
+                st.markdown("**💬 Recent Conversation**")
+                for msg in reversed(st.session_state.trinity_chat_history[-3:]):
+                    with st.expander(f"🗨️ {msg['user'][:25]}... • {msg.get('timestamp', '')}"):
+                        st.markdown(f"**Trinity:** {msg['trinity']}")
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+# ============================================================================
+# STATIONS
+# ============================================================================
+
+def render_dashboard(nav_key: str):
+    """Dashboard - System overview (quick actions navigate via ``nav_key``)."""
+    st.title("📊 Trinity Dashboard")
+    
+    # System metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        phoenix_status = check_phoenix()
+        mode_text = f"{phoenix_status['mode']} ${phoenix_status['capital']/1000:.0f}k"
+        st.metric("Phoenix", f"{'🟢' if phoenix_status['running'] else '🔴'} {mode_text}")
+        
+    with col2:
+        st.metric("Burn Rate", "-$635/mo", delta="-$330 target")
+        
+    with col3:
+        st.metric("Quick Cash", "3/3 Ready")
+        
+    with col4:
+        week1_done = sum(1 for v in st.session_state.week1_checklist.values() if v)
+        st.metric("Week 1", f"{week1_done}/18")
+    
+    st.markdown("---")
+    
+    # Quick actions
+    st.subheader("⚡ Quick Actions")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("💰 Financial Hub", use_container_width=True):
+            st.session_state[nav_key] = "Financial Hub"
+            st.rerun()
+        if st.button("🏢 Operations", use_container_width=True):
+            st.session_state[nav_key] = "Operations"
+            st.rerun()
+            
+    with col2:
+        if st.button("🔧 Engineering", use_container_width=True):
+            st.session_state[nav_key] = "Engineering"
+            st.rerun()
+        if st.button("🤖 AI Hub", use_container_width=True):
+            st.session_state[nav_key] = "AI Hub"
+            st.rerun()
+            
+    with col3:
+        if st.button("📊 Phoenix Log", use_container_width=True):
+            if PHOENIX_LOG.exists():
+                with open(PHOENIX_LOG) as f:
+                    st.text_area("Recent Activity", "".join(f.readlines()[-30:]), height=200)
+        if st.button("🔄 Refresh All", use_container_width=True):
+            st.session_state.last_refresh = datetime.now()
+            st.rerun()
+    
+    # Critical alerts
+    st.markdown("---")
+    st.subheader("🚨 Critical Alerts")
+    
+    phoenix_status = check_phoenix()
+    if not phoenix_status['running']:
+        st.error(f"**Phoenix Offline** - Currently in {phoenix_status['mode']} mode")
+    elif phoenix_status['mode'] == 'PAPER':
+        st.warning("**Phoenix Paper Trading** - Not generating real returns yet. Validating strategy.")
+    
+    st.warning("**Cash Flow Crisis** - Burn rate: -$635/mo. Execute Week 1 actions immediately.")
+    
+    # Today's focus
+    st.markdown("---")
+    st.subheader("🎯 Today's Focus")
+    st.info("**Week 1 Priority:** Cut $330/mo expenses. Launch Quick Cash services.")
+
+def render_equity_history():
+    """Account equity chart from the time-series store (rollups keep months instant)."""
+    import pandas as pd
+    from timeseries import DB_PATH, get_store
+
+    st.subheader("📈 Equity History")
+    if not DB_PATH.exists():
+        st.info("No account history yet - start trinity_auto_sync.py")
+        return
+
+    windows = {"1 day": 1, "1 week": 7, "1 month": 30, "3 months": 90, "1 year": 365}
+    window = st.radio("Window", list(windows), index=3, horizontal=True, label_visibility="collapsed")
+    ts, equity = get_store().range("account.equity", start=time.time() - windows[window] * 86400)
+    if not len(ts):
+        st.info("No account history yet - start trinity_auto_sync.py")
+        return
+    st.line_chart(pd.DataFrame({"Equity": equity}, index=pd.to_datetime(ts, unit="s")))
+
+def phoenix_projection(**overrides):
+    """Monte-Carlo projection resampling Phoenix's trades (cached per parameter set)."""
+    from monte_carlo import ProjectionParams, project, returns_pool, trades_per_month
+    from trade_analytics import load_trade_stats
+
+    _, stats = load_trade_stats(BOT_FACTORY_DIR / "phoenix_state.json", 100000)
+    pool, source = returns_pool(stats)
+    overrides.setdefault("trades_per_month", trades_per_month(stats))
+    return project(ProjectionParams(**overrides), pool, source)
+
+def render_projection_chart(projection, plan: Optional[Dict[int, float]] = None):
+    """P5/P50/P95 capital by year, optionally against the plan's year-end targets."""
+    import pandas as pd
+
+    rows = projection.yearly()
+    chart = pd.DataFrame({
+        "P5": [row[1] for row in rows],
+        "P50": [row[2] for row in rows],
+        "P95": [row[3] for row in rows]
+    }, index=[row[0] for row in rows])
+    if plan:
+        chart["Plan"] = [plan.get(year, float("nan")) for year in chart.index]
+    chart.index.name = "Year"
+    st.line_chart(chart)
+    st.caption(f"{projection.params.paths:,} paths · returns: {projection.source} · "
+               f"~{projection.params.trades_per_month:.1f} trades/mo · "
+               f"simulated in {projection.seconds * 1000:.0f}ms")
+
+def render_plan_sections(path: Path, label: str, key: str):
+    """Source plan browsed one section at a time (only the chosen section is read)."""
+    plan = get_plan_library().get(path)
+    if plan is None:
+        st.caption(f"{path.name} not found")
+        return
+    with st.expander(f"📄 {label}"):
+        outline = plan.outline(max_level=2)
+        if not outline:
+            st.markdown(plan.head())
+            return
+        titles = [("· " * (s.level - 1)) + s.title for s in outline]
+        choice = st.selectbox("Section", range(len(outline)), format_func=titles.__getitem__, key=key)
+        section = outline[choice]
+        st.markdown(plan.read(section.offset, section.end))
+        st.caption(f"{path.name} · {len(plan.sections)} sections · {plan.size / 1024:.0f} KB")
+
+def render_financial_hub():
+    """Financial Hub - All money operations."""
+    st.title("💰 Financial Hub")
+    
+    tabs = st.tabs([
+        "📊 Overview",
+        "🚀 Flywheel Strategy",
+        "📈 10-Year Projection",
+        "🎯 20 Optimizations",
+        "⚡ Quick Cash",
+        "📊 Phoenix AGRO",
+        "✅ Week 1 Actions",
+        "🔍 Paper → Live"
+    ])
+    
+    with tabs[0]:  # Overview
+        st.subheader("Current Financial State")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Monthly Income", "$3,250", help="After tax")
+        with col2:
+            st.metric("Monthly Expenses", "$3,885")
+        with col3:
+            st.metric("Net Burn", "-$635/mo", delta="-$330 target")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Runway", "16 months", delta="+14mo with cuts")
+        with col2:
+            st.metric("Month 3 Goal", "+$3k/mo", help="Positive cash flow!")
+
+        render_equity_history()
+    
+    with tabs[1]:  # Flywheel
+        st.subheader("🚀 Phoenix Flywheel Strategy")
+        
+        st.markdown("""
+        ### The Compound Growth Engine
+        
+        **How It Works:**
+        1. Trade $40k with Phoenix AGRO (3% risk, 5 positions)
+        2. Generate 10-12% monthly returns
+        3. Launch signal selling on Collective2/Darwinex
+        4. Reinvest ALL profits + signal revenue
+        5. Compound accelerates exponentially
+        """)
+        
+        st.markdown("---")
+        st.markdown("### 📅 Timeline")
+        
+        timeline = [
+            ("**Month 1-3:** BUILD TRACK RECORD", "$40k → $45k", "Add $1k/mo from savings"),
+            ("**Month 4-6:** EARLY ADOPTERS", "$45k → $58k", "First subscribers: +$1k/mo"),
+            ("**Month 7-12:** SCALE UP", "$58k → $110k", "30+ subscribers: +$4.25k/mo"),
+            ("**Year 1 Result:**", "$40k → $110k", "**175% growth**")
+        ]
+        
+        for phase, result, detail in timeline:
+            with st.expander(phase):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown(f"**Result:** {result}")
+                with col2:
+                    st.markdown(f"**Detail:** {detail}")
+        
+        st.markdown("---")
+        st.subheader("📈 10-Year Flywheel Projection")
+        
+        flywheel_data = [
+            (2026, 40000, 40500, 110000, 14250),
+            (2027, 110000, 48000, 194400, 36000),
+            (2028, 194400, 60000, 305280, 36000),
+            (2029, 305280, 78000, 460336, 36000),
+            (2030, 460336, 96000, 667603, 36000),
+            (2031, 667603, 108000, 931124, 36000),
+            (2032, 931124, 45000, 1171349, 24000),
+            (2033, 1171349, 57000, 1473619, 24000),
+            (2034, 1473619, 69000, 1850343, 24000),
+            (2035, 1850343, 69000, 2302812, 24000),
+            (2036, 2302812, 69000, 2847374, 24000),
+        ]
+        
+        for year, start, contrib, end, signals in flywheel_data:
+            trading_gain = end - start - contrib
+            gain_pct = (trading_gain / (start + contrib / 2)) * 100 if (start + contrib / 2) > 0 else 0
+
+            with st.expander(f"**{year}** → ${end:,}"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Start Capital", f"${start:,}")
+                    st.metric("+ Contributions", f"${contrib:,}", help="Savings + Signal Revenue")
+                with col2:
+                    st.metric("= Total Invested", f"${start + contrib:,}")
+                    st.metric("+ Trading Gains", f"${trading_gain:,}", delta=f"{gain_pct:.1f}% return")
+                with col3:
+                    st.metric("= End Balance", f"${end:,}")
+                    st.metric("Signal Revenue", f"${signals:,}", help="Annual signal selling income")
+
+                st.caption(f"💡 Math: ${start:,} start + ${contrib:,} added + ${trading_gain:,} gains = ${end:,} end")
+        
+        st.success("**Conservative Result:** $2.97M net worth by 2036")
+        render_plan_sections(FLYWHEEL_PLAN, "Source Plan: Decade Plan with Flywheel", "flywheel_plan_section")
+
+        # Same plan run through the simulator: contributions at the plan's
+        # average, returns resampled from Phoenix's trades
+        st.markdown("---")
+        st.subheader("🎲 Monte-Carlo Check")
+        months = 12 * len(flywheel_data)
+        projection = phoenix_projection(
+            start_capital=flywheel_data[0][1], months=months,
+            monthly_contribution=sum(row[2] for row in flywheel_data) / months
+        )
+        render_projection_chart(projection, {i + 1: row[3] for i, row in enumerate(flywheel_data)})
+        plan_end = flywheel_data[-1][3]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Median End Balance", f"${projection.percentiles[50][-1]:,.0f}")
+        with col2:
+            st.metric("P5 - P95", f"${projection.percentiles[5][-1] / 1e6:.2f}M - "
+                                  f"${projection.percentiles[95][-1] / 1e6:.2f}M")
+        with col3:
+            st.metric("Chance of Plan", f"{projection.prob_above(plan_end) * 100:.0f}%",
+                      help=f"Paths ending at or above ${plan_end:,}")
+    
+    with tabs[2]:  # 10-Year
+        st.subheader("📈 10-Year Scenarios")
+        
+        scenario = st.radio(
+            "Select Scenario:",
+            ["Conservative", "Base", "Optimistic", "Optimized"]
+        )
+        
+        # Plan total, description, and simulator presets: monthly
+        # contribution and return multiplier (risk setting vs paper)
+        scenarios = {
+            "Conservative": (2.97e6, "Phoenix steady + Quick Cash slow", 1000, 1.0),
+            "Base": (10.1e6, "Phoenix moderate + signal selling Y2", 3000, 1.25),
+            "Optimistic": (25e6, "Everything goes perfect naturally", 5000, 1.5),
+            "Optimized": (27.3e6, "Base + 20 optimizations executed ✅", 5500, 1.5)
+        }
+        
+        target, desc, contribution, scale = scenarios[scenario]
+
+        with st.expander("⚙️ Simulation Assumptions"):
+            col1, col2 = st.columns(2)
+            with col1:
+                start_capital = st.number_input("Starting Capital", value=40000, step=5000, key=f"mc_start_{scenario}")
+                contribution = st.number_input("Monthly Contribution", value=contribution, step=250,
+                                               key=f"mc_contrib_{scenario}", help="Savings + signal revenue")
+                burn = st.number_input("Monthly Withdrawals", value=0, step=100,
+                                       key=f"mc_burn_{scenario}", help="Burn covered from the account")
+            with col2:
+                scale = st.slider("Return Multiplier", 0.25, 3.0, float(scale), 0.25, key=f"mc_scale_{scenario}",
+                                  help="Scales resampled trade returns (e.g. live risk vs paper risk)")
+                paths = st.select_slider("Paths", [1000, 2500, 5000, 10000], value=5000, key=f"mc_paths_{scenario}")
+
+        projection = phoenix_projection(start_capital=float(start_capital), monthly_contribution=float(contribution),
+                                        monthly_burn=float(burn), return_scale=float(scale), paths=int(paths))
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("10-Year Total (Plan)", f"${target / 1e6:.2f}M")
+        with col2:
+            st.caption(desc)
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("P5", f"${projection.percentiles[5][-1]:,.0f}")
+        with col2:
+            st.metric("P50", f"${projection.percentiles[50][-1]:,.0f}")
+        with col3:
+            st.metric("P95", f"${projection.percentiles[95][-1]:,.0f}")
+        with col4:
+            st.metric("Chance of Plan", f"{projection.prob_above(target) * 100:.1f}%",
+                      help=f"Ruin probability: {projection.prob_ruin * 100:.1f}%")
+
+        render_projection_chart(projection)
+    
+    with tabs[3]:  # Daily Check-In Dashboard
+        today = datetime.now()
+
+        st.title("📋 Daily Check-In Dashboard")
+        st.caption(f"📅 {today.strftime('%A, %B %d, %Y')}")
+
+        # Trinity AI Brain Status
+        st.markdown("---")
+        st.subheader("🤖 Trinity AI Brain - Strategic Analysis")
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Last Analysis", "Feb 5, 22:08", help="Latest comprehensive AI analysis")
+        with col2:
+            st.metric("AI Models", "Claude Opus 4.5 + Gemini 1.5", help="Dual AI system active")
+        with col3:
+            st.metric("Confidence", "62%", help="AI confidence in recommendations")
+        with col4:
+            st.metric("Target CAGR", "63%", help="Required for $27.3M in 10 years")
+
+        # AI Implemented Recommendations
+        with st.expander("✅ AI Recommendations - IMPLEMENTED", expanded=True):
+            st.success("""
+            **PRIORITY #1: Diagnose Trade Paralysis** ✅ COMPLETE
+            - **AI Said:** "Understand why recent_trades=0. A perfect system that doesn't trade earns 0%."
+            - **We Did:** Added heartbeat logging to Phoenix (Feb 5)
+            - **Result:** Diagnosed correctly - system is operational, just waiting for SMA crossover signals. Market neutral (RSI 52.9). Not a bug!
+            - **Impact:** Full visibility into decision-making process. Can now track exactly why trades are/aren't taken.
+
+            **PRIORITY #2: Implement Tiered Position Sizing** ✅ COMPLETE
+            - **AI Said:** "Start with 1-2% risk per trade, scale to 3-5% as Sharpe ratio proves >1.5."
+            - **We Did:** Built 3-tier system (Feb 5)
+              - Tier 1: 1.0% risk (<10 trades or Sharpe <1.0) ← Current
+              - Tier 2: 1.76% risk (10-19 trades, Sharpe 1.0-1.5)
+              - Tier 3: 3.0% risk (20+ trades, Sharpe >1.5)
+            - **Result:** Capital protected during validation, will accelerate 3x once edge proven
+            - **Impact:** Risk scales automatically with performance. No manual intervention needed.
+
+            **NEW: Paper→Live Translation Hub** ✅ COMPLETE
+            - **Built:** Real-time validation dashboard (Feb 5)
+            - **Features:** Side-by-side comparison, Go/No-Go checklist, plan alignment
+            - **Impact:** Can validate strategy meets $4k/mo targets before risking real capital
+            """)
+
+        # AI Active Priorities
+        with st.expander("🎯 AI Recommendations - ACTIVE PRIORITIES", expanded=True):
+            st.warning("""
+            **PRIORITY #3: Activate Income Diversification Layer** 🔴 URGENT
+            - **AI Analysis (Latest):** "Implement the 'Barbell Income Strategy' - build 2-3 additional automated income streams that compound independently"
+            - **Impact:** +$300K over 10 years at 60% CAGR
+
+            **Recommended Income Streams:**
+            1. **High-Ticket Consulting** ($200-500/hr) 🔴 IMMEDIATE
+               - Target: Trading system architecture consulting
+               - Your Edge: Technical depth + Phoenix track record
+               - Route: 80% of consulting income → trading capital
+               - Timeline: Week 1-2 (create offer, reach out to networks)
+               - Expected: $2-5K/month part-time
+
+            2. **Fiverr Services** ($25-200/gig) 🔴 IMMEDIATE
+               - QR codes, 3D models, Python automation
+               - Timeline: Week 1-2 for launch
+               - Expected: $500-1,500/month initial
+
+            3. **Signal Selling** (Collective2/Darwinex) 🟡 MONTH 2-3
+               - After 15-20 validated trades
+               - Expected: $1-4K/month by Month 6
+               - Impact: +$85K-120K over 10 years
+
+            4. **Trinity SaaS MVP** 🟡 MONTH 2-3
+               - Dashboard + API marketplace
+               - 8-week MVP timeline
+               - Expected: $1-2K/month by Month 6
+
+            5. **Automated Trading Bots** 🟢 FUTURE (AI's "Barbell" Suggestion)
+               - MEV bots, arbitrage scanners, liquidation bots
+               - Requires proven track record first
+               - Potential: Additional compounding streams
+
+            **PRIORITY #4: High-Impact Phoenix Optimizations** 🟡 PLANNED
+            - **AI Sequencing:** (1) Execution/infrastructure → (2) Risk management → (3) Alpha generation → (4) Scaling
+            - **Specific Recommendations:**
+              a) Multi-timeframe confirmation (reduce false signals)
+              b) Kelly Criterion position sizing (adaptive based on confidence)
+              c) Correlation filters (avoid clustered losses)
+              d) Execution quality analytics (optimize fill rates)
+            - **Impact:** +$200K over 10 years, -35% downside risk
+            - **Timeline:** After 20+ paper trades validate core strategy
+            - **Rationale:** Don't optimize until base strategy proves profitable
+
+            **PRIORITY #5: Capital Injection Protocol + Asymmetric Bets** 🟡 PLANNED
+            - **Weekly Injection:** "Even $500/week from other income adds $26K/year base → $1M+ additional terminal value"
+            - **Implementation:** 100% of freelance profits → trading account
+            - **Expected:** $500-1,000/week once services launched
+            - **Impact:** +$38K over 10 years from injection alone (before compounding!)
+
+            - **NEW - Asymmetric Optionality:** Allocate 5-10% of capital to high-conviction asymmetric bets
+              - Early-stage DeFi protocols, options strategies
+              - Potential: 10-50x returns that dramatically accelerate timeline
+              - Timeline: After live trading proves stable (Month 3+)
+            """)
+
+        # AI Impact Tracking
+        with st.expander("📊 AI Recommendations - IMPACT TRACKING"):
+            st.info("""
+            **Implemented (Priority #1 & #2):**
+            - ✅ Heartbeat logging: Full visibility achieved
+            - ✅ Tiered position sizing: 3x growth potential unlocked
+            - ✅ Paper→Live hub: Validation framework in place
+            - **Expected Impact:** $0 immediate (validation phase), but enables safe scaling to 3.0% risk = $1.2k/mo vs $400/mo at 1.0%
+
+            **Pending (Priority #3-5):**
+            - ⏳ Income diversification: NOT STARTED ($300K at risk if delayed)
+            - ⏳ Phoenix optimizations: NOT NEEDED YET (wait for 20+ trades)
+            - ⏳ Capital injection: NOT STARTED (depends on Priority #3)
+
+            **Timeline Analysis:**
+            - **Current:** Paper trading validation (0/15 trades)
+            - **Week 1-2:** Launch income streams (Fiverr, freelance)
+            - **Week 3-4:** Reach 15-20 paper trades, validate strategy
+            - **Month 2:** Go live with $40k if validation passes
+            - **Month 2-3:** Start signal selling, implement optimizations
+
+            **Critical Path:** Income diversification (Priority #3) is the bottleneck. Phoenix is validated but needs external capital injection for maximum growth.
+
+            **62% Confidence Explained:** AI is confident in the approach but notes execution risk. Main uncertainty is whether you'll actually launch the income streams vs continuing to optimize the trading system.
+            """)
+
+        st.markdown("---")
+
+        # Progress overview
+        all_tasks = []
+
+        # Add optimizations
+        optimizations_list = [
+            # AI BRAIN PRIORITIES (Completed)
+            ("✅ AI Priority #1: Heartbeat logging (DONE)", "🟢", "Full visibility", "2026-02-05", "Added comprehensive decision logging to Phoenix. System is operational, correctly waiting for signals."),
+            ("✅ AI Priority #2: Tiered sizing (DONE)", "🟢", "3x growth potential", "2026-02-05", "Implemented performance-based risk scaling: 1.0%→1.76%→3.0% as Sharpe validates."),
+            ("✅ Paper→Live translation hub (DONE)", "🟢", "Validation framework", "2026-02-05", "Built side-by-side comparison dashboard to validate strategy before live deployment."),
+
+            # AI BRAIN PRIORITIES (Active)
+            ("🎯 AI Priority #3a: High-ticket consulting", "🔴", "+$60K+/yr", "2026-02-10", "Trading system architecture consulting at $200-500/hr. Target networks, create offer. 80% → trading capital."),
+            ("🎯 AI Priority #3b: Fiverr services launch", "🔴", "+$18K/yr", "2026-02-12", "Launch QR codes, 3D models, Python automation. $500-1,500/mo expected. Template library + automation."),
+            ("🎯 AI Priority #5: Capital injection protocol", "🔴", "+$1M+/10yr", "2026-02-15", "Route 100% of consulting/freelance profits → trading account. $500-1K/week = $26K/yr compounds to $1M+."),
+
+            # CRITICAL - Phoenix Trading Bug (RESOLVED)
+            ("Contract selection diagnosis (RESOLVED)", "🟢", "Understood", "2026-02-05", "Not a bug - system correctly waiting for SMA crossover signals. Market neutral (RSI 52.9)."),
+
+            # Financial (Immediate Action)
+            ("Cut $330/mo expenses", "🔴", "$4k/yr", "2026-02-07", "Cancel subscriptions, reduce dining out, meal prep"),
+            ("Health budget ($80/mo)", "🔴", "Prevent burnout", "2026-02-07", "Keep gym, add therapy/massage budget"),
+            ("Cancel Jarvis Phase 2-7", "🔴", "Save 600hrs", "2026-02-07", "Stop over-engineering, focus on revenue"),
+            ("Focus Matrix (60hr/wk)", "🔴", "Sustainability", "2026-02-08", "Stop 88hr weeks, prioritize ruthlessly"),
+
+            # Week 1-2 Actions
+            ("Start Collective2 signal selling", "🟡", "+$85k-120k/10yr", "2026-02-12", "Set up C2 account, publish Phoenix signals"),
+            ("AGRO MODE+ (3.5% risk)", "🟡", "+$12k-18k/yr", "2026-02-12", "Increase Phoenix risk parameter after stable week"),
+            ("Form S-Corporation", "🟡", "$14k/yr savings", "2026-03-01", "Research attorney, file by March for Q1 earnings"),
+            ("Set up QSBS strategy", "🟡", "+$390k at exit", "2026-02-28", "Decide C-Corp vs S-Corp before formation"),
+
+            # Month 1 Actions
+            ("Ship Trinity MVP", "🟡", "+$12k-20k/yr", "2026-03-15", "8-week MVP: dashboard + API marketplace + landing"),
+            ("Simplify tech stack", "🟡", "Save 200hrs", "2026-02-28", "Python+FastAPI+Streamlit only"),
+            ("Fiverr delivery automation", "🟡", "3x capacity", "2026-02-21", "Build template library + scripts (20hrs)"),
+            ("Batch processing days", "🟡", "+20% efficiency", "2026-02-15", "Theme days: Fiverr Mon/Wed, Dev Tue/Thu, Marketing Fri"),
+
+            # Month 2-3 Actions
+            ("Phoenix optimization", "🟢", "+$200k/10yr", "2026-03-30", "Adaptive sizing, profit targets, correlation filters"),
+            ("VIX-based risk reduction", "🟢", "-35% downside", "2026-03-15", "Add VIX filters to Phoenix config"),
+            ("Increase Fiverr pricing", "🟢", "+$4k/yr", "2026-03-01", "After 5 reviews: QR $25→$40, 3D $50→$75"),
+            ("Accelerate capital injection", "🟢", "+$38k/10yr", "2026-03-01", "100% Fiverr profit → trading account"),
+
+            # Month 3-4 Actions
+            ("Blue Ocean strategy", "🟢", "Better margins", "2026-04-01", "Target underserved niches, avoid competition"),
+            ("Customer acquisition system", "🟢", "Predictable growth", "2026-04-15", "SEO, content marketing, email funnels"),
+
+            # Ongoing/Future
+            ("Multi-strategy approach", "🟢", "Reduce risk", "2026-08-01", "Add mean reversion by Year 2"),
+            ("Outsource Fiverr", "🟢", "Scale without burnout", "When $10k/mo", "Hire VA when revenue supports it"),
+            ("Aggregation strategy", "🟢", "10x multiplier", "2027-01-01", "Roll-up strategy in Year 2-3"),
+            ("Optionality preservation", "🟢", "Keep options open", "Ongoing", "Don't commit to single path too early"),
+        ]
+
+        # Add Week 1 Urgent Actions
+        week1_actions = [
+            ("Cancel unused subscriptions", "🔴", "-$47/mo", "2026-02-07", "Netflix, unused services"),
+            ("Call internet provider", "🔴", "-$30/mo", "2026-02-07", "Negotiate lower rate"),
+            ("Switch to prepaid phone", "🔴", "-$30/mo", "2026-02-08", "Mint Mobile or similar"),
+            ("Shop for insurance", "🔴", "-$20/mo", "2026-02-09", "Compare quotes"),
+            ("Start meal prep", "🔴", "-$150/mo", "2026-02-10", "Weekly batch cooking"),
+            ("Reduce entertainment", "🔴", "-$50/mo", "2026-02-07", "Free activities"),
+            ("Set up Fiverr gigs", "🟡", "Revenue start", "2026-02-10", "QR, 3D, Python gigs live"),
+            ("Create portfolio samples", "🟡", "Social proof", "2026-02-12", "3 examples each service"),
+            ("Phoenix daily monitoring", "🟡", "$4-5k/mo", "Daily", "Check trades, adjust if needed"),
+        ]
+
+        all_tasks = optimizations_list + week1_actions
+
+        # Count by priority
+        red_tasks = [t for t in all_tasks if t[1] == "🔴" and not st.session_state.optimizations_checklist.get(t[0], False)]
+        yellow_tasks = [t for t in all_tasks if t[1] == "🟡" and not st.session_state.optimizations_checklist.get(t[0], False)]
+        green_tasks = [t for t in all_tasks if t[1] == "🟢" and not st.session_state.optimizations_checklist.get(t[0], False)]
+        done_tasks = [t for t in all_tasks if st.session_state.optimizations_checklist.get(t[0], False)]
+
+        # Dashboard metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("🔴 Urgent", len(red_tasks), help="Do TODAY")
+        with col2:
+            st.metric("🟡 Recommended", len(yellow_tasks), help="This week/month")
+        with col3:
+            st.metric("🟢 Suggested", len(green_tasks), help="When ready")
+        with col4:
+            st.metric("✅ Done", len(done_tasks), help=f"{len(done_tasks)}/{len(all_tasks)}")
+
+        total_progress = len(done_tasks) / len(all_tasks) if len(all_tasks) > 0 else 0
+        st.progress(total_progress)
+        st.caption(f"Overall Progress: {total_progress*100:.1f}%")
+
+        # Today's Focus
+        st.markdown("---")
+        st.subheader("🎯 Today's Focus (Urgent)")
+        if red_tasks:
+            for task_name, priority, impact, due_date, description in red_tasks:
+                with st.container():
+                    col1, col2 = st.columns([4, 1])
+                    with col1:
+                        checked = st.checkbox(
+                            f"**{task_name}**",
+                            key=f"task_{task_name}",
+                            value=st.session_state.optimizations_checklist.get(task_name, False)
+                        )
+                        st.session_state.optimizations_checklist[task_name] = checked
+                        st.caption(f"💰 {impact} | 📅 Due: {due_date} | 📝 {description}")
+                    with col2:
+                        st.markdown(f"### {priority}")
+                    st.markdown("---")
+        else:
+            st.success("🎉 No urgent tasks today! Great work!")
+
+        # This Week
+        st.markdown("---")
+        with st.expander(f"📅 This Week/Month - Recommended ({len(yellow_tasks)} tasks)", expanded=True):
+            for task_name, priority, impact, due_date, description in yellow_tasks:
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    checked = st.checkbox(
+                        f"**{task_name}**",
+                        key=f"task_{task_name}",
+                        value=st.session_state.optimizations_checklist.get(task_name, False)
+                    )
+                    st.session_state.optimizations_checklist[task_name] = checked
+                    st.caption(f"💰 {impact} | 📅 {due_date} | 📝 {description}")
+                with col2:
+                    st.markdown(f"## {priority}")
+
+        # Future/Suggestions
+        with st.expander(f"🔮 Future & Suggestions ({len(green_tasks)} tasks)"):
+            for task_name, priority, impact, due_date, description in green_tasks:
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    checked = st.checkbox(
+                        f"**{task_name}**",
+                        key=f"task_{task_name}",
+                        value=st.session_state.optimizations_checklist.get(task_name, False)
+                    )
+                    st.session_state.optimizations_checklist[task_name] = checked
+                    st.caption(f"💰 {impact} | 📅 {due_date} | 📝 {description}")
+                with col2:
+                    st.markdown(f"## {priority}")
+
+        # Completed
+        with st.expander(f"✅ Completed ({len(done_tasks)} tasks)"):
+            for task_name, priority, impact, due_date, description in done_tasks:
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    checked = st.checkbox(
+                        f"~~{task_name}~~",
+                        key=f"task_{task_name}",
+                        value=st.session_state.optimizations_checklist.get(task_name, False)
+                    )
+                    st.session_state.optimizations_checklist[task_name] = checked
+                    st.caption(f"💰 {impact} | ✅ Done")
+                with col2:
+                    st.markdown("✅")
+
+        # Summary
+        st.markdown("---")
+        st.info(f"""
+        **Daily Check-In Summary:**
+        - 🔴 **Urgent (TODAY):** {len(red_tasks)} tasks - Do these first!
+        - 🟡 **Recommended (THIS WEEK/MONTH):** {len(yellow_tasks)} tasks
+        - 🟢 **Suggested (WHEN READY):** {len(green_tasks)} tasks
+        - ✅ **Completed:** {len(done_tasks)}/{len(all_tasks)} ({total_progress*100:.1f}%)
+
+        **Goal:** Complete all tasks → Unlock $27.3M (beats Optimistic $25M)
+        """)
+        render_plan_sections(OPTIMIZATION_REPORT, "Source Report: Trinity Optimization Report", "optimization_report_section")
+
+    with tabs[4]:  # Quick Cash
+        st.subheader("⚡ Quick Cash Services")
+        
+        services = [
+            ("QR Code Generation", "$25-60", "10-15min", "$200-600/mo"),
+            ("3D Model Generation", "$50-150", "30min-2hr", "$300-900/mo"),
+            ("Python Automation", "$75-200", "1-3hr", "$500-1,500/mo")
+        ]
+        
+        for name, price, turnaround, target in services:
+            with st.expander(f"✅ {name} - READY"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.write(f"**Price:** {price}")
+                with col2:
+                    st.write(f"**Time:** {turnaround}")
+                with col3:
+                    st.write(f"**Target:** {target}")
+        
+        st.success("**Combined Target:** $1,000-3,000/mo (conservative: $300-700)")
+    
+    with tabs[5]:  # Phoenix Status
+        st.subheader("📊 Phoenix Trading Status")
+
+        phoenix_status = check_phoenix()
+        is_running = phoenix_status['running']
+        mode = phoenix_status['mode']
+        capital = phoenix_status['capital']
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            status_display = f"{'🟢 Active' if is_running else '🔴 Offline'}"
+            st.metric("Status", status_display)
+        with col2:
+            st.metric("Mode", mode, help="PAPER = validation, LIVE = real money")
+        with col3:
+            st.metric("Capital", f"${capital/1000:.0f}k")
+        with col4:
+            st.metric("Risk/Trade", "1.0%", help="Tiered: T1(1.0%)→T2(1.76%)→T3(3.0%)")
+
+        st.markdown("---")
+
+        if not is_running:
+            st.error("**Phoenix Offline** - Bot is not running")
+            st.code("cd /Users/tybrown/Desktop/Bot-Factory && python3 mark_xii_phoenix.py")
+        elif mode == "PAPER":
+            st.warning(f"""
+            **📊 PAPER TRADING MODE (Validation Phase)**
+
+            Phoenix is running with **${capital:,}** paper money to validate strategy before live deployment.
+
+            **Current Status:**
+            - Testing AGRO MODE configuration (3% risk, 5 positions)
+            - Validating 10-12% monthly return target
+            - Building track record for signal selling
+
+            **Next Steps:**
+            1. Collect 15-20 paper trades (7-10 days)
+            2. Verify win rate >50%, Avg R >2.0
+            3. Confirm <20% max drawdown
+            4. Go live with $40k real capital
+
+            **⚠️ Paper trading profits are NOT real money.**
+            """)
+        else:
+            st.success(f"""
+            **🟢 LIVE TRADING ACTIVE**
+
+            Phoenix AGRO running with **${capital:,}** real capital.
+            Target: $4-5k/month returns.
+            """)
+
+        # System status update
+        st.markdown("---")
+        st.success("""
+        ✅ **SYSTEMS OPERATIONAL**
+
+        Phoenix is running with **heartbeat logging** and **tiered position sizing** active.
+
+        **Current Status:**
+        - ✅ Contract selection bug FIXED (DTE 27-35, delta 0.25-0.35)
+        - ✅ Heartbeat logging ACTIVE (full visibility into decisions)
+        - ✅ Tiered position sizing ACTIVE (Tier 1: 1.0% risk)
+        - ⏳ Waiting for market signals (no SMA crossover detected yet)
+
+        **Why 0 Trades:** Market is neutral (RSI 52.9). Phoenix correctly holding until SMA crossover signal appears.
+
+        **AI Brain Analysis:** "System is operational but not yet generating signals. This is market conditions, not a bug."
+        """)
+    
+    with tabs[6]:  # Week 1
+        st.subheader("✅ Week 1 Urgent Actions")
+        
+        st.info("**Mission:** Stop the bleeding. Launch revenue. Cut waste.")
+        
+        actions = [
+            ("Cut $330/mo expenses", [
+                "Cancel unused subscriptions (-$47/mo)",
+                "Call internet provider (-$30/mo)",
+                "Switch phone to prepaid (-$30/mo)",
+                "Shop for insurance (-$20/mo)",
+                "Start meal prep (-$150/mo)",
+                "Cancel streaming service (-$13/mo)",
+                "Reduce entertainment (-$50/mo)"
+            ]),
+            ("Launch Quick Cash (8hrs)", [
+                "Set up Fiverr account (30min)",
+                "Create QR Code gig (1hr)",
+                "Create 3D Model gig (1hr)",
+                "Create Python gig (1hr)",
+                "Social media marketing (2hrs)",
+                "Direct outreach (2hrs)"
+            ]),
+            ("S-Corp Research (3hrs)", [
+                "Read IRS guide (30min)",
+                "Research state requirements (30min)",
+                "Find 3 attorneys (30min)",
+                "Schedule consultations (30min)",
+                "Make decision (1hr)"
+            ])
+        ]
+        
+        for title, items in actions:
+            with st.expander(f"**{title}**"):
+                for item in items:
+                    checked = st.checkbox(
+                        item,
+                        key=f"week1_{item}",
+                        value=st.session_state.week1_checklist.get(item, False)
+                    )
+                    st.session_state.week1_checklist[item] = checked
+        
+        # Progress
+        total = sum(len(items) for _, items in actions)
+        done = sum(1 for v in st.session_state.week1_checklist.values() if v)
+        st.progress(done / total if total > 0 else 0)
+        st.metric("Progress", f"{done}/{total}")
+
+    with tabs[7]:  # Paper → Live Translation
+        st.subheader("🔍 Paper → Live Strategy Validation")
+
+        st.info("""
+        **Purpose:** Compare paper trading performance ($100k) vs extrapolated live performance ($40k).
+        Validate strategy meets targets before deploying real capital.
+        """)
+
+        # Load Phoenix state (trade statistics cached until the file changes)
+        from trade_analytics import ROLLING_WINDOW, load_trade_stats
+
+        paper_start = 100000
+        phoenix_state, stats = load_trade_stats(
+            BOT_FACTORY_DIR / "phoenix_state.json", paper_start,
+            default={
+                "current_equity": 100000,
+                "peak_equity": 100000,
+                "total_trades": 0,
+                "total_pnl": 0.0,
+                "trade_history": []
+            }
+        )
+
+        # Calculate metrics
+        paper_equity = phoenix_state.get("current_equity", 100000)
+        has_history = stats.trades > 0
+        total_trades = stats.trades if has_history else phoenix_state.get("total_trades", 0)
+        total_pnl = stats.total_pnl if has_history else phoenix_state.get("total_pnl", 0.0)
+
+        # Calculate paper metrics
+        paper_return_pct = ((paper_equity - paper_start) / paper_start) * 100 if paper_start > 0 else 0
+        win_rate = stats.win_rate
+        avg_r_multiple = stats.avg_r_multiple
+        sharpe_ratio = stats.sharpe
+
+        # Drawdown: worst dip along the equity curve, and from the peak to now
+        peak_equity = max(phoenix_state.get("peak_equity", paper_start),
+                          float(stats.equity.max()) if has_history else paper_start)
+        current_drawdown_pct = ((peak_equity - paper_equity) / peak_equity * 100) if peak_equity > 0 else 0
+        max_drawdown_pct = max(stats.max_drawdown_pct, current_drawdown_pct)
+
+        # Scale to live account ($40k)
+        live_start = 40000
+        scaling_factor = live_start / paper_start
+        live_equity = paper_start + (paper_equity - paper_start) * scaling_factor
+        live_pnl = total_pnl * scaling_factor
+        live_return_pct = paper_return_pct  # Percentage stays same
+
+        # Projected monthly return (if we had trades)
+        if total_trades > 0:
+            # First entry to last exit (30 days if trades carry no times)
+            days_trading = stats.days_trading
+
+            monthly_return_pct = (paper_return_pct / days_trading) * 21 if days_trading > 0 else 0
+            projected_monthly_return_live = (live_start * monthly_return_pct / 100)
+        else:
+            monthly_return_pct = 0
+            projected_monthly_return_live = 0
+
+        st.markdown("---")
+
+        # Side-by-side comparison
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("### 📄 Paper Trading ($100k)")
+            st.metric("Starting Capital", f"${paper_start:,}")
+            st.metric("Current Equity", f"${paper_equity:,.2f}", delta=f"{paper_return_pct:+.2f}%")
+            st.metric("Total P&L", f"${total_pnl:,.2f}")
+            st.metric("Total Trades", f"{total_trades}")
+
+            if total_trades > 0:
+                st.metric("Win Rate", f"{win_rate:.1f}%")
+                st.metric("Avg R Multiple", f"{avg_r_multiple:.2f}x" if avg_r_multiple > 0 else "N/A")
+                st.metric("Max Drawdown", f"{max_drawdown_pct:.2f}%",
+                          help=f"Current: {current_drawdown_pct:.2f}% below peak")
+                st.metric("Sharpe Ratio", f"{sharpe_ratio:.2f}" if sharpe_ratio > 0 else "N/A")
+                st.metric("Sortino Ratio", f"{stats.sortino:.2f}" if stats.sortino > 0 else "N/A")
+                st.metric("Profit Factor", f"{stats.profit_factor:.2f}" if stats.profit_factor > 0 else "N/A")
+                st.metric("Exposure", f"{stats.exposure_pct:.1f}%", help="Time with a position open")
+            else:
+                st.caption("🕐 Waiting for first trade...")
+
+        with col2:
+            st.markdown("### 💰 Live Extrapolation ($40k)")
+            st.metric("Starting Capital", f"${live_start:,}")
+            st.metric("Projected Equity", f"${live_equity:,.2f}", delta=f"{live_return_pct:+.2f}%")
+            st.metric("Projected P&L", f"${live_pnl:,.2f}")
+            st.metric("Same Trades", f"{total_trades}")
+
+            if total_trades > 0:
+                st.metric("Win Rate", f"{win_rate:.1f}%", help="Same as paper")
+                st.metric("Avg R Multiple", f"{avg_r_multiple:.2f}x" if avg_r_multiple > 0 else "N/A")
+                st.metric("Max Drawdown", f"{max_drawdown_pct:.2f}%", help="Same as paper")
+                st.metric("Monthly Target", f"${projected_monthly_return_live:,.0f}", help="If sustained")
+            else:
+                st.caption("🕐 Waiting for first trade...")
+
+        if has_history:
+            import pandas as pd
+
+            st.markdown("#### 📈 Paper Equity Curve")
+            st.line_chart(pd.DataFrame({"Equity": stats.equity}))
+            if stats.trades >= ROLLING_WINDOW:
+                st.caption(f"Rolling Sharpe ({ROLLING_WINDOW} trades)")
+                st.line_chart(pd.DataFrame({"Rolling Sharpe": stats.rolling_sharpe}))
+
+        st.markdown("---")
+
+        # Validation Checkpoints
+        st.subheader("✅ Validation Checklist (Go/No-Go)")
+
+        st.markdown("""
+        **Minimum Requirements for Live Deployment:**
+        - 15-20 paper trades completed
+        - Win rate >50%
+        - Avg R multiple >2.0
+        - Max drawdown <20%
+        - Sharpe ratio >1.5 (Tier 3 unlock)
+        """)
+
+        # Checkpoint status
+        trades_needed = max(0, 15 - total_trades)
+        trades_check = total_trades >= 15
+        winrate_check = win_rate >= 50 if total_trades > 0 else False
+        r_multiple_check = avg_r_multiple >= 2.0 if total_trades > 0 else False
+        drawdown_check = max_drawdown_pct < 20 if total_trades > 0 else False
+        sharpe_check = sharpe_ratio >= 1.5 if sharpe_ratio > 0 else False
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            if trades_check:
+                st.success(f"✅ Trades: {total_trades}/15+")
+            else:
+                st.warning(f"⏳ Trades: {total_trades}/15 ({trades_needed} more needed)")
+
+        with col2:
+            if total_trades >= 5:
+                if winrate_check:
+                    st.success(f"✅ Win Rate: {win_rate:.1f}% (>50%)")
+                else:
+                    st.error(f"❌ Win Rate: {win_rate:.1f}% (<50%)")
+            else:
+                st.info("⏳ Win Rate: Need 5+ trades")
+
+        with col3:
+            if total_trades >= 5:
+                if r_multiple_check:
+                    st.success(f"✅ Avg R: {avg_r_multiple:.2f}x (>2.0)")
+                else:
+                    st.error(f"❌ Avg R: {avg_r_multiple:.2f}x (<2.0)")
+            else:
+                st.info("⏳ Avg R: Need 5+ trades")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            if total_trades >= 5:
+                if drawdown_check:
+                    st.success(f"✅ Drawdown: {max_drawdown_pct:.2f}% (<20%)")
+                else:
+                    st.error(f"❌ Drawdown: {max_drawdown_pct:.2f}% (>20%)")
+            else:
+                st.info("⏳ Drawdown: Need 5+ trades")
+
+        with col2:
+            if sharpe_ratio > 0:
+                if sharpe_check:
+                    st.success(f"✅ Sharpe: {sharpe_ratio:.2f} (>1.5)")
+                else:
+                    st.warning(f"⚠️ Sharpe: {sharpe_ratio:.2f} (<1.5)")
+            else:
+                st.info("⏳ Sharpe: Need 5+ trades")
+
+        with col3:
+            # Overall Go/No-Go
+            all_checks = [trades_check, winrate_check, r_multiple_check, drawdown_check, sharpe_check]
+            if total_trades >= 15 and all(all_checks):
+                st.success("🚀 GO FOR LIVE")
+            elif total_trades >= 5:
+                passed = sum(all_checks)
+                st.warning(f"⏳ {passed}/5 checks passed")
+            else:
+                st.info("⏳ Validating strategy...")
+
+        st.markdown("---")
+
+        # Plan alignment
+        st.subheader("📊 Plan Alignment Check")
+
+        target_monthly_return = 4000  # $4k-5k/mo target from plan
+        on_track = projected_monthly_return_live >= target_monthly_return if total_trades >= 10 else None
+
+        if on_track is None:
+            st.info(f"""
+            **Target:** ${target_monthly_return:,}/month from live trading
+
+            **Status:** Need 10+ trades to project monthly performance
+
+            **Current Progress:** {total_trades}/10 trades completed
+            """)
+        elif on_track:
+            st.success(f"""
+            ✅ **ON TRACK FOR PLAN TARGETS**
+
+            - Paper performance: {paper_return_pct:+.2f}%
+            - Extrapolated live monthly: ${projected_monthly_return_live:,.0f}
+            - Target: ${target_monthly_return:,}/month
+            - Status: **EXCEEDING TARGET** 🎯
+            """)
+        else:
+            st.warning(f"""
+            ⚠️ **BELOW PLAN TARGETS**
+
+            - Paper performance: {paper_return_pct:+.2f}%
+            - Extrapolated live monthly: ${projected_monthly_return_live:,.0f}
+            - Target: ${target_monthly_return:,}/month
+            - Gap: ${target_monthly_return - projected_monthly_return_live:,.0f}/month
+
+            **Recommendation:** Continue paper trading and optimize strategy before going live.
+            """)
+
+        # Next steps
+        st.markdown("---")
+        st.subheader("📋 Next Steps")
+
+        if total_trades == 0:
+            st.info("""
+            **Waiting for market signals...**
+
+            Phoenix is running and monitoring QQQ for SMA crossover signals.
+
+            **What's happening:**
+            - Market is neutral (RSI ~52.9)
+            - No SMA crossover detected yet
+            - System is correctly holding (not a bug)
+
+            **Timeline:** Expect first trade within 1-7 days depending on market conditions.
+            """)
+        elif total_trades < 5:
+            st.info(f"""
+            **Early validation phase**
+
+            - Completed: {total_trades} trades
+            - Need: 5+ trades for initial metrics
+            - Then: 15-20 trades for full validation
+
+            **ETA:** ~3-7 more days to reach 5 trades (based on typical signal frequency)
+            """)
+        elif total_trades < 15:
+            st.warning(f"""
+            **Continue paper trading validation**
+
+            - Completed: {total_trades}/15 trades
+            - Remaining: {15 - total_trades} trades
+
+            **Current metrics:**
+            - Win rate: {win_rate:.1f}% (target: >50%)
+            - Avg R: {avg_r_multiple:.2f}x (target: >2.0)
+            - Sharpe: {sharpe_ratio:.2f} (target: >1.5)
+
+            **ETA:** ~{(15 - total_trades) * 1.5:.0f} days to complete validation
+            """)
+        else:
+            if all([trades_check, winrate_check, r_multiple_check, drawdown_check]):
+                st.success("""
+                🚀 **READY FOR LIVE DEPLOYMENT**
+
+                All validation checks passed! Strategy is proven on paper.
+
+                **Next Steps:**
+                1. Review final paper trading results
+                2. Fund Alpaca account with $40k
+                3. Switch Phoenix to LIVE mode
+                4. Start with conservative position sizing (Tier 1)
+                5. Monitor closely for first 5 live trades
+
+                **Expected Results:** $4-5k/month based on paper performance
+                """)
+            else:
+                st.error("""
+                ❌ **NOT READY FOR LIVE - Failed Validation**
+
+                Some validation checks failed. Strategy needs optimization.
+
+                **Options:**
+                1. Continue paper trading and adjust parameters
+                2. Analyze losing trades for patterns
+                3. Consider different entry/exit criteria
+                4. Contact Trinity AI for optimization suggestions
+
+                **DO NOT go live until all checks pass!**
+                """)
+
+
+# ============================================================================
+# LAYOUT PRIMITIVES
+# ============================================================================
+
+APPLE_STYLE = """
+<style>
+    /* Apple Store Dark Mode */
+    :root {
+        --apple-bg: #000000;
+        --apple-card: #1c1c1e;
+        --apple-card-hover: #2c2c2e;
+        --apple-primary: #0a84ff;
+        --apple-success: #30d158;
+        --apple-warning: #ff9f0a;
+        --apple-danger: #ff453a;
+        --apple-text: #ffffff;
+        --apple-text-secondary: #98989d;
+        --apple-border: #38383a;
+    }
+    
+    /* Global Styles - Optimized for TV Display */
+    .main {
+        background-color: var(--apple-bg);
+        color: var(--apple-text);
+        font-size: 0.9rem;
+    }
+
+    /* Base text size reduction */
+    body, p, div, span {
+        font-size: 0.9rem;
+        line-height: 1.4;
+    }
+    
+    /* Cards with frosted glass effect */
+    .stCard, [data-testid="stVerticalBlock"] > div {
+        background: var(--apple-card);
+        border: 1px solid var(--apple-border);
+        border-radius: 12px;
+        padding: 1.5rem;
+        transition: all 0.3s ease;
+    }
+    
+    .stCard:hover {
+        background: var(--apple-card-hover);
+        transform: translateY(-2px);
+        box-shadow: 0 8px 24px rgba(0,0,0,0.3);
+    }
+    
+    /* Buttons - Apple style, reduced for TV */
+    .stButton > button {
+        background: var(--apple-primary);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 0.6rem 1.2rem;
+        font-weight: 500;
+        transition: all 0.2s ease;
+        font-size: 0.85rem;
+    }
+    
+    .stButton > button:hover {
+        background: #0070e0;
+        transform: scale(1.02);
+        box-shadow: 0 4px 12px rgba(10,132,255,0.3);
+    }
+    
+    /* Metrics - Reduced for TV display */
+    [data-testid="stMetricValue"] {
+        font-size: 1.5rem;
+        font-weight: 700;
+        color: var(--apple-primary);
+    }
+
+    [data-testid="stMetricDelta"] {
+        font-size: 0.75rem;
+        font-weight: 500;
+    }
+
+    [data-testid="stMetricLabel"] {
+        font-size: 0.85rem;
+    }
+    
+    /* Headers - Reduced for TV display */
+    h1, h2, h3 {
+        color: var(--apple-text);
+        font-weight: 700;
+        letter-spacing: -0.02em;
+    }
+
+    h1 { font-size: 1.75rem; }
+    h2 { font-size: 1.5rem; }
+    h3 { font-size: 1.25rem; }
+    
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #1c1c1e 0%, #000000 100%);
+        border-right: 1px solid var(--apple-border);
+        padding: 1rem 0.5rem;
+    }
+
+    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {
+        color: var(--apple-text);
+    }
+
+    /* Sidebar Radio Buttons - Custom Navigation Cards */
+    [data-testid="stSidebar"] .stRadio > div {
+        gap: 0.5rem;
+    }
+
+    [data-testid="stSidebar"] .stRadio > div > label {
+        background: rgba(28, 28, 30, 0.6);
+        border: 1px solid var(--apple-border);
+        border-radius: 12px;
+        padding: 0.75rem 1rem;
+        margin: 0.25rem 0;
+        cursor: pointer;
+        transition: all 0.3s ease;
+        display: flex;
+        align-items: center;
+        backdrop-filter: blur(10px);
+    }
+
+    [data-testid="stSidebar"] .stRadio > div > label:hover {
+        background: rgba(44, 44, 46, 0.8);
+        border-color: var(--apple-primary);
+        transform: translateX(4px);
+        box-shadow: 0 4px 12px rgba(10,132,255,0.2);
+    }
+
+    [data-testid="stSidebar"] .stRadio > div > label[data-checked="true"] {
+        background: linear-gradient(135deg, rgba(10,132,255,0.2) 0%, rgba(10,132,255,0.05) 100%);
+        border-color: var(--apple-primary);
+        box-shadow: 0 4px 16px rgba(10,132,255,0.3);
+        transform: translateX(4px);
+    }
+
+    [data-testid="stSidebar"] .stRadio > div > label > div {
+        color: var(--apple-text);
+        font-weight: 500;
+        font-size: 0.95rem;
+    }
+
+    /* Trinity Section Styling */
+    .trinity-section {
+        background: linear-gradient(135deg, rgba(10,132,255,0.1) 0%, rgba(10,132,255,0.02) 100%);
+        border: 1px solid rgba(10,132,255,0.3);
+        border-radius: 16px;
+        padding: 1rem;
+        margin: 1rem 0;
+        backdrop-filter: blur(10px);
+    }
+
+    .trinity-avatar-container {
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        padding: 0.5rem;
+        margin: 0.5rem 0;
+    }
+
+    /* Sidebar Buttons Enhancement */
+    [data-testid="stSidebar"] .stButton > button {
+        width: 100%;
+        background: rgba(10,132,255,0.15);
+        border: 1px solid rgba(10,132,255,0.3);
+        padding: 0.6rem 1rem;
+        font-size: 0.875rem;
+        margin: 0.25rem 0;
+    }
+
+    [data-testid="stSidebar"] .stButton > button:hover {
+        background: rgba(10,132,255,0.25);
+        border-color: var(--apple-primary);
+        transform: scale(1.02);
+    }
+
+    /* Sidebar Text Input */
+    [data-testid="stSidebar"] .stTextInput > div > div {
+        background: rgba(28,28,30,0.8);
+        border: 1px solid var(--apple-border);
+        border-radius: 10px;
+        transition: all 0.3s ease;
+    }
+
+    [data-testid="stSidebar"] .stTextInput > div > div:focus-within {
+        border-color: var(--apple-primary);
+        box-shadow: 0 0 0 3px rgba(10,132,255,0.2);
+    }
+
+    /* Sidebar Caption/Footer */
+    [data-testid="stSidebar"] .stCaption {
+        color: var(--apple-text-secondary);
+        text-align: center;
+        font-size: 0.75rem;
+        opacity: 0.7;
+    }
+
+    /* Status Indicator */
+    .status-indicator {
+        display: inline-block;
+        width: 8px;
+        height: 8px;
+        border-radius: 50%;
+        margin-right: 6px;
+        animation: pulse 2s infinite;
+    }
+
+    .status-online {
+        background: var(--apple-success);
+        box-shadow: 0 0 8px var(--apple-success);
+    }
+
+    .status-offline {
+        background: var(--apple-text-secondary);
+    }
+
+    @keyframes pulse {
+        0%, 100% { opacity: 1; }
+        50% { opacity: 0.5; }
+    }
+    
+    /* Tabs - Apple style */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background: transparent;
+        border-bottom: 1px solid var(--apple-border);
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background: transparent;
+        border: none;
+        color: var(--apple-text-secondary);
+        padding: 0.6rem 1rem;
+        font-weight: 500;
+        font-size: 0.85rem;
+        transition: all 0.2s ease;
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover {
+        color: var(--apple-text);
+        background: rgba(255,255,255,0.05);
+        border-radius: 8px;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        color: var(--apple-primary);
+        background: rgba(10,132,255,0.1);
+        border-radius: 8px;
+    }
+    
+    /* Progress bar */
+    .stProgress > div > div {
+        background: var(--apple-primary);
+        border-radius: 8px;
+    }
+    
+    /* Trinity AI Widget */
+    .trinity-widget {
+        position: fixed;
+        bottom: 20px;
+        right: 20px;
+        background: linear-gradient(135deg, #1c1c1e 0%, #2c2c2e 100%);
+        border: 2px solid var(--apple-primary);
+        border-radius: 20px;
+        padding: 1rem;
+        box-shadow: 0 8px 32px rgba(10,132,255,0.3);
+        backdrop-filter: blur(10px);
+        z-index: 9999;
+        max-width: 80px;
+        transition: all 0.3s ease;
+    }
+    
+    .trinity-widget:hover {
+        transform: scale(1.05);
+        box-shadow: 0 12px 48px rgba(10,132,255,0.5);
+    }
+    
+    /* Expander */
+    .streamlit-expanderHeader {
+        background: var(--apple-card);
+        border-radius: 12px;
+        padding: 1rem;
+        border: 1px solid var(--apple-border);
+    }
+    
+    .streamlit-expanderHeader:hover {
+        background: var(--apple-card-hover);
+        border-color: var(--apple-primary);
+    }
+    
+    /* Success/Warning/Error colors */
+    .stSuccess {
+        background: rgba(48,209,88,0.1);
+        border-left: 4px solid var(--apple-success);
+        border-radius: 8px;
+    }
+    
+    .stWarning {
+        background: rgba(255,159,10,0.1);
+        border-left: 4px solid var(--apple-warning);
+        border-radius: 8px;
+    }
+    
+    .stError {
+        background: rgba(255,69,58,0.1);
+        border-left: 4px solid var(--apple-danger);
+        border-radius: 8px;
+    }
+    
+    .stInfo {
+        background: rgba(10,132,255,0.1);
+        border-left: 4px solid var(--apple-primary);
+        border-radius: 8px;
+    }
+    
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+
+    /* Scrollbar Styling */
+    ::-webkit-scrollbar {
+        width: 8px;
+        height: 8px;
+    }
+
+    ::-webkit-scrollbar-track {
+        background: var(--apple-bg);
+    }
+
+    ::-webkit-scrollbar-thumb {
+        background: var(--apple-border);
+        border-radius: 4px;
+    }
+
+    ::-webkit-scrollbar-thumb:hover {
+        background: var(--apple-primary);
+    }
+
+    /* Sidebar Dividers */
+    [data-testid="stSidebar"] hr {
+        border: none;
+        height: 1px;
+        background: linear-gradient(90deg, transparent 0%, var(--apple-border) 50%, transparent 100%);
+        margin: 1rem 0;
+    }
+
+    /* Input Focus States */
+    input:focus, textarea:focus {
+        outline: none;
+        border-color: var(--apple-primary) !important;
+        box-shadow: 0 0 0 3px rgba(10,132,255,0.2) !important;
+    }
+
+    /* Selection Color */
+    ::selection {
+        background: rgba(10,132,255,0.3);
+        color: var(--apple-text);
+    }
+
+    /* Smooth Animations */
+    * {
+        -webkit-font-smoothing: antialiased;
+        -moz-osx-font-smoothing: grayscale;
+    }
+
+    /* Card Grid Layout */
+    [data-testid="column"] {
+        gap: 1rem;
+    }
+
+    /* Enhanced Shadows for Depth */
+    .stCard, [data-testid="stVerticalBlock"] > div:hover {
+        box-shadow:
+            0 1px 2px rgba(0,0,0,0.1),
+            0 2px 4px rgba(0,0,0,0.1),
+            0 4px 8px rgba(0,0,0,0.1),
+            0 8px 16px rgba(0,0,0,0.1);
+    }
+
+    /* Loading Spinner */
+    [data-testid="stSpinner"] > div {
+        border-color: var(--apple-primary) transparent transparent transparent !important;
+    }
+
+    /* Toast Notifications */
+    .stToast {
+        background: var(--apple-card) !important;
+        border: 1px solid var(--apple-border) !important;
+        border-radius: 12px !important;
+        backdrop-filter: blur(10px) !important;
+    }
+</style>
+"""
+
+
+def render_apple_style():
+    """Apple dark-mode CSS (Trinity v2.1)"""
+    st.markdown(APPLE_STYLE, unsafe_allow_html=True)
+
+
+def render_base_style():
+    """Command Center CSS (larger type and buttons in VR mode)."""
+    vr_size = "1.3em" if is_vr_mode() else "1em"
+    st.markdown(f"""
+    <style>
+        /* Enhanced UI Styling */
+        .main {{
+            font-size: {vr_size};
+        }}
+        button {{
+            font-size: {vr_size} !important;
+            padding: {'1em' if is_vr_mode() else '0.5em'} !important;
+            border-radius: 8px !important;
+            transition: all 0.3s ease !important;
+        }}
+        button:hover {{
+            transform: scale(1.05);
+            box-shadow: 0 4px 8px rgba(0,255,0,0.3) !important;
+        }}
+        .stChatMessage {{
+            border-radius: 10px;
+            padding: 1em;
+            margin: 0.5em 0;
+        }}
+        .stTextInput input {{
+            border-radius: 8px;
+        }}
+        .stSelectbox {{
+            border-radius: 8px;
+        }}
+        /* Success/Error styling */
+        .stSuccess {{
+            border-left: 4px solid #00ff00;
+        }}
+        .stError {{
+            border-left: 4px solid #ff0000;
+        }}
+        .stInfo {{
+            border-left: 4px solid #0088ff;
+        }}
+        /* Metrics enhancement */
+        [data-testid="stMetricValue"] {{
+            font-size: 2em;
+            font-weight: bold;
+            color: #00ff00;
+        }}
+    </style>
+    """, unsafe_allow_html=True)
+
+def render_vr_toggle(help: str = "Optimize interface for Oculus Quest"):
+    """VR mode toggle (reruns when switched)."""
+    vr_toggle = st.toggle("🥽 VR Mode", value=st.session_state.vr_mode, help=help)
+    if vr_toggle != st.session_state.vr_mode:
+        st.session_state.vr_mode = vr_toggle
+        st.rerun()
+
+def render_station_radio(key: str, modules: List[str]) -> str:
+    """Station selector bound to session key ``key``; reruns on change."""
+    current = st.session_state.get(key)
+    module = st.radio(
+        "Select Module:",
+        modules,
+        index=modules.index(current) if current in modules else 0,
+        label_visibility="collapsed"
+    )
+    if module != current:
+        st.session_state[key] = module
+        st.rerun()
+    return module
+
+def render_system_status(phoenix_label: str, running_caption: str, show_api: bool = True):
+    """Trinity API / Phoenix indicators (cached status checks, shared across sessions)."""
+    st.subheader("System Status")
+
+    if show_api:
+        st.write("🎯 Trinity API:", "🟢" if port_listening(8001) else "🔴")
+
+    phoenix_running = process_running(PHOENIX_PROCESS)
+    st.write(f"{phoenix_label}:", "🟢" if phoenix_running else "🔴")
+    if phoenix_running:
+        st.caption(running_caption)
+
+def sparkline(values, low: float = 0.0, high: float = 100.0) -> str:
+    """Unicode block sparkline of percentages."""
+    blocks = "▁▂▃▄▅▆▇█"
+    span = (high - low) or 1.0
+    return "".join(blocks[min(max(int((v - low) / span * len(blocks)), 0), len(blocks) - 1)]
+                   for v in values if v is not None)
+
+def render_quick_stats():
+    """CPU/RAM from the background sampler: no blocking cpu_percent() on every rerun."""
+    st.subheader("Quick Stats")
+    try:
+        summary = get_sampler().summary(300)
+        latest, averages = summary['latest'], summary['fields']
+        cpu_avg = averages.get('cpu_percent', {}).get('avg', latest['cpu_percent'])
+        mem_avg = averages.get('memory_percent', {}).get('avg', latest['memory_percent'])
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if latest['cpu_percent'] is None:
+                st.metric("CPU", "…")  # First reading lands on the next sampler tick
+            else:
+                st.metric("CPU", f"{latest['cpu_percent']:.0f}%",
+                          delta=f"{latest['cpu_percent'] - cpu_avg:+.0f} vs 5m avg",
+                          delta_color="inverse")
+        with col2:
+            st.metric("RAM", f"{latest['memory_percent']:.0f}%",
+                      delta=f"{latest['memory_percent'] - mem_avg:+.0f} vs 5m avg",
+                      delta_color="inverse")
+
+        # Text sparklines: a chart here would import pandas/altair (~0.5s)
+        # on every cold start, since the sidebar renders on every page
+        history = get_sampler().history(1800, points=30)
+        if len(history['timestamp']) > 1:
+            st.caption(f"CPU `{sparkline(history['cpu_percent'])}` 30m")
+            st.caption(f"RAM `{sparkline(history['memory_percent'])}` 30m")
+            cpu_p95 = averages.get('cpu_percent', {}).get('p95')
+            if cpu_p95 is not None:
+                st.caption(f"CPU p95 (5m): {cpu_p95:.0f}%")
+    except Exception:
+        st.caption("📊 Stats unavailable")
+
+def render_footer(version: str, tagline: str, third: str, shortcuts: Dict[str, str]):
+    """Four-column footer: version, tagline, status caption and a shortcuts popover."""
+    st.divider()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.caption(f"⚡ {version}")
+    with col2:
+        st.caption(tagline)
+    with col3:
+        st.caption(third)
+    with col4:
+        with st.popover("⌨️ Shortcuts"):
+            for keys, action in shortcuts.items():
+                st.caption(f"**{keys}**: {action}")
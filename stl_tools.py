@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Trinity STL Tools
+
+Helpers for delivering CAD models to the VR workspace:
+- Detect ASCII vs binary STL
+- Convert OpenSCAD's ASCII STL output to compact binary STL
+- Cached binary/gzip variants for models that were never converted
+"""
+
+import gzip
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from state_store import atomic_write_bytes
+
+BINARY_HEADER = b'Trinity binary STL'.ljust(80, b' ')
+FACET_STRUCT = struct.Struct('<12fH')  # normal, 3 vertices, attribute byte count
+COUNT_STRUCT = struct.Struct('<I')
+
+
+def is_binary_stl(path: Path) -> bool:
+    """
+    Check if an STL file is binary.
+
+    ASCII files may be large and binary files may also begin with
+    "solid", so the triangle count in the header is checked against the
+    file size instead of sniffing the first bytes.
+    """
+    size = path.stat().st_size
+    if size < 84:
+        return False
+    with open(path, 'rb') as f:
+        f.seek(80)
+        (count,) = COUNT_STRUCT.unpack(f.read(4))
+    return size == 84 + count * FACET_STRUCT.size
+
+
+def parse_ascii_stl(text: str) -> List[float]:
+    """
+    Parse ASCII STL text into a flat list of floats.
+
+    Every facet contributes 12 values: the normal followed by its three
+    vertices.
+    """
+    tokens = text.split()
+    values: List[float] = []
+    i = 0
+    n = len(tokens)
+    while i < n:
+        token = tokens[i]
+        if token == 'normal' or token == 'vertex':
+            values.extend(float(v) for v in tokens[i + 1:i + 4])
+            i += 4
+        else:
+            i += 1
+
+    if len(values) % 12:
+        raise ValueError("Malformed ASCII STL: incomplete facet")
+    return values
+
+
+def write_binary_stl(values: List[float], dst: Path) -> int:
+    """Write flat facet values as a binary STL (atomically). Returns triangle count."""
+    count = len(values) // 12
+    pack = FACET_STRUCT.pack
+    body = b''.join(pack(*values[i:i + 12], 0) for i in range(0, len(values), 12))
+    atomic_write_bytes(dst, BINARY_HEADER + COUNT_STRUCT.pack(count) + body)
+    return count
+
+
+def ascii_to_binary_stl(src: Path, dst: Optional[Path] = None) -> int:
+    """
+    Convert an ASCII STL to binary.
+
+    Args:
+        src: ASCII STL file
+        dst: Output path (defaults to replacing ``src`` in place)
+
+    Returns:
+        Number of triangles written
+    """
+    values = parse_ascii_stl(src.read_text(encoding='ascii', errors='ignore'))
+    return write_binary_stl(values, dst or src)
+
+
+def convert_to_binary_stl(path: Path) -> bool:
+    """
+    Convert an STL file to binary in place if it is ASCII.
+
+    Returns True if the file was converted, False if it was already
+    binary or could not be parsed (the original is left untouched).
+    """
+    try:
+        if is_binary_stl(path):
+            return False
+        ascii_to_binary_stl(path)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def _is_fresh(variant: Path, source: Path) -> bool:
+    """Check if a cached variant is at least as new as its source."""
+    try:
+        return variant.stat().st_mtime >= source.stat().st_mtime
+    except OSError:
+        return False
+
+
+def binary_variant(path: Path, cache_dir: Path) -> Path:
+    """
+    Return a binary version of ``path``.
+
+    Binary files are returned as-is; ASCII files are converted once into
+    ``cache_dir`` and reused until the source changes.
+    """
+    if is_binary_stl(path):
+        return path
+
+    cached = cache_dir / path.name
+    if not _is_fresh(cached, path):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        ascii_to_binary_stl(path, cached)
+    return cached
+
+
+def gzip_variant(path: Path, cache_dir: Path) -> Path:
+    """Return a cached ``.gz`` copy of ``path``, rebuilding it if stale."""
+    cached = cache_dir / f'{path.name}.gz'
+    if _is_fresh(cached, path):
+        return cached
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f'.{cached.name}.', suffix='.tmp')
+    try:
+        os.fchmod(fd, 0o644)
+        with open(path, 'rb') as src, os.fdopen(fd, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6, mtime=0) as gz:
+                shutil.copyfileobj(src, gz, 1024 * 1024)
+        os.replace(tmp_path, cached)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return cached
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Trinity Supervisor
+
+Single owner of the Trinity service processes (replaces restart logic in
+autonomous_watchdog.py and health_monitor.py):
+- Starts each service as a direct child, so exits are seen immediately
+  (one thread per child blocks in waitpid) instead of pgrep polling
+- Restarts with exponential backoff, reset once a service stays up
+- A service is "ready" only once its health endpoint answers; endpoints
+  that stop answering trigger a restart
+- Per-service uptime / restart metrics in supervisor_status.json
+
+Usage:
+    python3 supervisor.py                     # Supervise all services
+    python3 supervisor.py --only vr_server    # Subset
+    python3 supervisor.py --status            # Print current metrics
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from state_store import get_store
+
+# Configuration
+BASE_DIR = Path(__file__).parent
+LOG_DIR = BASE_DIR / "logs"
+STATUS_FILE = BASE_DIR / "supervisor_status.json"
+PID_FILE = BASE_DIR / ".supervisor.pid"
+
+BACKOFF_INITIAL = 1.0  # seconds
+BACKOFF_MAX = 300.0
+STABLE_AFTER = 60.0  # Up this long → backoff resets
+READY_TIMEOUT = 60.0  # Health endpoint must answer within this after start
+HEALTH_INTERVAL = 30.0  # Liveness probe interval for ready services
+UNHEALTHY_THRESHOLD = 3  # Consecutive failed probes before a restart
+STOP_TIMEOUT = 10.0  # SIGTERM → SIGKILL grace period
+
+logger = logging.getLogger("supervisor")
+
+
+@dataclass
+class ServiceSpec:
+    """How to run and probe one service."""
+    name: str
+    command: List[str]
+    health_url: Optional[str] = None
+    critical: bool = True
+
+
+SERVICES = [
+    ServiceSpec('vr_server', [sys.executable, 'vr_server.py'],
+                health_url='http://127.0.0.1:8503/api/status'),
+    ServiceSpec('command_center',
+                ['streamlit', 'run', 'trinity_app.py',
+                 '--server.port', '8502', '--server.headless', 'true'],
+                health_url='http://127.0.0.1:8502/_stcore/health'),
+    ServiceSpec('trinity_api', [sys.executable, 'main.py'],
+                health_url='http://127.0.0.1:8001/health', critical=False),
+    ServiceSpec('clipboard_daemon', [sys.executable, 'clipboard_daemon.py']),
+    ServiceSpec('scanner_service', [sys.executable, 'scanner_service.py'], critical=False)
+]
+
+
+@dataclass
+class ServiceState:
+    """Runtime state of a supervised service."""
+    spec: ServiceSpec
+    state: str = 'stopped'  # stopped | starting | ready | backoff | external
+    process: Optional[subprocess.Popen] = None
+    started_at: Optional[float] = None
+    ready_at: Optional[float] = None
+    restarts: int = 0
+    consecutive_failures: int = 0
+    failed_probes: int = 0
+    last_exit_code: Optional[int] = None
+    last_exit_at: Optional[float] = None
+    next_start_at: Optional[float] = None
+    generation: int = 0  # Bumped per spawn so stale events are ignored
+    total_uptime: float = 0.0
+    log_file: Optional[object] = field(default=None, repr=False)
+
+    def backoff(self) -> float:
+        """Delay before the next start attempt."""
+        if self.consecutive_failures == 0:
+            return 0.0
+        return min(BACKOFF_INITIAL * 2 ** (self.consecutive_failures - 1), BACKOFF_MAX)
+
+
+def probe(url: str, timeout: float = 2.0) -> bool:
+    """True if the health endpoint answers with a 2xx/3xx status."""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status < 400
+    except Exception:
+        return False
+
+
+def supervisor_active() -> bool:
+    """True if a supervisor process owns the services (watchdogs stand down)."""
+    try:
+        pid = int(PID_FILE.read_text().strip())
+        os.kill(pid, 0)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+class Supervisor:
+    """Owns the service processes and restarts them when they exit."""
+
+    def __init__(self, services: List[ServiceSpec] = SERVICES, cwd: Path = BASE_DIR,
+                 log_dir: Path = LOG_DIR, status_file: Optional[Path] = STATUS_FILE):
+        self.cwd = cwd
+        self.log_dir = log_dir
+        self.status_file = status_file
+        self.services: Dict[str, ServiceState] = {spec.name: ServiceState(spec) for spec in services}
+        self.events: "queue.Queue[tuple]" = queue.Queue()
+        self._stopping = threading.Event()
+        self._next_health_check = time.monotonic() + HEALTH_INTERVAL
+
+    # ------------------------------------------------------------------
+    # Process lifecycle
+    # ------------------------------------------------------------------
+
+    def spawn(self, service: ServiceState):
+        """Start a service and its exit/readiness watchers."""
+        spec = service.spec
+        if spec.health_url and service.state != 'external' and probe(spec.health_url):
+            # Something outside the supervisor already serves this port;
+            # starting ours would only crash-loop on the bind
+            logger.warning(f"{spec.name}: already running outside the supervisor, not managed")
+            service.state = 'external'
+            return
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if service.log_file is None:
+            service.log_file = open(self.log_dir / f"{spec.name}.log", 'ab')
+
+        try:
+            process = subprocess.Popen(
+                spec.command,
+                cwd=self.cwd,
+                stdout=service.log_file,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True  # Own process group, so children die with it
+            )
+        except OSError as e:
+            logger.error(f"{spec.name}: failed to start: {e}")
+            self._on_exit(service, service.generation, None)
+            return
+
+        service.generation += 1
+        service.process = process
+        service.state = 'starting'
+        service.started_at = time.monotonic()
+        service.ready_at = None
+        service.failed_probes = 0
+        service.next_start_at = None
+        logger.info(f"▶️  {spec.name}: started (pid {process.pid})")
+
+        generation = service.generation
+        threading.Thread(target=self._wait_exit, args=(service, process, generation),
+                         name=f"wait-{spec.name}", daemon=True).start()
+        if spec.health_url:
+            threading.Thread(target=self._wait_ready, args=(service, generation),
+                             name=f"ready-{spec.name}", daemon=True).start()
+        else:
+            self.events.put(('ready', spec.name, generation))
+
+    def _wait_exit(self, service: ServiceState, process: subprocess.Popen, generation: int):
+        # Blocks in waitpid(): wakes the instant the child exits
+        code = process.wait()
+        self.events.put(('exit', service.spec.name, generation, code))
+
+    def _wait_ready(self, service: ServiceState, generation: int):
+        deadline = time.monotonic() + READY_TIMEOUT
+        while time.monotonic() < deadline and not self._stopping.is_set():
+            if service.generation != generation:
+                return
+            if probe(service.spec.health_url, timeout=1.0):
+                self.events.put(('ready', service.spec.name, generation))
+                return
+            time.sleep(0.5)
+        self.events.put(('not_ready', service.spec.name, generation))
+
+    def terminate(self, service: ServiceState, timeout: float = STOP_TIMEOUT):
+        """Stop a service's process group (SIGTERM, then SIGKILL)."""
+        process = service.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+        except ProcessLookupError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Event handling (main thread only)
+    # ------------------------------------------------------------------
+
+    def _on_ready(self, service: ServiceState, generation: int):
+        if generation != service.generation or service.state != 'starting':
+            return
+        service.state = 'ready'
+        service.ready_at = time.monotonic()
+        logger.info(f"✅ {service.spec.name}: ready "
+                    f"({service.ready_at - service.started_at:.1f}s after start)")
+
+    def _on_exit(self, service: ServiceState, generation: int, code: Optional[int]):
+        if generation != service.generation or self._stopping.is_set():
+            return
+        now = time.monotonic()
+        uptime = now - service.started_at if service.started_at else 0.0
+        service.total_uptime += uptime
+
+        # A run that stayed up long enough counts as a success: reset backoff
+        if uptime >= STABLE_AFTER:
+            service.consecutive_failures = 0
+        service.consecutive_failures += 1
+
+        service.process = None
+        service.state = 'backoff'
+        service.started_at = None
+        service.ready_at = None
+        service.last_exit_code = code
+        service.last_exit_at = time.time()
+        service.next_start_at = now + service.backoff()
+        logger.warning(f"❌ {service.spec.name}: exited with {code} after {uptime:.1f}s, "
+                       f"restarting in {service.backoff():.0f}s")
+
+    def _restart(self, service: ServiceState, reason: str):
+        """Kill a running-but-broken service; its exit schedules the restart."""
+        logger.warning(f"🔄 {service.spec.name}: {reason}, restarting")
+        self.terminate(service)
+
+    def _health_checks(self):
+        """Liveness probes for ready (and externally run) services."""
+        for service in self.services.values():
+            url = service.spec.health_url
+            if service.state == 'external':
+                if not probe(url):
+                    logger.info(f"{service.spec.name}: external instance gone, taking over")
+                    service.state = 'stopped'
+                    self.spawn(service)
+            elif service.state == 'ready' and url:
+                if probe(url):
+                    service.failed_probes = 0
+                else:
+                    service.failed_probes += 1
+                    if service.failed_probes >= UNHEALTHY_THRESHOLD:
+                        self._restart(service, f"{service.failed_probes} failed health probes")
+
+    def _due_starts(self):
+        now = time.monotonic()
+        for service in self.services.values():
+            if service.state == 'backoff' and service.next_start_at <= now:
+                service.restarts += 1
+                self.spawn(service)
+
+    def _next_timeout(self) -> float:
+        now = time.monotonic()
+        wakeups = [self._next_health_check]
+        wakeups += [s.next_start_at for s in self.services.values() if s.state == 'backoff']
+        return max(0.0, min(wakeups) - now)
+
+    def step(self, timeout: Optional[float] = None):
+        """Process one event (or timer tick)."""
+        try:
+            event = self.events.get(timeout=self._next_timeout() if timeout is None else timeout)
+        except queue.Empty:
+            event = None
+
+        if event and event[0] != 'shutdown':
+            kind, name, generation = event[:3]
+            service = self.services[name]
+            if kind == 'exit':
+                self._on_exit(service, generation, event[3])
+            elif kind == 'ready':
+                self._on_ready(service, generation)
+            elif kind == 'not_ready' and generation == service.generation and service.state == 'starting':
+                self._restart(service, f"not healthy within {READY_TIMEOUT:.0f}s")
+
+        self._due_starts()
+        if time.monotonic() >= self._next_health_check:
+            self._health_checks()
+            self._next_health_check = time.monotonic() + HEALTH_INTERVAL
+        self.write_status()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict:
+        """Per-service state, uptime and restart counters."""
+        now = time.monotonic()
+        services = {}
+        for name, service in self.services.items():
+            uptime = now - service.started_at if service.started_at else 0.0
+            services[name] = {
+                'state': service.state,
+                'pid': service.process.pid if service.process else None,
+                'critical': service.spec.critical,
+                'uptime_seconds': round(uptime, 1),
+                'total_uptime_seconds': round(service.total_uptime + uptime, 1),
+                'restarts': service.restarts,
+                'consecutive_failures': service.consecutive_failures,
+                'last_exit_code': service.last_exit_code,
+                'last_exit': datetime.fromtimestamp(service.last_exit_at).isoformat()
+                if service.last_exit_at else None,
+                'next_restart_in': round(max(0.0, service.next_start_at - now), 1)
+                if service.state == 'backoff' else None
+            }
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'supervisor_pid': os.getpid(),
+            'services': services
+        }
+
+    def write_status(self):
+        if self.status_file:
+            try:
+                get_store(self.status_file, backend='file').write(self.metrics())
+            except OSError as e:
+                logger.error(f"Failed to write status: {e}")
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def start(self):
+        for service in self.services.values():
+            self.spawn(service)
+        self.write_status()
+
+    def stop(self):
+        """Stop all services."""
+        self._stopping.set()
+        for service in self.services.values():
+            self.terminate(service)
+            service.state = 'stopped'
+            service.process = None
+            if service.log_file:
+                service.log_file.close()
+                service.log_file = None
+        self.write_status()
+
+    def run(self):
+        """Supervise until SIGINT/SIGTERM."""
+        def _shutdown(signum, frame):
+            self._stopping.set()
+            self.events.put(('shutdown', None, None))
+
+        signal.signal(signal.SIGTERM, _shutdown)
+        signal.signal(signal.SIGINT, _shutdown)
+
+        PID_FILE.write_text(str(os.getpid()))
+        try:
+            self.start()
+            while not self._stopping.is_set():
+                self.step()
+        finally:
+            logger.info("🛑 Stopping services...")
+            self.stop()
+            PID_FILE.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Trinity service supervisor')
+    parser.add_argument('--only', nargs='+', metavar='SERVICE',
+                        help=f"Services to run ({', '.join(s.name for s in SERVICES)})")
+    parser.add_argument('--status', action='store_true', help='Print current metrics and exit')
+    args = parser.parse_args()
+
+    if args.status:
+        if not supervisor_active():
+            print("Supervisor not running")
+        if STATUS_FILE.exists():
+            print(json.dumps(json.loads(STATUS_FILE.read_text()), indent=2))
+        return
+
+    LOG_DIR.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        handlers=[
+            logging.FileHandler(LOG_DIR / "supervisor.log"),
+            logging.StreamHandler()
+        ]
+    )
+
+    if supervisor_active():
+        logger.error("Another supervisor is already running")
+        sys.exit(1)
+
+    services = SERVICES
+    if args.only:
+        unknown = set(args.only) - {s.name for s in SERVICES}
+        if unknown:
+            parser.error(f"Unknown services: {', '.join(sorted(unknown))}")
+        services = [s for s in SERVICES if s.name in args.only]
+
+    logger.info("╔════════════════════════════════════════╗")
+    logger.info("║      TRINITY SUPERVISOR ACTIVE         ║")
+    logger.info("╚════════════════════════════════════════╝")
+    Supervisor(services).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Trinity Blacklist Engine Tests
+
+Tests:
+1. Company names normalise across suffixes, articles and punctuation
+2. Every reason is persisted (adds no longer overwrite earlier reasons)
+3. External edits are picked up via mtime; unchanged files aren't re-read
+4. Fuzzy matching catches near-duplicates but not unrelated names
+5. safety_config matches exactly by default and flags near-duplicates on add
+"""
+
+import json
+
+import safety_config
+from blacklist import Blacklist, normalize_company
+
+
+def test_normalize_company():
+    """Test 1: Normalisation"""
+    assert normalize_company("The Madonna Inn, LLC") == "madonna inn"
+    assert normalize_company("MADONNA   INN inc.") == "madonna inn"
+    assert normalize_company("Smith & Co.") == "smith"
+    assert normalize_company("The Company") == "company"
+    assert normalize_company("Inc") == "inc"
+
+
+def test_all_reasons_persisted(tmp_path):
+    """Test 2: Reasons for every company are kept"""
+    path = tmp_path / "blacklist.json"
+    blacklist = Blacklist(path)
+
+    assert blacklist.add("BadCompany Inc", "Scam posting")
+    assert blacklist.add("Night Owl Hotels", "Only night shifts")
+    assert not blacklist.add("badcompany, inc.", "")  # Same company
+
+    data = json.loads(path.read_text())
+    assert data["companies"] == ["BadCompany Inc", "Night Owl Hotels"]
+    assert data["reasons"] == {
+        "BadCompany Inc": "Scam posting",
+        "Night Owl Hotels": "Only night shifts"
+    }
+    assert blacklist.reason("The BadCompany") == "Scam posting"
+    assert blacklist.is_blacklisted("BADCOMPANY LLC")
+
+
+def test_reload_on_change(tmp_path):
+    """Test 3: mtime-based reload"""
+    path = tmp_path / "blacklist.json"
+    path.write_text(json.dumps({"companies": ["Alpha Resorts"]}))
+    blacklist = Blacklist(path)
+    assert blacklist.is_blacklisted("Alpha Resorts")
+
+    # Unchanged file: index is reused, not rebuilt
+    index = blacklist._keys
+    assert blacklist.is_blacklisted("alpha resorts")
+    assert blacklist._keys is index
+
+    path.write_text(json.dumps({"companies": ["Alpha Resorts", "Beta Lodge"]}))
+    assert blacklist.is_blacklisted("Beta Lodge Inc")
+    assert len(blacklist) == 2
+
+    path.unlink()
+    assert not blacklist.is_blacklisted("Alpha Resorts")
+
+
+def test_fuzzy_matching(tmp_path):
+    """Test 4: Trigram near-duplicate matching"""
+    path = tmp_path / "blacklist.json"
+    blacklist = Blacklist(path)
+    blacklist.add("Pacific Coast Hospitality Group")
+
+    assert not blacklist.is_blacklisted("Pacific Coast Hospitalty Group")
+    assert blacklist.is_blacklisted("Pacific Coast Hospitalty Group", fuzzy=True)
+    assert blacklist.is_blacklisted("PacificCoast Hospitality Group", fuzzy=True)
+    assert not blacklist.is_blacklisted("Madonna Inn", fuzzy=True)
+
+    matches = blacklist.find_similar("Pacific Coast Hospitality Grp")
+    assert matches[0][0] == "Pacific Coast Hospitality Group"
+
+
+def test_safety_config_blacklist(tmp_path, monkeypatch):
+    """Test 5: Exact matching by default, near-duplicates warned at add time"""
+    monkeypatch.setattr(safety_config, "BLACKLIST_FILE", tmp_path / "blacklist.json")
+    assert safety_config.BLACKLIST_FUZZY_THRESHOLD == 0
+
+    assert safety_config.add_to_blacklist("Pacific Coast Hospitality Group") == []
+    assert safety_config.is_blacklisted("Pacific Coast Hospitality Group LLC")
+    assert not safety_config.is_blacklisted("Pacific Coast Hospitalty Group")
+
+    assert safety_config.add_to_blacklist("Pacific Coast Hospitalty Group") == [
+        "Pacific Coast Hospitality Group"]
+    assert safety_config.add_to_blacklist("Pacific Coast Hospitality Group", "again") == [
+        "Pacific Coast Hospitalty Group"]
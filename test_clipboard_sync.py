@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Trinity Clipboard Sync Engine Tests
+
+Uses the file-based clipboard backend as a stand-in for the Mac
+pasteboard.
+
+Tests:
+1. Local clipboard changes reach the sync file (atomically, once)
+2. Quest writes to the sync file reach the local clipboard without echo
+3. Idle ticks don't re-read or re-hash anything
+4. The running engine propagates file events faster than the old 1s poll
+5. The stat() polling fallback logs a warning
+6. The legacy ~/.trinity_clipboard moves into the sync directory once
+"""
+
+import json
+import logging
+import threading
+import time
+
+import clipboard_sync
+from clipboard_sync import (ClipboardSyncEngine, FileClipboardBackend, FileWatcher,
+                            SyncFileReader, migrate_legacy_sync_file)
+
+
+def make_engine(tmp_path):
+    backend = FileClipboardBackend(tmp_path / "clipboard.txt", source='mac')
+    sync_file = tmp_path / ".trinity_clipboard"
+    return ClipboardSyncEngine(backend, sync_file, log=lambda msg: None), backend, sync_file
+
+
+def test_clipboard_to_sync_file(tmp_path):
+    """Test 1: Local clipboard → sync file"""
+    engine, backend, sync_file = make_engine(tmp_path)
+    backend.set_text("hello from mac")
+
+    assert engine.sync_from_clipboard() is True
+    data = json.loads(sync_file.read_text())
+    assert data['content'] == "hello from mac"
+    assert data['source'] == 'mac'
+    assert data['hash'] == clipboard_sync.content_hash("hello from mac")
+
+    # Same content again is a no-op, and our own write doesn't echo back
+    assert engine.sync_from_clipboard() is False
+    assert engine.sync_from_file() is False
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sync_file_to_clipboard(tmp_path):
+    """Test 2: Quest → sync file → local clipboard"""
+    engine, backend, sync_file = make_engine(tmp_path)
+    SyncFileReader(sync_file).write("from quest", 'quest')
+
+    assert engine.sync_from_file() is True
+    assert backend.get_text() == "from quest"
+
+    # Applying it must not bounce back into the sync file
+    assert engine.sync_from_clipboard() is False
+    assert json.loads(sync_file.read_text())['source'] == 'quest'
+
+
+def test_idle_ticks_do_no_work(tmp_path, monkeypatch):
+    """Test 3: Unchanged clipboard and file are never re-read or re-hashed"""
+    engine, backend, sync_file = make_engine(tmp_path)
+    backend.set_text("steady")
+    engine.sync_from_clipboard()
+    engine.sync_from_file()
+
+    calls = {'hash': 0, 'read': 0}
+    real_hash = clipboard_sync.content_hash
+    real_get = backend.get_text
+
+    def counting_hash(text):
+        calls['hash'] += 1
+        return real_hash(text)
+
+    def counting_get():
+        calls['read'] += 1
+        return real_get()
+
+    monkeypatch.setattr(clipboard_sync, 'content_hash', counting_hash)
+    monkeypatch.setattr(backend, 'get_text', counting_get)
+
+    for _ in range(100):
+        engine.sync_from_clipboard()
+        engine.sync_from_file()
+
+    assert calls == {'hash': 0, 'read': 0}
+
+
+def test_engine_propagates_quickly(tmp_path):
+    """Test 4: Running engine applies a Quest write in well under 1s"""
+    engine, backend, sync_file = make_engine(tmp_path)
+    thread = threading.Thread(target=engine.run, daemon=True)
+    thread.start()
+    try:
+        time.sleep(0.3)  # Let the watcher start
+        start = time.perf_counter()
+        SyncFileReader(sync_file).write("fast path", 'quest')
+        while backend.get_text() != "fast path" and time.perf_counter() - start < 5:
+            time.sleep(0.01)
+        latency = time.perf_counter() - start
+    finally:
+        engine.stop()
+        thread.join(timeout=5)
+
+    assert backend.get_text() == "fast path"
+    assert latency < 1.0, f"Propagation took {latency:.3f}s"
+
+
+def test_polling_fallback_warns(tmp_path, monkeypatch, caplog):
+    """Test 5: Without watchdog the file watcher polls and says so"""
+    monkeypatch.setattr(clipboard_sync, 'WATCHDOG_AVAILABLE', False)
+    watcher = FileWatcher(tmp_path / "clipboard", lambda: None, poll_interval=0.05)
+    with caplog.at_level(logging.WARNING, logger='clipboard_sync'):
+        watcher.start()
+    try:
+        assert not watcher.native
+        assert "polling" in caplog.text
+    finally:
+        watcher.stop()
+
+
+def test_legacy_sync_file_migration(tmp_path):
+    """Test 6: Legacy sync file is moved into the sync directory"""
+    legacy = tmp_path / ".trinity_clipboard"
+    sync_file = tmp_path / ".trinity" / "clipboard"
+    SyncFileReader(legacy).write("old location", 'mac')
+
+    assert migrate_legacy_sync_file(sync_file, legacy) is True
+    assert not legacy.exists()
+    assert SyncFileReader(sync_file).read()['content'] == "old location"
+
+    # Never clobbers an existing sync file
+    SyncFileReader(legacy).write("stale", 'mac')
+    assert migrate_legacy_sync_file(sync_file, legacy) is False
+    assert SyncFileReader(sync_file).read()['content'] == "old location"
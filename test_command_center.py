@@ -22,9 +22,10 @@ TEST_RESULTS_FILE = BASE_DIR / "TEST_RESULTS.md"
 TEST_DB = BASE_DIR / "test_job_status.db"
 TEST_CAD_DIR = BASE_DIR / "test_cad_output"
 
-# Import the command_center module
+# Import the shared station library behind the command centers
 sys.path.insert(0, str(BASE_DIR))
-import command_center as cc
+import stations as cc
+import station_data as data
 
 # Test tracking
 test_results = {
@@ -50,12 +51,12 @@ class TestRunner:
         TEST_CAD_DIR.mkdir(exist_ok=True)
 
         # Backup original paths
-        self.original_job_db = cc.JOB_STATUS_DB
-        self.original_cad_dir = cc.CAD_OUTPUT_DIR
+        self.original_job_db = data.JOB_STATUS_DB
+        self.original_cad_dir = data.CAD_OUTPUT_DIR
 
         # Override with test paths
-        cc.JOB_STATUS_DB = TEST_DB
-        cc.CAD_OUTPUT_DIR = TEST_CAD_DIR
+        data.JOB_STATUS_DB = TEST_DB
+        data.CAD_OUTPUT_DIR = TEST_CAD_DIR
 
         print("Test environment ready")
 
@@ -64,8 +65,8 @@ class TestRunner:
         print("\nCleaning up test environment...")
 
         # Restore original paths
-        cc.JOB_STATUS_DB = self.original_job_db
-        cc.CAD_OUTPUT_DIR = self.original_cad_dir
+        data.JOB_STATUS_DB = self.original_job_db
+        data.CAD_OUTPUT_DIR = self.original_cad_dir
 
         # Clean test files
         if TEST_DB.exists():
@@ -545,8 +546,8 @@ class TestRunner:
                 self.record_fail("Error Handling - Null Safety", f"get_job_statistics crashed: {e}")
 
             # Test with invalid database path
-            original_db = cc.JOB_STATUS_DB
-            cc.JOB_STATUS_DB = Path("/invalid/path/to/nowhere.db")
+            original_db = data.JOB_STATUS_DB
+            data.JOB_STATUS_DB = Path("/invalid/path/to/nowhere.db")
 
             try:
                 stats = cc.get_job_statistics()
@@ -557,7 +558,7 @@ class TestRunner:
             except Exception as e:
                 self.record_pass("Error Handling - Exception on Invalid Path")
             finally:
-                cc.JOB_STATUS_DB = original_db
+                data.JOB_STATUS_DB = original_db
 
             # Test timeout handling in compilation
             try:
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Trinity Health Monitor Tests
+
+Tests:
+1. Full integrity checks run outside the per-cycle deadline and report on a later cycle
+2. Background restarts report their outcome on the next check
+"""
+
+import sqlite3
+import threading
+import time
+
+import health_monitor
+
+
+def test_integrity_check_outside_deadline(tmp_path, monkeypatch):
+    """Test 1: A slow integrity check never times out the cycle"""
+    db_path = tmp_path / "memory.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE t (x)")
+
+    monitor = health_monitor.TrinityHealthMonitor()
+    monitor.services = {}
+    monitor.databases = {'memory': db_path}
+    monitor.check_deadline = 0.2
+
+    check_database = monitor.check_database
+
+    def slow_check(path, full=False):
+        if full:
+            time.sleep(0.5)  # Longer than the whole cycle budget
+        return check_database(path, full)
+
+    monkeypatch.setattr(monitor, "check_database", slow_check)
+
+    report = monitor.check_system_health()
+    assert report['databases']['memory']['status'] == 'healthy'
+    assert report['databases']['memory']['check'] == 'probe'
+    assert report['cycle']['duration_ms'] < 500
+
+    monitor.pending_integrity[db_path].result(timeout=5)
+    report = monitor.check_system_health()
+    assert report['databases']['memory']['check'] == 'integrity'
+    assert not monitor.integrity_check_due(db_path)
+    assert db_path not in monitor.pending_integrity
+
+
+def test_restart_outcome_reported(monkeypatch):
+    """Test 2: recovery_successful reflects the finished background restart"""
+    monitor = health_monitor.TrinityHealthMonitor()
+    monkeypatch.setattr(health_monitor, "supervisor_active", lambda: False)
+    monkeypatch.setattr(monitor, "check_port", lambda port: False)
+    config = monitor.services['vr_server']
+
+    release = threading.Event()
+    outcomes = iter([False, True])
+
+    def fake_restart(service_name, config):
+        release.wait(5)
+        return next(outcomes)
+
+    monkeypatch.setattr(monitor, "restart_service", fake_restart)
+
+    status = monitor.check_service_health('vr_server', config, cmdlines=[])
+    assert status['recovery'] == 'started'
+    assert status['recovery_successful'] is None
+    assert monitor.check_service_health('vr_server', config, cmdlines=[])['recovery'] == 'pending'
+
+    # The failed attempt is reported and a new one is started
+    release.set()
+    monitor.pending_restarts['vr_server'].result(timeout=5)
+    status = monitor.check_service_health('vr_server', config, cmdlines=[])
+    assert status['recovery_successful'] is False
+    assert status['recovery'] == 'started'
+
+    monitor.pending_restarts['vr_server'].result(timeout=5)
+    assert monitor.collect_restart('vr_server') is True
+    assert 'vr_server' not in monitor.pending_restarts
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Trinity Insight Trigger Tests
+
+Tests:
+1. First check triggers; an unchanged context is skipped
+2. Numeric thresholds (including slow drift) and state changes trigger
+3. Floor interval forces a refresh; a simulated day needs a handful of calls
+"""
+
+from insight_trigger import InsightTrigger
+
+CONTEXT = {
+    'phoenix_status': 'RUNNING',
+    'equity': 100000.0,
+    'daily_pnl': 0.0,
+    'positions': 0,
+    'recent_trades': 3,
+    'tasks_completed': 0
+}
+
+
+def _trigger(now):
+    return InsightTrigger({'equity': 0.005}, {'daily_pnl': 250}, floor_interval=6 * 3600,
+                          clock=lambda: now[0])
+
+
+def test_startup_and_unchanged():
+    """Test 1: Startup, then identical contexts are skipped"""
+    now = [0.0]
+    trigger = _trigger(now)
+    assert trigger.check(CONTEXT) == 'startup'
+    trigger.record(CONTEXT)
+    now[0] = 60
+    assert trigger.check(dict(CONTEXT)) is None
+
+
+def test_thresholds():
+    """Test 2: Small moves skip, drift and state changes trigger"""
+    now = [0.0]
+    trigger = _trigger(now)
+    trigger.record(CONTEXT)
+
+    assert trigger.check({**CONTEXT, 'equity': 100200.0, 'daily_pnl': 100.0}) is None
+    # Compared with the last insight's context, not the previous tick
+    assert trigger.check({**CONTEXT, 'equity': 100600.0}) == 'equity'
+    assert trigger.check({**CONTEXT, 'daily_pnl': -300.0}) == 'daily_pnl'
+    assert trigger.check({**CONTEXT, 'phoenix_status': 'OFFLINE'}) == 'phoenix_status'
+    assert trigger.check({**CONTEXT, 'recent_trades': 4}) == 'recent_trades'
+
+    trigger.record({**CONTEXT, 'equity': 100600.0})
+    assert trigger.check({**CONTEXT, 'equity': 100700.0}) is None
+
+
+def test_floor_interval():
+    """Test 3: Floor refresh and calls per simulated day"""
+    now = [0.0]
+    trigger = _trigger(now)
+    calls = 0
+    for minute in range(24 * 60):
+        now[0] = minute * 60.0
+        # Equity wanders within $300 (0.3%); one trade after 500 minutes
+        context = {**CONTEXT, 'equity': 100000.0 + 10 * (minute % 30),
+                   'recent_trades': 4 if minute >= 500 else 3}
+        if trigger.check(context):
+            calls += 1
+            trigger.record(context)
+    assert calls == 5  # Startup, 6h floor, trade, two floors after it (vs 1440 before)
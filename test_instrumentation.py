@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Trinity Instrumentation Tests
+
+Tests:
+1. Histograms bucket observations and render cumulative Prometheus text
+2. timer()/@timed label outcomes (raised or mapped from return values)
+   and re-raise errors
+3. Instrumented SQLite connections time statements by db and operation
+"""
+
+import pytest
+
+from instrumentation import Registry, histogram, sqlite_connect, timed, timer
+
+
+def test_histogram_render():
+    """Test 1: Buckets, sum/count and exposition format"""
+    registry = Registry()
+    hist = registry.histogram("demo_seconds", "Demo latency", buckets=(0.1, 1))
+    hist.observe(0.05, route="/a")
+    hist.observe(0.5, route="/a")
+    hist.observe(5, route="/a")
+    registry.counter("demo_total", "Demo count").inc(2, kind='x"y')
+
+    text = registry.render()
+    assert '# TYPE demo_seconds histogram' in text
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{route="/a"} 3' in text
+    assert 'demo_total{kind="x\\"y"} 2' in text
+
+    with pytest.raises(ValueError):
+        registry.counter("demo_seconds")
+
+
+def test_timer_outcomes():
+    """Test 2: Outcome labels"""
+    name = "test_timer_outcome_seconds"
+
+    @timed(name, step="ok")
+    def succeed():
+        return 42
+
+    @timed(name, step="returned", outcome=lambda result: "ok" if result[0] else "error")
+    def report(success):
+        return success, "message"
+
+    assert succeed() == 42
+    assert report(False) == (False, "message")
+    assert report(True) == (True, "message")
+    with pytest.raises(RuntimeError):
+        with timer(name, step="boom"):
+            raise RuntimeError("boom")
+
+    hist = histogram(name)
+    assert hist.snapshot(step="ok", outcome="ok")["count"] == 1
+    assert hist.snapshot(step="returned", outcome="error")["count"] == 1
+    assert hist.snapshot(step="returned", outcome="ok")["count"] == 1
+    assert hist.snapshot(step="boom", outcome="error")["count"] == 1
+
+
+def test_sqlite_connect(tmp_path):
+    """Test 3: Per-statement SQLite latency"""
+    conn = sqlite_connect(tmp_path / "test.db", "instrumentation_test")
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    cursor = conn.cursor()
+    cursor.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+    conn.commit()
+    assert cursor.execute("SELECT SUM(x) FROM t").fetchone()[0] == 3
+    conn.close()
+
+    hist = histogram("trinity_sqlite_query_seconds")
+    for op in ("CREATE", "INSERT", "SELECT", "COMMIT"):
+        assert hist.snapshot(db="instrumentation_test", op=op, outcome="ok")["count"] == 1
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Job Sniper Tracing Tests
+
+Tests:
+1. Spans cover each stage; the last span carries the final status
+2. Traces persist to job_traces and roll up into per-stage p50/p95
+3. Flame summary names the dominant stage
+"""
+
+import time
+
+from job_trace import JobTrace, render_flame, stage_stats
+
+
+def _run_trace(db_path, analysis_seconds, status="ready_for_review"):
+    trace = JobTrace("Madonna Inn", "Front Desk Agent", db_path=db_path)
+    trace.stage("limit_check")
+    trace.stage("filter")
+    trace.stage("nexus_analysis")
+    time.sleep(analysis_seconds)
+    trace.annotate(tokens_in=100, tokens_out=20)
+    trace.stage("draft_notify")
+    return trace.finish(status)
+
+
+def test_spans_and_outcomes(tmp_path):
+    """Test 1: Stage spans and outcomes"""
+    summary = _run_trace(tmp_path / "applications.db", 0.01, status="filtered")
+
+    stages = summary["stages"]
+    assert [s["stage"] for s in stages] == ["limit_check", "filter", "nexus_analysis", "draft_notify"]
+    assert [s["outcome"] for s in stages] == ["ok", "ok", "ok", "filtered"]
+    assert stages[2]["tokens_in"] == 100 and stages[2]["tokens_out"] == 20
+    assert stages[2]["duration_ms"] >= 10
+    assert summary["total_ms"] >= sum(s["duration_ms"] for s in stages) - 1
+
+
+def test_persisted_stage_stats(tmp_path):
+    """Test 2: Persistence and percentiles"""
+    db_path = tmp_path / "applications.db"
+    for seconds in (0.001, 0.002, 0.02):
+        _run_trace(db_path, seconds)
+
+    stats = stage_stats(days=1, db_path=db_path)
+    assert list(stats)[-1] == "total"
+    assert stats["nexus_analysis"]["count"] == 3
+    assert stats["nexus_analysis"]["p95_ms"] >= 20
+    assert stats["nexus_analysis"]["p50_ms"] < stats["nexus_analysis"]["p95_ms"]
+    assert stats["nexus_analysis"]["tokens_in"] == 300
+    assert stats["total"]["tokens_out"] == 60
+
+    assert stage_stats(days=1, db_path=tmp_path / "missing.db") == {}
+
+
+def test_flame_summary(tmp_path):
+    """Test 3: Dominant stage"""
+    db_path = tmp_path / "applications.db"
+    _run_trace(db_path, 0.02)
+
+    text = render_flame(stage_stats(days=1, db_path=db_path))
+    assert "Dominant stage: nexus_analysis" in text
+    assert render_flame({}) == "No traces recorded"
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Trinity LLM Gateway Tests
+
+Tests:
+1. Circuit breaker opens after repeated failures and half-opens for one trial
+2. Failover to the next candidate, then short-circuiting an open breaker
+3. Hedged requests return the faster candidate
+4. Identical concurrent requests are coalesced into one provider call
+5. Streams fail over only before the first chunk
+6. Chat streams are hedged until the first chunk; Provider is abstract
+"""
+
+import threading
+
+import pytest
+
+from llm_gateway import HEDGES, CircuitBreaker, LLMGateway, LLMUnavailable, Provider, StubProvider
+
+ROUTES = {"chat": [("gemini", "fast"), ("claude", "backup")]}
+
+
+def test_circuit_breaker():
+    """Test 1: closed → open → half_open → closed"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    now[0] = 10
+    assert breaker.allow()  # Single trial
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failover_and_short_circuit():
+    """Test 2: Failover, then skipping the open breaker"""
+    gemini = StubProvider("gemini", error=RuntimeError("503"))
+    claude = StubProvider("claude", "from claude")
+    gateway = LLMGateway({"gemini": gemini, "claude": claude}, ROUTES, failure_threshold=2)
+
+    for i in range(3):
+        response = gateway.generate(f"question {i}")
+        assert (response.text, response.provider, response.model) == ("from claude", "claude", "backup")
+    assert len(gemini.calls) == 2  # Third call short-circuited
+    assert gateway.status()["gemini/fast"] == CircuitBreaker.OPEN
+
+    claude.error = RuntimeError("overloaded")
+    with pytest.raises(LLMUnavailable):
+        gateway.generate("question 4")
+    with pytest.raises(ValueError):
+        gateway.generate("question 5", route="unknown")
+
+
+def test_hedged_request():
+    """Test 3: Slow first candidate loses the race"""
+    gemini = StubProvider("gemini", "slow", latency=0.5)
+    claude = StubProvider("claude", "fast")
+    gateway = LLMGateway({"gemini": gemini, "claude": claude}, ROUTES, hedge_delay=0.05)
+
+    assert gateway.generate("hi", hedge=True).text == "fast"
+    assert gateway.generate("hi", hedge=False).text == "slow"
+
+
+def test_coalescing():
+    """Test 4: One provider call for identical concurrent prompts"""
+    gemini = StubProvider("gemini", "shared", latency=0.2)
+    gateway = LLMGateway({"gemini": gemini}, ROUTES)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(gateway.generate("same").text))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["shared"] * 5
+    assert len(gemini.calls) == 1
+    gateway.generate("same")
+    assert len(gemini.calls) == 2  # Finished calls aren't cached
+
+
+def test_stream_failover():
+    """Test 5: Stream failover before the first chunk"""
+    gemini = StubProvider("gemini", error=RuntimeError("503"))
+    claude = StubProvider("claude", "streamed from claude")
+    gateway = LLMGateway({"gemini": gemini, "claude": claude}, ROUTES)
+
+    usage = {}
+    assert "".join(gateway.stream("hi", usage=usage)) == "streamed from claude"
+    assert usage == {"tokens_in": 1, "tokens_out": 3}
+    assert len(gemini.calls) == 1
+
+
+def test_hedged_stream():
+    """Test 6: A slow first chunk is raced by the next candidate"""
+    gemini = StubProvider("gemini", "slow", latency=0.5)
+    claude = StubProvider("claude", "fast from claude")
+    gateway = LLMGateway({"gemini": gemini, "claude": claude}, ROUTES, hedge_delay=0.05)
+    hedges = HEDGES.value(provider="claude", model="backup")
+
+    usage = {}
+    assert "".join(gateway.stream("hi", route="chat", usage=usage)) == "fast from claude"
+    assert usage == {"tokens_in": 1, "tokens_out": 3}
+    assert HEDGES.value(provider="claude", model="backup") == hedges + 1
+    assert "".join(gateway.stream("hi", hedge=False)) == "slow"
+
+    with pytest.raises(TypeError):
+        Provider()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Trinity Mesh LOD Tests
+
+Tests:
+1. A sphere's LODs drop monotonically in triangle count and fit their targets
+2. When every in-budget clustering collapses all faces, the coarsest
+   non-empty mesh is used rather than the full mesh
+"""
+
+import numpy as np
+
+import mesh_lod
+
+
+def uv_sphere(segments: int, rings: int):
+    """Closed UV sphere as (vertices, faces)."""
+    vertices = [(0.0, 0.0, 1.0), (0.0, 0.0, -1.0)]
+    for i in range(1, rings):
+        theta = np.pi * i / rings
+        for j in range(segments):
+            phi = 2 * np.pi * j / segments
+            vertices.append((np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)))
+
+    def ring(i, j):
+        return 2 + (i - 1) * segments + j % segments
+
+    faces = []
+    for j in range(segments):
+        faces.append((0, ring(1, j), ring(1, j + 1)))
+        faces.append((1, ring(rings - 1, j + 1), ring(rings - 1, j)))
+    for i in range(1, rings - 1):
+        for j in range(segments):
+            a, b, c, d = ring(i, j), ring(i, j + 1), ring(i + 1, j), ring(i + 1, j + 1)
+            faces.extend([(a, c, b), (b, c, d)])
+    return np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.int64)
+
+
+def test_sphere_lods_monotonic(tmp_path):
+    """Test 1: Sphere LOD triangle counts"""
+    stl_path = tmp_path / "sphere.stl"
+    mesh_lod.write_stl(*uv_sphere(64, 32), stl_path)
+
+    manifest = mesh_lod.build_lods(stl_path, tmp_path / "lod", levels=(100, 25, 5))
+    counts = [lod['triangles'] for lod in manifest['lods']]
+    assert [lod['level'] for lod in manifest['lods']] == [100, 25, 5]
+    assert counts[0] == manifest['triangles'] == 64 * 2 * 31
+    assert counts[0] > counts[1] > counts[2] > 0
+
+    for lod in manifest['lods'][1:]:
+        assert lod['triangles'] <= counts[0] * lod['level'] / 100
+        _, faces = mesh_lod.load_mesh(tmp_path / lod['file'])
+        assert len(faces) == lod['triangles']
+
+
+def test_degenerate_collapse_falls_back_to_coarsest():
+    """Test 2: All-or-nothing collapse"""
+    # 13 unit and 13 tiny triangles, far apart: clustering goes 26 → 13 → 0,
+    # so nothing non-empty fits the 12-triangle floor
+    triangles = []
+    for i in range(26):
+        scale = 0.01 if i % 2 else 1.0
+        triangle = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32) * scale
+        triangles.append(triangle + np.array([i * 10, 0, 0], dtype=np.float32))
+    vertices, faces = mesh_lod.dedupe_vertices(np.array(triangles))
+
+    _, decimated = mesh_lod.decimate(vertices, faces, 0.05)
+    assert len(decimated) == 13
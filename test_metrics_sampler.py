@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Trinity Metrics Sampler Tests
+
+Tests:
+1. The ring buffer wraps without growing and keeps the newest samples
+2. Summaries and history cover only the requested window
+3. CPU readings over too short a span (the start-up sample) are skipped
+"""
+
+import uuid
+
+import numpy as np
+
+import metrics_sampler
+from metrics_sampler import MetricsSampler
+
+
+def fill(sampler, values, start=1000.0):
+    """Write synthetic rows straight into the buffer's sample path."""
+    for i, value in enumerate(values):
+        sampler.sample(now=start + i)
+        row = sampler._buffer[(sampler._next - 1) % sampler.capacity]
+        row[1] = value  # Deterministic CPU column
+
+
+def test_ring_buffer_wraps():
+    """Test 1: Fixed-size history"""
+    sampler = MetricsSampler(capacity=10, services={})
+    buffer = sampler._buffer
+    fill(sampler, range(25))
+
+    assert sampler._buffer is buffer  # Never reallocated
+    rows = sampler._window(None)
+    assert len(rows) == 10
+    assert list(rows[:, 1]) == list(range(15, 25))  # Oldest first
+    assert sampler.latest()['cpu_percent'] == 24
+
+
+def test_summary_and_history_windows():
+    """Test 2: Rolling statistics"""
+    sampler = MetricsSampler(capacity=100, services={'ghost': f'no-such-process-{uuid.uuid4().hex}'})
+    fill(sampler, [10.0] * 50 + [90.0] * 10)
+
+    recent = sampler.summary(9)['fields']['cpu_percent']
+    assert recent == {'avg': 90.0, 'p50': 90.0, 'p95': 90.0, 'max': 90.0}
+
+    overall = sampler.summary(None)
+    assert overall['samples'] == 60
+    assert overall['fields']['cpu_percent']['p50'] == 10.0
+    assert 'ghost.rss_mb' not in overall['fields']  # Never seen: no stats
+    assert overall['latest']['services']['ghost'] == {'rss_mb': None, 'fds': None}
+
+    history = sampler.history(None, points=6)
+    assert len(history['timestamp']) == 6
+    assert history['cpu_percent'][0] == 10.0 and history['cpu_percent'][-1] == 90.0
+    assert np.all(np.diff(history['timestamp']) > 0)
+
+
+def test_first_cpu_sample_skipped(monkeypatch):
+    """Test 3: No CPU reading right after priming"""
+    sampler = MetricsSampler(capacity=10, services={})
+    sampler.sample()
+    latest = sampler.latest()
+    assert latest['cpu_percent'] is None
+    assert latest['memory_percent'] is not None
+
+    monkeypatch.setattr(metrics_sampler, "MIN_CPU_INTERVAL", 0)
+    sampler.sample()
+    assert sampler.latest()['cpu_percent'] is not None
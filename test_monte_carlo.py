@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Trinity Monte-Carlo Projection Tests
+
+Tests:
+1. Percentile paths are ordered and start at the starting capital
+2. Without return or cash-flow noise the median matches the closed form
+3. Runs are seeded and cached per parameter set and return pool
+4. Trade counts follow the rate at low and very high trade frequencies
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from monte_carlo import (ProjectionParams, _poisson, assumed_returns, project, returns_pool,
+                         simulate)
+from trade_analytics import TradeStats
+
+
+def test_percentile_paths():
+    """Test 1: Shapes and ordering"""
+    params = ProjectionParams(months=36, paths=2000, monthly_burn=600)
+    projection = simulate(params, assumed_returns())
+
+    p5, p50, p95 = (projection.percentiles[p] for p in (5, 50, 95))
+    assert p50.shape == (37,) and len(projection.final) == 2000
+    assert p5[0] == p50[0] == p95[0] == 40000
+    assert np.all(p5 <= p50) and np.all(p50 <= p95)
+    assert p95[-1] > p5[-1]
+    assert [row[0] for row in projection.yearly()] == [1, 2, 3]
+    assert 0.0 <= projection.prob_ruin <= 1.0
+    assert np.isclose(projection.prob_above(p50[-1]), 0.5, atol=0.01)
+
+
+def test_deterministic_closed_form():
+    """Test 2: Zero volatility"""
+    params = ProjectionParams(start_capital=10000, months=24, monthly_contribution=500,
+                              contribution_vol=0.0, monthly_burn=100, burn_vol=0.0,
+                              trades_per_month=0.0, paths=100)
+    flat = simulate(params, np.full(10, 0.01))
+    expected = 10000 + 400 * np.arange(25)
+    assert np.allclose(flat.percentiles[5], expected)
+    assert np.allclose(flat.percentiles[95], expected)
+    assert flat.prob_ruin == 0.0
+
+    # Every trade gains 1%, so each path compounds 1.01 per trade taken
+    # and no path can end below the no-trade closed form
+    traded = simulate(replace(params, trades_per_month=4.0),
+                      np.full(10, 0.01))
+    assert np.all(traded.final >= expected[-1] - 1e-6)
+    # Median ~96 trades: 10000 * 1.01^96 plus contributions grown along the way
+    assert 10000 * 1.01 ** 90 < traded.percentiles[50][-1] < 10000 * 1.01 ** 102 + 400 * 24 * 1.01 ** 102
+
+    # Burn larger than the account drains it to zero and keeps it there
+    drained = simulate(replace(params, monthly_contribution=0.0, monthly_burn=1000), np.full(10, 0.01))
+    assert drained.prob_ruin == 1.0 and np.all(drained.percentiles[50][10:] == 0)
+
+
+def test_seeded_and_cached():
+    """Test 3: Seeding and cache"""
+    pool = np.random.default_rng(3).normal(0.002, 0.01, 200)
+    params = ProjectionParams(months=24, paths=500, seed=7)
+
+    first = project(params, pool, "test")
+    assert project(params, pool.copy(), "test") is first
+    assert np.array_equal(simulate(params, pool).final, first.final)
+
+    other_seed = project(ProjectionParams(months=24, paths=500, seed=8), pool)
+    assert other_seed is not first and not np.array_equal(other_seed.final, first.final)
+    assert project(params, pool * 2) is not first
+
+    # Phoenix returns replace the assumption once there are enough trades
+    assert returns_pool(TradeStats())[1] == "plan assumption"
+    stats = TradeStats(trades=30, returns=pool[:30])
+    resampled, source = returns_pool(stats)
+    assert np.array_equal(resampled, pool[:30]) and source == "Phoenix (30 trades)"
+
+
+def test_poisson_counts():
+    """Test 4: CDF inversion and the large-rate fallback"""
+    rng = np.random.default_rng(11)
+    for rate in (0.0, 8.0, 100.0, 800.0, 5000.0):  # exp(-800) underflows to 0.0
+        counts = _poisson(rng, rate, (200, 50))
+        assert counts.shape == (200, 50) and counts.dtype == np.int64
+        assert abs(counts.mean() - rate) <= 0.02 * rate + 0.05
+        assert np.isclose(counts.var(), rate, rtol=0.1, atol=0.05)
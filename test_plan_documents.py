@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Trinity Plan Documents Tests
+
+Tests:
+1. Headings are indexed to byte offsets; fenced code is not a heading
+2. Sections and windows read only their byte range
+3. The library caches by mtime/size and re-indexes appends incrementally
+"""
+
+import os
+
+from plan_documents import PLAN_INDEX, PlanLibrary
+
+PLAN = """Intro line before any heading.
+
+# 10-YEAR PLAN
+
+## 🚀 **THE FLYWHEEL**
+
+Reinvest everything.
+
+```bash
+# not a heading
+```
+
+### Year 1: IGNITION
+
+$40k → $110k
+
+## 💰 SCENARIOS
+
+### Conservative
+"""
+
+
+def write(path, text, bump=0):
+    path.write_text(text, encoding='utf-8')
+    if bump:
+        st = path.stat()
+        os.utime(path, ns=(st.st_mtime_ns + bump, st.st_mtime_ns + bump))
+
+
+def test_section_index(tmp_path):
+    """Test 1: Heading index"""
+    path = tmp_path / "plan.md"
+    write(path, PLAN)
+    plan = PlanLibrary().get(path)
+
+    assert [(s.level, s.title) for s in plan.sections] == [
+        (1, "10-YEAR PLAN"), (2, "🚀 THE FLYWHEEL"), (3, "Year 1: IGNITION"),
+        (2, "💰 SCENARIOS"), (3, "Conservative")
+    ]
+    raw = PLAN.encode('utf-8')
+    top, flywheel, year1, scenarios, conservative = plan.sections
+    assert top.offset == raw.index(b"# 10-YEAR") and top.end == len(raw)
+    assert flywheel.end == scenarios.offset == raw.index("## 💰".encode())
+    assert year1.parent == 1 and conservative.parent == 3 and top.parent is None
+    assert [s.title for s in plan.outline(max_level=2)] == ["10-YEAR PLAN", "🚀 THE FLYWHEEL", "💰 SCENARIOS"]
+
+
+def test_sections_and_windows(tmp_path):
+    """Test 2: Lazy reads"""
+    path = tmp_path / "plan.md"
+    write(path, PLAN)
+    plan = PlanLibrary().get(path)
+
+    flywheel = plan.section("the flywheel")
+    assert flywheel.startswith("## 🚀 **THE FLYWHEEL**") and "# not a heading" in flywheel
+    assert "$40k → $110k" in flywheel and "SCENARIOS" not in flywheel
+    assert plan.section("year 1: ignition").strip().endswith("$40k → $110k")
+    assert plan.section("missing") is None
+
+    assert plan.head(10) == "Intro line"
+    # A window ending inside a multi-byte character drops the partial character
+    cut = PLAN.encode('utf-8').index("🚀".encode()) + 2
+    assert plan.read(0, cut).endswith("## ")
+    assert plan.text() == PLAN and not plan.truncated
+
+
+def test_library_cache(tmp_path):
+    """Test 3: mtime cache and incremental appends"""
+    path = tmp_path / "log.md"
+    write(path, PLAN)
+    library = PlanLibrary()
+    plan = library.get(path)
+
+    hits = PLAN_INDEX.value(result="hit")
+    assert library.get(path) is plan
+    assert PLAN_INDEX.value(result="hit") == hits + 1
+
+    # Appending re-scans from the last heading only
+    incremental = PLAN_INDEX.value(result="incremental")
+    appended = PLAN + "More conservative detail.\n\n## 📈 NEW ENTRY\n\nLogged.\n"
+    write(path, appended, bump=10 ** 9)
+    assert library.get(path) is plan
+    assert PLAN_INDEX.value(result="incremental") == incremental + 1
+    assert [s.title for s in plan.sections][-2:] == ["Conservative", "📈 NEW ENTRY"]
+    assert "More conservative detail." in plan.section("Conservative")
+    assert plan.sections[0].end == len(appended.encode('utf-8'))
+
+    # An edit above the last heading forces a full re-index
+    full = PLAN_INDEX.value(result="full")
+    write(path, "# Inserted\n\n" + appended, bump=2 * 10 ** 9)
+    plan = library.get(path)
+    assert PLAN_INDEX.value(result="full") == full + 1
+    assert plan.sections[0].title == "Inserted" and plan.section("NEW ENTRY").endswith("Logged.\n")
+
+    path.unlink()
+    assert library.get(path) is None
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Trinity Prompt Builder Tests
+
+Tests:
+1. The prefix is cached until profile/preferences change, and its version
+   ignores confidence-only reinforcement churn
+2. Sections are fitted to the budget by priority (message always kept,
+   history trimmed oldest-first, decisions dropped first)
+3. The current message isn't duplicated from chat history
+4. An oversized profile entry is skipped without dropping later categories
+"""
+
+from prompt_builder import PromptBuilder
+from trinity_memory import TrinityMemory
+
+
+def _memory(tmp_path):
+    memory = TrinityMemory(tmp_path / "memory.db")
+    memory.set_profile("name", "Ty", "identity")
+    memory.learn_preference("Career", "shifts", "preferred", "day")
+    memory.record_decision("Career", "application", "Applied to Madonna Inn")
+    return memory
+
+
+def test_prefix_cache_and_version(tmp_path):
+    """Test 1: Prefix caching and versioning"""
+    memory = _memory(tmp_path)
+    builder = PromptBuilder()
+
+    first = builder.prefix(memory)
+    assert "identity.name: Ty" in first.text
+    assert "Career.shifts.preferred: day" in first.text
+    assert builder.prefix(memory) is first  # Cache hit
+
+    # Reinforcing an unchanged preference re-renders but keeps the version
+    memory.learn_preference("Career", "shifts", "preferred", "day")
+    again = builder.prefix(memory)
+    assert again is not first
+    assert again.version == first.version
+
+    memory.set_profile("location", "Paso Robles", "identity")
+    assert builder.prefix(memory).version != first.version
+
+    # Writes from another connection are seen too
+    other = TrinityMemory(tmp_path / "memory.db")
+    other.set_profile("phone", "555", "identity")
+    other.close()
+    assert "identity.phone: 555" in builder.prefix(memory).text
+    memory.close()
+
+
+def test_budget_priorities(tmp_path):
+    """Test 2: Token budget"""
+    memory = _memory(tmp_path)
+    builder = PromptBuilder()
+    prefix_tokens = builder.prefix(memory).tokens
+
+    history = [{'role': 'user' if i % 2 == 0 else 'assistant', 'content': f"turn {i} " + "x" * 190}
+               for i in range(10)]
+    roomy = builder.build(memory, history, "Hello", ["[File: notes.txt]\nshort"])
+    assert not roomy.truncated and not roomy.dropped
+    assert roomy.parts[0].startswith("RECENT DECISIONS:")
+    assert roomy.parts[-1] == "User: Hello"
+
+    # Room for the message, attachment and part of the history only
+    builder.budget = prefix_tokens + 350
+    tight = builder.build(memory, history, "Hello", ["[File: notes.txt]\nshort"])
+    assert tight.dropped == ["decisions"]
+    assert tight.truncated == ["history"]
+    history_text = next(p for p in tight.parts if "earlier content omitted" in p)
+    assert "turn 9" in history_text and "turn 0" not in history_text
+    assert tight.tokens <= builder.budget + 20
+    assert tight.parts[-1] == "User: Hello"
+
+    # Even with no room at all the message survives
+    builder.budget = 0
+    assert builder.build(memory, history, "Hello").parts == ["User: Hello"]
+    memory.close()
+
+
+def test_current_message_not_duplicated(tmp_path):
+    """Test 3: History de-duplication"""
+    memory = _memory(tmp_path)
+    history = [
+        {'role': 'user', 'content': 'Hi'},
+        {'role': 'assistant', 'content': 'Hello!'},
+        {'role': 'user', 'content': 'What shifts do I like?'}
+    ]
+    prompt = PromptBuilder().build(memory, history, 'What shifts do I like?')
+    history_text = next(p for p in prompt.parts if p.startswith("Previous conversation:"))
+    assert "What shifts" not in history_text
+    assert prompt.parts[-1] == "User: What shifts do I like?"
+    memory.close()
+
+
+def test_oversized_profile_entry_skipped():
+    """Test 4: One overflowing profile entry doesn't cut off the rest"""
+    builder = PromptBuilder(prefix_budget=400)
+    profile = {
+        'about': {'bio': {'value': "x" * 4000}, 'name': {'value': "Ty"}},
+        'work': {'shift': {'value': "day"}},
+    }
+    text = builder.render_prefix(profile, {}).text
+    assert "about.bio" not in text
+    assert "about.name: Ty" in text
+    assert "work.shift: day" in text
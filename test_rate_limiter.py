@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Trinity Rate Limiter Tests
+
+Tests:
+1. Hourly cap blocks, then frees up as the window slides
+2. Per-company windows are independent of each other
+3. Caps hold under contention from parallel processes and threads
+4. safety_config check/acquire report counts and reasons
+5. A released slot (failed send) frees every window it counted in
+"""
+
+import multiprocessing
+import threading
+
+import safety_config
+from rate_limiter import RateLimiter, Window
+
+HOUR = 3600
+
+
+def make_limiter(db_path, hourly=3, daily=10, company=1):
+    return RateLimiter(db_path, [
+        Window("hourly", HOUR, hourly),
+        Window("daily", 24 * HOUR, daily, buckets=96),
+        Window("company", 24 * HOUR, company, buckets=96, per_company=True)
+    ])
+
+
+def test_hourly_window_slides(tmp_path):
+    """Test 1: Hourly cap"""
+    limiter = make_limiter(tmp_path / "rate.db")
+    start = 1_000_000.0
+
+    for i in range(3):
+        assert limiter.acquire(now=start + i)['allowed']
+
+    blocked = limiter.acquire(now=start + 10)
+    assert not blocked['allowed']
+    assert blocked['window'] == 'hourly'
+    assert blocked['counts']['hourly'] == 3
+
+    # Still blocked just under an hour later, free once the buckets expire
+    assert not limiter.check(now=start + HOUR - 120)['allowed']
+    later = limiter.check(now=start + HOUR + 120)
+    assert later['allowed']
+    assert later['counts'] == {'hourly': 0, 'daily': 3}
+
+
+def test_per_company_window(tmp_path):
+    """Test 2: Per-company cap"""
+    limiter = make_limiter(tmp_path / "rate.db")
+
+    assert limiter.acquire("Madonna Inn")['allowed']
+    blocked = limiter.acquire("  madonna   INN ")
+    assert not blocked['allowed']
+    assert blocked['window'] == 'company'
+
+    other = limiter.acquire("Hotel Cerro")
+    assert other['allowed']
+    assert other['counts'] == {'hourly': 2, 'daily': 2, 'company': 1}
+
+
+def _worker(db_path, attempts, results):
+    limiter = make_limiter(db_path, hourly=5)
+    results.put(sum(limiter.acquire()['allowed'] for _ in range(attempts)))
+
+
+def test_caps_hold_under_contention(tmp_path):
+    """Test 3: Parallel workers never exceed the cap"""
+    db_path = tmp_path / "rate.db"
+    make_limiter(db_path, hourly=5)  # Create schema up front
+
+    ctx = multiprocessing.get_context('fork')
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(db_path, 10, results)) for _ in range(6)]
+    for proc in procs:
+        proc.start()
+
+    # Threads sharing one limiter in this process compete too
+    shared = make_limiter(db_path, hourly=5)
+    thread_allowed = []
+    threads = [
+        threading.Thread(target=lambda: thread_allowed.append(shared.acquire()['allowed']))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for proc in procs:
+        proc.join(timeout=30)
+
+    allowed = sum(results.get(timeout=5) for _ in procs) + sum(thread_allowed)
+    assert allowed == 5
+    assert shared.check()['counts']['hourly'] == 5
+
+
+def test_safety_config_slots(tmp_path, monkeypatch):
+    """Test 4: safety_config wrappers"""
+    monkeypatch.setattr(safety_config, "RATE_LIMIT_DB", tmp_path / "rate_limits.db")
+    monkeypatch.setattr(safety_config, "RATE_LIMIT_FILE", tmp_path / "rate_limits.json")
+
+    for _ in range(safety_config.MAX_HOURLY_APPLICATIONS):
+        assert safety_config.acquire_application_slot()['allowed']
+
+    rate = safety_config.check_rate_limit()
+    assert not rate['allowed']
+    assert rate['hourly_count'] == safety_config.MAX_HOURLY_APPLICATIONS
+    assert rate['reason'].startswith("Hourly limit reached")
+
+
+def test_release_slot(tmp_path, monkeypatch):
+    """Test 5: Releasing an unused slot"""
+    monkeypatch.setattr(safety_config, "RATE_LIMIT_DB", tmp_path / "rate_limits.db")
+    monkeypatch.setattr(safety_config, "RATE_LIMIT_FILE", tmp_path / "rate_limits.json")
+
+    slot = safety_config.acquire_application_slot("Acme")
+    assert slot['allowed'] and slot['company_count'] == 1
+    assert not safety_config.check_rate_limit("Acme")['allowed']
+
+    safety_config.release_application_slot("Acme", slot)
+    rate = safety_config.check_rate_limit("Acme")
+    assert rate['allowed']
+    assert (rate['hourly_count'], rate['daily_count'], rate['company_count']) == (0, 0, 0)
+
+    # A rejected slot holds nothing to give back
+    assert safety_config.acquire_application_slot("Acme")['allowed']
+    rejected = safety_config.acquire_application_slot("Acme")
+    assert not rejected['allowed']
+    safety_config.release_application_slot("Acme", rejected)
+    assert safety_config.check_rate_limit()['daily_count'] == 1
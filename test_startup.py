@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Trinity Startup Budget Tests
+
+Tests:
+1. -X importtime output parses into a tree with per-package totals
+2. Cold import of the command centers pulls in no heavy modules (and stays
+   in budget when TRINITY_STARTUP_BUDGET_TESTS=1)
+3. First Command Center render loads no pandas/altair (and stays in budget
+   when TRINITY_STARTUP_BUDGET_TESTS=1)
+
+Wall-clock budgets are opt-in: they depend on the machine, so shared CI
+runners would fail them at random.
+"""
+
+import os
+import sys
+
+import pytest
+
+from import_audit import (BASE_DIR, IMPORT_BUDGET_MS, RENDER_BUDGET_MS, ImportReport,
+                          measure_import, measure_render, parse_importtime)
+from lazy_imports import lazy_callable, lazy_module
+
+CHECK_BUDGETS = os.getenv("TRINITY_STARTUP_BUDGET_TESTS") == "1"
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _json
+import time:       800 |        920 |   json
+import time:      3000 |       3000 |     numpy.core
+import time:      1000 |       4000 |   numpy
+import time:       500 |       5420 | app
+"""
+
+
+def test_parse_importtime():
+    """Test 1: Parsing and lazy facades"""
+    report = ImportReport("app", parse_importtime(SAMPLE))
+    assert report.modules == ["_json", "json", "numpy.core", "numpy", "app"]
+    assert [e.depth for e in report.entries] == [2, 1, 2, 1, 0]
+    assert report.total_ms == 5.42
+    assert report.top(1, by='self')[0].module == "numpy.core"
+    assert report.packages() == {"numpy": 4.0, "json": 0.8, "app": 0.5, "_json": 0.12}
+    assert report.heavy() == ["numpy"]
+
+    # The facade defers the import to first attribute access / call
+    module = lazy_module("colorsys")
+    sys.modules.pop("colorsys", None)
+    assert not module.loaded
+    assert module.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1)
+    assert module.loaded
+    assert lazy_callable("textwrap", "dedent")("  x") == "x"
+    with pytest.raises(ImportError):
+        lazy_module("trinity_no_such_module").anything
+
+
+@pytest.mark.parametrize("target", ["command_center", "command_center_v2", "trinity_v3", "trinity_app"])
+def test_cold_import_budget(target):
+    """Test 2: Cold import"""
+    report = measure_import(target)
+    assert report.heavy() == []
+    if CHECK_BUDGETS:
+        assert report.total_ms < IMPORT_BUDGET_MS, [
+            (e.module, e.cumulative_us // 1000) for e in report.top(10)]
+
+
+def test_first_render_budget():
+    """Test 3: First render"""
+    render = measure_render(BASE_DIR / "command_center.py")
+    assert render.exceptions == []
+    if CHECK_BUDGETS:
+        assert render.first_render_seconds * 1000 < RENDER_BUDGET_MS
+    # Charts in the always-rendered sidebar would pull these into every cold start
+    assert "pandas" not in render.modules and "altair" not in render.modules
+    assert "google.generativeai" not in render.modules
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Trinity State Store Tests
+
+Tests:
+1. File store read-modify-write is atomic and cached by mtime/size
+2. Switching to SQLite imports the existing JSON state once
+3. Only changed keys are rewritten in the SQLite store
+"""
+
+import json
+
+from state_store import FileStateStore, SQLiteStateStore
+
+
+def test_file_store_update(tmp_path):
+    """Test 1: File store"""
+    path = tmp_path / "rate_limits.json"
+    store = FileStateStore(path, default={"applications": []})
+    assert store.read() == {"applications": []}
+
+    store.update(lambda d: {**d, "applications": d["applications"] + ["acme"]})
+    assert json.loads(path.read_text()) == {"applications": ["acme"]}
+    assert not list(tmp_path.glob(".rate_limits.json.*.tmp"))
+
+    # An external writer is picked up; the returned copy is private
+    path.write_text(json.dumps({"applications": ["acme", "globex"]}))
+    data = store.read()
+    data["applications"].clear()
+    assert store.read() == {"applications": ["acme", "globex"]}
+
+
+def test_sqlite_imports_json(tmp_path):
+    """Test 2: Backend switch keeps existing state"""
+    path = tmp_path / "blacklist.json"
+    path.write_text(json.dumps({"companies": {"acme": ["scam"]}, "updated": "2026-02-05"}))
+
+    store = SQLiteStateStore(str(path.resolve()), db_path=tmp_path / "state.db",
+                             default={"companies": {}}, import_path=path)
+    assert store.read() == {"companies": {"acme": ["scam"]}, "updated": "2026-02-05"}
+
+    # Once the store has rows, the JSON file is not imported again
+    store.update(lambda d: {**d, "companies": {}})
+    path.write_text(json.dumps({"companies": {"initech": ["spam"]}}))
+    reopened = SQLiteStateStore(store.name, db_path=store.db_path, default={"companies": {}},
+                                import_path=path)
+    assert reopened.read()["companies"] == {}
+
+    # No JSON file: defaults
+    empty = SQLiteStateStore("missing", db_path=tmp_path / "state.db", default={"count": 0},
+                             import_path=tmp_path / "missing.json")
+    assert empty.read() == {"count": 0}
+
+
+def test_sqlite_rewrites_changed_keys(tmp_path):
+    """Test 3: Per-key writes"""
+    store = SQLiteStateStore("watchdog", db_path=tmp_path / "state.db")
+    store.write({"history": list(range(1000)), "count": 0})
+    before = store.conn.total_changes
+    store.update(lambda d: {**d, "count": d["count"] + 1})
+    assert store.conn.total_changes - before == 1
+    assert store.read()["count"] == 1
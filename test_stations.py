@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Trinity Station Library Tests
+
+Tests:
+1. Process checks are shared process-wide for STATUS_TTL seconds
+2. Job database and Phoenix log helpers work against isolated files
+3. Every layout, and the single-process host, renders on the shared stations
+4. SCAD compiles are timed on /metrics (failed compiles as outcome="error")
+"""
+
+import sqlite3
+import subprocess
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import station_data
+from instrumentation import histogram
+from station_data import (STATUS_CHECKS, clear_status_cache, compile_scad_to_stl, get_job_statistics,
+                          get_phoenix_stats, get_recent_jobs, init_job_status_db, phoenix_status,
+                          process_running)
+
+LAYOUTS = ["command_center.py", "command_center_v2.py", "trinity_v3.py", "trinity_app.py"]
+
+
+def test_status_cache(monkeypatch):
+    """Test 1: One pgrep per TTL"""
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0 if 'mark_xii_phoenix' in args else 1)
+
+    monkeypatch.setattr(station_data.subprocess, "run", fake_run)
+    monkeypatch.setattr(station_data, "STATUS_TTL", 60)
+    clear_status_cache()
+
+    hits = STATUS_CHECKS.value(kind="process", result="hit")
+    assert phoenix_status()['running'] and phoenix_status()['mode'] == 'PAPER'
+    assert process_running('mark_xii_phoenix')  # Sidebar, homepage, stats: same poll
+    assert not process_running('mark_xi_genesis')
+    assert len(calls) == 2
+    assert STATUS_CHECKS.value(kind="process", result="hit") == hits + 2
+
+    # Expired entries poll again
+    monkeypatch.setattr(station_data, "STATUS_TTL", 0)
+    assert process_running('mark_xii_phoenix')
+    assert len(calls) == 3
+    clear_status_cache()
+
+
+def test_job_db_and_phoenix_log(tmp_path, monkeypatch):
+    """Test 2: Data access"""
+    monkeypatch.setattr(station_data, "JOB_STATUS_DB", tmp_path / "job_logs" / "job_status.db")
+    assert init_job_status_db()
+    assert get_job_statistics()['total'] == 0
+
+    with sqlite3.connect(station_data.JOB_STATUS_DB) as conn:
+        conn.executemany(
+            "INSERT INTO job_statuses (draft_filename, company, position, status, created_date) VALUES (?, ?, ?, ?, ?)",
+            [("a.txt", "Acme", "Engineer", "pending", "2026-02-01"),
+             ("b.txt", "Globex", "Developer", "applied", "2026-02-03"),
+             ("c.txt", "Initech", "Analyst", "applied", "2026-02-02")])
+    stats = get_job_statistics()
+    assert (stats['pending'], stats['applied'], stats['total']) == (1, 2, 3)
+    assert [job['company'] for job in get_recent_jobs(2)] == ["Globex", "Initech"]
+
+    monkeypatch.setattr(station_data, "BOT_FACTORY_DIR", tmp_path)
+    monkeypatch.setattr(station_data, "PHOENIX_LOG", tmp_path / "mark_xii_phoenix.log")
+    assert 'error' in get_phoenix_stats()
+    station_data.PHOENIX_LOG.write_text(
+        "2026-02-05 [INFO] $628.52 | RSI:33.1 | ATR:0.12 | SMA:HOLD | Pos:FLAT\n")
+    stats = get_phoenix_stats()
+    assert (stats['latest_price'], stats['rsi'], stats['position']) == ("628.52", "33.1", "FLAT")
+    assert stats['mode'] == station_data.PHOENIX_MODE
+
+
+@pytest.mark.parametrize("script", LAYOUTS)
+def test_layouts_render(script):
+    """Test 3: Thin layouts"""
+    app = AppTest.from_file(str(station_data.BASE_DIR / script), default_timeout=60).run()
+    assert list(app.exception) == []
+    assert app.session_state['vr_mode'] is False  # Shared station defaults
+
+    if script == "command_center_v2.py":
+        # v2 navigates on its own key, so v1's 'active_module' survives in one process
+        app.session_state['v2_module'] = "Trading"
+        app.run()
+        assert list(app.exception) == []
+        assert "active_module" not in app.session_state
+        assert any("AGRO MODE" in s.value for s in app.success)
+
+
+def test_scad_compile_timed(tmp_path, monkeypatch):
+    """Test 4: Compile latency histogram"""
+    monkeypatch.setattr(station_data, "CAD_OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(station_data.subprocess, "run",
+                        lambda args, **kwargs: subprocess.CompletedProcess(args, 1, stdout=""))
+    compiles = histogram("trinity_scad_compile_seconds")
+
+    before = compiles.snapshot(outcome="error")['count']
+    success, message, _ = compile_scad_to_stl("cube(1);", "part")
+    assert not success and "not installed" in message
+    assert compiles.snapshot(outcome="error")['count'] == before + 1
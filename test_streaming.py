@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Trinity Streaming Tests
+
+Tests:
+1. JARVIS streams chunks as they arrive, recording time-to-first-token
+   and token usage
+2. Provider errors mid-stream propagate to the caller after the chunks sent
+3. Mode detection routes job requests through NEXUS before streaming
+"""
+
+import threading
+
+import pytest
+
+from llm_gateway import FIRST_TOKEN_SECONDS, LLMGateway, StubProvider
+from trinity_router import TrinityRouter
+
+
+class BrokenStubProvider(StubProvider):
+    """Yields its first chunk, then drops the connection."""
+
+    def stream(self, model, parts, system, max_tokens, usage):
+        yield "partial"
+        raise RuntimeError("connection reset")
+
+
+def _router(claude: StubProvider) -> TrinityRouter:
+    router = TrinityRouter.__new__(TrinityRouter)  # Skip provider/voice setup
+    router._usage = threading.local()
+    router.gateway = LLMGateway({"claude": claude})
+    return router
+
+
+def test_stream_jarvis():
+    """Test 1: Incremental chunks, first-token latency and usage"""
+    router = _router(StubProvider("claude", "Hello, world", latency=0.02))
+    model = router.gateway.routes["writing"][0][1]
+    first_tokens = FIRST_TOKEN_SECONDS.snapshot(provider="claude", model=model)["count"]
+
+    source, chunks = router.stream_command("hi there", mode="chat")
+    assert source == "JARVIS (Claude)"
+    assert next(chunks) == "Hello,"
+    assert FIRST_TOKEN_SECONDS.snapshot(provider="claude", model=model)["count"] == first_tokens + 1
+    assert "".join(chunks) == " world"
+    assert router.last_usage() == {"tokens_in": 1, "tokens_out": 2}
+
+
+def test_stream_error():
+    """Test 2: Errors after the first chunk are raised, not sent as text"""
+    router = _router(BrokenStubProvider("claude"))
+    chunks = router.stream_jarvis("hi")
+    assert next(chunks) == "partial"
+    with pytest.raises(RuntimeError, match="connection reset"):
+        next(chunks)
+    assert router.last_usage() == {"tokens_in": None, "tokens_out": None}
+
+
+def test_job_mode_stream():
+    """Test 3: Job mode (NEXUS analysis fails over to Claude without Gemini)"""
+    claude = StubProvider("claude", lambda model, prompt:
+                          "Low stress, good fit" if prompt.startswith("Analyze") else "Dear Hiring Manager")
+    router = _router(claude)
+    source, chunks = router.stream_command("Write a cover letter for this job")
+    assert source == "Job Sniper (NEXUS + JARVIS)"
+    assert "".join(chunks) == "Dear Hiring Manager"
+    assert len(claude.calls) == 2
+    assert "Low stress, good fit" in claude.calls[1][1]
@@ -18,7 +18,10 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+import pytest
+
 # Import Trinity components
+import safety_config
 from safety_config import (
     validate_job_for_auto_apply,
     check_rate_limit,
@@ -105,6 +108,12 @@ WRONG_INDUSTRY_JOB = {
 # TEST FUNCTIONS
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def isolated_rate_limits(tmp_path, monkeypatch):
+    """Point the rate limiter at a fresh DB so the suite can be re-run"""
+    monkeypatch.setattr(safety_config, "RATE_LIMIT_DB", tmp_path / "rate_limits.db")
+    monkeypatch.setattr(safety_config, "RATE_LIMIT_FILE", tmp_path / "rate_limits.json")
+
 def test_good_job():
     """Test 1: Valid job should pass all checks"""
     print("\n" + "="*70)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Trinity Supervisor Tests
+
+Uses tiny stand-in services (python -c / http.server) instead of the
+real Trinity processes.
+
+Tests:
+1. Exits are detected immediately and restarts back off exponentially
+2. Readiness waits for the health endpoint
+3. Stopping the supervisor terminates its children
+"""
+
+import socket
+import sys
+import time
+
+import supervisor
+from supervisor import ServiceSpec, Supervisor
+
+
+def run_until(sup, predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        sup.step(timeout=0.05)
+    return predicate()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_exit_detection_and_backoff(tmp_path, monkeypatch):
+    """Test 1: Crash loop backs off"""
+    monkeypatch.setattr(supervisor, "BACKOFF_INITIAL", 0.1)
+    spec = ServiceSpec('crasher', [sys.executable, '-c', 'import sys; sys.exit(3)'])
+    sup = Supervisor([spec], cwd=tmp_path, log_dir=tmp_path, status_file=tmp_path / "status.json")
+    service = sup.services['crasher']
+
+    sup.start()
+    started = time.monotonic()
+    assert run_until(sup, lambda: service.last_exit_code == 3)
+    assert time.monotonic() - started < 2.0  # No polling interval in the way
+    assert service.state == 'backoff'
+
+    assert run_until(sup, lambda: service.restarts >= 3)
+    assert service.consecutive_failures >= 3
+    assert service.backoff() >= 0.4  # 0.1 → 0.2 → 0.4 ...
+
+    metrics = sup.metrics()['services']['crasher']
+    assert metrics['restarts'] == service.restarts
+    assert metrics['last_exit_code'] == 3
+    sup.stop()
+
+
+def test_readiness_gated_on_health(tmp_path):
+    """Test 2: Ready only once the health endpoint answers"""
+    port = free_port()
+    spec = ServiceSpec(
+        'web',
+        [sys.executable, '-c',
+         f'import time, http.server; time.sleep(0.5); '
+         f'http.server.test(HandlerClass=http.server.SimpleHTTPRequestHandler, '
+         f'port={port}, bind="127.0.0.1")'],
+        health_url=f'http://127.0.0.1:{port}/'
+    )
+    sup = Supervisor([spec], cwd=tmp_path, log_dir=tmp_path, status_file=None)
+    service = sup.services['web']
+
+    sup.start()
+    assert service.state == 'starting'
+    assert run_until(sup, lambda: service.state == 'ready')
+    assert service.ready_at - service.started_at >= 0.5
+    sup.stop()
+
+
+def test_stop_terminates_children(tmp_path):
+    """Test 3: Shutdown"""
+    spec = ServiceSpec('sleeper', [sys.executable, '-c', 'import time; time.sleep(60)'])
+    sup = Supervisor([spec], cwd=tmp_path, log_dir=tmp_path, status_file=None)
+    sup.start()
+    process = sup.services['sleeper'].process
+    assert run_until(sup, lambda: sup.services['sleeper'].state == 'ready')
+
+    sup.stop()
+    assert process.poll() is not None
+    assert sup.services['sleeper'].state == 'stopped'
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Trinity Time-Series Store Tests
+
+Tests:
+1. Rollups match the raw samples at every resolution, including rewrites
+2. Range queries pick a resolution and return NumPy arrays
+3. Legacy account_snapshots / system_metrics rows are imported once
+   (text series reject numeric range queries; /timeseries maps that to 400)
+"""
+
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from timeseries import TimeSeriesStore
+
+DAY = 86400
+START = 1_760_000_000 // DAY * DAY  # Midnight UTC
+
+
+def test_rollups(tmp_path):
+    """Test 1: count/sum/min/max/last per bucket"""
+    store = TimeSeriesStore(tmp_path / "ts.db")
+    ts = START + np.arange(0, 2 * DAY, 30)
+    values = np.sin(np.arange(len(ts)) / 50.0) * 1000 + 100000
+    store.write_many("account.equity", ts[:len(ts) // 2], values[:len(ts) // 2])
+    store.write_many("account.equity", ts[len(ts) // 2:], values[len(ts) // 2:])
+
+    for resolution, seconds in (('1m', 60), ('1h', 3600), ('1d', DAY)):
+        buckets = values.reshape(-1, seconds // 30)
+        rts, mean = store.range("account.equity", START, START + 2 * DAY - 1, resolution, 'mean')
+        assert rts.dtype == np.int64 and len(rts) == len(buckets)
+        assert np.allclose(mean, buckets.mean(axis=1))
+        assert np.allclose(store.range("account.equity", START, START + 2 * DAY - 1,
+                                       resolution, 'max')[1], buckets.max(axis=1))
+        assert np.allclose(store.range("account.equity", START, START + 2 * DAY - 1,
+                                       resolution, 'last')[1], buckets[:, -1])
+
+    # Rewriting a sample updates every level instead of double counting
+    store.write("account.equity", 0.0, ts[-1])
+    assert store.range("account.equity", START + DAY, START + 2 * DAY - 1, '1d', 'count')[1][0] == DAY // 30
+    assert store.range("account.equity", START + DAY, START + 2 * DAY - 1, '1d', 'last')[1][0] == 0.0
+    assert store.latest("account.equity") == (int(ts[-1]), 0.0)
+
+
+def test_range_auto_resolution(tmp_path):
+    """Test 2: Auto resolution and empty series"""
+    store = TimeSeriesStore(tmp_path / "ts.db")
+    ts = START + np.arange(0, 120 * DAY, 300)
+    store.write_many("account.equity", ts, np.linspace(100000, 120000, len(ts)))
+
+    end = int(ts[-1])
+    assert store.pick_resolution(end - 3600, end) == 'raw'
+    assert store.pick_resolution(end - 2 * DAY, end) == '1m'
+    assert store.pick_resolution(end - 90 * DAY, end) == '1h'
+    assert store.pick_resolution(end - 365 * DAY, end) == '1d'
+
+    rts, values = store.range("account.equity", end - 90 * DAY, end)
+    assert len(rts) == 90 * 24 + 1
+    assert np.all(np.diff(rts) == 3600)
+    assert values[-1] > values[0]
+
+    rts, values = store.range("missing.series", resolution='1h')
+    assert rts.shape == values.shape == (0,)
+
+
+def test_import_legacy(tmp_path):
+    """Test 3: One-time legacy import"""
+    db = tmp_path / "trinity_data.db"
+    conn = sqlite3.connect(db)
+    conn.execute("""CREATE TABLE account_snapshots (id INTEGER PRIMARY KEY, timestamp TEXT, equity REAL,
+                    cash REAL, buying_power REAL, mode TEXT, daily_pnl REAL, total_pnl REAL)""")
+    conn.execute("CREATE TABLE system_metrics (id INTEGER PRIMARY KEY, timestamp TEXT, "
+                 "metric_name TEXT, metric_value TEXT)")
+    stamp = datetime.fromtimestamp(START).isoformat()
+    conn.execute("INSERT INTO account_snapshots VALUES (1, ?, 101000, 50000, 200000, 'PAPER', 1000, 1000)",
+                 (stamp,))
+    conn.execute("INSERT INTO system_metrics VALUES (1, ?, 'phoenix_status', '{\"running\": true}')", (stamp,))
+    conn.execute("INSERT INTO system_metrics VALUES (2, ?, 'trinity_insight', 'Hold steady')", (stamp,))
+    conn.commit()
+    conn.close()
+
+    store = TimeSeriesStore(db)
+    assert store.import_legacy() == 3
+    assert store.import_legacy() == 0
+    assert store.latest("account.equity") == (START, 101000.0)
+    assert store.latest("phoenix.running") == (START, 1.0)
+    assert store.events("trinity.insight", end=START + 1) == [(START, "Hold steady")]
+    with pytest.raises(ValueError, match="holds text values"):
+        store.range("trinity.insight")
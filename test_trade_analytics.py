@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Trinity Trade Analytics Tests
+
+Tests:
+1. Win/loss, R multiple and Sharpe match the original per-trade loops
+2. Max drawdown follows the full equity curve; exposure merges overlapping trades
+3. Stats are cached until the state file changes
+"""
+
+import json
+import os
+
+import numpy as np
+
+from trade_analytics import analyze, load_trade_stats, trades_to_array
+
+HISTORY = [
+    {"entry_time": "2026-02-02T10:00:00", "exit_time": "2026-02-02T12:00:00", "pnl": 1200.0},
+    {"entry_time": "2026-02-03T10:00:00", "exit_time": "2026-02-03T11:00:00", "pnl": -400.0},
+    {"entry_time": "2026-02-03T10:30:00", "exit_time": "2026-02-03T12:00:00", "pnl": -900.0},
+    {"entry_time": "2026-02-04T10:00:00", "exit_time": "2026-02-04T14:00:00", "pnl": 2500.0},
+    {"entry_time": "2026-02-05T10:00:00", "exit_time": "2026-02-05T10:30:00", "pnl": -300.0},
+    {"entry_time": "2026-02-06T10:00:00", "exit_time": "2026-02-06T16:00:00", "pnl": 1800.0},
+]
+
+
+def legacy_sharpe(history, start=100000.0):
+    """The original Paper → Live loop (equity_after from the running total)."""
+    equity, returns = start, []
+    for trade in history:
+        returns.append(trade["pnl"] / equity)
+        equity += trade["pnl"]
+    mean = sum(returns) / len(returns)
+    std = (sum((r - mean) ** 2 for r in returns) / len(returns)) ** 0.5
+    return mean / std * (252 / len(returns)) ** 0.5
+
+
+def test_trade_metrics():
+    """Test 1: Aggregate metrics"""
+    stats = analyze(trades_to_array(HISTORY))
+    assert (stats.trades, stats.wins, stats.losses) == (6, 3, 3)
+    assert stats.win_rate == 50.0
+    assert np.isclose(stats.avg_win, 5500 / 3)
+    assert np.isclose(stats.avg_loss, 1600 / 3)
+    assert np.isclose(stats.avg_r_multiple, 5500 / 1600)
+    assert np.isclose(stats.profit_factor, 5500 / 1600)
+    assert np.isclose(stats.total_pnl, 3900)
+    assert np.isclose(stats.sharpe, legacy_sharpe(HISTORY))
+    assert stats.sortino > stats.sharpe > 0
+
+    empty = analyze(trades_to_array([]))
+    assert empty.trades == 0 and empty.sharpe == 0.0
+
+
+def test_drawdown_and_exposure():
+    """Test 2: Curve drawdown and merged exposure"""
+    stats = analyze(trades_to_array(HISTORY))
+    assert np.allclose(stats.equity, 100000 + np.cumsum([t["pnl"] for t in HISTORY]))
+    # Peak 101,200 after trade 1, trough 99,900 after trade 3
+    assert np.isclose(stats.max_drawdown_pct, 1300 / 101200 * 100)
+    assert stats.drawdown_pct[-1] == 0.0
+
+    # 2h + 2h (10:00-12:00 overlapping) + 4h + 0.5h + 6h open over 4 days 6 hours
+    assert np.isclose(stats.exposure_pct, 14.5 / 102 * 100)
+    assert np.isclose(stats.days_trading, 102 / 24)
+
+
+def test_load_cached(tmp_path):
+    """Test 3: mtime-keyed cache"""
+    path = tmp_path / "phoenix_state.json"
+    path.write_text(json.dumps({"current_equity": 103900, "trade_history": HISTORY}))
+
+    state, stats = load_trade_stats(path)
+    assert state["current_equity"] == 103900
+    assert load_trade_stats(path)[1] is stats
+
+    path.write_text(json.dumps({"current_equity": 101200, "trade_history": HISTORY[:1]}))
+    os.utime(path, ns=(path.stat().st_mtime_ns + 10 ** 9,) * 2)
+    state, fresh = load_trade_stats(path)
+    assert fresh is not stats and fresh.trades == 1
+
+    missing, empty = load_trade_stats(tmp_path / "missing.json", default={"trade_history": []})
+    assert missing == {"trade_history": []} and empty.trades == 0
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Trinity VR Server Tests
+
+Tests:
+1. Status refresher resolves Tailscale IP via a stubbed binary
+2. /api/status is served from cache (no subprocess per request) and is
+   counted and timed on /metrics
+3. Model count follows cad_output changes
+4. STL byte ranges: exact 206 slices, suffix ranges and 416 when unsatisfiable
+5. ASCII STL is served as binary (same triangle count), gzip'd on request
+6. Cached static assets revalidate (ETag/Last-Modified → 304) and gzip
+   only when the client accepts it
+7. HEAD matches GET without a body, and edits on disk invalidate the cache
+8. The clipboard broadcaster reads nothing until started
+9. SSE clients get an event per clipboard change, keepalives while idle,
+   and are unregistered when they disconnect
+"""
+
+import gzip
+import json
+import os
+import stat
+import struct
+import threading
+import time
+import http.client
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import vr_server
+from clipboard_sync import ClipboardBroadcaster, SyncFileReader
+from vr_asset_cache import MIN_GZIP_BYTES, StaticAssetCache
+
+STUB_IP = "100.64.0.7"
+STUB_DELAY = 0.5  # Stubbed tailscale is deliberately slow
+
+# Two facets, as OpenSCAD writes them (binary: 84 + 2 * 50 bytes)
+ASCII_STL = """solid fixture
+  facet normal 0 0 1
+    outer loop
+      vertex 0 0 0
+      vertex 1 0 0
+      vertex 0 1 0
+    endloop
+  endfacet
+  facet normal 0 0 -1
+    outer loop
+      vertex 0 0 0
+      vertex 0 1 0
+      vertex 1 0 0
+    endloop
+  endfacet
+endsolid fixture
+"""
+BINARY_SIZE = 84 + 2 * 50
+
+
+def make_tailscale_stub(bin_dir, calls_file):
+    """Create a fake `tailscale` executable that logs each invocation."""
+    stub = bin_dir / "tailscale"
+    stub.write_text(
+        "#!/bin/sh\n"
+        f"echo call >> '{calls_file}'\n"
+        f"sleep {STUB_DELAY}\n"
+        f"echo {STUB_IP}\n"
+    )
+    stub.chmod(stub.stat().st_mode | stat.S_IEXEC)
+    return stub
+
+
+def count_calls(calls_file):
+    return len(calls_file.read_text().splitlines()) if calls_file.exists() else 0
+
+
+@pytest.fixture
+def vr_site(tmp_path, monkeypatch):
+    """Serve a temporary site root (with its own cad_output) on a free port."""
+    cad_output = tmp_path / "cad_output"
+    cad_output.mkdir()
+    monkeypatch.setattr(vr_server, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(vr_server, "CAD_OUTPUT_DIR", cad_output)
+    monkeypatch.setattr(vr_server, "LOD_DIR", cad_output / "lod")
+    monkeypatch.setattr(vr_server, "MODEL_CACHE_DIR", cad_output / ".cache")
+    monkeypatch.setattr(vr_server, "ASSET_CACHE", StaticAssetCache())
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), vr_server.TrinityVRHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield tmp_path, server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def fetch(port, path, method="GET", headers=None):
+    """One request on a fresh connection; returns (response, body)."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        conn.request(method, path, headers=headers or {})
+        response = conn.getresponse()
+        return response, response.read()
+    finally:
+        conn.close()
+
+
+def test_refresher_uses_stubbed_tailscale(tmp_path, monkeypatch):
+    """Test 1: Refresher caches the stubbed Tailscale IP"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls_file = tmp_path / "calls.log"
+    make_tailscale_stub(bin_dir, calls_file)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    refresher = vr_server.StatusRefresher(models_dir=tmp_path, network_interval=3600)
+    refresher.refresh_network()
+
+    assert refresher.snapshot()['tailscale'] == STUB_IP
+    assert count_calls(calls_file) == 1
+
+
+def test_status_endpoint_is_cached(tmp_path, monkeypatch):
+    """Test 2: /api/status never forks tailscale on the request path"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    models_dir = tmp_path / "cad_output"
+    models_dir.mkdir()
+    calls_file = tmp_path / "calls.log"
+    make_tailscale_stub(bin_dir, calls_file)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    refresher = vr_server.StatusRefresher(models_dir=models_dir,
+                                          network_interval=3600, poll_interval=3600)
+    refresher.start()
+    monkeypatch.setattr(vr_server, "STATUS_REFRESHER", refresher)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), vr_server.TrinityVRHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    timed_before = vr_server.REQUEST_SECONDS.snapshot(
+        method="GET", route="/api/status", status="200")['count']
+    requests_before = vr_server.REQUESTS.value()
+
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        requests = 10
+        start = time.perf_counter()
+        for _ in range(requests):
+            conn.request("GET", "/api/status")
+            response = conn.getresponse()
+            status = json.loads(response.read())
+            assert response.status == 200
+        elapsed = time.perf_counter() - start
+
+        # Out-of-range page sizes are clamped before the offset is computed
+        for per_page, expected in (("0", 1), ("-5", 1), ("100000", vr_server.MAX_PAGE_SIZE)):
+            conn.request("GET", f"/api/models?page=2&per_page={per_page}")
+            response = conn.getresponse()
+            response.read()
+            assert response.status == 200
+            assert response.getheader('X-Per-Page') == str(expected)
+
+        # Same keep-alive connection: earlier requests have been recorded
+        conn.request("GET", "/metrics")
+        metrics = conn.getresponse().read().decode()
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        refresher.stop()
+
+    # One call at start(), none per request
+    assert count_calls(calls_file) == 1
+    assert status['network']['tailscale'] == STUB_IP
+    # A single fork of the slow stub would exceed this budget
+    assert elapsed < STUB_DELAY, f"{requests} status requests took {elapsed:.3f}s"
+
+    assert "# TYPE trinity_vr_requests_total counter" in metrics
+    assert vr_server.REQUESTS.value() - requests_before == requests + 4
+    assert vr_server.REQUEST_SECONDS.snapshot(
+        method="GET", route="/api/status", status="200")['count'] - timed_before == requests
+    assert 'trinity_vr_request_seconds_count{method="GET",route="/api/models",status="200"}' in metrics
+
+
+def test_model_count_tracks_directory(tmp_path):
+    """Test 3: Model count refreshes when cad_output changes"""
+    refresher = vr_server.StatusRefresher(models_dir=tmp_path)
+    refresher.refresh_models(force=True)
+    assert refresher.snapshot()['models_count'] == 0
+
+    (tmp_path / "part.stl").write_text("solid part\nendsolid part\n")
+    (tmp_path / "part.scad").write_text("cube(1);\n")
+    # Make sure the directory mtime moves even on coarse-grained filesystems
+    future = time.time() + 5
+    os.utime(tmp_path, (future, future))
+
+    refresher.refresh_models()
+    assert refresher.snapshot()['models_count'] == 1
+
+
+def test_model_byte_ranges(vr_site):
+    """Test 4: Range requests address the binary model bytes"""
+    site, port = vr_site
+    (site / "cad_output" / "part.stl").write_text(ASCII_STL)
+    full = fetch(port, "/cad_output/part.stl")[1]
+    assert len(full) == BINARY_SIZE
+
+    response, body = fetch(port, "/cad_output/part.stl", headers={"Range": "bytes=10-99"})
+    assert response.status == 206
+    assert response.getheader("Content-Range") == f"bytes 10-99/{BINARY_SIZE}"
+    assert response.getheader("Content-Length") == "90"
+    assert body == full[10:100]
+
+    # Suffix range: the last 50 bytes (one facet)
+    response, body = fetch(port, "/cad_output/part.stl", headers={"Range": "bytes=-50"})
+    assert response.status == 206
+    assert response.getheader("Content-Range") == f"bytes {BINARY_SIZE - 50}-{BINARY_SIZE - 1}/{BINARY_SIZE}"
+    assert body == full[-50:]
+
+    # An end past EOF is clamped; a start past EOF can't be satisfied
+    response, body = fetch(port, "/cad_output/part.stl", headers={"Range": "bytes=100-9999"})
+    assert response.status == 206 and body == full[100:]
+    response, body = fetch(port, "/cad_output/part.stl", headers={"Range": f"bytes={BINARY_SIZE}-"})
+    assert response.status == 416
+    assert response.getheader("Content-Range") == f"bytes */{BINARY_SIZE}"
+    assert body == b""
+
+
+def test_model_binary_and_gzip(vr_site):
+    """Test 5: Binary conversion keeps every triangle; gzip variant decodes to it"""
+    site, port = vr_site
+    (site / "cad_output" / "part.stl").write_text(ASCII_STL)
+
+    response, body = fetch(port, "/cad_output/part.stl")
+    assert response.status == 200
+    assert response.getheader("Content-Type") == "model/stl"
+    assert response.getheader("Accept-Ranges") == "bytes"
+    assert response.getheader("Content-Encoding") is None
+    (count,) = struct.unpack("<I", body[80:84])
+    assert count == ASCII_STL.count("endfacet") == 2
+    assert len(body) == 84 + count * 50
+    # The normal of the second facet survives the conversion
+    assert struct.unpack("<3f", body[84 + 50:84 + 62]) == (0.0, 0.0, -1.0)
+
+    response, gz_body = fetch(port, "/cad_output/part.stl", headers={"Accept-Encoding": "gzip"})
+    assert response.status == 200
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("ETag").endswith('-gz"')
+    assert int(response.getheader("Content-Length")) == len(gz_body)
+    assert gzip.decompress(gz_body) == body
+    assert (site / "cad_output" / ".cache" / "part.stl.gz").exists()
+
+    # Revalidating with the gzip ETag is a 304
+    response, _ = fetch(port, "/cad_output/part.stl",
+                        headers={"Accept-Encoding": "gzip", "If-None-Match": response.getheader("ETag")})
+    assert response.status == 304
+
+
+def test_asset_revalidation_and_gzip(vr_site):
+    """Test 6: ETag/304 and gzip negotiation for cached assets"""
+    site, port = vr_site
+    script = "console.log('trinity');\n" * 100
+    (site / "app.js").write_text(script)
+    (site / "tiny.js").write_text("x = 1;\n")
+
+    response, body = fetch(port, "/app.js")
+    assert response.status == 200 and body == script.encode()
+    assert response.getheader("Content-Encoding") is None
+    assert response.getheader("Vary") == "Accept-Encoding"
+    etag, last_modified = response.getheader("ETag"), response.getheader("Last-Modified")
+
+    for headers in ({"If-None-Match": etag}, {"If-None-Match": f"W/{etag}"},
+                    {"If-Modified-Since": last_modified}):
+        response, body = fetch(port, "/app.js", headers=headers)
+        assert response.status == 304, headers
+        assert body == b"" and response.getheader("ETag") == etag
+
+    response, body = fetch(port, "/app.js", headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert int(response.getheader("Content-Length")) == len(body) < len(script)
+    assert gzip.decompress(body) == script.encode()
+
+    # Below the gzip threshold the identity body is sent even when accepted
+    response, body = fetch(port, "/tiny.js", headers={"Accept-Encoding": "gzip"})
+    assert len(body) < MIN_GZIP_BYTES
+    assert response.getheader("Content-Encoding") is None and body == b"x = 1;\n"
+
+
+def test_asset_head_and_invalidation(vr_site):
+    """Test 7: HEAD and on-disk changes"""
+    site, port = vr_site
+    page = site / "page.html"
+    page.write_text("<html>" + "v1 " * 300 + "</html>")
+
+    get_response, get_body = fetch(port, "/page.html")
+    head_response, head_body = fetch(port, "/page.html", method="HEAD")
+    assert head_response.status == 200 and head_body == b""
+    for header in ("Content-Length", "ETag", "Last-Modified", "Content-Type"):
+        assert head_response.getheader(header) == get_response.getheader(header)
+    assert int(head_response.getheader("Content-Length")) == len(get_body)
+    assert vr_server.ASSET_CACHE.stats()['hits'] >= 1
+
+    # Same size, new content and mtime: the cached body must not be served
+    old_etag = get_response.getheader("ETag")
+    page.write_text("<html>" + "v2 " * 300 + "</html>")
+    future = time.time() + 5
+    os.utime(page, (future, future))
+
+    response, body = fetch(port, "/page.html", headers={"If-None-Match": old_etag})
+    assert response.status == 200
+    assert b"v2" in body and b"v1" not in body
+    assert response.getheader("ETag") != old_etag
+
+    page.unlink()
+    response, _ = fetch(port, "/page.html")
+    assert response.status == 404
+    assert vr_server.ASSET_CACHE.stats()['entries'] == 0
+
+
+def test_broadcaster_reads_on_start(tmp_path):
+    """Test 8: No sync file I/O before start()"""
+    sync_file = tmp_path / "clipboard"
+    broadcaster = ClipboardBroadcaster(sync_file)
+    SyncFileReader(sync_file).write("written after construction", 'mac')
+    assert broadcaster.current()['content'] == ""
+
+    broadcaster.start()
+    try:
+        assert broadcaster.current()['content'] == "written after construction"
+    finally:
+        broadcaster.stop()
+
+
+def read_sse_message(response) -> str:
+    """Read one SSE message (up to its blank line)."""
+    lines = []
+    while True:
+        line = response.fp.readline().decode()
+        assert line, "stream closed"
+        if line == "\n":
+            return "".join(lines)
+        lines.append(line)
+
+
+def test_clipboard_stream(vr_site, monkeypatch):
+    """Test 9: Clipboard SSE stream"""
+    site, port = vr_site
+    sync_file = site / "clipboard"
+    SyncFileReader(sync_file).write("before connect", 'mac')
+    broadcaster = ClipboardBroadcaster(sync_file)
+    monkeypatch.setattr(vr_server, "CLIPBOARD_BROADCASTER", broadcaster)
+    monkeypatch.setattr(vr_server, "SSE_KEEPALIVE_INTERVAL", 0.2)
+    clients_before = vr_server.SSE_CLIENTS
+
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.request("GET", "/api/clipboard/stream")
+    response = conn.getresponse()  # Owns the socket: the stream is Connection: close
+    try:
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "text/event-stream"
+        assert read_sse_message(response) == "retry: 3000\n"
+
+        # Current content first, then each change as it is written
+        first = read_sse_message(response)
+        assert json.loads(first.split("data: ", 1)[1])['content'] == "before connect"
+        assert vr_server.SSE_CLIENTS == clients_before + 1
+
+        written = SyncFileReader(sync_file).write("from quest", 'quest')
+        message = read_sse_message(response)
+        while message.startswith(": keepalive"):
+            message = read_sse_message(response)
+        assert message.startswith(f"id: {written['hash']}\nevent: clipboard\n")
+        event = json.loads(message.split("data: ", 1)[1])
+        assert event['content'] == "from quest" and event['source'] == 'quest'
+
+        # Idle: only keepalive comments
+        assert read_sse_message(response) == ": keepalive\n"
+    finally:
+        response.close()
+        broadcaster.stop()
+
+    # The next keepalive write fails and the handler unregisters the client
+    deadline = time.monotonic() + 5
+    while vr_server.SSE_CLIENTS != clients_before and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert vr_server.SSE_CLIENTS == clients_before
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Trinity Time-Series Store
+
+Typed metric history in trinity_data.db, replacing one-row-per-sample
+text rows in account_snapshots / system_metrics:
+- Named series with integer epoch-second timestamps; numeric samples in
+  ``ts_points``, text (AI insights) in ``ts_events``
+- WITHOUT ROWID tables keyed (series, ts): range scans read the value
+  straight from the primary key, no extra index lookups
+- 1m / 1h / 1d rollups (count, sum, min, max, last) kept current on
+  every write, so months of history are a few thousand rows
+- Range queries return NumPy arrays, picking a resolution that fits
+  the requested number of points
+
+Usage:
+    store = get_store()
+    store.write_values({"account.equity": 101250.0, "account.cash": 40000.0})
+    ts, equity = store.range("account.equity", start=time.time() - 90 * 86400)
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from instrumentation import sqlite_connect
+
+DB_PATH = Path(__file__).parent / "trinity_data.db"
+
+# Rollup levels, finest first; each is built from the one before it
+RESOLUTIONS = {'1m': 60, '1h': 3600, '1d': 86400}
+RAW_SPAN = 6 * 3600  # Auto-resolution serves raw samples for spans up to this
+MAX_POINTS = 3000  # Default cap on points returned by auto-resolution
+RAW_RETENTION_DAYS = int(os.getenv("TRINITY_TS_RAW_DAYS", 90))  # Rollups are kept indefinitely
+
+# Rollup column per aggregate
+AGGREGATES = {
+    'mean': 'total / n',
+    'min': 'low',
+    'max': 'high',
+    'last': 'last_value',
+    'sum': 'total',
+    'count': 'n'
+}
+
+
+def _epoch(ts) -> int:
+    return int(time.time() if ts is None else ts)
+
+
+class TimeSeriesStore:
+    """Numeric series with rollups, plus text event series, in SQLite."""
+
+    def __init__(self, db_path: Path = DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._series: Dict[str, int] = {}
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite_connect(str(db_path), "trinity_data", check_same_thread=False, timeout=10)
+        self._initialize_database()
+
+    def _initialize_database(self):
+        """Create the time-series schema."""
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS ts_series (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT UNIQUE NOT NULL,
+                    kind TEXT NOT NULL CHECK (kind IN ('real', 'text'))
+                );
+                CREATE TABLE IF NOT EXISTS ts_points (
+                    series_id INTEGER NOT NULL,
+                    ts INTEGER NOT NULL,
+                    value REAL NOT NULL,
+                    PRIMARY KEY (series_id, ts)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS ts_rollups (
+                    series_id INTEGER NOT NULL,
+                    resolution INTEGER NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    n INTEGER NOT NULL,
+                    total REAL NOT NULL,
+                    low REAL NOT NULL,
+                    high REAL NOT NULL,
+                    last_ts INTEGER NOT NULL,
+                    last_value REAL NOT NULL,
+                    PRIMARY KEY (series_id, resolution, bucket)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS ts_events (
+                    series_id INTEGER NOT NULL,
+                    ts INTEGER NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (series_id, ts)
+                ) WITHOUT ROWID;
+            """)
+            self.conn.commit()
+
+    def _series_id(self, name: str, kind: str, create: bool = True) -> Optional[int]:
+        """Id of series ``name`` (created on first write)."""
+        key = f"{kind}:{name}"
+        if key in self._series:
+            return self._series[key]
+        row = self.conn.execute("SELECT id, kind FROM ts_series WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            if not create:
+                return None
+            row = (self.conn.execute("INSERT INTO ts_series (name, kind) VALUES (?, ?)",
+                                     (name, kind)).lastrowid, kind)
+        if row[1] != kind:
+            raise ValueError(f"Series {name} holds {row[1]} values, not {kind}")
+        self._series[key] = row[0]
+        return row[0]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _rollup(self, series_id: int, start: int, end: int):
+        """Rebuild the rollup buckets covering [start, end] at every level."""
+        fine = None
+        for resolution in RESOLUTIONS.values():
+            lo = start // resolution * resolution
+            hi = end // resolution * resolution + resolution - 1
+            if fine is None:
+                self.conn.execute("""
+                    WITH b AS (
+                        SELECT ts / :r * :r AS bucket, COUNT(*) AS n, SUM(value) AS total,
+                               MIN(value) AS low, MAX(value) AS high, MAX(ts) AS last_ts
+                        FROM ts_points
+                        WHERE series_id = :sid AND ts BETWEEN :lo AND :hi
+                        GROUP BY bucket
+                    )
+                    INSERT OR REPLACE INTO ts_rollups
+                    SELECT :sid, :r, bucket, n, total, low, high, last_ts,
+                           (SELECT value FROM ts_points WHERE series_id = :sid AND ts = b.last_ts)
+                    FROM b
+                """, {"sid": series_id, "r": resolution, "lo": lo, "hi": hi})
+            else:
+                self.conn.execute("""
+                    WITH b AS (
+                        SELECT bucket / :r * :r AS coarse, SUM(n) AS n, SUM(total) AS total,
+                               MIN(low) AS low, MAX(high) AS high, MAX(last_ts) AS last_ts
+                        FROM ts_rollups
+                        WHERE series_id = :sid AND resolution = :fine AND bucket BETWEEN :lo AND :hi
+                        GROUP BY coarse
+                    )
+                    INSERT OR REPLACE INTO ts_rollups
+                    SELECT :sid, :r, coarse, n, total, low, high, last_ts,
+                           (SELECT last_value FROM ts_rollups
+                            WHERE series_id = :sid AND resolution = :fine
+                              AND bucket = b.last_ts / :fine * :fine)
+                    FROM b
+                """, {"sid": series_id, "r": resolution, "fine": fine, "lo": lo, "hi": hi})
+            fine = resolution
+
+    def write_many(self, name: str, ts: Iterable, values: Iterable):
+        """Write samples of one numeric series (later writes replace same-second ones)."""
+        ts = np.asarray(ts, dtype=np.int64).ravel()
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(ts) != len(values):
+            raise ValueError("ts and values must have the same length")
+        if not len(ts):
+            return
+        with self._lock:
+            series_id = self._series_id(name, 'real')
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ts_points (series_id, ts, value) VALUES (?, ?, ?)",
+                zip([series_id] * len(ts), ts.tolist(), values.tolist())
+            )
+            self._rollup(series_id, int(ts.min()), int(ts.max()))
+            self.conn.commit()
+
+    def write(self, name: str, value: float, ts: Optional[float] = None):
+        """Write one sample (``ts`` defaults to now)."""
+        self.write_many(name, [_epoch(ts)], [value])
+
+    def write_values(self, values: Dict[str, float], ts: Optional[float] = None):
+        """Write one sample to each of several series at the same timestamp."""
+        ts = _epoch(ts)
+        with self._lock:
+            for name, value in values.items():
+                series_id = self._series_id(name, 'real')
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO ts_points (series_id, ts, value) VALUES (?, ?, ?)",
+                    (series_id, ts, float(value))
+                )
+                self._rollup(series_id, ts, ts)
+            self.conn.commit()
+
+    def write_text(self, name: str, text: str, ts: Optional[float] = None):
+        """Append a text event (e.g. an AI insight)."""
+        with self._lock:
+            series_id = self._series_id(name, 'text')
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ts_events (series_id, ts, value) VALUES (?, ?, ?)",
+                (series_id, _epoch(ts), text)
+            )
+            self.conn.commit()
+
+    def prune(self, raw_days: float = RAW_RETENTION_DAYS) -> int:
+        """Drop raw samples older than ``raw_days`` (rollups are kept)."""
+        with self._lock:
+            deleted = self.conn.execute("DELETE FROM ts_points WHERE ts < ?",
+                                        (int(time.time() - raw_days * 86400),)).rowcount
+            self.conn.commit()
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def pick_resolution(start: float, end: float, max_points: int = MAX_POINTS) -> str:
+        """Finest level (``'raw'`` or a RESOLUTIONS key) with at most ``max_points`` buckets."""
+        span = end - start
+        if span <= RAW_SPAN:
+            return 'raw'
+        for name, seconds in RESOLUTIONS.items():
+            if span / seconds <= max_points:
+                return name
+        return list(RESOLUTIONS)[-1]
+
+    def range(self, name: str, start: Optional[float] = None, end: Optional[float] = None,
+              resolution: str = 'auto', agg: str = 'mean',
+              max_points: int = MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Samples of ``name`` between ``start`` and ``end`` (epoch seconds).
+
+        Args:
+            resolution: 'raw', '1m', '1h', '1d' or 'auto'
+            agg: Rollup aggregate ('mean', 'min', 'max', 'last', 'sum', 'count');
+                 ignored for raw samples
+
+        Returns:
+            (timestamps int64, values float64); rollup timestamps are bucket starts
+        """
+        end = _epoch(end)
+        start = 0 if start is None else int(start)
+        if resolution == 'auto':
+            resolution = self.pick_resolution(start, end, max_points)
+
+        with self._lock:
+            series_id = self._series_id(name, 'real', create=False)
+            if series_id is None:
+                rows = []
+            elif resolution == 'raw':
+                rows = self.conn.execute("""
+                    SELECT ts, value FROM ts_points
+                    WHERE series_id = ? AND ts BETWEEN ? AND ? ORDER BY ts
+                """, (series_id, start, end)).fetchall()
+            else:
+                seconds = RESOLUTIONS[resolution]
+                rows = self.conn.execute(f"""
+                    SELECT bucket, {AGGREGATES[agg]} FROM ts_rollups
+                    WHERE series_id = ? AND resolution = ? AND bucket BETWEEN ? AND ?
+                    ORDER BY bucket
+                """, (series_id, seconds, start // seconds * seconds, end)).fetchall()
+
+        data = np.array(rows, dtype=np.float64).reshape(-1, 2)
+        return data[:, 0].astype(np.int64), data[:, 1]
+
+    def latest(self, name: str) -> Optional[Tuple[int, float]]:
+        """Most recent (ts, value) of a numeric series."""
+        with self._lock:
+            series_id = self._series_id(name, 'real', create=False)
+            if series_id is None:
+                return None
+            return self.conn.execute("""
+                SELECT ts, value FROM ts_points WHERE series_id = ? ORDER BY ts DESC LIMIT 1
+            """, (series_id,)).fetchone()
+
+    def events(self, name: str, start: Optional[float] = None, end: Optional[float] = None,
+               limit: int = 100) -> List[Tuple[int, str]]:
+        """Text events of ``name``, newest first."""
+        with self._lock:
+            series_id = self._series_id(name, 'text', create=False)
+            if series_id is None:
+                return []
+            return self.conn.execute("""
+                SELECT ts, value FROM ts_events
+                WHERE series_id = ? AND ts BETWEEN ? AND ? ORDER BY ts DESC LIMIT ?
+            """, (series_id, 0 if start is None else int(start), _epoch(end), limit)).fetchall()
+
+    def stats(self) -> Dict:
+        """Row counts per table."""
+        with self._lock:
+            return {
+                table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ('ts_series', 'ts_points', 'ts_rollups', 'ts_events')
+            }
+
+    # ------------------------------------------------------------------
+    # Legacy tables
+    # ------------------------------------------------------------------
+
+    def import_legacy(self) -> int:
+        """
+        One-time import of account_snapshots and system_metrics rows into
+        series (skipped once any series exists). Returns rows imported.
+        """
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM ts_series LIMIT 1").fetchone():
+                return 0
+            tables = {row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'")}
+            accounts = metrics = []
+            if 'account_snapshots' in tables:
+                accounts = self.conn.execute("""
+                    SELECT timestamp, equity, cash, buying_power, daily_pnl, total_pnl
+                    FROM account_snapshots ORDER BY id
+                """).fetchall()
+            if 'system_metrics' in tables:
+                metrics = self.conn.execute("""
+                    SELECT timestamp, metric_name, metric_value FROM system_metrics ORDER BY id
+                """).fetchall()
+
+        fields = ['equity', 'cash', 'buying_power', 'daily_pnl', 'total_pnl']
+        if accounts:
+            ts = [datetime.fromisoformat(row[0]).timestamp() for row in accounts]
+            for i, field in enumerate(fields, 1):
+                pairs = [(t, row[i]) for t, row in zip(ts, accounts) if row[i] is not None]
+                if pairs:
+                    self.write_many(f"account.{field}", *zip(*pairs))
+
+        running = []
+        for timestamp, metric, value in metrics:
+            ts = datetime.fromisoformat(timestamp).timestamp()
+            if metric == 'phoenix_status':
+                running.append((ts, 1.0 if json.loads(value).get('running') else 0.0))
+            elif metric == 'trinity_insight':
+                self.write_text("trinity.insight", value, ts)
+        if running:
+            self.write_many("phoenix.running", *zip(*running))
+        return len(accounts) + len(metrics)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_stores: Dict[Path, TimeSeriesStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path: Path = DB_PATH) -> TimeSeriesStore:
+    """Shared store for ``db_path``."""
+    key = db_path.resolve()
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = TimeSeriesStore(db_path)
+        return _stores[key]
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Trinity Trade Analytics
+
+NumPy trade statistics for the Paper → Live tab:
+- Trade history converted once into a structured array (entry/exit
+  time, P&L, equity after)
+- Win rate, average win/loss, R multiple, profit factor, expectancy
+- Full equity curve with running peak, so max drawdown reflects the
+  worst dip along the way rather than the stored peak alone
+- Sharpe, Sortino and rolling Sharpe over per-trade returns
+- Exposure: share of the trading period with a position open
+- Results cached by the state file's mtime/size, so Streamlit reruns
+  don't recompute anything until Phoenix writes a new trade
+
+Usage:
+    state, stats = load_trade_stats(BOT_FACTORY_DIR / "phoenix_state.json")
+    stats.win_rate, stats.max_drawdown_pct, stats.sharpe
+"""
+
+import json
+import threading
+import warnings
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+START_EQUITY = 100000.0  # Paper account starting capital
+PERIODS_PER_YEAR = 252  # Annualisation used by Phoenix's Sharpe
+MIN_RATIO_TRADES = 5  # Trades needed before Sharpe/Sortino are reported
+ROLLING_WINDOW = 20  # Trades per rolling Sharpe window
+DEFAULT_DAYS = 30  # Trading period assumed when trades carry no timestamps
+
+TRADE_DTYPE = np.dtype([
+    ('entry_time', 'f8'),  # Epoch seconds (NaN if unknown)
+    ('exit_time', 'f8'),
+    ('pnl', 'f8'),
+    ('equity_after', 'f8')  # NaN if not recorded
+])
+
+
+def _epoch(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return np.nan
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)  # Same reading as the vectorised path
+    return parsed.timestamp()
+
+
+def _epochs(values: List[Any]) -> np.ndarray:
+    """Epoch seconds for ISO strings / numbers (NaN where missing)."""
+    if all(isinstance(v, str) for v in values):
+        try:
+            # ISO strings parse in one vectorised pass (naive times read
+            # as UTC; only differences between times are used). Strings
+            # with UTC offsets warn, and go through fromisoformat instead
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                parsed = np.array(values, dtype='datetime64[s]')
+            return parsed.astype(np.int64).astype(np.float64)
+        except (ValueError, UserWarning):
+            pass
+    return np.array([_epoch(v) for v in values], dtype=np.float64)
+
+
+def trades_to_array(trade_history: List[Dict]) -> np.ndarray:
+    """Phoenix ``trade_history`` entries as a TRADE_DTYPE array."""
+    trades = np.empty(len(trade_history), dtype=TRADE_DTYPE)
+    trades['entry_time'] = _epochs([t.get('entry_time') for t in trade_history])
+    trades['exit_time'] = _epochs([t.get('exit_time') for t in trade_history])
+    trades['pnl'] = [t.get('pnl') or 0.0 for t in trade_history]
+    trades['equity_after'] = [np.nan if t.get('equity_after') is None else t['equity_after']
+                              for t in trade_history]
+    return trades
+
+
+@dataclass
+class TradeStats:
+    """Aggregate statistics of a trade array (ratios are 0 when undefined)."""
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    win_rate: float = 0.0  # Percent
+    avg_win: float = 0.0
+    avg_loss: float = 0.0  # Positive magnitude
+    avg_r_multiple: float = 0.0  # avg_win / avg_loss
+    profit_factor: float = 0.0
+    expectancy: float = 0.0  # Mean P&L per trade
+    total_pnl: float = 0.0
+    return_pct: float = 0.0
+    max_drawdown_pct: float = 0.0
+    sharpe: float = 0.0
+    sortino: float = 0.0
+    exposure_pct: float = 0.0
+    days_trading: float = DEFAULT_DAYS
+    equity: np.ndarray = field(default_factory=lambda: np.empty(0))  # After each trade
+    drawdown_pct: np.ndarray = field(default_factory=lambda: np.empty(0))
+    rolling_sharpe: np.ndarray = field(default_factory=lambda: np.empty(0))  # NaN until a full window
+    returns: np.ndarray = field(default_factory=lambda: np.empty(0))  # P&L / equity before, per trade
+
+
+def _ratio(mean, deviation, count: int, periods: int):
+    """Phoenix-style annualised ratio: mean / deviation * sqrt(periods / count)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = mean / deviation * np.sqrt(periods / count)
+    return np.where(deviation > 0, ratio, 0.0)
+
+
+def _exposure(entry: np.ndarray, exit: np.ndarray) -> Tuple[float, float]:
+    """(seconds with a position open, total seconds) over the union of trade intervals."""
+    known = ~(np.isnan(entry) | np.isnan(exit))
+    if not known.any():
+        return 0.0, 0.0
+    order = np.argsort(entry[known], kind='stable')
+    entry, exit = entry[known][order], exit[known][order]
+    # Time each trade adds beyond the furthest exit of the trades before it
+    covered_until = np.maximum.accumulate(np.concatenate(([entry[0]], exit[:-1])))
+    open_seconds = np.clip(exit - np.maximum(entry, covered_until), 0, None).sum()
+    return float(open_seconds), float(exit.max() - entry[0])
+
+
+def analyze(trades: np.ndarray, start_equity: float = START_EQUITY,
+            periods: int = PERIODS_PER_YEAR, window: int = ROLLING_WINDOW) -> TradeStats:
+    """Statistics for a TRADE_DTYPE array in execution order."""
+    n = len(trades)
+    if n == 0:
+        return TradeStats()
+
+    pnl = trades['pnl']
+    wins, losses = pnl[pnl > 0], pnl[pnl < 0]
+    avg_win = wins.mean() if len(wins) else 0.0
+    avg_loss = -losses.mean() if len(losses) else 0.0
+    gross_loss = -losses.sum()
+
+    # Recorded equity where available, else the cumulative P&L curve
+    equity = np.where(np.isnan(trades['equity_after']), start_equity + np.cumsum(pnl),
+                      trades['equity_after'])
+    peak = np.maximum.accumulate(np.concatenate(([start_equity], equity)))[1:]
+    drawdown = np.where(peak > 0, (peak - equity) / peak * 100, 0.0)
+
+    equity_before = equity - pnl
+    returns = pnl[equity_before > 0] / equity_before[equity_before > 0]
+    sharpe = sortino = 0.0
+    rolling = np.full(n, np.nan)
+    if len(returns) >= MIN_RATIO_TRADES:
+        mean = returns.mean()
+        sharpe = float(_ratio(mean, returns.std(), len(returns), periods))
+        sortino = float(_ratio(mean, np.sqrt(np.mean(np.minimum(returns, 0) ** 2)),
+                               len(returns), periods))
+        if len(returns) >= window:
+            # Window means/deviations from running sums: O(n) for any window
+            sums = np.concatenate(([0.0], np.cumsum(returns)))
+            squares = np.concatenate(([0.0], np.cumsum(returns ** 2)))
+            means = (sums[window:] - sums[:-window]) / window
+            deviations = np.sqrt(np.clip((squares[window:] - squares[:-window]) / window - means ** 2, 0, None))
+            rolling[n - len(means):] = _ratio(means, deviations, window, periods)
+
+    open_seconds, span = _exposure(trades['entry_time'], trades['exit_time'])
+
+    return TradeStats(
+        trades=n,
+        wins=len(wins),
+        losses=len(losses),
+        win_rate=len(wins) / n * 100,
+        avg_win=float(avg_win),
+        avg_loss=float(avg_loss),
+        avg_r_multiple=float(avg_win / avg_loss) if avg_loss > 0 else 0.0,
+        profit_factor=float(wins.sum() / gross_loss) if gross_loss > 0 else 0.0,
+        expectancy=float(pnl.mean()),
+        total_pnl=float(pnl.sum()),
+        return_pct=float((equity[-1] - start_equity) / start_equity * 100),
+        max_drawdown_pct=float(drawdown.max()),
+        sharpe=sharpe,
+        sortino=sortino,
+        exposure_pct=open_seconds / span * 100 if span > 0 else 0.0,
+        days_trading=max(span / 86400, 1.0) if span > 0 else DEFAULT_DAYS,
+        equity=equity,
+        drawdown_pct=drawdown,
+        rolling_sharpe=rolling,
+        returns=returns
+    )
+
+
+# ============================================================================
+# CACHED LOADING
+# ============================================================================
+
+_cache: Dict[Tuple, Tuple[Dict, TradeStats]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_trade_stats(path: Path, start_equity: float = START_EQUITY,
+                     default: Optional[Dict] = None) -> Tuple[Dict, TradeStats]:
+    """
+    Phoenix state and its trade statistics, recomputed only when the
+    state file's mtime/size change.
+
+    Returns:
+        (state dict, TradeStats); ``default`` state if the file is missing
+        or unreadable
+    """
+    try:
+        st = path.stat()
+        key = (str(path), start_equity, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    with _cache_lock:
+        if key is not None and key in _cache:
+            return _cache[key]
+
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = dict(default or {})
+    result = (state, analyze(trades_to_array(state.get("trade_history", [])), start_equity))
+
+    if key is not None:
+        with _cache_lock:
+            for stale in [k for k in _cache if k[:2] == key[:2]]:
+                del _cache[stale]
+            _cache[key] = result
+    return result
@@ -20,7 +20,6 @@ Author: Trinity System
 Created: 2026-02-05
 """
 
-import os
 import sys
 import json
 import time
@@ -31,8 +30,8 @@ from typing import Dict, List, Any, Optional
 import logging
 
 # AI Integrations
-import anthropic
-import google.generativeai as genai
+from llm_gateway import get_gateway
+from timeseries import get_store
 
 # Data loading
 from dotenv import load_dotenv
@@ -48,10 +47,6 @@ DB_FILE = BASE_DIR / "trinity_data.db"
 BRAIN_LOG = BASE_DIR / "trinity_ai_brain.log"
 DECISIONS_LOG = BASE_DIR / "trinity_ai_decisions.json"
 
-# AI Configuration
-CLAUDE_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-
 # Personal Data Access (Read-Only)
 RESUME_PATH = BASE_DIR / "ty_resume.md"
 FLYWHEEL_PATH = BASE_DIR / "FINANCIAL_PROJECTIONS.md"
@@ -89,31 +84,14 @@ class TrinityAIBrain:
     """
 
     def __init__(self):
-        # Initialize Claude
-        if CLAUDE_API_KEY:
-            self.claude = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
-            self.claude_model = "claude-opus-4-5-20251101"  # Most capable
-            log.info("Claude Opus 4.5 initialized")
-        else:
-            self.claude = None
-            log.warning("Claude API key not found")
-
-        # Initialize Gemini
-        if GEMINI_API_KEY:
-            try:
-                genai.configure(api_key=GEMINI_API_KEY)
-                # Try multiple model names
-                try:
-                    self.gemini = genai.GenerativeModel('gemini-pro')
-                except:
-                    self.gemini = genai.GenerativeModel('models/gemini-pro')
-                log.info("Gemini Pro initialized")
-            except Exception as e:
-                self.gemini = None
-                log.warning(f"Gemini initialization failed: {e}")
-        else:
-            self.gemini = None
-            log.warning("Gemini API key not found")
+        # Claude ("deep" route) and Gemini ("analysis" route) via the shared
+        # gateway; each route falls back to the other provider
+        self.gateway = get_gateway()
+        for provider in ("claude", "gemini"):
+            if self.gateway.has_provider(provider):
+                log.info(f"{provider.title()} initialized")
+            else:
+                log.warning(f"{provider.title()} API key not found")
 
         # Load personal context
         self.personal_context = self._load_personal_context()
@@ -179,7 +157,7 @@ class TrinityAIBrain:
 
     def claude_deep_analysis(self, context: Dict) -> Dict:
         """Use Claude Opus 4.5 for deep strategic analysis."""
-        if not self.claude:
+        if not self.gateway.available("deep"):
             return {'error': 'Claude not available'}
 
         prompt = f"""You are Trinity AI Brain, a super-intelligent system analyzing the entire Trinity ecosystem.
@@ -237,14 +215,10 @@ Respond in JSON format:
 }}"""
 
         try:
-            response = self.claude.messages.create(
-                model=self.claude_model,
-                max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            response = self.gateway.generate(prompt, route="deep", max_tokens=4096)
 
             # Parse response
-            content = response.content[0].text
+            content = response.text
 
             # Try to extract JSON
             if '{' in content:
@@ -263,7 +237,7 @@ Respond in JSON format:
 
     def claude_prompt_optimizer(self, original_prompt: str, context: Dict) -> str:
         """Use Claude to improve user prompts."""
-        if not self.claude:
+        if not self.gateway.available("deep"):
             return original_prompt
 
         optimization_prompt = f"""You are a prompt engineering expert. Analyze this prompt and improve it.
@@ -284,13 +258,9 @@ Rewrite this prompt to be:
 Return only the improved prompt, no explanation."""
 
         try:
-            response = self.claude.messages.create(
-                model=self.claude_model,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": optimization_prompt}]
-            )
+            response = self.gateway.generate(optimization_prompt, route="deep", max_tokens=1024)
 
-            improved = response.content[0].text.strip()
+            improved = response.text.strip()
             log.info("Prompt optimized by Claude")
             return improved
 
@@ -304,7 +274,7 @@ Return only the improved prompt, no explanation."""
 
     def gemini_financial_analysis(self, context: Dict) -> Dict:
         """Use Gemini 1.5 Pro for financial strategy analysis."""
-        if not self.gemini:
+        if not self.gateway.available("analysis"):
             return {'error': 'Gemini not available'}
 
         prompt = f"""You are Trinity AI's financial strategist. Analyze the financial plan.
@@ -338,7 +308,7 @@ Respond in JSON:
 }}"""
 
         try:
-            response = self.gemini.generate_content(prompt)
+            response = self.gateway.generate(prompt, route="analysis")
             content = response.text
 
             # Parse JSON
@@ -358,7 +328,7 @@ Respond in JSON:
 
     def gemini_trading_analysis(self, context: Dict) -> Dict:
         """Use Gemini to analyze Phoenix trading logic."""
-        if not self.gemini:
+        if not self.gateway.available("analysis"):
             return {'error': 'Gemini not available'}
 
         prompt = f"""You are Trinity AI's trading analyst. Analyze Phoenix bot performance.
@@ -390,7 +360,7 @@ Respond in JSON:
 }}"""
 
         try:
-            response = self.gemini.generate_content(prompt)
+            response = self.gateway.generate(prompt, route="analysis")
             content = response.text
 
             if '{' in content:
@@ -491,19 +461,19 @@ Respond in JSON:
         # Get current context
         conn = sqlite3.connect(DB_FILE)
         c = conn.cursor()
-
-        # Latest metrics
-        c.execute('SELECT * FROM account_snapshots ORDER BY id DESC LIMIT 1')
-        account = c.fetchone()
-
-        c.execute('SELECT COUNT(*) FROM phoenix_trades WHERE timestamp > datetime("now", "-7 days")')
+        c.execute('SELECT COUNT(*) FROM phoenix_trades WHERE timestamp > ?',
+                  ((datetime.now() - timedelta(days=7)).isoformat(),))
         recent_trades = c.fetchone()[0]
-
         conn.close()
 
+        # Latest metrics
+        store = get_store(DB_FILE)
+        equity = store.latest("account.equity")
+        daily_pnl = store.latest("account.daily_pnl")
+
         context = {
-            'equity': account[2] if account else 100000,
-            'daily_pnl': account[6] if account else 0,
+            'equity': equity[1] if equity else 100000,
+            'daily_pnl': daily_pnl[1] if daily_pnl else 0,
             'phoenix_status': 'RUNNING',
             'recent_trades': recent_trades,
             'timestamp': datetime.now().isoformat()
@@ -642,12 +612,9 @@ class ContinuousLearningEngine:
 
         # Check database
         try:
-            conn = sqlite3.connect(DB_FILE)
-            c = conn.cursor()
-            c.execute('SELECT COUNT(*) FROM system_metrics')
-            count = c.fetchone()[0]
-            conn.close()
-            log.info(f"Database health: {count} metrics recorded")
+            stats = get_store(DB_FILE).stats()
+            log.info(f"Database health: {stats['ts_points']} metric samples, "
+                     f"{stats['ts_series']} series recorded")
         except Exception as e:
             log.error(f"Database check failed: {e}")
 
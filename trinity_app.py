@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Trinity App
+
+One Streamlit process serving every Command Center layout:
+- v1 (command_center), v2.0 (command_center_v2) and v2.1 (trinity_v3)
+  are pages of a single st.navigation app
+- All three are thin layouts over the shared station library, so the
+  process loads stations.py / station_data.py, the lazily imported SDKs
+  and the metrics sampler once, and shares the cached status checks
+- Session state carries across layouts (VR mode, chat history,
+  checklists); each layout keeps its own navigation key
+
+Usage:
+    streamlit run trinity_app.py --server.port 8502
+    # http://localhost:8502/  /command_center_v2  /trinity_v3
+"""
+
+import streamlit as st
+
+import command_center
+import command_center_v2
+import trinity_v3
+
+
+def build_pages():
+    return [
+        st.Page(command_center.main, title="Command Center", icon="🎯",
+                url_path="command_center", default=True),
+        st.Page(command_center_v2.main, title="Command Center v2.0", icon="🚀",
+                url_path="command_center_v2"),
+        st.Page(trinity_v3.main, title="Trinity v2.1", icon="🍎", url_path="trinity_v3"),
+    ]
+
+
+def main():
+    """Run the selected layout (top navigation; each layout owns its sidebar)."""
+    st.navigation(build_pages(), position="top").run()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ Features:
 - Auto-syncs Phoenix trading data
 - Monitors financial accounts (Alpaca)
 - Tracks task completion
-- Integrates Gemini 2.0 Flash for Trinity AI
+- Integrates Gemini 2.0 Flash for Trinity AI (insights only when metrics move)
 - Updates Command Center database in real-time
 - No human interaction needed - fully autonomous
 
@@ -26,8 +26,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
 
-# Gemini AI integration
-import google.generativeai as genai
+# Gemini AI integration (via the shared LLM gateway)
+from llm_gateway import get_gateway
+from insight_trigger import InsightTrigger
+from timeseries import get_store
 
 # Alpaca for trading data
 from alpaca.trading.client import TradingClient
@@ -53,7 +55,6 @@ PHOENIX_CHECK_INTERVAL = 30  # Check Phoenix every 30 seconds
 ALPACA_SYNC_INTERVAL = 300  # Sync Alpaca every 5 minutes
 
 # API Configuration
-GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
 ALPACA_API_KEY = os.getenv("APCA_API_KEY_ID")
 ALPACA_SECRET = os.getenv("APCA_API_SECRET_KEY")
 ALPACA_BASE_URL = os.getenv("APCA_API_BASE_URL", "https://paper-api.alpaca.markets")
@@ -152,8 +153,16 @@ def init_database():
         )
     ''')
 
+    c.execute('CREATE INDEX IF NOT EXISTS idx_phoenix_trades_timestamp ON phoenix_trades(timestamp)')
+
     conn.commit()
     conn.close()
+
+    # Metric history lives in the time-series tables; account_snapshots /
+    # system_metrics rows from older versions are imported once
+    imported = get_store(DB_FILE).import_legacy()
+    if imported:
+        log.info(f"Imported {imported} legacy metric rows into time series")
     log.info("Database initialized")
 
 # ============================================================================
@@ -265,17 +274,16 @@ class TrinityAI:
     """Gemini-powered Trinity AI for autonomous updates."""
 
     def __init__(self):
-        if GEMINI_API_KEY:
-            genai.configure(api_key=GEMINI_API_KEY)
-            # Use stable Gemini Pro model
-            self.model = genai.GenerativeModel('gemini-pro')
-        else:
-            self.model = None
+        # Cheapest "background" route; during an outage its breaker stops
+        # these periodic calls instead of timing out every cycle
+        self.gateway = get_gateway()
+        self.available = self.gateway.available("background")
+        if not self.available:
             log.warning("Gemini API key not found")
 
-    def analyze_system_state(self, context: Dict) -> str:
-        """Analyze current system state and provide insights."""
-        if not self.model:
+    def analyze_system_state(self, context: Dict) -> Optional[str]:
+        """Analyze current system state and provide insights (None on failure)."""
+        if not self.available:
             return "Trinity AI offline - API key not configured"
 
         prompt = f"""
@@ -294,18 +302,18 @@ Be concise and actionable.
 """
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self.gateway.generate(prompt, route="background")
             return response.text
         except Exception as e:
             # Log only once, don't spam
             if not hasattr(self, '_ai_error_logged'):
                 log.warning(f"Trinity AI unavailable: {str(e)[:100]}")
                 self._ai_error_logged = True
-            return "Trinity AI temporarily unavailable"
+            return None
 
     def generate_daily_summary(self, data: Dict) -> str:
         """Generate daily summary report."""
-        if not self.model:
+        if not self.available:
             return "Trinity AI offline"
 
         prompt = f"""
@@ -324,7 +332,7 @@ Keep it under 200 words.
 """
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self.gateway.generate(prompt, route="background")
             return response.text
         except Exception as e:
             return f"Summary generation error: {str(e)}"
@@ -340,9 +348,11 @@ class TrinityAutoSync:
         self.phoenix = PhoenixMonitor()
         self.alpaca = AlpacaSync()
         self.trinity_ai = TrinityAI()
+        self.insight_trigger = InsightTrigger()
         self.last_phoenix_check = 0
         self.last_alpaca_sync = 0
         self.db = DB_FILE
+        self.store = get_store(DB_FILE)
 
     def run(self):
         """Main sync loop."""
@@ -380,16 +390,7 @@ class TrinityAutoSync:
     def sync_phoenix(self):
         """Sync Phoenix data."""
         status = self.phoenix.get_status()
-
-        # Update system metrics
-        conn = sqlite3.connect(self.db)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO system_metrics (timestamp, metric_name, metric_value)
-            VALUES (?, ?, ?)
-        ''', (datetime.now().isoformat(), 'phoenix_status', json.dumps(status)))
-        conn.commit()
-        conn.close()
+        self.store.write("phoenix.running", 1.0 if status['running'] else 0.0)
 
         log.info(f"Phoenix sync: {status['running'] and 'RUNNING' or 'OFFLINE'}")
 
@@ -399,23 +400,12 @@ class TrinityAutoSync:
         if not snapshot:
             return
 
-        # Save to database
-        conn = sqlite3.connect(self.db)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO account_snapshots (timestamp, equity, cash, buying_power, mode, daily_pnl, total_pnl)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            snapshot['timestamp'],
-            snapshot['equity'],
-            snapshot['cash'],
-            snapshot['buying_power'],
-            snapshot['mode'],
-            snapshot['daily_pnl'],
-            snapshot['total_pnl']
-        ))
-        conn.commit()
-        conn.close()
+        # Save to time series (and drop raw samples past retention; rollups stay)
+        self.store.write_values({
+            f"account.{field}": snapshot[field]
+            for field in ('equity', 'cash', 'buying_power', 'daily_pnl', 'total_pnl')
+        })
+        self.store.prune()
 
         log.info(f"Alpaca sync: Equity ${snapshot['equity']:,.2f}, P&L ${snapshot['daily_pnl']:+,.2f}")
 
@@ -424,40 +414,42 @@ class TrinityAutoSync:
         # Get context
         context = self._get_context()
 
+        # Only ask for a new insight when key metrics moved (or the floor
+        # interval passed); the previous insight still describes the state
+        reason = self.insight_trigger.check(context)
+        if not reason:
+            return
+
         # Generate Trinity AI insight
         insight = self.trinity_ai.analyze_system_state(context)
+        if insight is None:
+            return  # Retried next tick (the gateway breaker keeps outages cheap)
+        self.insight_trigger.record(context)
+        log.info(f"Trinity insight refreshed ({reason})")
 
         # Save insight
-        conn = sqlite3.connect(self.db)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO system_metrics (timestamp, metric_name, metric_value)
-            VALUES (?, ?, ?)
-        ''', (datetime.now().isoformat(), 'trinity_insight', insight))
-        conn.commit()
-        conn.close()
+        self.store.write_text("trinity.insight", insight)
 
     def _get_context(self) -> Dict:
         """Get current system context."""
+        # Get recent trades count (timestamps are isoformat() text)
         conn = sqlite3.connect(self.db)
         c = conn.cursor()
-
-        # Get latest account snapshot
-        c.execute('SELECT * FROM account_snapshots ORDER BY id DESC LIMIT 1')
-        account = c.fetchone()
-
-        # Get recent trades count
-        c.execute('SELECT COUNT(*) FROM phoenix_trades WHERE timestamp > datetime("now", "-1 day")')
+        c.execute('SELECT COUNT(*) FROM phoenix_trades WHERE timestamp > ?',
+                  ((datetime.now() - timedelta(days=1)).isoformat(),))
         recent_trades = c.fetchone()[0]
-
         conn.close()
 
+        # Latest account snapshot
+        equity = self.store.latest("account.equity")
+        daily_pnl = self.store.latest("account.daily_pnl")
+
         phoenix_status = self.phoenix.get_status()
 
         return {
             'phoenix_status': phoenix_status['running'] and 'RUNNING' or 'OFFLINE',
-            'equity': account[2] if account else 100000,
-            'daily_pnl': account[6] if account else 0,
+            'equity': equity[1] if equity else 100000,
+            'daily_pnl': daily_pnl[1] if daily_pnl else 0,
             'positions': 0,  # TODO: Get from Alpaca
             'recent_trades': recent_trades,
             'tasks_completed': 0  # TODO: Get from tasks table
@@ -19,11 +19,12 @@ def start_streamlit_subprocess():
     """Start Streamlit as a subprocess."""
     global STREAMLIT_PROCESS
 
-    command_center_py = Path(__file__).parent / "command_center.py"
+    # One process serves every Command Center layout (see trinity_app.py)
+    trinity_app_py = Path(__file__).parent / "trinity_app.py"
 
     STREAMLIT_PROCESS = subprocess.Popen([
         "streamlit", "run",
-        str(command_center_py),
+        str(trinity_app_py),
         "--server.port", str(STREAMLIT_PORT),
         "--server.address", "0.0.0.0",
         "--server.headless", "true",
@@ -101,7 +101,7 @@ start_all() {
     # Command Center
     if ! lsof -i :8502 > /dev/null 2>&1; then
         echo -e "${YELLOW}Starting Command Center...${NC}"
-        streamlit run command_center.py --server.port 8502 --server.headless true --browser.gatherUsageStats false > /dev/null 2>&1 &
+        streamlit run trinity_app.py --server.port 8502 --server.headless true --browser.gatherUsageStats false > /dev/null 2>&1 &
         sleep 3
         echo -e "${GREEN}✅ Command Center started${NC}"
     else
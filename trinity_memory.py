@@ -65,6 +65,7 @@ class TrinityMemory:
         """Initialize Trinity Memory system."""
         self.db_path = db_path
         self.conn = None
+        self._profile_writes = 0  # Bumped by profile/preference writes
         self._initialize_database()
 
     def _initialize_database(self):
@@ -191,6 +192,7 @@ class TrinityMemory:
             VALUES (?, ?, ?, CURRENT_TIMESTAMP)
         """, (key, json.dumps(value), category))
         self.conn.commit()
+        self._profile_writes += 1
 
     def get_profile(self, key: str = None) -> Dict:
         """Get user profile attribute(s)."""
@@ -215,6 +217,16 @@ class TrinityMemory:
             }
         return dict(profile)
 
+    def profile_version(self) -> Tuple[int, int]:
+        """
+        Cheap change token for user_profile/preferences.
+
+        Changes on this instance's profile/preference writes and on commits
+        from other connections (PRAGMA data_version), without reading rows.
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self._profile_writes, data_version)
+
     # ========================================================================
     # PREFERENCE LEARNING
     # ========================================================================
@@ -232,6 +244,7 @@ class TrinityMemory:
                 reinforcement_count = reinforcement_count + 1
         """, (station, category, key, json.dumps(value), confidence))
         self.conn.commit()
+        self._profile_writes += 1
 
     def get_preference(self, station: str, category: str, key: str = None) -> Any:
         """Retrieve learned preference(s)."""
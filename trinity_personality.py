@@ -76,29 +76,27 @@ CURRENT CONTEXT:
 You are their most trusted advisor. Make them successful.
 """
 
-def get_trinity_response(user_message: str, context: dict) -> str:
+def stream_trinity_response(user_message: str, context: dict):
     """
-    Generate Trinity's response with personality.
+    Stream Trinity's response with personality as it is generated.
 
     Args:
         user_message: User's question or command
         context: Dict with system state (burn_rate, phoenix_status, etc.)
 
-    Returns:
-        Trinity's personalized response
+    Yields:
+        Chunks of Trinity's personalized response
     """
-    import google.generativeai as genai
-    import os
-
-    api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return "⚠️ Trinity AI offline - API key not configured."
+    from llm_gateway import get_gateway
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-2.0-flash-exp')
+    gateway = get_gateway()
+    if not gateway.available("chat"):
+        yield "⚠️ Trinity AI offline - API key not configured."
+        return
 
-    # Build context-aware prompt
-    system_context = f"""
+    # The personality is a fixed system instruction (shared client, cacheable
+    # prefix); only the live state and message vary per request
+    prompt = f"""
 CURRENT SYSTEM STATE:
 - Burn Rate: ${context.get('burn_rate', -635)}/month
 - Phoenix AGRO: {'🟢 Active' if context.get('phoenix_running') else '🔴 Offline'}
@@ -106,18 +104,28 @@ CURRENT SYSTEM STATE:
 - Quick Cash: {context.get('quick_cash_ready', 3)}/3 services ready
 - Trading Capital: ${context.get('trading_capital', 40000):,}
 
-{TRINITY_PERSONALITY}
-
 USER MESSAGE: {user_message}
 
 Respond as Trinity - professional, strategic, with personality.
 """
 
     try:
-        response = model.generate_content(system_context)
-        return response.text
+        yield from gateway.stream(prompt, route="chat", system=TRINITY_PERSONALITY)
     except Exception as e:
-        return f"Trinity AI error: {str(e)}"
+        yield f"Trinity AI error: {str(e)}"
+
+def get_trinity_response(user_message: str, context: dict) -> str:
+    """
+    Generate Trinity's response with personality.
+
+    Args:
+        user_message: User's question or command
+        context: Dict with system state (burn_rate, phoenix_status, etc.)
+
+    Returns:
+        Trinity's personalized response
+    """
+    return "".join(stream_trinity_response(user_message, context))
 
 def get_trinity_avatar() -> str:
     """Return Trinity avatar SVG (EVE from Wall-E inspired - sleek AI companion)."""
@@ -9,13 +9,18 @@ Routing Logic:
 - Voice output → AVA (edge-tts) for speech
 """
 
-import os
 import sys
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
+from typing import Iterator, Tuple
 from dotenv import load_dotenv
 
+from llm_gateway import get_gateway
+
+JOB_KEYWORDS = ["job", "resume", "apply", "cover letter", "application"]
+
 # Load environment
 load_dotenv()
 
@@ -30,23 +35,14 @@ class TrinityRouter:
     def __init__(self):
         print("🔵 Initializing Trinity System...")
 
-        # 1. NEXUS (Gemini): The Analyst & Memory
-        try:
-            from google import genai
-            self.nexus_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-            print("  ✅ NEXUS (Gemini) online")
-        except Exception as e:
-            print(f"  ❌ NEXUS failed: {e}")
-            self.nexus_client = None
-
-        # 2. JARVIS (Claude): The Architect & Writer
-        try:
-            from anthropic import Anthropic
-            self.jarvis_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-            print("  ✅ JARVIS (Claude) online")
-        except Exception as e:
-            print(f"  ❌ JARVIS failed: {e}")
-            self.jarvis_client = None
+        # 1. NEXUS (Gemini) and 2. JARVIS (Claude) share the LLM gateway,
+        # which fails over between them when one is down
+        self.gateway = get_gateway()
+        for name, provider in (("NEXUS", "gemini"), ("JARVIS", "claude")):
+            if self.gateway.has_provider(provider):
+                print(f"  ✅ {name} ({provider.title()}) online")
+            else:
+                print(f"  ❌ {name} ({provider.title()}) not configured")
 
         # 3. AVA (Voice): The Interface
         try:
@@ -57,8 +53,15 @@ class TrinityRouter:
             print("  ⚠️  AVA (Voice) not available - using fallback")
             self.ava_speak = self._fallback_speak
 
+        # Token usage of this thread's most recent NEXUS/JARVIS call
+        self._usage = threading.local()
+
         print("🟢 Trinity System online\n")
 
+    def last_usage(self) -> dict:
+        """Token counts of the calling thread's last LLM call"""
+        return getattr(self._usage, "tokens", {"tokens_in": None, "tokens_out": None})
+
     def _fallback_speak(self, text, blocking=True):
         """Fallback TTS using macOS say command"""
         try:
@@ -84,12 +87,7 @@ class TrinityRouter:
         """
         print(f"\n⚡ Command Received: {user_input[:100]}...")
 
-        # Detect mode if auto
-        if mode == "auto":
-            if any(word in user_input.lower() for word in ["job", "resume", "apply", "cover letter", "application"]):
-                mode = "job"
-            else:
-                mode = "chat"
+        mode = self._detect_mode(user_input, mode)
 
         # JOB SNIPER MODE
         if mode == "job":
@@ -127,34 +125,80 @@ class TrinityRouter:
                 "source": "JARVIS (Claude)"
             }
 
-    def ask_nexus(self, prompt: str) -> str:
-        """Query NEXUS (Gemini) for analysis"""
-        if not self.nexus_client:
-            return "NEXUS unavailable"
+    @staticmethod
+    def _detect_mode(user_input: str, mode: str) -> str:
+        """Resolve "auto" to "job" or "chat" by keyword"""
+        if mode != "auto":
+            return mode
+        if any(word in user_input.lower() for word in JOB_KEYWORDS):
+            return "job"
+        return "chat"
+
+    def stream_command(self, user_input: str, mode="auto") -> Tuple[str, Iterator[str]]:
+        """
+        Streaming counterpart of route_command.
 
+        Returns:
+            (source, iterator of response text chunks)
+        """
+        print(f"\n⚡ Streaming Command: {user_input[:100]}...")
+
+        if self._detect_mode(user_input, mode) == "job":
+            def job_stream():
+                # NEXUS analysis is an input to the letter; only JARVIS streams
+                analysis = self.ask_nexus(
+                    f"Analyze this job posting for stress level, work environment, and fit "
+                    f"for someone with carpentry/construction background transitioning to hospitality. "
+                    f"Job info: {user_input}"
+                )
+                yield from self.stream_jarvis(
+                    f"Based on this job analysis, write a professional cover letter "
+                    f"for Ty Brown (carpentry/construction to hospitality transition). "
+                    f"Analysis: {analysis}"
+                )
+            return "Job Sniper (NEXUS + JARVIS)", job_stream()
+
+        return "JARVIS (Claude)", self.stream_jarvis(user_input)
+
+    def _stream(self, prompt: str, route: str, max_tokens=None) -> Iterator[str]:
+        """
+        Stream ``prompt`` over ``route``, recording token usage when done.
+
+        Provider errors propagate (after any chunks already sent), so the
+        caller can tell them apart from response text - /chat/stream turns
+        them into an SSE 'error' event.
+        """
+        self._usage.tokens = {"tokens_in": None, "tokens_out": None}
+        usage = {}
         try:
-            response = self.nexus_client.models.generate_content(
-                model='models/gemini-2.5-pro',
-                contents=prompt
-            )
-            return response.text
-        except Exception as e:
-            return f"NEXUS error: {e}"
+            yield from self.gateway.stream(prompt, route=route, max_tokens=max_tokens, usage=usage)
+        finally:
+            self._usage.tokens = {"tokens_in": usage.get("tokens_in"), "tokens_out": usage.get("tokens_out")}
 
-    def ask_jarvis(self, prompt: str) -> str:
-        """Query JARVIS (Claude) for deep reasoning"""
-        if not self.jarvis_client:
-            return "JARVIS unavailable"
+    def stream_nexus(self, prompt: str) -> Iterator[str]:
+        """Stream NEXUS (Gemini) response text as it is generated"""
+        yield from self._stream(prompt, "analysis")
+
+    def stream_jarvis(self, prompt: str) -> Iterator[str]:
+        """Stream JARVIS (Claude) response text as it is generated"""
+        yield from self._stream(prompt, "writing", max_tokens=2048)
 
+    def _ask(self, name: str, prompt: str, route: str, max_tokens=None) -> str:
+        self._usage.tokens = {"tokens_in": None, "tokens_out": None}
         try:
-            message = self.jarvis_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text
+            response = self.gateway.generate(prompt, route=route, max_tokens=max_tokens)
         except Exception as e:
-            return f"JARVIS error: {e}"
+            return f"{name} error: {e}"
+        self._usage.tokens = {"tokens_in": response.tokens_in, "tokens_out": response.tokens_out}
+        return response.text
+
+    def ask_nexus(self, prompt: str) -> str:
+        """Query NEXUS (Gemini) for analysis"""
+        return self._ask("NEXUS", prompt, "analysis")
+
+    def ask_jarvis(self, prompt: str) -> str:
+        """Query JARVIS (Claude) for deep reasoning"""
+        return self._ask("JARVIS", prompt, "writing", max_tokens=2048)
 
     def speak_ava(self, text: str, blocking=False):
         """Speak text using AVA voice"""
@@ -224,8 +268,8 @@ if __name__ == "__main__":
     system = TrinityRouter()
 
     print("\n📊 System Status:")
-    print(f"  NEXUS: {'✅ Online' if system.nexus_model else '❌ Offline'}")
-    print(f"  JARVIS: {'✅ Online' if system.jarvis_client else '❌ Offline'}")
+    print(f"  NEXUS: {'✅ Online' if system.gateway.has_provider('gemini') else '❌ Offline'}")
+    print(f"  JARVIS: {'✅ Online' if system.gateway.has_provider('claude') else '❌ Offline'}")
     print(f"  AVA: ✅ Online")
 
     print("\n🧪 Testing JARVIS...")
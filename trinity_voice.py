@@ -23,6 +23,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
 
+from state_store import get_store
+
 # Try Azure Speech SDK (premium voice)
 try:
     import azure.cognitiveservices.speech as speechsdk
@@ -170,16 +172,15 @@ class TrinityVoiceSystem:
 
     def _load_config(self):
         """Load voice configuration from file."""
-        if VOICE_CONFIG.exists():
-            try:
-                with open(VOICE_CONFIG, 'r') as f:
-                    config = json.load(f)
-                    self.voice_name = config.get('voice', self.voice_name)
-                    self.voice_style = config.get('style', self.voice_style)
-                    self.current_device = config.get('device', self.current_device)
+        try:
+            config = get_store(VOICE_CONFIG).read()
+            if config:
+                self.voice_name = config.get('voice', self.voice_name)
+                self.voice_style = config.get('style', self.voice_style)
+                self.current_device = config.get('device', self.current_device)
                 logger.info(f"Loaded config from {VOICE_CONFIG}")
-            except Exception as e:
-                logger.warning(f"Failed to load config: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to load config: {e}")
 
     def _save_config(self):
         """Save voice configuration to file."""
@@ -190,8 +191,7 @@ class TrinityVoiceSystem:
                 'device': self.current_device,
                 'last_updated': datetime.now().isoformat()
             }
-            with open(VOICE_CONFIG, 'w') as f:
-                json.dump(config, f, indent=2)
+            get_store(VOICE_CONFIG).write(config)
         except Exception as e:
             logger.warning(f"Failed to save config: {e}")
 
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Trinity VR Static Asset Cache
+
+In-memory cache for files served by the VR server (HTML, JS, STL).
+- Entries are keyed by path and invalidated when mtime/size change
+- Strong ETag + Last-Modified for conditional requests (304)
+- Lazily built gzip variant for compressible (text) assets
+- Byte-bounded LRU eviction so large model folders can't exhaust RAM
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+# Cache limits
+MAX_CACHE_BYTES = 64 * 1024 * 1024   # Total bytes held in memory
+MAX_FILE_BYTES = 16 * 1024 * 1024    # Larger files are streamed from disk
+MIN_GZIP_BYTES = 512                 # Not worth compressing below this
+
+# Extra types the stdlib doesn't know about
+mimetypes.add_type('model/stl', '.stl')
+mimetypes.add_type('text/plain', '.scad')
+mimetypes.add_type('application/manifest+json', '.webmanifest')
+
+COMPRESSIBLE_TYPES = {
+    'application/javascript',
+    'application/json',
+    'application/manifest+json',
+    'image/svg+xml',
+    'model/stl',
+}
+
+
+def guess_content_type(path: Path) -> str:
+    """Guess the Content-Type for a file path."""
+    content_type, _ = mimetypes.guess_type(str(path))
+    return content_type or 'application/octet-stream'
+
+
+def is_compressible(content_type: str) -> bool:
+    """Check if a content type benefits from gzip."""
+    return content_type.startswith('text/') or content_type in COMPRESSIBLE_TYPES
+
+
+class CachedAsset:
+    """A single file snapshot held in memory."""
+
+    __slots__ = ('path', 'mtime', 'size', 'body', 'etag', 'last_modified',
+                 'content_type', '_gzip_body', '_lock')
+
+    def __init__(self, path: Path, mtime: float, body: bytes):
+        self.path = path
+        self.mtime = mtime
+        self.size = len(body)
+        self.body = body
+        self.content_type = guess_content_type(path)
+        self.etag = '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.last_modified = formatdate(int(mtime), usegmt=True)
+        self._gzip_body = None
+        self._lock = threading.Lock()
+
+    @property
+    def compressible(self) -> bool:
+        return self.size >= MIN_GZIP_BYTES and is_compressible(self.content_type)
+
+    def gzip_body(self) -> Optional[bytes]:
+        """Return the gzip variant (built once), or None if not worthwhile."""
+        if not self.compressible:
+            return None
+        with self._lock:
+            if self._gzip_body is None:
+                compressed = gzip.compress(self.body, compresslevel=6, mtime=0)
+                # Remember b'' when gzip doesn't help so we never retry
+                self._gzip_body = compressed if len(compressed) < self.size else b''
+        return self._gzip_body or None
+
+    @property
+    def memory_size(self) -> int:
+        return self.size + len(self._gzip_body or b'')
+
+    def not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """Evaluate conditional request headers (RFC 7232 precedence)."""
+        if if_none_match:
+            tags = [t.strip() for t in if_none_match.split(',')]
+            # Accept weak comparisons too (W/"..." from gzip-aware proxies)
+            return '*' in tags or any(t.removeprefix('W/') == self.etag for t in tags)
+
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(self.mtime) <= since
+
+        return False
+
+
+class StaticAssetCache:
+    """Thread-safe, mtime-validated LRU cache of static files."""
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES, max_file_bytes: int = MAX_FILE_BYTES):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self._entries: 'OrderedDict[Path, CachedAsset]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path) -> Optional[CachedAsset]:
+        """
+        Return a cached snapshot of ``path``, reloading it if it changed.
+
+        Returns None if the file is missing, not a regular file, or too
+        large to cache (callers should stream those from disk).
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            self.invalidate(path)
+            return None
+
+        if not path.is_file() or st.st_size > self.max_file_bytes:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry.mtime == st.st_mtime and entry.size == st.st_size:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+
+        try:
+            body = path.read_bytes()
+        except OSError:
+            return None
+
+        entry = CachedAsset(path, st.st_mtime, body)
+        with self._lock:
+            self.misses += 1
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            self._evict()
+        return entry
+
+    def invalidate(self, path: Path):
+        """Drop a single path from the cache."""
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self):
+        """Evict least-recently-used entries until under the byte budget."""
+        total = sum(e.memory_size for e in self._entries.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            total -= evicted.memory_size
+
+    def stats(self) -> dict:
+        """Cache statistics for /api/status."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': sum(e.memory_size for e in self._entries.values()),
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Trinity VR Server Load Test
+
+Hammers the VR server with many concurrent keep-alive clients and
+reports throughput and latency percentiles.
+
+Usage:
+    python3 vr_load_test.py                         # localhost:8503, 50 clients, 10s
+    python3 vr_load_test.py --clients 200 --duration 30
+    python3 vr_load_test.py --path / --path /api/status --gzip
+"""
+
+import argparse
+import http.client
+import statistics
+import sys
+import threading
+import time
+from typing import Dict, List
+
+DEFAULT_PATHS = ['/vr', '/api/status', '/api/models']
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already-sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def client_worker(host: str, port: int, paths: List[str], headers: Dict[str, str],
+                  deadline: float, results: Dict, lock: threading.Lock):
+    """Issue requests over one persistent connection until the deadline."""
+    latencies = []
+    errors = 0
+    status_counts: Dict[int, int] = {}
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    i = 0
+
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            status_counts[response.status] = status_counts.get(response.status, 0) + 1
+            if response.will_close:
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=10)
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=10)
+
+    conn.close()
+
+    with lock:
+        results['latencies'].extend(latencies)
+        results['errors'] += errors
+        for status, count in status_counts.items():
+            results['status'][status] = results['status'].get(status, 0) + count
+
+
+def run_load_test(host: str, port: int, clients: int, duration: float,
+                  paths: List[str], gzip: bool = False) -> Dict:
+    """Run the load test and return summary statistics."""
+    headers = {'Connection': 'keep-alive'}
+    if gzip:
+        headers['Accept-Encoding'] = 'gzip'
+
+    results = {'latencies': [], 'errors': 0, 'status': {}}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    threads = [
+        threading.Thread(target=client_worker,
+                         args=(host, port, paths, headers, deadline, results, lock),
+                         daemon=True)
+        for _ in range(clients)
+    ]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(results['latencies'])
+    total = len(latencies)
+    return {
+        'clients': clients,
+        'duration': elapsed,
+        'requests': total,
+        'errors': results['errors'],
+        'status': results['status'],
+        'rps': total / elapsed if elapsed else 0.0,
+        'mean_ms': statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0
+    }
+
+
+def main():
+    """Parse arguments and print a load test report."""
+    parser = argparse.ArgumentParser(description='Trinity VR server load test')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8503)
+    parser.add_argument('--clients', type=int, default=50, help='Concurrent keep-alive clients')
+    parser.add_argument('--duration', type=float, default=10.0, help='Test duration in seconds')
+    parser.add_argument('--path', action='append', dest='paths',
+                        help='Path to request (repeatable, default: /vr /api/status /api/models)')
+    parser.add_argument('--gzip', action='store_true', help='Send Accept-Encoding: gzip')
+    args = parser.parse_args()
+
+    paths = args.paths or DEFAULT_PATHS
+
+    print("=" * 60)
+    print("  TRINITY VR SERVER LOAD TEST")
+    print("=" * 60)
+    print(f"  Target:   http://{args.host}:{args.port}")
+    print(f"  Paths:    {', '.join(paths)}")
+    print(f"  Clients:  {args.clients}")
+    print(f"  Duration: {args.duration:.0f}s")
+    print()
+
+    summary = run_load_test(args.host, args.port, args.clients, args.duration,
+                            paths, gzip=args.gzip)
+
+    print(f"  Requests:     {summary['requests']}")
+    print(f"  Errors:       {summary['errors']}")
+    print(f"  Status codes: {summary['status']}")
+    print(f"  Throughput:   {summary['rps']:.1f} req/s")
+    print(f"  Latency mean: {summary['mean_ms']:.2f} ms")
+    print(f"  Latency p50:  {summary['p50_ms']:.2f} ms")
+    print(f"  Latency p95:  {summary['p95_ms']:.2f} ms")
+    print(f"  Latency p99:  {summary['p99_ms']:.2f} ms")
+    print(f"  Latency max:  {summary['max_ms']:.2f} ms")
+    print("=" * 60)
+
+    return 0 if summary['requests'] and not summary['errors'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
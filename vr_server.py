@@ -11,20 +11,36 @@ VR Server for Trinity Engineering Station
 - Integrates with Trinity CAD generation
 - Supports Oculus Quest 1 via USB-C
 - Real-time model loading and manipulation
+- Threaded HTTP/1.1 keep-alive server with cached static assets
+- Range/streamed delivery of binary (and gzip'd) STL models
+- Decimated level-of-detail variants listed in /api/models
+- Indexed model catalog with pagination/sorting for /api/models
+- Server-Sent Events push for clipboard changes (/api/clipboard/stream)
+- Request counter and per-route latency histogram on /metrics
 """
 
 import os
+import gzip
 import json
+import socket
 import time
 import logging
-import hashlib
 import sys
+import threading
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
 from datetime import datetime
+from email.utils import formatdate
+from typing import Dict, Optional
 import subprocess
 
+from vr_asset_cache import StaticAssetCache, MIN_GZIP_BYTES
+from stl_tools import binary_variant, gzip_variant
+from model_catalog import MAX_PAGE_SIZE, get_catalog, ModelCatalog
+from clipboard_sync import ClipboardBroadcaster, SYNC_FILE
+from instrumentation import CONTENT_TYPE, counter, gauge, histogram, render
+
 # Import Trinity Voice System
 try:
     from trinity_voice import TrinityVoiceSystem
@@ -37,8 +53,16 @@ except ImportError:
 VR_PORT = 8503
 BASE_DIR = Path(__file__).parent
 CAD_OUTPUT_DIR = BASE_DIR / "cad_output"
+MODEL_CACHE_DIR = CAD_OUTPUT_DIR / ".cache"  # Binary/gzip variants of served models
+LOD_DIR = CAD_OUTPUT_DIR / "lod"  # Decimated level-of-detail variants
 VR_WORKSPACE_FILE = BASE_DIR / "vr_workspace_wireless.html"
 LOG_DIR = BASE_DIR / "logs"
+KEEPALIVE_TIMEOUT = 30  # Idle keep-alive connections are closed after this many seconds
+NETWORK_REFRESH_INTERVAL = 60  # Re-resolve Tailscale/local IPs every minute
+MODELS_POLL_INTERVAL = 2  # Check cad_output for changes every 2 seconds
+STREAM_CHUNK_SIZE = 256 * 1024  # Model bytes sent per write
+SSE_KEEPALIVE_INTERVAL = 15  # Comment ping for idle clipboard streams (< KEEPALIVE_TIMEOUT)
+SSE_INLINE_LIMIT = 64 * 1024  # Larger clipboard payloads are fetched (gzip'd) on demand
 
 # Ensure directories exist
 CAD_OUTPUT_DIR.mkdir(exist_ok=True)
@@ -57,92 +81,424 @@ logger = logging.getLogger(__name__)
 
 # Server stats
 SERVER_START_TIME = time.time()
-REQUEST_COUNT = 0
 ACTIVE_CONNECTIONS = 0
+SSE_CLIENTS = 0
+STATS_LOCK = threading.Lock()
+
+# Shared in-memory cache for HTML/JS/STL assets
+ASSET_CACHE = StaticAssetCache()
+
+# Pushes clipboard sync file changes to SSE clients (the file is first read in start())
+CLIPBOARD_BROADCASTER = ClipboardBroadcaster(SYNC_FILE)
+
+# Exported on /metrics
+REQUESTS = counter("trinity_vr_requests_total", "GET/POST requests handled since start")
+REQUEST_SECONDS = histogram("trinity_vr_request_seconds", "VR server request latency")
+# Routes labelled by path; anything else collapses to one label (bounded cardinality)
+METRIC_ROUTES = {'/', '/vr', '/api/status', '/metrics', '/api/models', '/api/clipboard',
+                 '/api/generate_cad', '/api/speak'}
+STREAM_ROUTES = {'/api/clipboard/stream'}  # Long-lived: latency would only measure the session
+gauge("trinity_vr_active_connections", "Open client connections", callback=lambda: ACTIVE_CONNECTIONS)
+gauge("trinity_vr_clipboard_stream_clients", "Connected clipboard SSE clients",
+      callback=lambda: SSE_CLIENTS)
 
 class TrinityVRHandler(SimpleHTTPRequestHandler):
     """Custom HTTP handler for Trinity VR Workspace."""
 
+    # HTTP/1.1 keeps Quest connections alive between asset/API requests.
+    # Every response must therefore carry a Content-Length.
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEPALIVE_TIMEOUT
+
     def __init__(self, *args, **kwargs):
         # Set the directory to serve from
         super().__init__(*args, directory=str(BASE_DIR), **kwargs)
 
+    def setup(self):
+        """Track open client connections."""
+        global ACTIVE_CONNECTIONS
+        super().setup()
+        with STATS_LOCK:
+            ACTIVE_CONNECTIONS += 1
+
+    def finish(self):
+        """Release connection tracking."""
+        global ACTIVE_CONNECTIONS
+        with STATS_LOCK:
+            ACTIVE_CONNECTIONS -= 1
+        super().finish()
+
+    def handle_one_request(self):
+        """Handle one request and record its latency by method/route/status."""
+        self._status = None
+        start = time.perf_counter()
+        try:
+            super().handle_one_request()
+        finally:
+            if self._status is not None:
+                path = urlparse(self.path).path
+                if path not in STREAM_ROUTES:
+                    REQUEST_SECONDS.observe(time.perf_counter() - start, method=self.command,
+                                            route=_route_label(path), status=str(self._status))
+
+    def send_response(self, code, message=None):
+        """Remember the status for the latency histogram."""
+        self._status = code
+        super().send_response(code, message)
+
+    def _send_json(self, payload, status: int = 200, headers: Optional[Dict] = None):
+        """Send a JSON response with an explicit Content-Length (gzip'd when large)."""
+        body = json.dumps(payload).encode()
+        compressed = (len(body) >= MIN_GZIP_BYTES
+                      and 'gzip' in self.headers.get('Accept-Encoding', ''))
+        if compressed:
+            body = gzip.compress(body, compresslevel=6)
+
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_asset(self, file_path: Path, head_only: bool = False) -> bool:
+        """
+        Serve a file from the in-memory asset cache.
+
+        Handles ETag/Last-Modified revalidation (304) and gzip for text
+        assets. Returns False if the file can't be cached (missing,
+        directory or too large) so the caller can fall back to disk.
+        """
+        asset = ASSET_CACHE.get(file_path)
+        if asset is None:
+            return False
+
+        if asset.not_modified(self.headers.get('If-None-Match'),
+                              self.headers.get('If-Modified-Since')):
+            self.send_response(304)
+            self.send_header('ETag', asset.etag)
+            self.send_header('Last-Modified', asset.last_modified)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return True
+
+        body = asset.body
+        encoding = None
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            gzipped = asset.gzip_body()
+            if gzipped:
+                body, encoding = gzipped, 'gzip'
+
+        self.send_response(200)
+        self.send_header('Content-type', asset.content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', asset.etag)
+        self.send_header('Last-Modified', asset.last_modified)
+        self.send_header('Cache-Control', 'no-cache')
+        if asset.compressible:
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+
+        if not head_only:
+            self.wfile.write(body)
+        return True
+
+    def _parse_range(self, size: int):
+        """
+        Parse a single-range ``Range: bytes=...`` header.
+
+        Returns (start, end) inclusive, None for a full response, or
+        False if the range can't be satisfied.
+        """
+        header = self.headers.get('Range')
+        if not header or not header.startswith('bytes=') or ',' in header:
+            return None
+
+        start_str, _, end_str = header[6:].strip().partition('-')
+        try:
+            if start_str:
+                start = int(start_str)
+                end = int(end_str) if end_str else size - 1
+            else:
+                # Suffix range: last N bytes
+                length = int(end_str)
+                if length <= 0:
+                    return False
+                start = max(0, size - length)
+                end = size - 1
+        except ValueError:
+            return None
+
+        if start >= size or start > end:
+            return False
+        return start, min(end, size - 1)
+
+    def _serve_model(self, stl_path: Path, head_only: bool = False):
+        """
+        Stream an STL model with Range and gzip support.
+
+        ASCII models are delivered as (cached) binary STL. Full responses
+        to gzip-capable clients use a cached .gz variant; range requests
+        always address the uncompressed binary bytes so the Quest can
+        resume or fetch models progressively.
+        """
+        try:
+            file_path = binary_variant(stl_path, MODEL_CACHE_DIR)
+        except (OSError, ValueError) as e:
+            logger.error(f"Model conversion error: {e}")
+            self.send_error(500, 'Model conversion failed')
+            return
+
+        st = file_path.stat()
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        gzip_etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}-gz"'
+        last_modified = formatdate(int(st.st_mtime), usegmt=True)
+
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match in (etag, gzip_etag):
+            self.send_response(304)
+            self.send_header('ETag', if_none_match)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        byte_range = self._parse_range(st.st_size)
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range not in (etag, last_modified):
+            byte_range = None  # Model changed since the client's first chunk
+
+        if byte_range is False:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{st.st_size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        encoding = None
+        if byte_range:
+            start, end = byte_range
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{st.st_size}')
+        else:
+            start, end = 0, st.st_size - 1
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                file_path = gzip_variant(file_path, MODEL_CACHE_DIR)
+                end = file_path.stat().st_size - 1
+                encoding = 'gzip'
+                etag = gzip_etag
+            self.send_response(200)
+
+        length = end - start + 1
+        self.send_header('Content-type', 'model/stl')
+        self.send_header('Content-Length', str(length))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+
+        if head_only:
+            return
+
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = f.read(min(STREAM_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def _model_path(self, url_path: str) -> Optional[Path]:
+        """Map /cad_output/<name>.stl to a model file, or None."""
+        if not (url_path.startswith('/cad_output/') and url_path.endswith('.stl')):
+            return None
+        file_path = Path(self.translate_path(url_path))
+        if file_path.parent.resolve() not in (CAD_OUTPUT_DIR.resolve(), LOD_DIR.resolve()):
+            return None
+        if not file_path.is_file():
+            return None
+        return file_path
+
+    def _send_clipboard_event(self, data: Dict):
+        """Write one SSE clipboard event (large content is fetched separately)."""
+        content = data.get('content', '')
+        event = {
+            'hash': data.get('hash', ''),
+            'source': data.get('source', 'none'),
+            'timestamp': data.get('timestamp', ''),
+            'length': len(content)
+        }
+        if len(content) <= SSE_INLINE_LIMIT:
+            event['content'] = content
+        else:
+            # Keep the stream light; clients GET /api/clipboard (gzip'd)
+            event['content'] = None
+            event['preview'] = content[:200]
+            event['url'] = f"/api/clipboard?hash={event['hash']}"
+
+        message = f"id: {event['hash']}\nevent: clipboard\ndata: {json.dumps(event)}\n\n"
+        self.wfile.write(message.encode())
+
+    def _stream_clipboard(self):
+        """
+        Hold the connection open and push clipboard changes as they happen.
+
+        Events are deduplicated by content hash; a reconnecting client's
+        Last-Event-ID suppresses resending content it already has.
+        """
+        global SSE_CLIENTS
+        CLIPBOARD_BROADCASTER.start()
+
+        # Stream has no length, so the connection ends with the response
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+
+        last_hash = self.headers.get('Last-Event-ID', '')
+        with STATS_LOCK:
+            SSE_CLIENTS += 1
+        try:
+            self.wfile.write(b'retry: 3000\n\n')
+            data = CLIPBOARD_BROADCASTER.current()
+            while True:
+                if data is not None and data.get('hash') != last_hash:
+                    self._send_clipboard_event(data)
+                    last_hash = data.get('hash')
+                else:
+                    self.wfile.write(b': keepalive\n\n')
+                self.wfile.flush()
+                data = CLIPBOARD_BROADCASTER.wait_for_change(last_hash, SSE_KEEPALIVE_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError, socket.timeout):
+            pass  # Client went away
+        finally:
+            with STATS_LOCK:
+                SSE_CLIENTS -= 1
+
+    def do_HEAD(self):
+        """Handle HEAD requests for static assets."""
+        parsed_path = urlparse(self.path)
+        model_path = self._model_path(parsed_path.path)
+        if model_path:
+            self._serve_model(model_path, head_only=True)
+            return
+
+        if parsed_path.path in ('/', '/vr'):
+            file_path = VR_WORKSPACE_FILE
+        else:
+            file_path = Path(self.translate_path(parsed_path.path))
+
+        if not self._serve_asset(file_path, head_only=True):
+            super().do_HEAD()
+
     def do_GET(self):
         """Handle GET requests."""
-        global REQUEST_COUNT
-        REQUEST_COUNT += 1
+        REQUESTS.inc()
 
         parsed_path = urlparse(self.path)
         logger.info(f"GET {parsed_path.path} from {self.client_address[0]}")
 
         # Serve main VR workspace
         if parsed_path.path == '/' or parsed_path.path == '/vr':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            with open(VR_WORKSPACE_FILE, 'rb') as f:
-                self.wfile.write(f.read())
+            if not self._serve_asset(VR_WORKSPACE_FILE):
+                self.send_error(404, 'VR workspace not found')
             return
 
         # Server status endpoint
         elif parsed_path.path == '/api/status':
+            # Pure in-memory read: network info and model count are kept
+            # fresh by STATUS_REFRESHER in the background.
             uptime = time.time() - SERVER_START_TIME
+            cached = STATUS_REFRESHER.snapshot()
             status = {
                 'status': 'online',
                 'uptime': uptime,
                 'uptime_human': f"{int(uptime // 3600)}h {int((uptime % 3600) // 60)}m",
-                'requests': REQUEST_COUNT,
-                'models_count': len(list(CAD_OUTPUT_DIR.glob('*.stl'))),
+                'requests': int(REQUESTS.value()),
+                'active_connections': ACTIVE_CONNECTIONS,
+                'clipboard_stream_clients': SSE_CLIENTS,
+                'asset_cache': ASSET_CACHE.stats(),
+                'models_count': cached['models_count'],
                 'timestamp': datetime.now().isoformat(),
                 'version': '1.0',
                 'wireless': True,
                 'network': {
-                    'tailscale': self._get_tailscale_ip(),
-                    'local': self._get_local_ip()
-                }
+                    'tailscale': cached['tailscale'],
+                    'local': cached['local']
+                },
+                'network_refreshed': cached['refreshed']
             }
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(status).encode())
+            self._send_json(status)
             return
 
-        # List available models
-        elif parsed_path.path == '/api/models':
+        # Prometheus-style metrics
+        elif parsed_path.path == '/metrics':
+            body = render().encode()
             self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Content-type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
+            self.wfile.write(body)
+            return
 
-            models = []
-            for file in CAD_OUTPUT_DIR.glob('*.stl'):
-                models.append({
-                    'name': file.name,
-                    'path': f'/cad_output/{file.name}',
-                    'size': file.stat().st_size,
-                    'modified': file.stat().st_mtime
-                })
-
-            self.wfile.write(json.dumps(models).encode())
+        # List available models (paginated, from the model catalog)
+        # Query: ?page=1&per_page=100&sort=modified|name|size|triangles&order=desc|asc
+        # Total count is returned in X-Total-Count; the body stays a list.
+        elif parsed_path.path == '/api/models':
+            query = parse_qs(parsed_path.query)
+            try:
+                page = max(1, int(query.get('page', ['1'])[0]))
+                # Clamp as list_models does, so offsets and X-Per-Page match the page served
+                per_page = max(1, min(int(query.get('per_page', ['100'])[0]), MAX_PAGE_SIZE))
+            except ValueError:
+                self.send_error(400, 'page and per_page must be integers')
+                return
+            sort = query.get('sort', ['modified'])[0]
+            descending = query.get('order', ['desc'])[0] != 'asc'
+
+            total, models = STATUS_REFRESHER.catalog.list_models(
+                offset=(page - 1) * per_page, limit=per_page,
+                sort=sort, descending=descending
+            )
+
+            self._send_json(models, headers={
+                'X-Total-Count': total,
+                'X-Page': page,
+                'X-Per-Page': per_page
+            })
             return
 
         # Get clipboard content (Mac ↔ Quest sync)
+        # Revalidates by content hash: If-None-Match or ?since=<hash> → 304
         elif parsed_path.path == '/api/clipboard':
             try:
-                sync_file = Path.home() / '.trinity_clipboard'
-                if sync_file.exists():
-                    with open(sync_file, 'r') as f:
-                        clipboard_data = json.load(f)
-                else:
-                    clipboard_data = {'content': '', 'source': 'none', 'timestamp': ''}
+                clipboard_data = CLIPBOARD_BROADCASTER.reader.read()
+                etag = f'"{clipboard_data.get("hash", "")}"'
+                since = parse_qs(parsed_path.query).get('since', [None])[0]
+
+                if self.headers.get('If-None-Match') == etag or since == clipboard_data.get('hash'):
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(clipboard_data).encode())
+                self._send_json(clipboard_data, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
                 logger.info(f"Clipboard read: {len(clipboard_data.get('content', ''))} chars")
                 return
             except Exception as e:
@@ -150,36 +506,25 @@ class TrinityVRHandler(SimpleHTTPRequestHandler):
                 self.send_error(500, f'Clipboard read error: {str(e)}')
                 return
 
-        # Default file serving
-        else:
-            # Add CORS headers for cross-origin requests
-            super().do_GET()
+        # Push clipboard changes as Server-Sent Events
+        elif parsed_path.path == '/api/clipboard/stream':
+            self._stream_clipboard()
+            return
 
-    def _get_tailscale_ip(self):
-        """Get Tailscale IP address."""
-        try:
-            result = subprocess.run(['tailscale', 'ip', '-4'],
-                                  capture_output=True, text=True, timeout=2)
-            return result.stdout.strip() if result.returncode == 0 else None
-        except:
-            return None
+        # Default file serving (cached; large files and directories stream from disk)
+        else:
+            model_path = self._model_path(parsed_path.path)
+            if model_path:
+                self._serve_model(model_path)
+                return
 
-    def _get_local_ip(self):
-        """Get local WiFi IP address."""
-        try:
-            import socket
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(('8.8.8.8', 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except:
-            return None
+            file_path = Path(self.translate_path(parsed_path.path))
+            if not self._serve_asset(file_path):
+                super().do_GET()
 
     def do_POST(self):
         """Handle POST requests."""
-        global REQUEST_COUNT
-        REQUEST_COUNT += 1
+        REQUESTS.inc()
 
         parsed_path = urlparse(self.path)
         logger.info(f"POST {parsed_path.path} from {self.client_address[0]}")
@@ -204,11 +549,7 @@ class TrinityVRHandler(SimpleHTTPRequestHandler):
                     'timestamp': datetime.now().isoformat()
                 }
 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(response).encode())
+                self._send_json(response)
 
             except Exception as e:
                 logger.error(f"CAD generation error: {str(e)}")
@@ -237,17 +578,8 @@ class TrinityVRHandler(SimpleHTTPRequestHandler):
                     self.send_error(413, f'Clipboard content too large (max {MAX_CLIPBOARD_SIZE // 1024 // 1024}MB)')
                     return
 
-                # Write to sync file
-                sync_file = Path.home() / '.trinity_clipboard'
-                clipboard_data = {
-                    'content': clipboard_content,
-                    'source': 'quest',
-                    'timestamp': datetime.now().isoformat(),
-                    'hash': hashlib.md5(clipboard_content.encode()).hexdigest()
-                }
-
-                with open(sync_file, 'w') as f:
-                    json.dump(clipboard_data, f)
+                # Write to sync file (atomic, picked up by the clipboard daemon's watcher)
+                clipboard_data = CLIPBOARD_BROADCASTER.reader.write(clipboard_content, 'quest')
 
                 logger.info(f"Clipboard written: {len(clipboard_content)} chars from Quest")
 
@@ -258,11 +590,7 @@ class TrinityVRHandler(SimpleHTTPRequestHandler):
                     'timestamp': clipboard_data['timestamp']
                 }
 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(response).encode())
+                self._send_json(response)
 
             except Exception as e:
                 logger.error(f"Clipboard write error: {str(e)}")
@@ -308,11 +636,7 @@ class TrinityVRHandler(SimpleHTTPRequestHandler):
                     'timestamp': datetime.now().isoformat()
                 }
 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(response).encode())
+                self._send_json(response)
 
                 logger.info(f"Voice: {text or action}")
 
@@ -336,26 +660,147 @@ class TrinityVRHandler(SimpleHTTPRequestHandler):
         logger.debug(f"{self.address_string()} - {format % args}")
 
 
-def get_network_info():
-    """Get current network configuration."""
+def _route_label(path: str) -> str:
+    """Latency histogram route label for a request path."""
+    if path in METRIC_ROUTES:
+        return path
+    if path.startswith('/cad_output/'):
+        return '/cad_output/*'
+    return 'static'
+
+
+def get_tailscale_ip() -> Optional[str]:
+    """Get Tailscale IP address."""
     try:
-        # Get Tailscale IP
         result = subprocess.run(['tailscale', 'ip', '-4'],
                               capture_output=True, text=True, timeout=2)
-        tailscale_ip = result.stdout.strip() if result.returncode == 0 else "Not available"
+        return result.stdout.strip() if result.returncode == 0 else None
     except:
-        tailscale_ip = "Not available"
+        return None
 
-    # Get local IP
+
+def get_local_ip() -> Optional[str]:
+    """Get local WiFi IP address."""
     try:
         import socket
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(('8.8.8.8', 80))
-        local_ip = s.getsockname()[0]
+        ip = s.getsockname()[0]
         s.close()
+        return ip
     except:
-        local_ip = "Not available"
+        return None
+
+
+class StatusRefresher:
+    """
+    Background refresher for /api/status.
+
+    Network addresses are re-resolved on a slow timer (they fork
+    `tailscale` and open a UDP socket), while the model catalog is only
+    re-synced when the CAD output directory's mtime changes. Readers get
+    an immutable snapshot dict, so /api/status never blocks.
+    """
+
+    def __init__(self, models_dir: Path = CAD_OUTPUT_DIR,
+                 network_interval: float = NETWORK_REFRESH_INTERVAL,
+                 poll_interval: float = MODELS_POLL_INTERVAL,
+                 catalog: Optional[ModelCatalog] = None):
+        self.models_dir = models_dir
+        self._catalog = catalog
+        self.network_interval = network_interval
+        self.poll_interval = poll_interval
+        self._snapshot = {
+            'tailscale': None,
+            'local': None,
+            'models_count': 0,
+            'refreshed': None
+        }
+        self._dir_mtime = None
+        self._last_network = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def catalog(self) -> ModelCatalog:
+        """Model catalog for ``models_dir`` (opened on first use)."""
+        if self._catalog is None:
+            self._catalog = get_catalog(self.models_dir)
+        return self._catalog
+
+    def snapshot(self) -> Dict:
+        """Return the latest cached status (no I/O)."""
+        return self._snapshot
+
+    def refresh_network(self):
+        """Re-resolve Tailscale and local addresses."""
+        tailscale_ip = get_tailscale_ip()
+        local_ip = get_local_ip()
+        self._last_network = time.monotonic()
+        self._snapshot = {
+            **self._snapshot,
+            'tailscale': tailscale_ip,
+            'local': local_ip,
+            'refreshed': datetime.now().isoformat()
+        }
+
+    def refresh_models(self, force: bool = False):
+        """Re-sync the model catalog if the output directory changed."""
+        try:
+            dir_mtime = self.models_dir.stat().st_mtime
+        except OSError:
+            dir_mtime = None
+
+        if not force and dir_mtime == self._dir_mtime:
+            return
+
+        self._dir_mtime = dir_mtime
+        if dir_mtime is None:
+            self._snapshot = {**self._snapshot, 'models_count': 0}
+            return
+
+        changes = self.catalog.sync()
+        if any(changes.values()):
+            logger.info(f"Model catalog synced: {changes}")
+        self._snapshot = {**self._snapshot, 'models_count': self.catalog.count()}
+
+    def start(self):
+        """Populate the cache once, then keep it fresh in a daemon thread."""
+        self.refresh_network()
+        self.refresh_models(force=True)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='status-refresher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh_models()
+                if time.monotonic() - self._last_network >= self.network_interval:
+                    self.refresh_network()
+            except Exception as e:
+                logger.warning(f"Status refresh failed: {e}")
+
+
+STATUS_REFRESHER = StatusRefresher()
+
+
+def get_network_info():
+    """Get current network configuration."""
+    snapshot = STATUS_REFRESHER.snapshot()
+    if snapshot['refreshed'] is None:
+        STATUS_REFRESHER.refresh_network()
+        snapshot = STATUS_REFRESHER.snapshot()
 
+    tailscale_ip = snapshot['tailscale'] or "Not available"
+    local_ip = snapshot['local'] or "Not available"
     return tailscale_ip, local_ip
 
 
@@ -368,7 +813,9 @@ def main():
     logger.info("🥽 Oculus Quest 1 Engineering Workspace")
     logger.info(f"📡 Server starting on port {VR_PORT}...")
 
-    # Get network info
+    # Start background status refresher, clipboard watcher and get network info
+    STATUS_REFRESHER.start()
+    CLIPBOARD_BROADCASTER.start()
     tailscale_ip, local_ip = get_network_info()
 
     logger.info("")
@@ -402,13 +849,17 @@ def main():
     logger.info("Press Ctrl+C to stop")
     logger.info("=" * 44)
 
-    server = HTTPServer(('0.0.0.0', VR_PORT), TrinityVRHandler)
+    # Thread per connection so one slow Quest client can't block the others
+    server = ThreadingHTTPServer(('0.0.0.0', VR_PORT), TrinityVRHandler)
+    server.daemon_threads = True
 
     try:
         logger.info("Server listening on 0.0.0.0:8503")
         server.serve_forever()
     except KeyboardInterrupt:
         logger.info("\n\n🛑 Trinity VR Server stopped")
+        STATUS_REFRESHER.stop()
+        CLIPBOARD_BROADCASTER.stop()
         server.shutdown()
 
 